@@ -0,0 +1,26 @@
+from fastapi import APIRouter
+
+from app.domain.diagnosis.rules import rule_cache
+
+router = APIRouter(prefix="/diagnosis", tags=["Diagnosis"])
+
+
+@router.get("/rules")
+def list_rules():
+    """
+    다중 메트릭 진단 룰 목록 + 룰별 누적 발동 수
+
+    Returns:
+        dict:
+            - source: 룰 파일 경로
+            - rules: [{name, phases, condition, issue, suggestion, deduction, hits, evaluated, hit_rate}]
+              (evaluated = 룰 대상 페이즈가 평가된 횟수, 룰 파일이 바뀌면 0부터 다시 집계)
+    """
+    rules = rule_cache.get()
+    return {
+        "source": str(rules.source) if rules.source else None,
+        "rules": rules.stats(),
+    }
+
+
+ROUTER = [router]
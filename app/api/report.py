@@ -1,12 +1,10 @@
 # app/api/report.py
 from __future__ import annotations
 from typing import Optional, Dict, Any
-from fastapi import APIRouter, Body, Query
+from fastapi import APIRouter, Body, HTTPException, Query
 
 from app.report.service import build_text_report
-from app.utils.resource_finder import rf  # thresholds_path() 쓸 수 있으면 사용
-import json
-from pathlib import Path
+from app.infrastructure.thresholds.registry import threshold_registry
 
 router = APIRouter()
 
@@ -20,6 +18,9 @@ def build_report_api(
     language: str = Query("ko", regex="^(ko|en)$"),
     tone: str = Query("coach"),
     model: Optional[str] = Query(None),
+    thresholds_version: Optional[str] = Query(
+        None, description="thresholds 버전 고정 (날짜/파일명/지문/current, 없으면 pin → A/B → current)"
+    ),
 ):
     # 입력에서 필요한 것만 추출(프론트가 analyze_swing 결과를 그대로 보내준다는 가정)
     phase_metrics = payload.get("phase_metrics") or {}
@@ -27,12 +28,17 @@ def build_report_api(
     club = (payload.get("input") or {}).get("club") or payload.get("club")
     side = payload.get("side") or (payload.get("input") or {}).get("side")
 
-    # thresholds는 파일에서 읽거나, 프론트가 같이 보내줄 수도 있음
+    # thresholds는 프론트가 같이 보내주거나, 레지스트리에서 버전 선택 (요청 중 교체되어도 이 버전 유지)
     thresholds = payload.get("thresholds")
+    version = "payload" if thresholds is not None else None
     if thresholds is None:
-        p = rf.thresholds_path()
-        if p and Path(p).exists():
-            thresholds = json.loads(Path(p).read_text(encoding="utf-8"))
+        ab_key = payload.get("user_id") or (payload.get("input") or {}).get("user_id")
+        try:
+            snapshot = threshold_registry.select(thresholds_version, key=ab_key)
+        except KeyError:
+            raise HTTPException(status_code=404, detail=f"unknown thresholds_version: {thresholds_version}")
+        if snapshot is not None:
+            thresholds, version = snapshot.data, snapshot.version
 
     text = build_text_report(
         phase_metrics=phase_metrics,
@@ -44,4 +50,4 @@ def build_report_api(
         language=language,
         model=model,
     )
-    return {"report": text}
+    return {"report": text, "thresholds_version": version}
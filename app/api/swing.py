@@ -1,11 +1,37 @@
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
+from fastapi import APIRouter, UploadFile, File, Form, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from pathlib import Path
+from typing import Literal, Optional
+import asyncio
+import hashlib
+import json
 import os
 import logging
+import time
+import uuid
 
-from app.schemas.analyze_dto import AnalyzeSwingRequest, AnalyzeSwingResponse
+from app.schemas.analyze_dto import (
+    AnalyzeSwingResponse,
+    AnalyzeMultiSwingResponse,
+    AnalyzeJobSubmitResponse,
+    AnalyzeJobStatusResponse,
+    AiFeedbackResponse,
+    SessionEvent
+)
+from app.schemas.video_dto import VideoPreprocessRequest
+from app.services.session_pipeline import SwingSessionPipeline
 from app.schemas.analyze_request import AnalyzeSwingApiRequest
-from app.services.service_factory import create_swing_analysis_service
+from app.services.service_factory import build_analyze_request, create_swing_analysis_service
+from app.services.feedback_store import feedback_store
+from app.services.job_runner import job_runner
+from app.services.result_cache import result_cache, result_cache_key, result_flight_key
+from app.services.swing_analysis_service import generate_analysis_id
+from app.infrastructure.jobs.broker import job_broker
+from app.infrastructure.storage.uploads import upload_storage
+from app.infrastructure.thresholds.registry import threshold_registry
 from app.config.settings import settings
+from app.common.admission import admission
+from app.common.deadline import request_received_at
 from app.common.dependencies import verify_api_key, parse_analyze_request
 
 logger = logging.getLogger(__name__)
@@ -14,6 +40,8 @@ router = APIRouter(prefix="/analyze", tags=["Swing Analysis"])
 # ========== API Endpoint ==========
 @router.post("", response_model=AnalyzeSwingResponse)
 async def analyze_swing(
+        http_request: Request,
+        response: Response,
         file: UploadFile = File(..., description="스윙 비디오 파일"),
         req: AnalyzeSwingApiRequest = Depends(parse_analyze_request),
         _: bool = Depends(verify_api_key)
@@ -23,59 +51,335 @@ async def analyze_swing(
 
     기본: llm_provider="noop" (테스트, 무과금)
     실제: llm_provider="openai" (과금)
+
+    같은 영상 + 같은 설정이면 캐시된 결과를 반환 (X-Analysis-Cache: hit | coalesced | miss)
+    feedback_mode="deferred"면 진단 직후 응답하고 LLM 피드백은 ai_feedback_url로 조회
     """
     logger.info(f"📥 분석 요청: user={req.user_id}, club={req.club}, llm={req.llm_provider}")
 
-    # 1. 파일 저장
+    # 1. 파일 저장 (저장하면서 내용 해시 계산)
+    file_path, content_hash = await _save_upload_hashed(file)
+
+    # 2~3. Service + Service DTO 생성 (마감 예산은 요청 도착 시각부터)
+    service, request = _build_service_request(req, file_path, received_at=request_received_at(http_request))
+
+    # 4. 분석 실행 (업로드 파일은 분석이 끝나거나 캐시 결과를 쓰면 삭제)
+    try:
+        logger.info("🔄 스윙 분석 시작...")
+        result = await _analyze_cached("single", service, request, content_hash, response)
+        logger.info(f"✅ 스윙 분석 완료: {result.analysis_id}")
+        return result
+
+    except Exception as e:
+        logger.error(f"❌ 분석 실패: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"분석 실패: {e}")
+
+
+@router.post("/multi", response_model=AnalyzeMultiSwingResponse)
+async def analyze_multi_swing(
+        http_request: Request,
+        response: Response,
+        file: UploadFile = File(..., description="여러 스윙이 담긴 비디오 파일 (연습장 세션)"),
+        req: AnalyzeSwingApiRequest = Depends(parse_analyze_request),
+        _: bool = Depends(verify_api_key)
+) -> AnalyzeMultiSwingResponse:
+    """
+    멀티 스윙 분석 API
+
+    영상 1개에서 스윙 구간을 모두 찾아 스윙별 페이즈/진단을 반환
+    (포즈 추출은 영상 전체에 1회만 수행)
+    """
+    logger.info(f"📥 멀티 스윙 분석 요청: user={req.user_id}, club={req.club}")
+
+    file_path, content_hash = await _save_upload_hashed(file)
+    service, request = _build_service_request(req, file_path, received_at=request_received_at(http_request))
+
+    try:
+        logger.info("🔄 멀티 스윙 분석 시작...")
+        result = await _analyze_cached("multi", service, request, content_hash, response)
+        logger.info(f"✅ 멀티 스윙 분석 완료: {result.analysis_id} (swings={len(result.swings)})")
+        return result
+
+    except Exception as e:
+        logger.error(f"❌ 분석 실패: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"분석 실패: {e}")
+
+
+@router.post("/session")
+async def analyze_session(
+        file: Optional[UploadFile] = File(None, description="세션 비디오 파일 (source_path 대신)"),
+        source_path: Optional[str] = Form(
+            None, description="UPLOADS_DIR 아래 녹화 중인 파일 경로 (follow=true와 함께 사용)"
+        ),
+        follow: bool = Form(False, description="파일 끝에서 새 프레임을 기다림 (녹화 중인 파일)"),
+        req: AnalyzeSwingApiRequest = Depends(parse_analyze_request),
+        _: bool = Depends(verify_api_key)
+) -> StreamingResponse:
+    """
+    세션 모드 분석 API (NDJSON 스트리밍)
+
+    스윙이 끝날 때마다 {"event": "swing", ...} 한 줄을 바로 내보내고,
+    스트림이 끝나면 {"event": "end", ...}로 종료
+    """
+    if (file is None) == (source_path is None):
+        raise HTTPException(status_code=422, detail="file 또는 source_path 중 하나만 지정하세요")
+
+    if file is not None:
+        file_path, cleanup = await _save_upload(file), True
+    else:
+        file_path, cleanup = _resolve_source_path(source_path), False
+
+    session_id = f"session_{uuid.uuid4().hex[:12]}"
+    service, _request = _build_service_request(req, file_path, cleanup=cleanup)
+    preprocess_request = VideoPreprocessRequest(
+        file_path=file_path,
+        target_fps=settings.VIDEO_FPS,
+        target_height=settings.VIDEO_HEIGHT,
+        mirror=(req.swing_direction == "left")
+    )
+    pipeline = SwingSessionPipeline(service, fps=preprocess_request.target_fps)
+    logger.info(f"📥 세션 분석 시작: {session_id} (follow={follow})")
+
+    def events():
+        # 동기 제너레이터 → Starlette가 스레드풀에서 순회 (이벤트 루프 블로킹 없음)
+        try:
+            frames = service.video_preprocessor.stream(
+                preprocess_request,
+                follow=follow,
+                idle_timeout=settings.SESSION_IDLE_TIMEOUT_SEC
+            )
+            for swing in pipeline.run(frames):
+                yield _ndjson(SessionEvent(
+                    event="swing",
+                    session_id=session_id,
+                    swing=swing,
+                    frames_processed=pipeline.frames_processed,
+                    swings_emitted=pipeline.swings_emitted
+                ))
+            yield _ndjson(SessionEvent(
+                event="end",
+                session_id=session_id,
+                frames_processed=pipeline.frames_processed,
+                swings_emitted=pipeline.swings_emitted
+            ))
+            logger.info(f"✅ 세션 분석 종료: {session_id} (swings={pipeline.swings_emitted})")
+        finally:
+            if cleanup and os.path.exists(file_path):
+                os.remove(file_path)
+                logger.info(f"🗑️ 임시 파일 삭제: {file_path}")
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
+@router.post("/jobs", response_model=AnalyzeJobSubmitResponse, status_code=202)
+async def submit_analyze_job(
+        file: UploadFile = File(..., description="스윙 비디오 파일"),
+        mode: Literal["single", "multi"] = Form(
+            "single", description="single: /analyze와 같은 분석, multi: /analyze/multi와 같은 분석"
+        ),
+        req: AnalyzeSwingApiRequest = Depends(parse_analyze_request),
+        _: bool = Depends(verify_api_key)
+) -> AnalyzeJobSubmitResponse:
+    """
+    비동기 분석 작업 등록
+
+    업로드만 공유 스토리지에 저장하고 바로 job_id를 반환 (분석은 작업 워커가 순서대로 실행)
+    결과는 GET /analyze/jobs/{job_id}로 조회 (feedback_mode와 무관하게 AI 피드백은 결과에 포함)
+    """
+    if req.thresholds_version:
+        try:
+            threshold_registry.get(req.thresholds_version)
+        except KeyError:
+            raise HTTPException(status_code=404, detail=f"unknown thresholds_version: {req.thresholds_version}")
+
+    queued = await asyncio.to_thread(job_broker.count, "queued")
+    if queued >= settings.JOBS_MAX_QUEUED:
+        retry_after = admission.retry_after(queued, max(1, settings.JOBS_WORKERS))
+        raise HTTPException(
+            status_code=503, detail="작업 대기열이 가득 찼습니다", headers={"Retry-After": str(retry_after)}
+        )
+
+    # 작업마다 파일명이 겹치지 않도록 업로드 이름 대신 임의 이름으로 저장 → 공유 스토리지로 이동
+    name = f"job_{uuid.uuid4().hex}{Path(file.filename or '').suffix or '.mp4'}"
+    file_path = await _save_upload(file, filename=name)
+    try:
+        upload_ref = await asyncio.to_thread(upload_storage.put, file_path, name)
+    except Exception as e:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        logger.error(f"❌ 업로드 공유 스토리지 저장 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"파일 저장 실패: {e}")
+
+    payload = {"request": req.model_dump(), "upload": upload_ref}
+    job_id = await asyncio.to_thread(job_broker.submit, mode, payload)
+    job_runner.notify()
+    logger.info(f"📥 작업 등록: {job_id} (user={req.user_id}, club={req.club}, mode={mode})")
+
+    return AnalyzeJobSubmitResponse(job_id=job_id, status="queued", status_url=f"/analyze/jobs/{job_id}")
+
+
+@router.get("/jobs/{job_id}", response_model=AnalyzeJobStatusResponse)
+async def get_analyze_job(job_id: str, _: bool = Depends(verify_api_key)) -> AnalyzeJobStatusResponse:
+    """비동기 분석 작업 상태 조회 (succeeded면 result에 분석 결과 포함)"""
+    job = await asyncio.to_thread(job_broker.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"job not found: {job_id}")
+
+    return AnalyzeJobStatusResponse(
+        job_id=job["id"],
+        kind=job["kind"],
+        status=job["status"],
+        attempts=job["attempts"],
+        created_at=job["created_at"],
+        started_at=job["started_at"],
+        finished_at=job["finished_at"],
+        result=json.loads(job["result"]) if job["result"] else None,
+        error=job["error"]
+    )
+
+
+@router.get("/feedback/{analysis_id}", response_model=AiFeedbackResponse)
+async def get_ai_feedback(analysis_id: str, _: bool = Depends(verify_api_key)) -> AiFeedbackResponse:
+    """지연 AI 피드백 조회 (feedback_mode=deferred 응답의 ai_feedback_url)"""
+    record = await asyncio.to_thread(feedback_store.get, analysis_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"feedback not found: {analysis_id}")
+    return record
+
+
+# ========== Helpers ==========
+def _ndjson(event: SessionEvent) -> str:
+    return event.model_dump_json() + "\n"
+
+
+def _resolve_source_path(source_path: str) -> str:
+    """source_path는 UPLOADS_DIR 하위 파일만 허용"""
+    upload_dir = Path(settings.UPLOADS_DIR).resolve()
+    path = (upload_dir / source_path).resolve()
+    if upload_dir not in path.parents or not path.is_file():
+        raise HTTPException(status_code=404, detail=f"source not found: {source_path}")
+    return str(path)
+
+
+async def _save_upload(file: UploadFile, filename: Optional[str] = None) -> str:
+    """업로드 파일을 UPLOADS_DIR에 저장하고 경로 반환 (filename 없으면 업로드 파일명 사용)"""
+    file_path, _ = await _save_upload_hashed(file, filename or file.filename)
+    return file_path
+
+
+async def _save_upload_hashed(file: UploadFile, filename: Optional[str] = None) -> tuple[str, str]:
+    """
+    업로드 파일을 청크 단위로 저장하면서 sha256 계산 (파일 전체를 메모리에 올리지 않음)
+
+    filename이 없으면 "<임의 8자>_<업로드 파일명>"으로 저장
+    (같은 파일을 동시에 재전송해도 서로의 업로드를 덮어쓰거나 지우지 않도록)
+
+    Returns:
+        (저장 경로, 내용 sha256 hex)
+    """
     upload_dir = settings.UPLOADS_DIR
     os.makedirs(upload_dir, exist_ok=True)
-    file_path = os.path.join(upload_dir, file.filename)
+    filename = filename or f"{uuid.uuid4().hex[:8]}_{Path(file.filename or 'upload.mp4').name}"
+    file_path = os.path.join(upload_dir, filename)
+    digest = hashlib.sha256()
 
     try:
         with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
+            while chunk := await file.read(settings.UPLOAD_CHUNK_BYTES):
+                digest.update(chunk)
+                f.write(chunk)
         logger.info(f"✅ 파일 저장: {file_path}")
     except Exception as e:
         logger.error(f"❌ 파일 저장 실패: {e}")
         raise HTTPException(status_code=500, detail=f"파일 저장 실패: {e}")
 
-    # 2. Factory로 Service 생성
-    service = create_swing_analysis_service(
-        club=req.club,
-        swing_direction=req.swing_direction,
-        visibility_threshold=req.visibility_threshold,
-        llm_provider=req.llm_provider,
-        llm_model=req.llm_model
-    )
+    return file_path, digest.hexdigest()
 
-    # 3. Service DTO 생성
-    request = AnalyzeSwingRequest(
-        file_path=file_path,
-        user_id=req.user_id,
-        club=req.club,
-        swing_direction=req.swing_direction,
-        visibility_threshold=req.visibility_threshold,
-        normalize_mode=req.normalize_mode,
-        llm_provider=req.llm_provider,
-        llm_model=req.llm_model
+
+def _remove_file(file_path: str) -> None:
+    if os.path.exists(file_path):
+        os.remove(file_path)
+        logger.info(f"🗑️ 임시 파일 삭제: {file_path}")
+
+
+async def _analyze_cached(
+        mode: Literal["single", "multi"],
+        service,
+        request,
+        content_hash: str,
+        response: Response
+):
+    """
+    결과 캐시 → 진행 중인 같은 분석 → 새 분석 순으로 결과 확보
+
+    업로드 파일 삭제도 여기서 담당 (새로 분석하면 분석이 끝난 뒤, 아니면 바로)
+    """
+    run = service.analyze if mode == "single" else service.analyze_multi
+    if not settings.RESULT_CACHE_ENABLED:
+        try:
+            return await run(request)
+        finally:
+            _remove_file(request.file_path)
+
+    started = time.perf_counter()
+    model = AnalyzeSwingResponse if mode == "single" else AnalyzeMultiSwingResponse
+    key = result_cache_key(content_hash, mode, request, service.diagnosis_engine.fingerprint)
+    result, outcome = await result_cache.get_or_compute(
+        key, model, lambda: run(request), cleanup=lambda: _remove_file(request.file_path),
+        flight_key=result_flight_key(key, request)
     )
+    response.headers["X-Analysis-Cache"] = outcome
+    if outcome != "miss":
+        source_id = result.analysis_id
+        await asyncio.to_thread(_rebase_shared_result, result, request, started)
+        logger.info(f"♻️ 분석 결과 재사용 ({outcome}): {result.analysis_id} ← {source_id}")
+    return result
 
-    # 4. 분석 실행
-    try:
-        logger.info("🔄 스윙 분석 시작...")
-        result = await service.analyze(request)
-        logger.info(f"✅ 스윙 분석 완료: {result.analysis_id}")
-        return result
 
-    except Exception as e:
-        logger.error(f"❌ 분석 실패: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"분석 실패: {e}")
+def _rebase_shared_result(result, request, started: float) -> None:
+    """
+    다른 요청의 분석 결과를 이 요청의 응답으로 바꿈
 
-    finally:
-        if os.path.exists(file_path):
+    - analysis_id는 새로 발급, user_id / processing_time_ms는 이 요청 기준 (이 요청은 단계를 실행하지 않음)
+    - result_url은 원래 분석의 저장 경로라 제거
+    - 지연 피드백은 새 ID로도 조회되도록 원래 분석의 피드백에 연결
+    """
+    source_id = result.analysis_id
+    result.analysis_id = generate_analysis_id()
+    result.user_id = request.user_id  # 키에 user_id가 없으면 다른 사용자의 결과일 수 있음
+    result.processing_time_ms = round((time.perf_counter() - started) * 1000, 2)
+    result.stage_timings_ms = None
+    if isinstance(result, AnalyzeSwingResponse):
+        result.result_url = None
+        if result.ai_feedback_url is not None:
+            feedback_store.link(result.analysis_id, source_id)
+            result.ai_feedback_url = feedback_store.url(result.analysis_id)
+
+
+def _build_service_request(
+        req: AnalyzeSwingApiRequest, file_path: str, cleanup: bool = True, received_at: Optional[float] = None
+):
+    """
+    Factory로 Service 생성 + Service DTO 생성 (cleanup=True면 실패 시 업로드 파일 삭제)
+
+    received_at: 요청 도착 시각 (마감 예산 시작점, 없으면 서비스 진입 시각)
+    """
+    try:
+        service = create_swing_analysis_service(
+            club=req.club,
+            swing_direction=req.swing_direction,
+            visibility_threshold=req.visibility_threshold,
+            llm_provider=req.llm_provider,
+            llm_model=req.llm_model,
+            thresholds_version=req.thresholds_version,
+            user_id=req.user_id
+        )
+    except KeyError:
+        if cleanup and os.path.exists(file_path):
             os.remove(file_path)
-            logger.info(f"🗑️ 임시 파일 삭제: {file_path}")
+        raise HTTPException(status_code=404, detail=f"unknown thresholds_version: {req.thresholds_version}")
+
+    return service, build_analyze_request(req, file_path, received_at)
 
 
 ROUTER = [router]
\ No newline at end of file
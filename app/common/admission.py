@@ -0,0 +1,276 @@
+"""
+분석 요청 입장 제어 (업로드를 받기 전에 거절)
+
+- 동시 분석 수 max_in_flight까지 바로 실행, 넘으면 대기열(FIFO, max_waiting개)에서 차례를 기다림
+- 대기열도 가득 → 429 + Retry-After (평균 처리 시간 × 앞선 대기 수 / 동시 실행 수)
+- 호스트 CPU 부하(LoadGate) 높음 → 거절하지 않고 슬롯 수를 지금 실행 중인 수로 줄임 (새 요청은 대기열로)
+  LoadGate는 1분 loadavg라 이 서버의 분석만으로도 busy가 되고 늦게 풀리므로, 거절 기준으로 쓰면
+  대기열 없이 503만 나가고 분석이 끝난 뒤에도 1분가량 계속 거절하게 됨
+- 여유 메모리 부족 → 503 + Retry-After (평균 처리 시간)
+- 실행 중인 분석이 없으면 항상 1건은 받음
+- 끝난 분석이 슬롯을 대기열 맨 앞 요청에 바로 넘김 → 여유가 생기면 다시 받음
+
+세션 스트림(/analyze/session)은 스트림이 끝날 때까지 슬롯을 잡으므로 별도 제어기(session_admission)로
+동시 세션 수만 제한 → 요청 단위 분석의 슬롯과 평균 처리 시간(Retry-After 추정)에 섞이지 않음
+
+FastAPI는 엔드포인트(의존성 포함) 호출 전에 multipart 본문을 다 읽으므로
+ASGI 미들웨어에서 판정해야 거절된 요청의 업로드를 받지 않는다.
+"""
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Optional
+
+import psutil
+from fastapi.responses import JSONResponse
+
+from app.common import metrics
+from app.config.settings import settings
+from app.utils.sysload import LoadGate, load_gate
+
+logger = logging.getLogger(__name__)
+
+# 입장 제어 대상 (POST, 분석을 요청 안에서 실행하는 경로)
+ADMITTED_PATHS = ("/analyze", "/analyze/multi")
+# 세션 스트림 (연결 내내 실행, session_admission으로 따로 제한)
+SESSION_PATHS = ("/analyze/session",)
+
+
+class AdmissionRejected(Exception):
+    """입장 거절 (429: 대기열 가득, 503: 호스트 자원 부족)"""
+
+    def __init__(self, status_code: int, reason: str, retry_after: int):
+        self.status_code = status_code
+        self.reason = reason
+        self.retry_after = retry_after
+        super().__init__(f"{reason} (retry after {retry_after}s)")
+
+
+def _available_memory_mb() -> float:
+    return psutil.virtual_memory().available / (1024 * 1024)
+
+
+class AdmissionController:
+    """동시 분석 슬롯 + 대기열 + 호스트 자원 확인 (이벤트 루프 1개에서만 사용)"""
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        max_waiting: int,
+        min_free_memory_mb: float = 0.0,
+        gate: Optional[LoadGate] = load_gate,
+        memory_probe: Callable[[], float] = _available_memory_mb,
+        probe_interval: float = 1.0,
+        initial_service_sec: float = 10.0,
+        retry_after_max: int = 120
+    ):
+        """
+        Args:
+            max_in_flight: 동시 분석 수
+            max_waiting: 슬롯을 기다릴 수 있는 요청 수 (넘으면 429)
+            min_free_memory_mb: 여유 메모리가 이보다 적으면 503 (0이면 확인 안 함)
+            gate: CPU 부하 히스테리시스 게이트 (busy면 슬롯을 늘리지 않음, None이면 확인 안 함)
+            memory_probe: 여유 메모리(MB) 측정 함수
+            probe_interval: 부하/메모리 재측정 주기(초)
+            initial_service_sec: 처리 시간 관측 전 평균 처리 시간 추정값
+            retry_after_max: Retry-After 상한(초)
+        """
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_waiting = max(0, max_waiting)
+        self.min_free_memory_mb = min_free_memory_mb
+        self.gate = gate
+        self.memory_probe = memory_probe
+        self.probe_interval = probe_interval
+        self.retry_after_max = retry_after_max
+        self.avg_service_sec = initial_service_sec  # 처리 시간 지수 이동 평균
+
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._probed_at = -math.inf
+        self._busy = False
+        self._free_mb = math.inf
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    @property
+    def capacity(self) -> int:
+        """지금 쓸 수 있는 슬롯 수 (CPU 부하가 높으면 실행 중인 수 이상으로 늘리지 않음, 최소 1)"""
+        if self._busy:
+            return max(1, min(self.max_in_flight, self.in_flight))
+        return self.max_in_flight
+
+    def retry_after(self, backlog: int, workers: int) -> int:
+        """backlog개가 workers개씩 처리될 때까지 기다릴 시간(초) 추정 (1 ~ retry_after_max)"""
+        estimate = self.avg_service_sec * backlog / max(1, workers)
+        return int(min(self.retry_after_max, max(1, math.ceil(estimate))))
+
+    def check(self) -> None:
+        """
+        지금 받을 수 있는지 확인
+
+        Raises:
+            AdmissionRejected: 대기열 가득(429) / 메모리 부족(503)
+        """
+        self._probe()
+        if self.in_flight == 0:
+            return
+        if self.min_free_memory_mb > 0 and self._free_mb < self.min_free_memory_mb:
+            self._reject(503, "memory", self.retry_after(1, 1))
+        if self.in_flight >= self.capacity and self.waiting >= self.max_waiting:
+            self._reject(429, "queue_full", self.retry_after(self.waiting + 1, self.capacity))
+
+    async def acquire(self) -> None:
+        """확인 후 슬롯 확보 (없으면 대기열에서 차례를 기다림)"""
+        self.check()
+        if self.in_flight < self.capacity and not self._waiters:
+            self.in_flight += 1
+            self._update_gauges()
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._update_gauges()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._hand_over()  # 슬롯을 넘겨받은 직후 취소 → 다음 요청에 넘김
+            else:
+                self._waiters.remove(waiter)
+                self._update_gauges()
+            raise
+
+    def release(self, service_sec: Optional[float] = None) -> None:
+        """
+        슬롯 반납 (대기 중인 요청이 있으면 그대로 넘김)
+
+        Args:
+            service_sec: 이번 요청 처리 시간 (평균 처리 시간 갱신용)
+        """
+        if service_sec is not None:
+            self.avg_service_sec = 0.8 * self.avg_service_sec + 0.2 * service_sec
+        self._hand_over()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        await self.acquire()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.release(time.perf_counter() - started)
+
+    def _hand_over(self) -> None:
+        self._probe()
+        handed = False
+        while self._waiters and not handed:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)  # in_flight 유지 (슬롯이 그대로 이동)
+                handed = True
+        if not handed:
+            self.in_flight -= 1
+        self._wake()  # 부하가 풀려 슬롯이 늘었으면 대기 요청을 더 실행
+        self._update_gauges()
+
+    def _wake(self) -> None:
+        """남는 슬롯만큼 대기 요청 실행"""
+        while self._waiters and self.in_flight < self.capacity:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def _probe(self) -> None:
+        now = time.monotonic()
+        if now - self._probed_at < self.probe_interval:
+            return
+        self._probed_at = now
+        try:
+            self._busy = self.gate.update() if self.gate is not None else False
+            if self.min_free_memory_mb > 0:
+                self._free_mb = self.memory_probe()
+        except Exception as e:
+            logger.warning(f"⚠️ 호스트 자원 확인 실패, 여유 있다고 가정: {e}")
+            self._busy, self._free_mb = False, math.inf
+
+    def _reject(self, status_code: int, reason: str, retry_after: int) -> None:
+        metrics.ADMISSION_REJECTIONS.labels(reason).inc()
+        logger.warning(
+            f"🚦 요청 거절 {status_code} ({reason}): in_flight={self.in_flight}, waiting={self.waiting}, "
+            f"retry_after={retry_after}s"
+        )
+        raise AdmissionRejected(status_code, reason, retry_after)
+
+    def _update_gauges(self) -> None:
+        metrics.ADMISSION_IN_FLIGHT.set(self.in_flight)
+        metrics.ADMISSION_WAITING.set(self.waiting)
+
+
+class AdmissionMiddleware:
+    """ADMITTED_PATHS POST 요청을 입장 제어 슬롯 안에서 실행 (순수 ASGI, 본문을 읽기 전에 판정)"""
+
+    def __init__(self, app, controller: Optional[AdmissionController] = None, paths: tuple[str, ...] = ADMITTED_PATHS):
+        """
+        Args:
+            app: 다음 ASGI 앱
+            controller: 입장 제어기 (기본: 전역 admission)
+            paths: 대상 경로
+        """
+        self.app = app
+        self.controller = controller
+        self.paths = paths
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or scope["path"].rstrip("/") not in self.paths
+            or not settings.ADMISSION_ENABLED
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        controller = self.controller or admission
+        try:
+            await controller.acquire()
+        except AdmissionRejected as e:
+            response = JSONResponse(
+                {"detail": f"서버가 혼잡합니다 ({e.reason})", "retry_after": e.retry_after},
+                status_code=e.status_code,
+                headers={"Retry-After": str(e.retry_after)}
+            )
+            await response(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            controller.release(time.perf_counter() - started)
+
+
+# 프로세스 전역 입장 제어기
+admission = AdmissionController(
+    max_in_flight=settings.ADMISSION_MAX_IN_FLIGHT,
+    max_waiting=settings.ADMISSION_MAX_WAITING,
+    min_free_memory_mb=settings.ADMISSION_MIN_FREE_MB,
+    probe_interval=settings.ADMISSION_PROBE_SEC,
+    initial_service_sec=settings.ADMISSION_INITIAL_SERVICE_SEC,
+    retry_after_max=settings.ADMISSION_RETRY_AFTER_MAX_SEC
+)
+
+# 세션 스트림 동시 수 제한 (대기열 없이 바로 429, 평균 처리 시간 = 세션 길이)
+session_admission = AdmissionController(
+    max_in_flight=settings.ADMISSION_MAX_SESSIONS,
+    max_waiting=0,
+    min_free_memory_mb=settings.ADMISSION_MIN_FREE_MB,
+    probe_interval=settings.ADMISSION_PROBE_SEC,
+    initial_service_sec=settings.ADMISSION_SESSION_INITIAL_SEC,
+    retry_after_max=settings.ADMISSION_RETRY_AFTER_MAX_SEC
+)
@@ -0,0 +1,100 @@
+"""
+요청 마감 시간 (엔드투엔드 시간 예산)
+
+요청 도착 시각(RequestClockMiddleware)부터 예산을 계산해 업로드/해시/캐시 조회/입장 대기도 포함
+서비스는 단계마다 남은 시간을 확인하고, 부족하면 품질을 낮춰 마감 안에 응답:
+- 포즈: 목표 FPS↓(프레임 간격↑) + MediaPipe model_complexity↓
+- 키네마틱스: 생략
+- LLM: 생략하거나 남은 시간을 타임아웃으로 → 진단 텍스트 피드백
+- S3: 응답 뒤 업로드
+낮춘 내용은 notes에 모아 응답의 degradation_notes로 반환
+"""
+import logging
+import math
+import time
+from typing import Callable, Optional
+
+from app.common import metrics
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class Deadline:
+    """요청 1건의 마감 시각 + 품질을 낮춘 기록 (budget 없으면 항상 여유)"""
+
+    def __init__(
+        self,
+        budget_sec: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        started_at: Optional[float] = None
+    ):
+        """
+        Args:
+            budget_sec: started_at부터 쓸 수 있는 시간(초), None/0 이하면 마감 없음
+            clock: 단조 시계 (테스트용)
+            started_at: 예산 시작 시각 (clock 기준, 기본: 지금)
+        """
+        self.budget_sec = budget_sec if budget_sec and budget_sec > 0 else None
+        self._clock = clock
+        start = clock() if started_at is None else started_at
+        self._expires_at = start + self.budget_sec if self.budget_sec is not None else None
+        self.notes: list[str] = []
+
+    @classmethod
+    def for_request(cls, deadline_ms: Optional[int] = None, received_at: Optional[float] = None) -> "Deadline":
+        """
+        Args:
+            deadline_ms: 요청 값 (없으면 settings.REQUEST_DEADLINE_SEC)
+            received_at: 요청 도착 시각 (time.monotonic, 없으면 지금부터)
+        """
+        return cls(cls.budget_for(deadline_ms), started_at=received_at)
+
+    @staticmethod
+    def budget_for(deadline_ms: Optional[int] = None) -> Optional[float]:
+        """요청에 적용할 시간 예산(초), 마감 없으면 None"""
+        budget = deadline_ms / 1000 if deadline_ms else settings.REQUEST_DEADLINE_SEC
+        return budget if budget and budget > 0 else None
+
+    def remaining(self) -> float:
+        """남은 시간(초), 마감 없으면 inf"""
+        if self._expires_at is None:
+            return math.inf
+        return max(0.0, self._expires_at - self._clock())
+
+    def allows(self, seconds: float) -> bool:
+        """남은 시간이 seconds 이상인지"""
+        return self.remaining() >= seconds
+
+    def timeout(self) -> Optional[float]:
+        """asyncio.wait_for 등에 넘길 타임아웃 (마감 없으면 None)"""
+        return None if self._expires_at is None else self.remaining()
+
+    def degrade(self, action: str, note: str) -> None:
+        """
+        품질을 낮춘 단계 기록
+
+        Args:
+            action: 메트릭 라벨 (pose / kinematics / llm_skip / llm_timeout / storage_defer)
+            note: 응답에 넣을 설명
+        """
+        self.notes.append(note)
+        metrics.DEADLINE_DEGRADATIONS.labels(action).inc()
+        logger.info(f"⏳ 마감 대응 ({action}): {note} (남은 {self.remaining():.1f}s)")
+
+
+class RequestClockMiddleware:
+    """HTTP 요청 도착 시각을 scope state에 기록 (순수 ASGI, 가장 바깥 미들웨어로 등록)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            scope.setdefault("state", {})["received_at"] = time.monotonic()
+        await self.app(scope, receive, send)
+
+
+def request_received_at(request) -> Optional[float]:
+    """RequestClockMiddleware가 기록한 도착 시각 (미들웨어 밖에서 호출되면 None)"""
+    return getattr(request.state, "received_at", None)
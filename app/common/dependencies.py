@@ -61,6 +61,19 @@ async def parse_analyze_request(
             default=None,
             description="LLM 모델명 (예: gpt-4o-mini)"
         ),
+        thresholds_version: Optional[str] = Form(
+            default=None,
+            description="thresholds 버전 고정 (예: 2025-11-10, 지정 시 분포 기반 진단)"
+        ),
+        feedback_mode: Literal["inline", "deferred"] = Form(
+            default="inline",
+            description="inline: 응답에 LLM 피드백 포함, deferred: 진단 직후 응답 + ai_feedback_url로 나중에 조회"
+        ),
+        deadline_ms: Optional[int] = Form(
+            default=None,
+            ge=100,
+            description="처리 시간 예산(ms), 부족하면 품질을 낮추고 degradation_notes에 기록"
+        ),
 ) -> AnalyzeSwingApiRequest:
     """
     FastAPI Form 데이터를 AnalyzeSwingApiRequest DTO로 변환
@@ -84,5 +97,8 @@ async def parse_analyze_request(
         visibility_threshold=visibility_threshold,
         normalize_mode=normalize_mode,
         llm_provider=llm_provider,
-        llm_model=llm_model
+        llm_model=llm_model,
+        thresholds_version=thresholds_version,
+        feedback_mode=feedback_mode,
+        deadline_ms=deadline_ms
     )
\ No newline at end of file
@@ -0,0 +1,203 @@
+"""
+단계별 실행기 (이벤트 루프 밖에서 동기 작업 실행)
+
+- cpu: 디코딩 / MediaPipe / 각도·페이즈·진단 계산
+- io:  boto3 등 블로킹 I/O
+- 네트워크 호출(LLM Gateway)은 실행기 대신 httpx.AsyncClient로 직접 await
+- 응답 뒤에 끝내도 되는 작업(결과 보강 업로드 등)은 spawn_background → 종료 시 drain_background
+
+CPU 단계도 스레드 풀을 쓴다: MediaPipe 그래프 / torch 모델을 가진 서비스 객체는 pickle이 안 되어
+프로세스 풀로 넘길 수 없고, cv2·MediaPipe·numpy 연산은 GIL을 놓고 실행되므로 스레드로 병렬화된다.
+"""
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Iterator, Optional
+
+from app.common import metrics
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class StageTimings:
+    """
+    요청 1건의 단계별 시간 (밀리초)
+
+    - queue_ms: 실행기에 제출된 뒤 워커가 잡을 때까지 대기
+    - exec_ms: 실제 실행
+    같은 단계가 여러 번 실행되면 합산, 기록할 때마다 Prometheus 히스토그램에도 반영
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: dict[str, dict[str, float]] = {}
+
+    def record(self, stage: str, queue_ms: float, exec_ms: float) -> None:
+        with self._lock:
+            entry = self._stages.setdefault(stage, {"queue_ms": 0.0, "exec_ms": 0.0})
+            entry["queue_ms"] += queue_ms
+            entry["exec_ms"] += exec_ms
+        metrics.observe_stage(stage, queue_ms, exec_ms)
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """실행기를 거치지 않는 단계(await 중인 네트워크 호출 등) 시간 기록 (대기 0)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, 0.0, (time.perf_counter() - started) * 1000)
+
+    def as_dict(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            return {
+                stage: {k: round(v, 2) for k, v in entry.items()}
+                for stage, entry in self._stages.items()
+            }
+
+    def summary(self) -> str:
+        """로그용 한 줄 요약 (stage=대기+실행ms)"""
+        return " ".join(
+            f"{stage}={t['queue_ms']:.0f}+{t['exec_ms']:.0f}ms" for stage, t in self.as_dict().items()
+        )
+
+
+class StageExecutor:
+    """이름 붙은 스레드 풀 (대기/실행 시간 측정 포함)"""
+
+    def __init__(self, name: str, max_workers: int):
+        """
+        Args:
+            name: 실행기 이름 (스레드 이름 접두사)
+            max_workers: 워커 수
+        """
+        self.name = name
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"{name}-stage")
+        self._busy = metrics.EXECUTOR_BUSY.labels(name)
+        self._queued = metrics.EXECUTOR_QUEUED.labels(name)
+        metrics.EXECUTOR_WORKERS.labels(name).set(max_workers)
+
+    async def run(
+        self,
+        stage: str,
+        fn: Callable[..., Any],
+        *args,
+        timings: Optional[StageTimings] = None,
+        **kwargs
+    ) -> Any:
+        """
+        동기 함수를 풀에서 실행하고 결과를 await
+
+        Args:
+            stage: 단계 이름 (timings 키)
+            fn: 실행할 동기 함수
+            timings: 시간을 기록할 요청별 StageTimings (없으면 기록 안 함)
+        """
+        submitted = time.perf_counter()
+        state_lock = threading.Lock()
+        state = {"started": False, "cancelled": False}
+        self._queued.inc()
+
+        def call():
+            with state_lock:
+                if state["cancelled"]:
+                    return None
+                state["started"] = True
+            started = time.perf_counter()
+            self._queued.dec()
+            self._busy.inc()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._busy.dec()
+                if timings is not None:
+                    finished = time.perf_counter()
+                    timings.record(stage, (started - submitted) * 1000, (finished - started) * 1000)
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._pool, call)
+        except asyncio.CancelledError:
+            # 워커가 잡기 전에 취소된 작업은 실행하지 않음 (대기 수 게이지 정리)
+            with state_lock:
+                if not state["started"]:
+                    state["cancelled"] = True
+                    self._queued.dec()
+            raise
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+
+
+_lock = threading.Lock()
+_executors: dict[str, StageExecutor] = {}
+
+
+def get_executor(kind: str) -> StageExecutor:
+    """
+    프로세스 전역 실행기 ("cpu" | "io")
+
+    풀 크기: settings.CPU_EXECUTOR_WORKERS / IO_EXECUTOR_WORKERS
+    """
+    executor = _executors.get(kind)
+    if executor is None:
+        with _lock:
+            executor = _executors.get(kind)
+            if executor is None:
+                sizes = {"cpu": settings.CPU_EXECUTOR_WORKERS, "io": settings.IO_EXECUTOR_WORKERS}
+                if kind not in sizes:
+                    raise ValueError(f"unknown executor kind: {kind}")
+                executor = StageExecutor(kind, max_workers=max(1, sizes[kind]))
+                _executors[kind] = executor
+                logger.info(f"🧵 {kind} 실행기 생성 (workers={executor.max_workers})")
+    return executor
+
+
+def shutdown_executors(wait: bool = True) -> None:
+    """전역 실행기 종료 (앱 종료 시)"""
+    with _lock:
+        for executor in _executors.values():
+            executor.shutdown(wait=wait)
+        _executors.clear()
+
+
+# 응답과 무관하게 끝까지 실행할 태스크 (참조를 잡아 둬야 GC로 사라지지 않음)
+_background: set[asyncio.Task] = set()
+
+
+def spawn_background(coro: Awaitable, name: Optional[str] = None) -> asyncio.Task:
+    """
+    응답을 기다리게 하지 않는 후속 작업 시작 (실패는 로그만 남김)
+
+    Args:
+        coro: 실행할 코루틴
+        name: 태스크 이름 (로그용)
+    """
+    task = asyncio.ensure_future(coro)
+    if name:
+        task.set_name(name)
+    _background.add(task)
+    task.add_done_callback(_background_done)
+    return task
+
+
+def _background_done(task: asyncio.Task) -> None:
+    _background.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"❌ 백그라운드 작업 실패 ({task.get_name()}): {task.exception()}")
+
+
+async def drain_background(timeout: float = 10.0) -> None:
+    """남은 백그라운드 작업을 timeout까지 기다리고, 못 끝낸 것은 취소 (실행기 종료 전에 호출)"""
+    pending = [t for t in _background if not t.done()]
+    if not pending:
+        return
+    _, still_running = await asyncio.wait(pending, timeout=timeout)
+    for task in still_running:
+        task.cancel()
+    if still_running:
+        logger.warning(f"⚠️ 백그라운드 작업 {len(still_running)}개 취소 (종료 대기 초과)")
@@ -0,0 +1,86 @@
+"""
+Prometheus 메트릭 (GET /metrics)
+
+- 단계별 시간: StageTimings.record()가 기록하는 모든 단계 (대기 / 실행 분리)
+- 분석 건수/시간, 처리·버린 프레임 수
+- lru_cache / 분석 결과 캐시 적중, 실행기(스레드 풀) 사용률
+- 마감 시간 대응 품질 저하 수, 입장 제어 대기/거절
+"""
+from typing import Callable
+
+from prometheus_client import Counter, Gauge, Histogram
+from prometheus_client.core import CounterMetricFamily, REGISTRY
+from prometheus_client.registry import Collector
+
+from app.domain.phase.filters import savgol_dot_coeffs
+
+# 단계 시간: 디코딩/포즈는 수 초, 진단은 ms 단위라 범위를 넓게
+STAGE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+STAGE_SECONDS = Histogram(
+    "swing_stage_seconds", "분석 단계 실행 시간", ["stage"], buckets=STAGE_BUCKETS
+)
+STAGE_QUEUE_SECONDS = Histogram(
+    "swing_stage_queue_seconds", "분석 단계 실행기 대기 시간", ["stage"], buckets=STAGE_BUCKETS
+)
+ANALYSIS_SECONDS = Histogram(
+    "swing_analysis_seconds", "분석 요청 전체 처리 시간", ["mode"], buckets=STAGE_BUCKETS
+)
+ANALYSES_TOTAL = Counter("swing_analyses_total", "분석 요청 수", ["mode", "outcome"])
+
+FRAMES_PROCESSED = Counter("swing_frames_processed_total", "포즈 추출에 들어간 프레임 수")
+FRAMES_DROPPED = Counter("swing_frames_dropped_total", "포즈 추출에서 버린 프레임 수", ["reason"])
+
+# 분석 결과 캐시: hit(디스크) / coalesced(진행 중 분석에 합류) / miss(새로 분석)
+CACHE_REQUESTS = Counter("swing_result_cache_requests_total", "분석 결과 캐시 조회 수", ["result"])
+
+# 마감 시간 때문에 품질을 낮춘 횟수 (pose / kinematics / llm_skip / llm_timeout / storage_defer)
+DEADLINE_DEGRADATIONS = Counter("swing_deadline_degradations_total", "마감 대응 품질 저하 수", ["action"])
+
+# 입장 제어: 실행 중 / 슬롯 대기 요청 수, 거절 사유 (queue_full / memory)
+ADMISSION_IN_FLIGHT = Gauge("swing_admission_in_flight", "입장 제어 슬롯을 가진 요청 수")
+ADMISSION_WAITING = Gauge("swing_admission_waiting", "입장 제어 슬롯을 기다리는 요청 수")
+ADMISSION_REJECTIONS = Counter("swing_admission_rejections_total", "입장 제어 거절 수", ["reason"])
+
+EXECUTOR_WORKERS = Gauge("swing_executor_workers", "실행기 워커 수", ["executor"])
+EXECUTOR_BUSY = Gauge("swing_executor_busy_workers", "실행 중인 작업 수", ["executor"])
+EXECUTOR_QUEUED = Gauge("swing_executor_queued_tasks", "워커를 기다리는 작업 수", ["executor"])
+
+
+def observe_stage(stage: str, queue_ms: float, exec_ms: float) -> None:
+    STAGE_QUEUE_SECONDS.labels(stage).observe(queue_ms / 1000)
+    STAGE_SECONDS.labels(stage).observe(exec_ms / 1000)
+
+
+def record_frames(total: int, detected: int, low_visibility: int) -> None:
+    """
+    포즈 추출 프레임 집계
+
+    Args:
+        total: 입력 프레임 수
+        detected: 유효 포즈 프레임 수
+        low_visibility: 가시성 미달로 버린 프레임 수 (나머지 누락은 포즈 미검출)
+    """
+    FRAMES_PROCESSED.inc(total)
+    FRAMES_DROPPED.labels("low_visibility").inc(low_visibility)
+    FRAMES_DROPPED.labels("no_pose").inc(max(0, total - detected - low_visibility))
+
+
+class LruCacheCollector(Collector):
+    """functools.lru_cache 함수의 hits/misses를 swing_lru_cache_requests_total로 노출"""
+
+    def __init__(self, caches: dict[str, Callable]):
+        self.caches = caches
+
+    def collect(self):
+        family = CounterMetricFamily(
+            "swing_lru_cache_requests", "lru_cache 조회 수", labels=["cache", "result"]
+        )
+        for name, fn in self.caches.items():
+            info = fn.cache_info()
+            family.add_metric([name, "hit"], info.hits)
+            family.add_metric([name, "miss"], info.misses)
+        yield family
+
+
+REGISTRY.register(LruCacheCollector({"savgol_coeffs": savgol_dot_coeffs}))
@@ -28,3 +28,15 @@ def env_list(name: str, default_list):
 def env_path(name: str, default: Path) -> Path:
     v = os.getenv(name)
     return Path(v) if v else default
+
+
+"""환경 변수에서 "이름:가중치" 콤마 구분 목록을 dict로 읽는다. (예: "a:0.5,b:0.5")"""
+
+
+def env_weights(name: str) -> dict[str, float]:
+    out: dict[str, float] = {}
+    for part in env_list(name, []):
+        key, _, weight = part.rpartition(":")
+        if key:
+            out[key.strip()] = float(weight)
+    return out
@@ -6,7 +6,7 @@ from typing import Optional
 from dotenv import load_dotenv
 
 # helpers
-from app.config.env_utils import env_bool, env_path, env_list
+from app.config.env_utils import env_bool, env_path, env_list, env_weights
 
 DEFAULT_VIDEO_FPS=60
 DEFAULT_VIDEO_HEIGHT=720
@@ -88,6 +88,84 @@ class Settings:
     PHASE_MODEL_INPUT_DIM: int = 3
     PHASE_MODEL_HIDDEN_DIM: int = 32
     PHASE_MODEL_NUM_CLASSES: int = 8
+    # 모델 로드 실패 후 재시도까지 대기(초) - 그 사이 요청은 규칙 기반으로 바로 진행
+    PHASE_MODEL_RETRY_SEC: float = float(os.getenv("PHASE_MODEL_RETRY_SEC", 300))
+    # 동적 배칭 추론 워커: 최대 배치 크기 / 배치 수집 대기(ms) / torch intra-op 스레드 상한
+    PHASE_BATCH_MAX_SIZE: int = int(os.getenv("PHASE_BATCH_MAX_SIZE", 16))
+    PHASE_BATCH_MAX_WAIT_MS: float = float(os.getenv("PHASE_BATCH_MAX_WAIT_MS", 5))
+    # 페이즈 모델 추론 대기 상한(초) - 넘으면 규칙 기반으로 진행
+    PHASE_INFERENCE_TIMEOUT_SEC: float = float(os.getenv("PHASE_INFERENCE_TIMEOUT_SEC", 2))
+    TORCH_NUM_THREADS: int = int(os.getenv("TORCH_NUM_THREADS", 1))
+    # 단계별 실행기 크기: CPU(디코딩/포즈/계산), 블로킹 I/O(S3 등)
+    CPU_EXECUTOR_WORKERS: int = int(os.getenv("CPU_EXECUTOR_WORKERS", os.cpu_count() or 4))
+    IO_EXECUTOR_WORKERS: int = int(os.getenv("IO_EXECUTOR_WORKERS", 16))
+    # PoseExtractor 풀: 가시성 임계값별 유휴 추출기 보관 수 (MediaPipe 그래프 재사용)
+    POSE_POOL_MAX_IDLE: int = int(os.getenv("POSE_POOL_MAX_IDLE", CPU_EXECUTOR_WORKERS))
+    # LLM Gateway 공유 httpx.AsyncClient 연결 상한
+    LLM_HTTP_MAX_CONNECTIONS: int = int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", 32))
+    # 멀티 스윙 분석: 스윙 구간별 페이즈/진단 병렬 처리 스레드 수
+    MULTI_SWING_MAX_WORKERS: int = int(os.getenv("MULTI_SWING_MAX_WORKERS", 4))
+    # 세션 모드: 최근 포즈 링 버퍼 길이 / 스윙 최대 길이 / 녹화 중 파일 대기 한도 (초)
+    SESSION_BUFFER_SEC: float = float(os.getenv("SESSION_BUFFER_SEC", 10))
+    SESSION_MAX_SWING_SEC: float = float(os.getenv("SESSION_MAX_SWING_SEC", 5))
+    SESSION_IDLE_TIMEOUT_SEC: float = float(os.getenv("SESSION_IDLE_TIMEOUT_SEC", 5))
+    # 비동기 작업 API: SQLite 큐 / 앱 내 워커 수(0이면 별도 워커 프로세스만 사용) / 대기 작업 상한
+    JOBS_DB_PATH: Path = env_path("JOBS_DB_PATH", DATA_DIR / "jobs" / "jobs.sqlite3")
+    JOBS_WORKERS: int = int(os.getenv("JOBS_WORKERS", 2))
+    JOBS_MAX_QUEUED: int = int(os.getenv("JOBS_MAX_QUEUED", 100))
+    JOBS_POLL_SEC: float = float(os.getenv("JOBS_POLL_SEC", "1.0"))
+    # 워커가 이 시간 안에 끝내지 못하면(프로세스 종료 등) 다른 워커가 다시 가져감, 최대 시도 횟수
+    JOBS_LEASE_SEC: float = float(os.getenv("JOBS_LEASE_SEC", 600))
+    JOBS_MAX_ATTEMPTS: int = int(os.getenv("JOBS_MAX_ATTEMPTS", 2))
+    # 작업 브로커: 미설정 → JOBS_DB_PATH SQLite, "redis://host:6379/0" → Redis (노드 간 공유)
+    JOBS_BROKER_URL: Optional[str] = os.getenv("JOBS_BROKER_URL")
+    JOBS_REDIS_PREFIX: str = os.getenv("JOBS_REDIS_PREFIX", "swing:jobs")
+    # 작업 업로드 공유 스토리지: "local" (SHARED_UPLOADS_DIR 공유 볼륨) | "s3"
+    UPLOADS_STORAGE: str = os.getenv("UPLOADS_STORAGE", "local")
+    SHARED_UPLOADS_DIR: Path = env_path("SHARED_UPLOADS_DIR", UPLOADS_DIR / "jobs")
+    UPLOADS_S3_BUCKET: Optional[str] = os.getenv("UPLOADS_S3_BUCKET")
+    UPLOADS_S3_PREFIX: str = os.getenv("UPLOADS_S3_PREFIX", "uploads/")
+    # 실행 로그 (LOG_DIR/runs.jsonl): 회전 크기 / 배치 크기 / 최대 기록 지연(초) / 대기 레코드 상한
+    RUNLOG_ENABLED: bool = env_bool("RUNLOG_ENABLED", True)
+    RUNLOG_MAX_BYTES: int = int(os.getenv("RUNLOG_MAX_BYTES", 64 * 1024 * 1024))
+    RUNLOG_BATCH_SIZE: int = int(os.getenv("RUNLOG_BATCH_SIZE", 64))
+    RUNLOG_FLUSH_SEC: float = float(os.getenv("RUNLOG_FLUSH_SEC", "1.0"))
+    RUNLOG_QUEUE_SIZE: int = int(os.getenv("RUNLOG_QUEUE_SIZE", 10000))
+    # 분석 결과 캐시 (업로드 내용 해시 + 클럽/방향/프로필/진단 기준 지문 키, 디스크 LRU + TTL)
+    RESULT_CACHE_ENABLED: bool = env_bool("RESULT_CACHE_ENABLED", True)
+    RESULT_CACHE_DIR: Path = env_path("RESULT_CACHE_DIR", DATA_DIR / "cache" / "results")
+    RESULT_CACHE_MAX_ENTRIES: int = int(os.getenv("RESULT_CACHE_MAX_ENTRIES", 1000))
+    RESULT_CACHE_MAX_BYTES: int = int(os.getenv("RESULT_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+    RESULT_CACHE_TTL_SEC: float = float(os.getenv("RESULT_CACHE_TTL_SEC", 24 * 3600))
+    # 지연 AI 피드백 (feedback_mode=deferred): 상태/결과 저장소 (TTL은 결과 캐시와 같게 둬야 캐시된 응답의 URL이 유효)
+    FEEDBACK_STORE_DIR: Path = env_path("FEEDBACK_STORE_DIR", DATA_DIR / "cache" / "feedback")
+    FEEDBACK_STORE_MAX_ENTRIES: int = int(os.getenv("FEEDBACK_STORE_MAX_ENTRIES", 10000))
+    FEEDBACK_TTL_SEC: float = float(os.getenv("FEEDBACK_TTL_SEC", 24 * 3600))
+    # 요청 마감 시간 (요청에 deadline_ms가 없을 때 기본값, 0이면 마감 없음)
+    REQUEST_DEADLINE_SEC: float = float(os.getenv("REQUEST_DEADLINE_SEC", 0))
+    # 단계 시작 시 남은 시간이 이보다 적으면 품질을 낮춤 (초)
+    DEADLINE_FULL_POSE_SEC: float = float(os.getenv("DEADLINE_FULL_POSE_SEC", 12))  # 포즈 FPS / 모델 경량화
+    DEADLINE_KINEMATICS_MIN_SEC: float = float(os.getenv("DEADLINE_KINEMATICS_MIN_SEC", 0.5))
+    DEADLINE_LLM_MIN_SEC: float = float(os.getenv("DEADLINE_LLM_MIN_SEC", 3))
+    DEADLINE_STORAGE_MIN_SEC: float = float(os.getenv("DEADLINE_STORAGE_MIN_SEC", 1))
+    # 포즈 경량화 시 목표 FPS / MediaPipe model_complexity (기본 60 / 2)
+    DEADLINE_REDUCED_FPS: int = int(os.getenv("DEADLINE_REDUCED_FPS", 30))
+    DEADLINE_REDUCED_COMPLEXITY: int = int(os.getenv("DEADLINE_REDUCED_COMPLEXITY", 1))
+    # 입장 제어 (/analyze, /analyze/multi): 동시 분석 수 / 대기 요청 수 (넘으면 429)
+    ADMISSION_ENABLED: bool = env_bool("ADMISSION_ENABLED", True)
+    ADMISSION_MAX_IN_FLIGHT: int = int(os.getenv("ADMISSION_MAX_IN_FLIGHT", CPU_EXECUTOR_WORKERS))
+    ADMISSION_MAX_WAITING: int = int(os.getenv("ADMISSION_MAX_WAITING", 2 * CPU_EXECUTOR_WORKERS))
+    # 여유 메모리가 이보다 적으면 503, CPU 부하(LoadGate)가 높으면 슬롯을 늘리지 않음 / 부하·메모리 재측정 주기
+    ADMISSION_MIN_FREE_MB: float = float(os.getenv("ADMISSION_MIN_FREE_MB", 512))
+    ADMISSION_PROBE_SEC: float = float(os.getenv("ADMISSION_PROBE_SEC", "1.0"))
+    # Retry-After 계산: 처리 시간 관측 전 평균 추정값 / 상한 (초)
+    ADMISSION_INITIAL_SERVICE_SEC: float = float(os.getenv("ADMISSION_INITIAL_SERVICE_SEC", 10))
+    ADMISSION_RETRY_AFTER_MAX_SEC: int = int(os.getenv("ADMISSION_RETRY_AFTER_MAX_SEC", 120))
+    # 세션 스트림(/analyze/session)은 스트림 내내 슬롯을 잡으므로 별도 상한 (대기열 없음) / 평균 길이 추정값(초)
+    ADMISSION_MAX_SESSIONS: int = int(os.getenv("ADMISSION_MAX_SESSIONS", max(1, CPU_EXECUTOR_WORKERS // 2)))
+    ADMISSION_SESSION_INITIAL_SEC: float = float(os.getenv("ADMISSION_SESSION_INITIAL_SEC", 60))
+    # 업로드 저장/해시 청크 크기
+    UPLOAD_CHUNK_BYTES: int = int(os.getenv("UPLOAD_CHUNK_BYTES", 1024 * 1024))
 
     # ── Threshold / 통계용 공용 키 ───────────────────────
     THRESH_METRICS = env_list(
@@ -117,6 +195,13 @@ class Settings:
     THRESH_DEGENERATE_EPS: float = float(
         os.getenv("THRESH_DEGENERATE_EPS", "1e-6")
     )  # 퇴화 가드 임계값: 구간이 사실상 한 점이면 skip
+    # thresholds_current.json 핫 리로드 (watchfiles 미설치 시 폴링 주기)
+    THRESHOLDS_WATCH: bool = env_bool("THRESHOLDS_WATCH", True)
+    THRESHOLDS_POLL_SEC: float = float(os.getenv("THRESHOLDS_POLL_SEC", "1.0"))
+    # 진단 방식: "range" (클럽별 min/max/optimal) | "distribution" (thresholds 분포 z-score/백분위)
+    DIAGNOSIS_SCORING: str = os.getenv("DIAGNOSIS_SCORING", "range")
+    # 다중 메트릭 코치 룰 (DSL, 수정 시 자동 재컴파일, 파일이 없으면 룰 없음 - 예시: diagnosis_rules.example.txt)
+    DIAGNOSIS_RULES_FILE: Path = env_path("DIAGNOSIS_RULES_FILE", CONFIG_DIR / "diagnosis_rules.txt")
 
     # ── Metrics Range & Sample Guards ─────────────────────
     METRIC_RANGES = {
@@ -148,6 +233,9 @@ class Settings:
 
     # ── 명시적 파일/데이터셋 경로(선택) ───────────────────
     THRESHOLDS_FILE: Optional[str] = os.getenv("THRESHOLDS_FILE")
+    # thresholds 버전 고정 / A/B 분배 (예: "2025-10-21:0.5,2025-11-10:0.5")
+    THRESHOLDS_PIN: Optional[str] = os.getenv("THRESHOLDS_PIN")
+    THRESHOLDS_AB_SPLIT: dict[str, float] = env_weights("THRESHOLDS_AB_SPLIT")
     DATASET_PATH: Optional[str] = os.getenv("DATASET_PATH")
 
     def __init__(self) -> None:
@@ -4,8 +4,85 @@
 """
 import numpy as np
 
-from app.schemas.angle_dto import AngleCalculationResult, AngleMetrics
-from app.schemas.pose_dto import PoseData, Keypoint
+from app.schemas.angle_dto import AngleCalculationResult, ANGLE_METRIC_NAMES
+from app.schemas.pose_dto import PoseData
+
+# 각도 계산에 쓰는 keypoint (xy 배열의 2번째 축 순서)
+KEYPOINT_NAMES: tuple[str, ...] = (
+    "left_shoulder",
+    "right_shoulder",
+    "left_elbow",
+    "right_elbow",
+    "left_wrist",
+    "right_wrist",
+    "left_hip",
+    "right_hip",
+    "left_knee",
+    "right_knee",
+    "left_ankle",
+    "right_ankle",
+)
+_KP = {name: i for i, name in enumerate(KEYPOINT_NAMES)}
+
+# 3점 관절 각도 정의: metric → (p1, 꼭짓점, p3)
+JOINT_ANGLE_DEFS: dict[str, tuple[str, str, str]] = {
+    "left_elbow": ("left_shoulder", "left_elbow", "left_wrist"),
+    "right_elbow": ("right_shoulder", "right_elbow", "right_wrist"),
+    "left_knee": ("left_hip", "left_knee", "left_ankle"),
+    "right_knee": ("right_hip", "right_knee", "right_ankle"),
+    "left_hip": ("left_shoulder", "left_hip", "left_knee"),
+    "right_hip": ("right_shoulder", "right_hip", "right_knee"),
+}
+
+
+def poses_to_xy(poses: list[PoseData]) -> np.ndarray:
+    """PoseData 리스트 → (N, len(KEYPOINT_NAMES), 2) 좌표 배열"""
+    xy = np.empty((len(poses), len(KEYPOINT_NAMES), 2), dtype=np.float64)
+    for i, pose in enumerate(poses):
+        for j, name in enumerate(KEYPOINT_NAMES):
+            kp = getattr(pose, name)
+            xy[i, j, 0] = kp.x
+            xy[i, j, 1] = kp.y
+    return xy
+
+
+def compute_angle_matrix(xy: np.ndarray) -> np.ndarray:
+    """
+    좌표 배열 → 각도 행렬 (모든 프레임/메트릭을 한 번에 계산)
+
+    Args:
+        xy: (N, len(KEYPOINT_NAMES), 2) 좌표 배열
+
+    Returns:
+        (N, len(ANGLE_METRIC_NAMES)) 각도 행렬 (도)
+    """
+    out = np.empty((xy.shape[0], len(ANGLE_METRIC_NAMES)), dtype=np.float64)
+
+    # 3점 각도 (p2가 꼭짓점): 6개 관절을 한 번에 계산
+    names = list(JOINT_ANGLE_DEFS)
+    p1 = xy[:, [_KP[JOINT_ANGLE_DEFS[n][0]] for n in names]]
+    p2 = xy[:, [_KP[JOINT_ANGLE_DEFS[n][1]] for n in names]]
+    p3 = xy[:, [_KP[JOINT_ANGLE_DEFS[n][2]] for n in names]]
+    v1 = p1 - p2
+    v2 = p3 - p2
+    cos_angle = np.einsum("nkd,nkd->nk", v1, v2) / (
+        np.linalg.norm(v1, axis=-1) * np.linalg.norm(v2, axis=-1) + 1e-6
+    )
+    joint = np.degrees(np.arccos(np.clip(cos_angle, -1.0, 1.0)))
+    for k, name in enumerate(names):
+        out[:, ANGLE_METRIC_NAMES.index(name)] = joint[:, k]
+
+    # 어깨/엉덩이 회전 각도 (오른쪽 - 왼쪽 벡터의 기울기)
+    shoulder_vec = xy[:, _KP["right_shoulder"]] - xy[:, _KP["left_shoulder"]]
+    hip_vec = xy[:, _KP["right_hip"]] - xy[:, _KP["left_hip"]]
+    shoulder_rot = np.degrees(np.arctan2(shoulder_vec[:, 1], shoulder_vec[:, 0]))
+    hip_rot = np.degrees(np.arctan2(hip_vec[:, 1], hip_vec[:, 0]))
+
+    out[:, ANGLE_METRIC_NAMES.index("shoulder_rotation")] = shoulder_rot
+    out[:, ANGLE_METRIC_NAMES.index("hip_rotation")] = hip_rot
+    # X-Factor (어깨-엉덩이 회전 차이)
+    out[:, ANGLE_METRIC_NAMES.index("x_factor")] = np.abs(shoulder_rot - hip_rot)
+    return out
 
 
 class AngleCalculator:
@@ -19,85 +96,12 @@ class AngleCalculator:
             poses: 포즈 데이터 리스트
 
         Returns:
-            AngleCalculationResult (프레임별 각도 + 평균)
+            AngleCalculationResult (프레임별 각도 배열 + 평균)
         """
-        angles_list = []
-
-        for pose in poses:
-            angles = AngleMetrics(
-                frame_number=pose.frame_number,
-                timestamp=pose.timestamp,
-                left_elbow=self._calc_angle_3points(
-                    pose.left_shoulder, pose.left_elbow, pose.left_wrist
-                ),
-                right_elbow=self._calc_angle_3points(
-                    pose.right_shoulder, pose.right_elbow, pose.right_wrist
-                ),
-                left_knee=self._calc_angle_3points(
-                    pose.left_hip, pose.left_knee, pose.left_ankle
-                ),
-                right_knee=self._calc_angle_3points(
-                    pose.right_hip, pose.right_knee, pose.right_ankle
-                ),
-                left_hip=self._calc_angle_3points(
-                    pose.left_shoulder, pose.left_hip, pose.left_knee
-                ),
-                right_hip=self._calc_angle_3points(
-                    pose.right_shoulder, pose.right_hip, pose.right_knee
-                ),
-                x_factor=self._calc_x_factor(pose),
-                shoulder_rotation=self._calc_shoulder_rotation(pose),
-                hip_rotation=self._calc_hip_rotation(pose)
-            )
-            angles_list.append(angles)
-
-        # 평균값 계산
-        avg_left_elbow = np.mean([a.left_elbow for a in angles_list])
-        avg_right_elbow = np.mean([a.right_elbow for a in angles_list])
-        avg_left_knee = np.mean([a.left_knee for a in angles_list])
-        avg_right_knee = np.mean([a.right_knee for a in angles_list])
-        avg_x_factor = np.mean([a.x_factor for a in angles_list])
-
-        return AngleCalculationResult(
-            total_frames=len(poses),
-            angles=angles_list,
-            avg_left_elbow=avg_left_elbow,
-            avg_right_elbow=avg_right_elbow,
-            avg_left_knee=avg_left_knee,
-            avg_right_knee=avg_right_knee,
-            avg_x_factor=avg_x_factor
-        )
+        values = compute_angle_matrix(poses_to_xy(poses))
 
-    def _calc_angle_3points(self, p1: Keypoint, p2: Keypoint, p3: Keypoint) -> float:
-        """3점으로 각도 계산 (p2가 꼭짓점)"""
-        # 벡터 계산
-        v1 = np.array([p1.x - p2.x, p1.y - p2.y])
-        v2 = np.array([p3.x - p2.x, p3.y - p2.y])
-
-        # 내적으로 각도 계산
-        cos_angle = np.dot(v1, v2) / (np.linalg.norm(v1) * np.linalg.norm(v2) + 1e-6)
-        angle = np.arccos(np.clip(cos_angle, -1.0, 1.0))
-
-        return np.degrees(angle)
-
-    def _calc_x_factor(self, pose: PoseData) -> float:
-        """X-Factor (어깨-엉덩이 회전 차이) 계산"""
-        shoulder_rot = self._calc_shoulder_rotation(pose)
-        hip_rot = self._calc_hip_rotation(pose)
-        return abs(shoulder_rot - hip_rot)
-
-    def _calc_shoulder_rotation(self, pose: PoseData) -> float:
-        """어깨 회전 각도"""
-        shoulder_vector = np.array([
-            pose.right_shoulder.x - pose.left_shoulder.x,
-            pose.right_shoulder.y - pose.left_shoulder.y
-        ])
-        return np.degrees(np.arctan2(shoulder_vector[1], shoulder_vector[0]))
-
-    def _calc_hip_rotation(self, pose: PoseData) -> float:
-        """엉덩이 회전 각도"""
-        hip_vector = np.array([
-            pose.right_hip.x - pose.left_hip.x,
-            pose.right_hip.y - pose.left_hip.y
-        ])
-        return np.degrees(np.arctan2(hip_vector[1], hip_vector[0]))
+        return AngleCalculationResult.from_arrays(
+            frame_numbers=np.array([p.frame_number for p in poses], dtype=np.int64),
+            timestamps=np.array([p.timestamp for p in poses], dtype=np.float64),
+            values=values
+        )
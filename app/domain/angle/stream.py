@@ -0,0 +1,126 @@
+"""
+실시간 각도 계산 Domain Logic
+랜드마크 프레임 1개씩 입력 → 즉시 각도 계산 + 누적 통계
+"""
+import logging
+from typing import Callable, Optional
+
+import numpy as np
+
+from app.domain.angle.calculator import compute_angle_matrix, poses_to_xy
+from app.domain.pose.extractor import landmarks_to_pose_data
+from app.schemas.angle_dto import AngleMetrics, ANGLE_METRIC_NAMES
+from app.schemas.pose_dto import PoseData
+
+logger = logging.getLogger(__name__)
+
+AngleSubscriber = Callable[[AngleMetrics], None]
+
+
+class RunningStats:
+    """Welford 누적 평균/분산 (메트릭 M개를 벡터로 한 번에 갱신, 프레임당 O(1))"""
+
+    def __init__(self, size: int):
+        self.count = 0
+        self.mean = np.zeros(size, dtype=np.float64)
+        self._m2 = np.zeros(size, dtype=np.float64)
+
+    def update(self, x: np.ndarray) -> None:
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+
+    @property
+    def variance(self) -> np.ndarray:
+        """모분산 (ddof=0, thresholds 생성 스크립트와 동일 기준)"""
+        if self.count == 0:
+            return np.full_like(self.mean, np.nan)
+        return self._m2 / self.count
+
+    @property
+    def std(self) -> np.ndarray:
+        return np.sqrt(self.variance)
+
+
+class StreamingAngleCalculator:
+    """
+    AngleCalculator의 스트리밍 버전
+
+    - 메트릭 정의는 배치 계산기와 동일 (compute_angle_matrix 공유)
+    - 프레임이 도착할 때마다 각도 계산 → 구독자에게 push
+    """
+
+    def __init__(self):
+        self.stats = RunningStats(len(ANGLE_METRIC_NAMES))
+        self._subscribers: list[AngleSubscriber] = []
+
+    def subscribe(self, callback: AngleSubscriber) -> Callable[[], None]:
+        """
+        프레임별 각도 구독
+
+        Returns:
+            구독 해제 함수
+        """
+        self._subscribers.append(callback)
+        return lambda: self._subscribers.remove(callback)
+
+    def push(self, pose: PoseData) -> AngleMetrics:
+        """
+        포즈 1프레임 입력
+
+        Args:
+            pose: 포즈 데이터
+
+        Returns:
+            이 프레임의 AngleMetrics
+        """
+        row = compute_angle_matrix(poses_to_xy([pose]))[0]
+        self.stats.update(row)
+
+        angles = AngleMetrics(
+            frame_number=pose.frame_number,
+            timestamp=pose.timestamp,
+            **dict(zip(ANGLE_METRIC_NAMES, row.tolist()))
+        )
+        for callback in list(self._subscribers):
+            try:
+                callback(angles)
+            except Exception as e:
+                # 구독자 오류가 스트림을 멈추지 않도록 격리
+                logger.warning(f"⚠️ 각도 구독자 오류: {e}")
+        return angles
+
+    def push_landmarks(
+        self, landmarks, frame_number: int, timestamp: float
+    ) -> Optional[AngleMetrics]:
+        """
+        MediaPipe 랜드마크(33개) 1프레임 입력
+
+        Args:
+            landmarks: MediaPipe landmark 리스트 (속성 또는 dict 형태)
+            frame_number: 프레임 번호
+            timestamp: 타임스탬프(초)
+
+        Returns:
+            AngleMetrics (랜드마크가 비어 있으면 None)
+        """
+        if not landmarks:
+            return None
+        return self.push(landmarks_to_pose_data(landmarks, frame_number, timestamp))
+
+    def statistics(self) -> dict[str, dict[str, float]]:
+        """지금까지의 메트릭별 누적 통계 {metric: {mean, std, count}}"""
+        std = self.stats.std
+        return {
+            name: {
+                "mean": float(self.stats.mean[i]),
+                "std": float(std[i]),
+                "count": self.stats.count,
+            }
+            for i, name in enumerate(ANGLE_METRIC_NAMES)
+        }
+
+    def reset(self) -> None:
+        """누적 통계 초기화 (구독자는 유지)"""
+        self.stats = RunningStats(len(ANGLE_METRIC_NAMES))
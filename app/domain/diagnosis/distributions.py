@@ -0,0 +1,63 @@
+"""
+분포형 Threshold 테이블
+thresholds_current.json ({P2..P9: {metric: {bins, mean, std, n}}}) → (phase, metric) 배열로 컴파일
+"""
+from typing import Any
+
+import numpy as np
+
+from app.config.settings import settings
+from app.utils.thresholds_utils import bins_to_range, is_metric_block
+
+
+class DistributionTable:
+    """
+    컴파일된 분포 테이블 (요청 간 공유되므로 모든 배열은 읽기 전용)
+
+    - phases / metrics: 행/열 이름 (파일 등장 순서)
+    - mean / std / n: (P, M), 값이 없으면 NaN (n은 0)
+    - bins: (P, M, B) 분위 엣지, 엣지 수가 적은 칸은 NaN으로 패딩
+    - range_min / range_max: settings.THRESH_QLOW~QHIGH 분위 구간 (P, M)
+    """
+
+    def __init__(self, raw: dict[str, Any]):
+        required = set(settings.THRESH_REQUIRED_KEYS)
+        blocks = {
+            phase: {m: b for m, b in metrics.items() if is_metric_block(b, required)}
+            for phase, metrics in raw.items()
+            if isinstance(metrics, dict)
+        }
+
+        self.phases: tuple[str, ...] = tuple(blocks)
+        metrics: list[str] = []
+        for block in blocks.values():
+            metrics.extend(m for m in block if m not in metrics)
+        self.metrics: tuple[str, ...] = tuple(metrics)
+        self.phase_index = {p: i for i, p in enumerate(self.phases)}
+        self.metric_index = {m: j for j, m in enumerate(self.metrics)}
+
+        shape = (len(self.phases), len(self.metrics))
+        num_bins = max(
+            (len(b["bins"]) for block in blocks.values() for b in block.values()),
+            default=0
+        )
+        self.mean = np.full(shape, np.nan)
+        self.std = np.full(shape, np.nan)
+        self.n = np.zeros(shape, dtype=np.int64)
+        self.bins = np.full(shape + (num_bins,), np.nan)
+        self.range_min = np.full(shape, np.nan)
+        self.range_max = np.full(shape, np.nan)
+
+        for i, block in enumerate(blocks.values()):
+            for metric, spec in block.items():
+                j = self.metric_index[metric]
+                self.mean[i, j] = spec["mean"]
+                self.std[i, j] = spec["std"]
+                self.n[i, j] = spec["n"]
+                self.bins[i, j, :len(spec["bins"])] = spec["bins"]
+                rng = bins_to_range(spec, settings.THRESH_QLOW, settings.THRESH_QHIGH, required)
+                if rng:
+                    self.range_min[i, j], self.range_max[i, j] = rng
+
+        for arr in (self.mean, self.std, self.n, self.bins, self.range_min, self.range_max):
+            arr.setflags(write=False)
@@ -1,171 +1,362 @@
 """
 진단 엔진 Domain Logic
-Threshold 기반 룰 진단
+Threshold 기반 룰 진단 (range) / 분포 기반 z-score·백분위 진단 (distribution)
++ 다중 메트릭 코치 룰 (rules DSL)
 """
+import hashlib
 import json
-from pathlib import Path
+from typing import Iterator, Optional, Sequence
 
+import numpy as np
+
+from app.config.settings import settings
+from app.domain.diagnosis.rules import RuleSet, rule_cache
+from app.domain.diagnosis.scoring import DistributionScorer
+from app.domain.diagnosis.thresholds import ThresholdTable, threshold_cache
 from app.schemas.diagnosis_dto import PhaseDiagnosis, DiagnosisResult
 from app.schemas.phase_dto import PhaseInfo
 
+# 감점 규칙
+RANGE_DEDUCTION = 5       # min/max 범위 이탈
+OPTIMAL_DEDUCTION = 2     # 최적값과 차이가 큼 (경고)
+OPTIMAL_TOLERANCE = 10.0  # 최적값 허용 오차(도)
+Z_TOLERANCE = 1.0         # distribution 모드: 평균에서 이 z 이상 벗어나면 경고
+
 
 class DiagnosisEngine:
     """Threshold 기반 스윙 진단 엔진"""
 
-    def __init__(self, club: str = "driver"):
+    def __init__(
+        self,
+        club: str = "driver",
+        table: Optional[ThresholdTable] = None,
+        scorer: Optional[DistributionScorer] = None,
+        thresholds_version: Optional[str] = None,
+        rules: Optional[RuleSet] = None
+    ):
         """
         Args:
             club: 골프 클럽 종류 (driver, iron, wedge 등)
+            table: 사용할 threshold 테이블 (None = 프로세스 캐시에서 클럽별 테이블)
+            scorer: 분포 CDF 테이블 (주어지면 distribution 모드로 진단)
+            thresholds_version: scorer를 만든 thresholds 버전 (응답 표시용)
+            rules: 다중 메트릭 룰 (None = 룰 파일 캐시)
         """
         self.club = club
-        self.thresholds = self._load_thresholds(club)
+        self.table = table or threshold_cache.get(club)
+        self.scorer = scorer
+        self.thresholds_version = thresholds_version
+        self.rules = rules if rules is not None else rule_cache.get()
+
+        # 측정값 열 = threshold 메트릭 + 룰에만 나오는 메트릭
+        base = (self.scorer or self.table).metrics
+        self._num_base = len(base)
+        self._metrics = base + tuple(m for m in self.rules.metrics if m not in base)
+        self._metric_index = {m: j for j, m in enumerate(self._metrics)}
+        self._rule_cols = np.array([self._metric_index[m] for m in self.rules.metrics], dtype=np.int64)
+        self._rule_deductions = np.array([r.deduction for r in self.rules.rules], dtype=np.float64)
+        self._fingerprint: Optional[str] = None
+
+    @property
+    def thresholds(self) -> dict:
+        """원본 threshold dict"""
+        return self.table.raw
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        진단 기준 지문 (sha256 앞 12자리, 실행 로그/결과 캐시 키용)
+
+        range 모드는 클럽 threshold 원본, distribution 모드는 컴파일된 CDF 테이블 + 룰 조건으로 계산
+        """
+        if self._fingerprint is None:
+            digest = hashlib.sha256()
+            if self.scorer is not None:
+                digest.update("|".join(self.scorer.phases + self.scorer.metrics).encode("utf-8"))
+                for arr in (self.scorer.grid, self.scorer.mean, self.scorer.std):
+                    digest.update(np.ascontiguousarray(arr).tobytes())
+            else:
+                digest.update(json.dumps(self.table.raw, sort_keys=True).encode("utf-8"))
+            for rule in self.rules.rules:
+                digest.update(f"{rule.name}|{rule.phases}|{rule.source}|{rule.deduction}".encode("utf-8"))
+            self._fingerprint = digest.hexdigest()[:12]
+        return self._fingerprint
+
+    @property
+    def key_count(self) -> int:
+        """기준값이 있는 (페이즈, 메트릭) 칸 수"""
+        return int((self.scorer or self.table).present.sum())
+
+    @property
+    def metrics(self) -> tuple[str, ...]:
+        """진단에 쓰는 메트릭 (diagnose_batch 입력의 마지막 축 순서)"""
+        return self._metrics
+
+    def diagnose_batch(self, angles: np.ndarray, phase_names: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        여러 스윙 점수만 한 번에 계산 (문구 생성 없음, 재채점용)
+
+        Args:
+            angles: (N, P, M) 페이즈 대표 각도 (메트릭 순서 = self.metrics, 없는 값은 NaN)
+            phase_names: P개 페이즈 이름 (angles 두 번째 축 순서)
+
+        Returns:
+            (페이즈별 점수 (N, P), 전체 점수 (N,)) - diagnose()와 같은 규칙
+        """
+        angles = np.asarray(angles, dtype=np.float64)
+        n, p, m = angles.shape
+        if p != len(phase_names) or m != len(self.metrics):
+            raise ValueError(f"angles shape {angles.shape} != (N, {len(phase_names)}, {len(self.metrics)})")
+
+        table = self.scorer or self.table
+        rows = np.tile([table.phase_index.get(name, -1) for name in phase_names], n).astype(np.int64)
+        measured = angles.reshape(n * p, m)
+        judge = self._judge_distribution if self.scorer is not None else self._judge_range
+        below, above, far, has, _aux = judge(rows, measured[:, :self._num_base])
+        rule_hits = self.rules.evaluate(list(phase_names) * n, measured[:, self._rule_cols], count=False)
+
+        scores = self._scores(below, above, far, rule_hits).reshape(n, p)
+        if self.scorer is None:
+            return scores, scores.mean(axis=1)
+        return scores, self._overall_scores(scores, self._scored_rows(has, rule_hits).reshape(n, p))
+
+    def _judge_range(self, rows: np.ndarray, measured: np.ndarray):
+        """range 모드 판정 → (below, above, far, has, (lo, hi, opt)) 모두 (R, M)"""
+        table = self.table
+        # threshold 행 (테이블에 없는 페이즈는 -1 → 빈 행, 판정 없음)
+        lo = table.min_rows[rows]
+        hi = table.max_rows[rows]
+        opt = table.optimal_rows[rows]
+        has = table.present_rows[rows] & ~np.isnan(measured)
+
+        below = has & (measured < lo)
+        above = has & ~below & (measured > hi)
+        far = has & ~below & ~above & (np.abs(measured - opt) > OPTIMAL_TOLERANCE)
+        return below, above, far, has, (lo, hi, opt)
+
+    def _judge_distribution(self, rows: np.ndarray, measured: np.ndarray):
+        """distribution 모드 판정 → (below, above, far, has, DistributionScores)"""
+        scored = self.scorer.score(rows, measured)
+        pct, has = scored.percentile, scored.available
+
+        below = has & (pct < 100.0 * settings.THRESH_QLOW)
+        above = has & (pct > 100.0 * settings.THRESH_QHIGH)
+        far = has & ~below & ~above & (np.abs(scored.z) > Z_TOLERANCE)
+        return below, above, far, has, scored
+
+    def _scores(self, below: np.ndarray, above: np.ndarray, far: np.ndarray, rule_hits: np.ndarray) -> np.ndarray:
+        """행별 점수 = 100 - 감점 (0 미만은 0)"""
+        deductions = RANGE_DEDUCTION * (below | above).sum(axis=1) + OPTIMAL_DEDUCTION * far.sum(axis=1)
+        if self._rule_deductions.size:
+            deductions = deductions + rule_hits @ self._rule_deductions
+        return np.maximum(0, 100 - deductions)
+
+    @staticmethod
+    def _scored_rows(has: np.ndarray, rule_hits: np.ndarray) -> np.ndarray:
+        """실제로 채점한 행 (분포가 있는 메트릭이 있거나 룰이 발동)"""
+        return has.any(axis=1) | rule_hits.any(axis=1)
+
+    @staticmethod
+    def _overall_scores(scores: np.ndarray, scored: np.ndarray) -> np.ndarray:
+        """(..., P) 페이즈 점수 → 채점한 페이즈만 평균 (하나도 없으면 100)"""
+        count = scored.sum(axis=-1)
+        total = np.where(scored, scores, 0).sum(axis=-1)
+        return np.where(count > 0, total / np.maximum(count, 1), 100.0)
+
+    def _apply_rules(self, phases: list[PhaseInfo], measured: np.ndarray) -> np.ndarray:
+        """룰 평가 (hit 카운터 반영) → (N, K) 발동 여부"""
+        return self.rules.evaluate([p.name for p in phases], measured[:, self._rule_cols])
+
+    def _rule_messages(self, rule_hits: np.ndarray, issues: list[list[str]], suggestions: list[list[str]]) -> None:
+        """발동한 룰 문구를 페이즈별 issues / suggestions에 추가"""
+        for i, k in zip(*np.nonzero(rule_hits)):
+            rule = self.rules.rules[int(k)]
+            issues[int(i)].append(rule.issue)
+            if rule.suggestion:
+                suggestions[int(i)].append(rule.suggestion)
 
     def diagnose(self, phases: list[PhaseInfo]) -> DiagnosisResult:
         """
         전체 페이즈 진단
 
+        Process:
+        1. 페이즈 대표 각도 → threshold 테이블과 같은 (phase, metric) 배열
+        2. 범위 이탈 / 최적값 차이를 배열 비교로 한 번에 판정 → 페이즈별 감점
+        3. 위반 항목에 대해서만 문구 생성
+
         Args:
             phases: 6개 페이즈 정보
 
         Returns:
             DiagnosisResult (페이즈별 진단 + 전체 점수)
         """
-        diagnoses = []
+        if self.scorer is not None:
+            return self._diagnose_distribution(phases)
+
+        rows, full = self._measured_matrix(phases)
+        measured = full[:, :self._num_base]
+        below, above, far, has, (lo, hi, opt) = self._judge_range(rows, measured)
+        rule_hits = self._apply_rules(phases, full)
+        scores = self._scores(below, above, far, rule_hits)
+
+        # 문구/세부값은 해당 칸만 Python 값으로 꺼내서 생성
+        values = (measured.tolist(), lo.tolist(), hi.tolist(), opt.tolist())
+        issues, suggestions = self._messages(values, below, above, far, phases)
+        self._rule_messages(rule_hits, issues, suggestions)
+        measured_values = self._measured_values(values, has, phases)
 
-        for phase in phases:
-            diagnosis = self._diagnose_phase(phase)
-            diagnoses.append(diagnosis)
+        diagnoses = [
+            PhaseDiagnosis(
+                phase=phase.name,
+                score=float(scores[i]),
+                issues=issues[i],
+                suggestions=suggestions[i],
+                measured_values=measured_values[i]
+            )
+            for i, phase in enumerate(phases)
+        ]
 
         # 전체 점수 = 각 페이즈 점수 평균
-        overall_score = sum(d.score for d in diagnoses) / len(diagnoses)
+        overall_score = float(scores.mean())
 
         return DiagnosisResult(
             diagnoses=diagnoses,
             overall_score=overall_score
         )
 
-    def _diagnose_phase(self, phase: PhaseInfo) -> PhaseDiagnosis:
-        """단일 페이즈 진단"""
-        phase_name = phase.name
-        angles = phase.representative_angles
-
-        # 이 페이즈의 threshold 가져오기
-        phase_thresholds = self.thresholds.get(phase_name, {})
-
-        issues = []
-        suggestions = []
-        measured_values = {}
-        deduction = 0  # 감점
-
-        # 각도별 체크
-        for metric_name, measured_value in angles.items():
-            if metric_name not in phase_thresholds:
-                continue
-
-            threshold = phase_thresholds[metric_name]
-            min_val = threshold.get("min")
-            max_val = threshold.get("max")
-            optimal = threshold.get("optimal")
-
-            measured_values[metric_name] = {
-                "measured": measured_value,
-                "threshold_min": min_val,
-                "threshold_max": max_val,
-                "optimal": optimal
+    def _diagnose_distribution(self, phases: list[PhaseInfo]) -> DiagnosisResult:
+        """
+        분포 기반 진단
+
+        - 백분위가 [THRESH_QLOW, THRESH_QHIGH] 밖 → RANGE_DEDUCTION
+        - 구간 안이지만 |z| > Z_TOLERANCE → OPTIMAL_DEDUCTION
+        - 전체 점수는 분포가 있는(또는 룰이 발동한) 페이즈만 평균
+        """
+        scorer = self.scorer
+        rows, full = self._measured_matrix(phases)
+        measured = full[:, :self._num_base]
+        below, above, far, has, scored = self._judge_distribution(rows, measured)
+        rule_hits = self._apply_rules(phases, full)
+        scores = self._scores(below, above, far, rule_hits)
+        pct, z = scored.percentile, scored.z
+
+        mean = scorer.mean_rows[rows]
+        values = (measured.tolist(), mean.tolist(), scorer.std_rows[rows].tolist(), z.tolist(), pct.tolist())
+        issues, suggestions = self._distribution_messages(values, below, above, far, phases)
+        self._rule_messages(rule_hits, issues, suggestions)
+
+        metrics = scorer.metrics
+        measured_values = [{} for _ in phases]
+        percentile_ranks = [{} for _ in phases]
+        measured_l, mean_l, std_l, z_l, pct_l = values
+        for i, j in self._cells(phases, has):
+            percentile_ranks[i][metrics[j]] = pct_l[i][j]
+            measured_values[i][metrics[j]] = {
+                "measured": measured_l[i][j],
+                "mean": mean_l[i][j],
+                "std": std_l[i][j],
+                "z_score": z_l[i][j],
+                "percentile": pct_l[i][j]
             }
 
-            # 범위 체크
-            if min_val is not None and measured_value < min_val:
-                diff = min_val - measured_value
-                issues.append(
-                    f"{metric_name} 부족: {measured_value:.1f}도 (최소 {min_val:.1f}도 필요)"
-                )
-                suggestions.append(
-                    f"{metric_name}을(를) {diff:.1f}도 증가시키세요"
-                )
-                deduction += 5
+        diagnoses = [
+            PhaseDiagnosis(
+                phase=phase.name,
+                score=float(scores[i]),
+                issues=issues[i],
+                suggestions=suggestions[i],
+                measured_values=measured_values[i],
+                percentile_ranks=percentile_ranks[i]
+            )
+            for i, phase in enumerate(phases)
+        ]
 
-            elif max_val is not None and measured_value > max_val:
-                diff = measured_value - max_val
-                issues.append(
-                    f"{metric_name} 과다: {measured_value:.1f}도 (최대 {max_val:.1f}도)"
-                )
-                suggestions.append(
-                    f"{metric_name}을(를) {diff:.1f}도 감소시키세요"
+        # 전체 점수 = 분포/룰로 실제 채점한 페이즈만 평균 (분포가 없는 페이즈의 100점은 제외)
+        overall_score = float(self._overall_scores(scores, self._scored_rows(has, rule_hits)))
+        return DiagnosisResult(diagnoses=diagnoses, overall_score=overall_score)
+
+    def _distribution_messages(self, values, below, above, far, phases) -> tuple[list[list[str]], list[list[str]]]:
+        """distribution 모드 위반 항목 문구 (페이즈별 issues / suggestions)"""
+        measured, mean, _std, z, pct = values
+        below_l, above_l = below.tolist(), above.tolist()
+        issues = [[] for _ in phases]
+        suggestions = [[] for _ in phases]
+
+        for i, j in self._cells(phases, below | above | far):
+            metric_name = self.scorer.metrics[j]
+            value, avg = measured[i][j], mean[i][j]
+            if below_l[i][j]:
+                issues[i].append(f"{metric_name} 부족: {value:.1f}도 (하위 {pct[i][j]:.0f}%, 평균 {avg:.1f}도)")
+                suggestions[i].append(f"{metric_name}을(를) 평균까지 {avg - value:.1f}도 증가시키세요")
+            elif above_l[i][j]:
+                issues[i].append(f"{metric_name} 과다: {value:.1f}도 (상위 {100 - pct[i][j]:.0f}%, 평균 {avg:.1f}도)")
+                suggestions[i].append(f"{metric_name}을(를) 평균까지 {value - avg:.1f}도 감소시키세요")
+            else:
+                suggestions[i].append(
+                    f"{metric_name} 최적화 가능: 현재 {value:.1f}도, 평균 {avg:.1f}도 (z={z[i][j]:+.2f})"
                 )
-                deduction += 5
-
-            # 최적값과 비교 (경고만)
-            elif optimal is not None:
-                diff = abs(measured_value - optimal)
-                if diff > 10:  # 10도 이상 차이
-                    suggestions.append(
-                        f"{metric_name} 최적화 가능: 현재 {measured_value:.1f}도, 최적 {optimal:.1f}도"
-                    )
-                    deduction += 2
-
-        # 점수 계산 (100점 만점에서 감점)
-        score = max(0, 100 - deduction)
-
-        return PhaseDiagnosis(
-            phase=phase_name,
-            score=score,
-            issues=issues,
-            suggestions=suggestions,
-            measured_values=measured_values
-        )
+        return issues, suggestions
 
-    def _load_thresholds(self, club: str) -> dict:
+    def _cells(self, phases: list[PhaseInfo], mask: np.ndarray) -> Iterator[tuple[int, int]]:
         """
-        클럽별 threshold 로드
-
-        Expected structure:
-        {
-            "Backswing": {
-                "left_elbow": {"min": 160, "max": 170, "optimal": 165},
-                "x_factor": {"min": 40, "max": 60, "optimal": 50}
-            },
-            "Downswing": { ... }
-        }
+        mask가 참인 (페이즈, 메트릭) 칸을 페이즈 대표 각도의 순서대로
+        (문구/세부값 순서가 테이블 메트릭 순서가 아니라 측정값 순서를 따르도록)
         """
-        # threshold 파일 경로 (기존 코드의 경로 사용)
-        threshold_file = Path(__file__).parent.parent.parent / "config" / "thresholds" / f"{club}.json"
-
-        if not threshold_file.exists():
-            # fallback: driver 기본값
-            threshold_file = Path(__file__).parent.parent.parent / "config" / "thresholds" / "driver.json"
-
-        if not threshold_file.exists():
-            # 하드코딩된 기본값 (실제로는 파일에서 로드)
-            return self._get_default_thresholds()
-
-        with open(threshold_file, "r", encoding="utf-8") as f:
-            return json.load(f)
-
-    def _get_default_thresholds(self) -> dict:
-        """기본 threshold (파일 없을 때)"""
-        return {
-            "Address": {
-                "left_elbow": {"min": 140, "max": 160, "optimal": 150},
-                "right_knee": {"min": 160, "max": 180, "optimal": 170}
-            },
-            "Backswing": {
-                "left_elbow": {"min": 160, "max": 180, "optimal": 170},
-                "x_factor": {"min": 40, "max": 60, "optimal": 50}
-            },
-            "Top": {
-                "left_elbow": {"min": 150, "max": 170, "optimal": 160},
-                "shoulder_rotation": {"min": 80, "max": 100, "optimal": 90}
-            },
-            "Downswing": {
-                "left_elbow": {"min": 140, "max": 160, "optimal": 150},
-                "x_factor": {"min": 30, "max": 50, "optimal": 40}
-            },
-            "Impact": {
-                "left_elbow": {"min": 160, "max": 180, "optimal": 170},
-                "left_knee": {"min": 160, "max": 180, "optimal": 170}
-            },
-            "Follow-through": {
-                "left_elbow": {"min": 150, "max": 170, "optimal": 160}
+        mask_l = mask.tolist()
+        width = mask.shape[1]
+        for i, phase in enumerate(phases):
+            for metric in phase.representative_angles:
+                j = self._metric_index.get(metric)
+                if j is not None and j < width and mask_l[i][j]:
+                    yield i, j
+
+    def _measured_matrix(self, phases: list[PhaseInfo]) -> tuple[np.ndarray, np.ndarray]:
+        """페이즈 대표 각도 → (테이블 행 인덱스 (N,), 측정값 (N, len(self.metrics)))"""
+        table = self.scorer or self.table
+        rows = np.array([table.phase_index.get(p.name, -1) for p in phases], dtype=np.int64)
+        measured = np.full((len(phases), len(self._metrics)), np.nan)
+        for i, phase in enumerate(phases):
+            for metric, value in phase.representative_angles.items():
+                j = self._metric_index.get(metric)
+                if j is not None and value is not None:
+                    measured[i, j] = value
+        return rows, measured
+
+    def _messages(self, values, below, above, far, phases) -> tuple[list[list[str]], list[list[str]]]:
+        """위반 항목에 대해서만 문구 생성 (페이즈별 issues / suggestions)"""
+        measured, lo, hi, opt = values
+        below_l, above_l = below.tolist(), above.tolist()
+        issues = [[] for _ in phases]
+        suggestions = [[] for _ in phases]
+
+        for i, j in self._cells(phases, below | above | far):
+            metric_name = self.table.metrics[j]
+            value = measured[i][j]
+            if below_l[i][j]:
+                issues[i].append(f"{metric_name} 부족: {value:.1f}도 (최소 {lo[i][j]:.1f}도 필요)")
+                suggestions[i].append(f"{metric_name}을(를) {lo[i][j] - value:.1f}도 증가시키세요")
+            elif above_l[i][j]:
+                issues[i].append(f"{metric_name} 과다: {value:.1f}도 (최대 {hi[i][j]:.1f}도)")
+                suggestions[i].append(f"{metric_name}을(를) {value - hi[i][j]:.1f}도 감소시키세요")
+            else:
+                suggestions[i].append(
+                    f"{metric_name} 최적화 가능: 현재 {value:.1f}도, 최적 {opt[i][j]:.1f}도"
+                )
+        return issues, suggestions
+
+    def _measured_values(self, values, has, phases) -> list[dict]:
+        """세부 측정값 (디버깅용, 페이즈별)"""
+        measured, lo, hi, opt = values
+
+        def _num(v):
+            return None if v != v else v  # NaN → None
+
+        out = [{} for _ in phases]
+        for i, j in self._cells(phases, has):
+            out[i][self.table.metrics[j]] = {
+                "measured": measured[i][j],
+                "threshold_min": _num(lo[i][j]),
+                "threshold_max": _num(hi[i][j]),
+                "optimal": _num(opt[i][j])
             }
-        }
+        return out
@@ -0,0 +1,443 @@
+"""
+진단 룰 DSL
+여러 메트릭 조건을 묶은 코치 룰을 1회 파싱/컴파일해 (페이즈 × 메트릭) 배열 위에서 한 번에 평가
+
+문법 (한 파일에 여러 룰, 줄바꿈은 의미 없음, '#' 이후는 주석):
+
+    rule <name> @ <Phase>[, <Phase>...] | *  :  <condition>
+        => "<issue>" ["<suggestion>"] [deduct <N>]
+
+    condition  := or_expr
+    or_expr    := and_expr ("or" and_expr)*
+    and_expr   := not_expr ("and" not_expr)*
+    not_expr   := "not" not_expr | "(" or_expr ")" | comparison
+    comparison := operand ("<" | "<=" | ">" | ">=" | "==" | "!=") operand
+    operand    := metric | number
+
+페이즈는 PhaseType 이름, 메트릭은 각도 계산기 이름(left_elbow 등) 또는 데이터셋 이름(elbow 등 → 계산기 이름으로 변환)
+모르는 이름은 파싱 단계에서 RuleSyntaxError (오타 난 룰이 조용히 영원히 발동하지 않는 것 방지)
+
+예)
+    rule weak_top_turn @ Top: x_factor < 40 and left_elbow < 150
+        => "상체 회전 부족 + 리드 팔 굽힘" "어깨를 더 돌리고 왼팔을 펴세요" deduct 5
+
+컴파일:
+- 모든 룰의 비교식을 중복 제거한 원자(atom) 목록으로 모으고, 각 룰은 DNF(리터럴 AND 항의 OR)로 변환
+- 평가 = 원자 비교 1회 (R, A) + 행렬곱 2회 → 룰 수가 늘어도 파이썬 루프 없음
+- 측정값이 없는(NaN) 원자는 참/거짓 어느 쪽으로도 성립하지 않음 (not 포함)
+"""
+import logging
+import re
+import threading
+from pathlib import Path
+from typing import Any, Optional, Sequence, Union, get_args
+
+import numpy as np
+
+from app.config.settings import settings
+from app.domain.diagnosis.scoring import METRIC_ALIASES
+from app.schemas.angle_dto import ANGLE_METRIC_NAMES
+from app.schemas.phase_dto import PhaseType
+
+logger = logging.getLogger(__name__)
+
+# 룰 1개당 deduct 생략 시 감점
+RULE_DEDUCTION = 5
+# DNF 전개 시 룰 1개당 최대 항 수 (과도한 or/and 중첩 방지)
+MAX_TERMS_PER_RULE = 256
+
+_TOKEN_PATTERN = re.compile(r"""
+    (?P<ws>\s+|\#[^\n]*)
+  | (?P<string>"(?:[^"\\]|\\.)*")
+  | (?P<number>-?\d+(?:\.\d+)?)
+  | (?P<arrow>=>)
+  | (?P<op><=|>=|==|!=|<|>)
+  | (?P<punct>[():,@*])
+  | (?P<ident>[A-Za-z_][A-Za-z0-9_\-]*)
+""", re.VERBOSE)
+
+_KEYWORDS = {"rule", "and", "or", "not", "deduct"}
+_PHASES = frozenset(get_args(PhaseType))
+_METRICS = frozenset(ANGLE_METRIC_NAMES) | frozenset(METRIC_ALIASES.values())
+_OPS = ("<", "<=", ">", ">=", "==", "!=")
+# 비교 결과표: _TRUTH[op, sign(lhs - rhs) + 1]
+_TRUTH = np.array([
+    [True, False, False],   # <
+    [True, True, False],    # <=
+    [False, False, True],   # >
+    [False, True, True],    # >=
+    [False, True, False],   # ==
+    [True, False, True],    # !=
+])
+
+
+class RuleSyntaxError(ValueError):
+    """룰 파일 문법 오류 (줄:열 포함)"""
+
+
+class Rule:
+    """파싱된 룰 1개 (조건은 AST 그대로 보관, 평가는 RuleSet이 담당)"""
+
+    __slots__ = ("name", "phases", "condition", "source", "issue", "suggestion", "deduction")
+
+    def __init__(self, name: str, phases: Optional[tuple[str, ...]], condition: tuple, source: str,
+                 issue: str, suggestion: Optional[str], deduction: float):
+        self.name = name
+        self.phases = phases          # None = 모든 페이즈
+        self.condition = condition
+        self.source = source          # 조건식 원문 (리포트용)
+        self.issue = issue
+        self.suggestion = suggestion
+        self.deduction = deduction
+
+
+# ========== Parser ==========
+def _tokenize(text: str) -> list[tuple[str, Any, int]]:
+    """(kind, value, offset) 토큰 리스트"""
+    tokens, pos = [], 0
+    while pos < len(text):
+        match = _TOKEN_PATTERN.match(text, pos)
+        if match is None:
+            raise _error(text, pos, f"unexpected character {text[pos]!r}")
+        kind = match.lastgroup
+        value = match.group()
+        if kind == "string":
+            tokens.append(("string", re.sub(r"\\(.)", r"\1", value[1:-1]), pos))
+        elif kind == "number":
+            tokens.append(("number", float(value), pos))
+        elif kind == "ident" and value in _KEYWORDS:
+            tokens.append((value, value, pos))
+        elif kind != "ws":
+            tokens.append((kind if kind in ("ident", "arrow") else value, value, pos))
+        pos = match.end()
+    tokens.append(("eof", None, len(text)))
+    return tokens
+
+
+def _error(text: str, offset: int, message: str) -> RuleSyntaxError:
+    line = text.count("\n", 0, offset) + 1
+    col = offset - (text.rfind("\n", 0, offset) + 1) + 1
+    return RuleSyntaxError(f"line {line}:{col}: {message}")
+
+
+class _Parser:
+    """재귀 하강 파서"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.pos = 0
+
+    def parse(self) -> list[Rule]:
+        rules = []
+        while self._peek() != "eof":
+            rules.append(self._rule())
+        return rules
+
+    def _peek(self) -> str:
+        return self.tokens[self.pos][0]
+
+    def _next(self, *expected: str):
+        kind, value, offset = self.tokens[self.pos]
+        if expected and kind not in expected:
+            raise _error(self.text, offset, f"expected {' or '.join(expected)}, got {value!r}")
+        self.pos += 1
+        return value
+
+    def _rule(self) -> Rule:
+        self._next("rule")
+        name = self._next("ident")
+        self._next("@")
+
+        phases: Optional[tuple[str, ...]] = None
+        if self._peek() == "*":
+            self._next("*")
+        else:
+            names = [self._phase()]
+            while self._peek() == ",":
+                self._next(",")
+                names.append(self._phase())
+            phases = tuple(names)
+        self._next(":")
+
+        start = self.tokens[self.pos][2]
+        condition = self._or()
+        source = self.text[start:self.tokens[self.pos][2]].strip()
+
+        self._next("arrow")
+        issue = self._next("string")
+        suggestion = self._next("string") if self._peek() == "string" else None
+        deduction = float(RULE_DEDUCTION)
+        if self._peek() == "deduct":
+            self._next("deduct")
+            deduction = self._next("number")
+        return Rule(name, phases, condition, " ".join(source.split()), issue, suggestion, deduction)
+
+    def _or(self) -> tuple:
+        items = [self._and()]
+        while self._peek() == "or":
+            self._next("or")
+            items.append(self._and())
+        return items[0] if len(items) == 1 else ("or", items)
+
+    def _and(self) -> tuple:
+        items = [self._not()]
+        while self._peek() == "and":
+            self._next("and")
+            items.append(self._not())
+        return items[0] if len(items) == 1 else ("and", items)
+
+    def _not(self) -> tuple:
+        if self._peek() == "not":
+            self._next("not")
+            return ("not", self._not())
+        if self._peek() == "(":
+            self._next("(")
+            node = self._or()
+            self._next(")")
+            return node
+        return self._comparison()
+
+    def _comparison(self) -> tuple:
+        offset = self.tokens[self.pos][2]
+        lhs = self._operand()
+        op = self._next(*_OPS)
+        rhs = self._operand()
+        if lhs[0] == "num" and rhs[0] == "num":
+            raise _error(self.text, offset, "comparison needs at least one metric")
+        return ("cmp", lhs, op, rhs)
+
+    def _operand(self) -> tuple:
+        if self._peek() == "number":
+            return ("num", self._next("number"))
+        offset = self.tokens[self.pos][2]
+        name = self._next("ident")
+        name = METRIC_ALIASES.get(name, name)
+        if name not in _METRICS:
+            raise _error(self.text, offset, f"unknown metric {name!r} (expected one of {sorted(_METRICS)})")
+        return ("metric", name)
+
+    def _phase(self) -> str:
+        offset = self.tokens[self.pos][2]
+        name = self._next("ident")
+        if name not in _PHASES:
+            raise _error(self.text, offset, f"unknown phase {name!r} (expected one of {sorted(_PHASES)})")
+        return name
+
+
+def parse_rules(text: str) -> list[Rule]:
+    """
+    룰 텍스트 파싱
+
+    Raises:
+        RuleSyntaxError: 문법 오류
+    """
+    rules = _Parser(text).parse()
+    names = [r.name for r in rules]
+    duplicated = sorted({n for n in names if names.count(n) > 1})
+    if duplicated:
+        raise RuleSyntaxError(f"duplicated rule names: {duplicated}")
+    return rules
+
+
+# ========== Compiler ==========
+_FLIP = {"<": ">", "<=": ">=", ">": "<", ">=": "<=", "==": "==", "!=": "!="}
+
+
+def _to_dnf(node: tuple, positive: bool = True) -> list[frozenset]:
+    """AST → DNF (리터럴 (원자키, 극성) 집합의 리스트), not은 리터럴 극성으로 내림"""
+    kind = node[0]
+    if kind == "not":
+        return _to_dnf(node[1], not positive)
+    if kind == "cmp":
+        _, lhs, op, rhs = node
+        if lhs[0] == "num":  # 상수는 항상 오른쪽으로
+            lhs, op, rhs = rhs, _FLIP[op], lhs
+        return [frozenset({((lhs[1], op, rhs), positive)})]
+
+    # 드모르간: not (a and b) = (not a) or (not b)
+    is_and = (kind == "and") == positive
+    parts = [_to_dnf(child, positive) for child in node[1]]
+    if not is_and:
+        return [term for part in parts for term in part]
+
+    terms = [frozenset()]
+    for part in parts:
+        terms = [t | p for t in terms for p in part]
+        if len(terms) > MAX_TERMS_PER_RULE:
+            raise RuleSyntaxError(f"condition expands to more than {MAX_TERMS_PER_RULE} terms")
+    return terms
+
+
+class RuleSet:
+    """
+    컴파일된 룰 묶음
+
+    - metrics: 룰이 참조하는 메트릭 (evaluate 입력 열 순서)
+    - hits / evaluated: 룰별 누적 발동 수 / 평가 대상 페이즈 수
+    """
+
+    def __init__(self, rules: Sequence[Rule], source: Optional[Path] = None):
+        self.rules: tuple[Rule, ...] = tuple(rules)
+        self.source = source
+        self._lock = threading.Lock()
+        self.hits = np.zeros(len(self.rules), dtype=np.int64)
+        self.evaluated = np.zeros(len(self.rules), dtype=np.int64)
+
+        dnfs = [_to_dnf(rule.condition) for rule in self.rules]
+
+        # 원자 (lhs 메트릭, op, rhs) 중복 제거
+        atoms: dict[tuple, int] = {}
+        metrics: list[str] = []
+        for dnf in dnfs:
+            for term in dnf:
+                for atom, _positive in term:
+                    if atom not in atoms:
+                        atoms[atom] = len(atoms)
+                    lhs, _op, rhs = atom
+                    for operand in (("metric", lhs), rhs):
+                        if operand[0] == "metric" and operand[1] not in metrics:
+                            metrics.append(operand[1])
+        self.metrics: tuple[str, ...] = tuple(metrics)
+        metric_index = {m: j for j, m in enumerate(metrics)}
+
+        num_atoms = len(atoms)
+        self._lhs = np.array([metric_index[a[0]] for a in atoms], dtype=np.int64)
+        self._op = np.array([_OPS.index(a[1]) for a in atoms], dtype=np.int64)
+        self._rhs_is_metric = np.array([a[2][0] == "metric" for a in atoms], dtype=bool)
+        self._rhs_index = np.array(
+            [metric_index[a[2][1]] if a[2][0] == "metric" else 0 for a in atoms], dtype=np.int64
+        )
+        self._rhs_const = np.array(
+            [a[2][1] if a[2][0] == "num" else np.nan for a in atoms], dtype=np.float64
+        )
+
+        # 항 행렬: 리터럴 열 (양: atom, 음: num_atoms + atom) → 항, 항 → 룰
+        terms = [(k, term) for k, dnf in enumerate(dnfs) for term in dnf]
+        self._term_literals = np.zeros((2 * num_atoms, len(terms)), dtype=np.float32)
+        self._term_rules = np.zeros((len(terms), len(self.rules)), dtype=np.float32)
+        for t, (k, term) in enumerate(terms):
+            for atom, positive in term:
+                self._term_literals[atoms[atom] + (0 if positive else num_atoms), t] = 1.0
+            self._term_rules[t, k] = 1.0
+        self._term_sizes = self._term_literals.sum(axis=0)
+
+        # 페이즈 게이트: 행 = 페이즈 이름 인덱스 (+ 마지막 행 = 모르는 페이즈)
+        phase_names = sorted({p for r in self.rules if r.phases for p in r.phases})
+        self._phase_index = {p: i for i, p in enumerate(phase_names)}
+        self._phase_mask = np.zeros((len(phase_names) + 1, len(self.rules)), dtype=bool)
+        for k, rule in enumerate(self.rules):
+            if rule.phases is None:
+                self._phase_mask[:, k] = True
+            else:
+                for p in rule.phases:
+                    self._phase_mask[self._phase_index[p], k] = True
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def evaluate(self, phase_names: Sequence[str], measured: np.ndarray, count: bool = True) -> np.ndarray:
+        """
+        룰 평가
+
+        Args:
+            phase_names: (R,) 행별 페이즈 이름
+            measured: (R, len(self.metrics)) 측정값 (없으면 NaN)
+            count: 누적 hit/evaluated 카운터에 반영할지 (재채점 등 오프라인 평가는 False)
+
+        Returns:
+            (R, K) 룰 발동 여부
+        """
+        rows = len(phase_names)
+        if not self.rules:
+            return np.zeros((rows, 0), dtype=bool)
+
+        # 1) 원자 비교 한 번에: sign(lhs - rhs)로 결과표 조회
+        lhs = measured[:, self._lhs]
+        rhs = np.where(self._rhs_is_metric, measured[:, self._rhs_index], self._rhs_const)
+        known = ~(np.isnan(lhs) | np.isnan(rhs))
+        sign = np.sign(np.where(known, lhs - rhs, 0.0)).astype(np.int64)
+        truth = _TRUTH[self._op, sign + 1]
+        literals = np.concatenate([truth & known, ~truth & known], axis=1).astype(np.float32)
+
+        # 2) 항 = 리터럴 전부 참, 룰 = 항 중 하나라도 참
+        term_hit = (literals @ self._term_literals) >= self._term_sizes
+        rule_hit = (term_hit.astype(np.float32) @ self._term_rules) > 0
+
+        # 3) 페이즈 게이트
+        gate_rows = np.array(
+            [self._phase_index.get(p, len(self._phase_index)) for p in phase_names], dtype=np.int64
+        )
+        gate = self._phase_mask[gate_rows]
+        hits = rule_hit & gate
+
+        if count:
+            with self._lock:
+                self.hits += hits.sum(axis=0)
+                self.evaluated += gate.sum(axis=0)
+        return hits
+
+    def stats(self) -> list[dict]:
+        """룰별 정의 + 누적 카운터"""
+        with self._lock:
+            hits, evaluated = self.hits.tolist(), self.evaluated.tolist()
+        return [
+            {
+                "name": rule.name,
+                "phases": list(rule.phases) if rule.phases else ["*"],
+                "condition": rule.source,
+                "issue": rule.issue,
+                "suggestion": rule.suggestion,
+                "deduction": rule.deduction,
+                "hits": hits[k],
+                "evaluated": evaluated[k],
+                "hit_rate": hits[k] / evaluated[k] if evaluated[k] else 0.0,
+            }
+            for k, rule in enumerate(self.rules)
+        ]
+
+
+def compile_rules(text: str, source: Optional[Path] = None) -> RuleSet:
+    """룰 텍스트 → RuleSet"""
+    return RuleSet(parse_rules(text), source=source)
+
+
+class RuleCache:
+    """
+    룰 파일 캐시 (mtime이 바뀌면 다시 컴파일, 문법 오류면 이전 룰 유지)
+
+    다시 컴파일하면 hit 카운터는 새로 시작한다.
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None):
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._entry: tuple[int, RuleSet] = (-1, RuleSet([]))
+
+    def get(self) -> RuleSet:
+        """현재 룰셋 (파일이 없으면 빈 룰셋)"""
+        path = self.path or Path(settings.DIAGNOSIS_RULES_FILE)
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            mtime = -1
+
+        entry = self._entry
+        if entry[0] == mtime:
+            return entry[1]
+
+        with self._lock:
+            if self._entry[0] != mtime and mtime == -1:
+                self._entry = (-1, RuleSet([]))
+            elif self._entry[0] != mtime:
+                try:
+                    self._entry = (mtime, compile_rules(path.read_text(encoding="utf-8"), source=path))
+                    logger.info(f"📐 진단 룰 {len(self._entry[1])}개 컴파일: {path}")
+                except RuleSyntaxError as e:
+                    logger.error(f"❌ 진단 룰 문법 오류, 이전 룰 유지 ({path}): {e}")
+                    self._entry = (mtime, self._entry[1])
+            return self._entry[1]
+
+
+# 프로세스 전역 캐시
+rule_cache = RuleCache()
@@ -0,0 +1,170 @@
+"""
+분포 기반 진단 점수
+P2~P9 분포 테이블(DistributionTable)을 엔진 페이즈/메트릭 기준 CDF 테이블로 컴파일해
+z-score / 백분위를 전 페이즈·전 메트릭 한 번에 계산
+"""
+import numpy as np
+from scipy.stats import norm
+
+from app.domain.diagnosis.distributions import DistributionTable
+
+# P 포지션 → 엔진 페이즈 (Address는 분포 없음)
+PHASE_POSITIONS: dict[str, tuple[str, ...]] = {
+    "Backswing": ("P2", "P3"),
+    "Top": ("P4",),
+    "Downswing": ("P5", "P6"),
+    "Impact": ("P7",),
+    "Follow-through": ("P8", "P9"),
+}
+
+# 데이터셋 메트릭 이름 → 각도 계산기 메트릭 이름 (좌타는 미러링되므로 리드 사이드 = left)
+METRIC_ALIASES: dict[str, str] = {
+    "elbow": "left_elbow",
+    "knee": "left_knee",
+    "shoulder_turn": "shoulder_rotation",
+    "hip_turn": "hip_rotation",
+    "x_factor": "x_factor",
+    "spine_tilt": "spine_tilt",
+}
+
+# CDF 테이블 분위 레벨 (양 끝 0/1은 정규분포 역함수가 무한대라 제외)
+CDF_LEVELS = np.linspace(0.001, 0.999, 199)
+CDF_LEVELS.setflags(write=False)
+
+
+class DistributionScores:
+    """scorer.score() 결과 (행: 입력 페이즈, 열: scorer.metrics)"""
+
+    __slots__ = ("z", "percentile", "available")
+
+    def __init__(self, z: np.ndarray, percentile: np.ndarray, available: np.ndarray):
+        self.z = z                    # (N, M) z-score, 판정 불가 칸은 NaN
+        self.percentile = percentile  # (N, M) 0~100 백분위, 판정 불가 칸은 NaN
+        self.available = available    # (N, M) 분포와 측정값이 모두 있는 칸
+
+
+class DistributionScorer:
+    """
+    엔진 페이즈 기준 분포 CDF 테이블
+
+    - 여러 P 포지션이 한 페이즈에 속하면 분위 함수를 평균 (Vincentization)
+    - bins가 실제 값 분위 엣지이면 경험 CDF, 0~1 분위 레벨만 들어 있으면 mean/std로 정규 CDF 합성
+    - 조회: 칸마다 [c, c+1) 구간으로 단조 변환한 1차원 키 배열에 np.searchsorted 1회
+    """
+
+    def __init__(self, table: DistributionTable, min_n: int = 1):
+        """
+        Args:
+            table: P2~P9 분포 테이블
+            min_n: 이보다 표본이 적은 분포는 사용하지 않음
+        """
+        self.phases: tuple[str, ...] = tuple(
+            phase for phase, positions in PHASE_POSITIONS.items()
+            if any(p in table.phase_index for p in positions)
+        )
+        self.metrics: tuple[str, ...] = tuple(
+            METRIC_ALIASES.get(m, m) for m in table.metrics
+        )
+        self.phase_index = {p: i for i, p in enumerate(self.phases)}
+        self.metric_index = {m: j for j, m in enumerate(self.metrics)}
+
+        num_levels = len(CDF_LEVELS)
+        shape = (len(self.phases), len(self.metrics))
+        grid = np.full(shape + (num_levels,), np.nan)
+        mean = np.full(shape, np.nan)
+        std = np.full(shape, np.nan)
+
+        for i, phase in enumerate(self.phases):
+            rows = [table.phase_index[p] for p in PHASE_POSITIONS[phase] if p in table.phase_index]
+            for j in range(len(self.metrics)):
+                members = [
+                    r for r in rows
+                    if table.n[r, j] >= min_n and np.isfinite(table.std[r, j]) and table.std[r, j] > 0
+                ]
+                if not members:
+                    continue
+                grid[i, j] = np.mean([_quantile_grid(table, r, j) for r in members], axis=0)
+                mean[i, j] = np.mean(table.mean[members, j])
+                std[i, j] = np.sqrt(np.mean(table.std[members, j] ** 2))
+
+        self.grid = grid
+        self.mean = mean
+        self.std = std
+        self.present = ~np.isnan(mean)
+
+        # 마지막에 빈 행 1개: 분포가 없는 페이즈는 인덱스 -1로 이 행을 선택
+        self.mean_rows = np.vstack([mean, np.full((1, shape[1]), np.nan)])
+        self.std_rows = np.vstack([std, np.full((1, shape[1]), np.nan)])
+        self.present_rows = np.vstack([self.present, np.zeros((1, shape[1]), dtype=bool)])
+
+        # searchsorted용 평탄화 키: 칸 c의 그리드를 c + t(x) ∈ (c, c+1)로 변환 (t는 단조)
+        cells = np.arange(grid.shape[0] * grid.shape[1], dtype=np.float64)
+        flat_grid = grid.reshape(-1, num_levels)
+        center = np.nan_to_num(mean.reshape(-1, 1))
+        scale = np.nan_to_num(std.reshape(-1, 1), nan=1.0)
+        self._grid_flat = flat_grid
+        self._keys = (cells[:, None] + _squash(np.nan_to_num(flat_grid, nan=0.0), center, scale)).ravel()
+        self._center = center.ravel()
+        self._scale = scale.ravel()
+
+        for arr in (self.grid, self.mean, self.std, self.present, self.mean_rows, self.std_rows,
+                    self.present_rows, self._grid_flat, self._keys, self._center, self._scale):
+            arr.setflags(write=False)
+
+    def rows_for(self, phase_names: list[str]) -> np.ndarray:
+        """페이즈 이름 → 테이블 행 인덱스 (없으면 -1)"""
+        return np.array([self.phase_index.get(p, -1) for p in phase_names], dtype=np.int64)
+
+    def score(self, rows: np.ndarray, measured: np.ndarray) -> DistributionScores:
+        """
+        측정값의 z-score / 백분위 (전 칸 한 번에)
+
+        Args:
+            rows: (N,) 테이블 행 인덱스 (-1 = 분포 없음)
+            measured: (N, M) 측정값 (열 순서 = self.metrics, 없으면 NaN)
+
+        Returns:
+            DistributionScores
+        """
+        num_levels = len(CDF_LEVELS)
+        available = self.present_rows[rows] & ~np.isnan(measured)
+        z = np.where(available, (measured - self.mean_rows[rows]) / self.std_rows[rows], np.nan)
+
+        # 사용 가능한 칸만 평탄화해서 1회 조회
+        ii, jj = np.nonzero(available)
+        cells = rows[ii] * len(self.metrics) + jj
+        values = measured[ii, jj]
+        query = cells + _squash(values, self._center[cells], self._scale[cells])
+        k = np.searchsorted(self._keys, query, side="right") - cells * num_levels
+
+        # 그리드 구간 내 선형 보간 (그리드 밖은 양 끝 레벨로 고정)
+        k_hi = np.clip(k, 1, num_levels - 1)
+        x_lo = self._grid_flat[cells, k_hi - 1]
+        x_hi = self._grid_flat[cells, k_hi]
+        width = x_hi - x_lo
+        frac = np.clip(np.divide(values - x_lo, width, out=np.zeros_like(values), where=width > 0), 0.0, 1.0)
+        levels = CDF_LEVELS[k_hi - 1] + frac * (CDF_LEVELS[k_hi] - CDF_LEVELS[k_hi - 1])
+
+        percentile = np.full(measured.shape, np.nan)
+        percentile[ii, jj] = 100.0 * levels
+        return DistributionScores(z=z, percentile=percentile, available=available)
+
+
+def _quantile_grid(table: DistributionTable, row: int, col: int) -> np.ndarray:
+    """분포 1칸의 분위 함수를 CDF_LEVELS 위에서 샘플링"""
+    bins = table.bins[row, col]
+    bins = bins[~np.isnan(bins)]
+    if len(bins) >= 2 and not _is_level_grid(bins) and bins[-1] > bins[0]:
+        return np.interp(CDF_LEVELS, np.linspace(0.0, 1.0, len(bins)), bins)
+    return table.mean[row, col] + table.std[row, col] * norm.ppf(CDF_LEVELS)
+
+
+def _is_level_grid(bins: np.ndarray) -> bool:
+    """bins가 값이 아니라 0~1 분위 레벨 자체인지 (현재 운영 파일 형식)"""
+    return bool(np.allclose(bins, np.linspace(0.0, 1.0, len(bins))))
+
+
+def _squash(x: np.ndarray, center: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    """(-inf, inf) → (0, 1) 단조 변환 (칸별 중심/스케일로 정규화해 정밀도 유지)"""
+    return 0.5 + np.arctan((x - center) / scale) / np.pi
+
@@ -0,0 +1,138 @@
+"""
+진단 Threshold 테이블
+클럽별 threshold JSON을 프로세스 전역으로 1회 로드하고 (phase, metric) 배열로 컴파일
+"""
+import json
+import threading
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+# 클럽별 threshold 파일 위치 (app/config/thresholds/<club>.json)
+THRESHOLDS_DIR = Path(__file__).parent.parent.parent / "config" / "thresholds"
+
+# 파일이 없을 때 쓰는 기본 threshold
+DEFAULT_THRESHOLDS: dict = {
+    "Address": {
+        "left_elbow": {"min": 140, "max": 160, "optimal": 150},
+        "right_knee": {"min": 160, "max": 180, "optimal": 170}
+    },
+    "Backswing": {
+        "left_elbow": {"min": 160, "max": 180, "optimal": 170},
+        "x_factor": {"min": 40, "max": 60, "optimal": 50}
+    },
+    "Top": {
+        "left_elbow": {"min": 150, "max": 170, "optimal": 160},
+        "shoulder_rotation": {"min": 80, "max": 100, "optimal": 90}
+    },
+    "Downswing": {
+        "left_elbow": {"min": 140, "max": 160, "optimal": 150},
+        "x_factor": {"min": 30, "max": 50, "optimal": 40}
+    },
+    "Impact": {
+        "left_elbow": {"min": 160, "max": 180, "optimal": 170},
+        "left_knee": {"min": 160, "max": 180, "optimal": 170}
+    },
+    "Follow-through": {
+        "left_elbow": {"min": 150, "max": 170, "optimal": 160}
+    }
+}
+
+
+class ThresholdTable:
+    """
+    컴파일된 threshold 테이블
+
+    - phases / metrics: 행/열 이름
+    - min / max / optimal: (P, M) float 배열, 값이 없으면 NaN
+    - raw: 원본 dict (디버깅/하위 호환용)
+    """
+
+    def __init__(self, raw: dict):
+        self.raw = raw
+        self.phases: tuple[str, ...] = tuple(raw)
+        metrics: list[str] = []
+        for block in raw.values():
+            metrics.extend(m for m in block if m not in metrics)
+        self.metrics: tuple[str, ...] = tuple(metrics)
+
+        self.phase_index = {p: i for i, p in enumerate(self.phases)}
+        self.metric_index = {m: j for j, m in enumerate(self.metrics)}
+
+        shape = (len(self.phases), len(self.metrics))
+        self.min = np.full(shape, np.nan)
+        self.max = np.full(shape, np.nan)
+        self.optimal = np.full(shape, np.nan)
+        self.present = np.zeros(shape, dtype=bool)
+
+        for i, block in enumerate(raw.values()):
+            for metric, spec in block.items():
+                j = self.metric_index[metric]
+                self.present[i, j] = True
+                for key, arr in (("min", self.min), ("max", self.max), ("optimal", self.optimal)):
+                    if spec.get(key) is not None:
+                        arr[i, j] = float(spec[key])
+
+        # 마지막에 빈 행 1개를 덧붙인 버전: 테이블에 없는 페이즈는 인덱스 -1로 이 행을 선택
+        self.min_rows = np.vstack([self.min, np.full((1, shape[1]), np.nan)])
+        self.max_rows = np.vstack([self.max, np.full((1, shape[1]), np.nan)])
+        self.optimal_rows = np.vstack([self.optimal, np.full((1, shape[1]), np.nan)])
+        self.present_rows = np.vstack([self.present, np.zeros((1, shape[1]), dtype=bool)])
+
+        for arr in (
+            self.min, self.max, self.optimal, self.present,
+            self.min_rows, self.max_rows, self.optimal_rows, self.present_rows
+        ):
+            arr.setflags(write=False)  # 요청 간 공유되므로 읽기 전용
+
+
+class ThresholdCache:
+    """
+    클럽별 ThresholdTable 캐시 (파일 mtime이 바뀌면 다시 로드)
+
+    요청마다 DiagnosisEngine을 생성해도 파일은 stat만 하고 파싱/컴파일은 변경 시 1회
+    """
+
+    def __init__(self, thresholds_dir: Path = THRESHOLDS_DIR):
+        self.thresholds_dir = Path(thresholds_dir)
+        self._lock = threading.Lock()
+        self._entries: dict[Optional[Path], tuple[int, ThresholdTable]] = {}
+
+    def get(self, club: str) -> ThresholdTable:
+        """클럽 threshold 테이블 (파일 없으면 driver.json → 기본값 순으로 대체)"""
+        path = self._resolve(club)
+        mtime = path.stat().st_mtime_ns if path is not None else 0
+
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[0] != mtime:
+                entry = (mtime, ThresholdTable(self._read(path)))
+                self._entries[path] = entry
+            return entry[1]
+
+    def clear(self) -> None:
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+    def _resolve(self, club: str) -> Optional[Path]:
+        for name in (f"{club}.json", "driver.json"):
+            path = self.thresholds_dir / name
+            if path.is_file():
+                return path
+        return None
+
+    def _read(self, path: Optional[Path]) -> dict:
+        if path is None:
+            return DEFAULT_THRESHOLDS
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+
+# 프로세스 전역 캐시
+threshold_cache = ThresholdCache()
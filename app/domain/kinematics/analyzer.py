@@ -0,0 +1,160 @@
+"""
+키네마틱스 Domain Logic
+각도 배열 → 각속도/각가속도 + 키네마틱 시퀀스
+"""
+from typing import Optional
+
+import numpy as np
+from scipy.signal import savgol_filter
+
+from app.domain.phase.filters import fit_filter_params
+from app.schemas.angle_dto import AngleCalculationResult, ANGLE_METRIC_NAMES
+from app.schemas.kinematics_dto import (
+    KINEMATIC_SEGMENTS,
+    KinematicSequence,
+    KinematicsResult,
+    SegmentPeak,
+)
+from app.schemas.pose_dto import PoseData
+
+
+class KinematicsAnalyzer:
+    """각도 시계열의 1·2차 미분 계산기"""
+
+    def __init__(
+        self,
+        swing_direction: str = "right",
+        window_length: int = 11,
+        polyorder: int = 3
+    ):
+        """
+        Args:
+            swing_direction: "right" (우타) 또는 "left" (좌타)
+            window_length: Savitzky-Golay 윈도우 길이 (홀수)
+            polyorder: Savitzky-Golay 다항식 차수 (2 이상)
+        """
+        self.swing_direction = swing_direction
+        self.window_length = window_length
+        self.polyorder = polyorder
+
+    def analyze(
+        self,
+        angles: AngleCalculationResult,
+        poses: list[PoseData],
+        fps: float,
+        window: Optional[tuple[int, int]] = None
+    ) -> KinematicsResult:
+        """
+        모든 메트릭의 속도/가속도를 한 번에 계산
+
+        Process:
+        1. 각도 + 주도 손목 좌표를 (N, M+2) 행렬로 결합
+        2. 누락 프레임을 선형 보간해 균일 프레임 그리드로 리샘플링
+        3. Savitzky-Golay 미분 필터(deriv=1, 2)를 axis=0으로 한 번씩 적용
+        4. 세그먼트별 피크 시점 → 키네마틱 시퀀스
+
+        Args:
+            angles: 각도 계산 결과
+            poses: 포즈 데이터 리스트 (angles와 같은 순서)
+            fps: 프레임 레이트
+            window: 피크 탐색 구간 (시작 프레임, 끝 프레임), None이면 전체
+
+        Returns:
+            KinematicsResult
+        """
+        if len(angles.values) < 3:
+            raise ValueError("Cannot compute kinematics - too few frames")
+
+        # 1. 각도(회전각 wrap 해제) + 주도 손목 xy
+        wrist = "left_wrist" if self.swing_direction == "right" else "right_wrist"
+        wrist_xy = np.array(
+            [[getattr(p, wrist).x, getattr(p, wrist).y] for p in poses], dtype=np.float64
+        )
+        channels = np.hstack([np.unwrap(angles.values, period=360.0, axis=0), wrist_xy])
+
+        # 2. 균일 그리드
+        frame_numbers, channels = self._resample_uniform(angles.frame_numbers, channels)
+
+        # 3. fps 스케일링된 미분 (delta = 프레임 간격(초))
+        window_length, polyorder = fit_filter_params(len(frame_numbers), self.window_length, self.polyorder)
+        polyorder = max(polyorder, 2)  # 2차 미분을 위해 최소 2 (len >= 3 이므로 window_length >= 3)
+        delta = 1.0 / fps
+        d1 = savgol_filter(channels, window_length, polyorder, deriv=1, delta=delta, axis=0)
+        d2 = savgol_filter(channels, window_length, polyorder, deriv=2, delta=delta, axis=0)
+
+        n_metrics = len(ANGLE_METRIC_NAMES)
+        velocity, acceleration = d1[:, :n_metrics], d2[:, :n_metrics]
+        lead_wrist_speed = np.linalg.norm(d1[:, n_metrics:], axis=1)
+
+        # 4. 키네마틱 시퀀스
+        sequence = self._kinematic_sequence(
+            frame_numbers, velocity, lead_wrist_speed, fps, window
+        )
+
+        return KinematicsResult(
+            fps=fps,
+            frame_numbers=frame_numbers,
+            velocity=velocity,
+            acceleration=acceleration,
+            lead_wrist_speed=lead_wrist_speed,
+            sequence=sequence
+        )
+
+    def _resample_uniform(
+        self, frame_numbers: np.ndarray, channels: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """가시성 필터로 빠진 프레임을 선형 보간 (전 채널 동시 처리)"""
+        grid = np.arange(frame_numbers[0], frame_numbers[-1] + 1)
+        if len(grid) == len(frame_numbers):
+            return grid, channels
+
+        # grid 각 점의 오른쪽 샘플 인덱스 → 좌/우 가중치
+        right = np.clip(np.searchsorted(frame_numbers, grid), 1, len(frame_numbers) - 1)
+        left = right - 1
+        span = (frame_numbers[right] - frame_numbers[left]).astype(np.float64)
+        w = ((grid - frame_numbers[left]) / span)[:, None]
+        return grid, channels[left] * (1.0 - w) + channels[right] * w
+
+    def _kinematic_sequence(
+        self,
+        frame_numbers: np.ndarray,
+        velocity: np.ndarray,
+        lead_wrist_speed: np.ndarray,
+        fps: float,
+        window: Optional[tuple[int, int]]
+    ) -> KinematicSequence:
+        """세그먼트별 |속도| 피크를 찾아 순서 결정"""
+        lead_elbow = "left_elbow" if self.swing_direction == "right" else "right_elbow"
+        cols = [
+            ANGLE_METRIC_NAMES.index("hip_rotation"),
+            ANGLE_METRIC_NAMES.index("shoulder_rotation"),
+            ANGLE_METRIC_NAMES.index(lead_elbow),
+        ]
+        # (T, 4): hips, shoulders, arms, wrists
+        speeds = np.column_stack([np.abs(velocity[:, cols]), lead_wrist_speed])
+
+        mask = np.ones(len(frame_numbers), dtype=bool)
+        if window is not None:
+            mask = (frame_numbers >= window[0]) & (frame_numbers <= window[1])
+            if not mask.any():
+                mask[:] = True
+
+        masked = np.where(mask[:, None], speeds, -np.inf)
+        peak_idx = np.argmax(masked, axis=0)
+
+        peaks = [
+            SegmentPeak(
+                segment=segment,
+                frame=int(frame_numbers[idx]),
+                time=float(frame_numbers[idx] / fps),
+                peak_velocity=float(speeds[idx, k])
+            )
+            for k, (segment, idx) in enumerate(zip(KINEMATIC_SEGMENTS, peak_idx))
+        ]
+        order = [KINEMATIC_SEGMENTS[k] for k in np.argsort(peak_idx, kind="stable")]
+
+        return KinematicSequence(
+            order=order,
+            peaks=peaks,
+            is_ideal_order=tuple(order) == KINEMATIC_SEGMENTS
+        )
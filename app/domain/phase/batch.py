@@ -0,0 +1,177 @@
+"""
+배치 페이즈 감지 Domain Logic
+여러 스윙의 손목 Y좌표 시계열을 2D 배열로 묶어 한 번에 스무딩 + 전환점 탐색
+"""
+import logging
+from typing import Optional, Sequence
+
+import numpy as np
+
+from app.domain.phase.detector import PhaseDetector
+from app.domain.phase.filters import fit_filter_params, savgol_dot_coeffs
+
+logger = logging.getLogger(__name__)
+
+
+class BatchPhaseDetector:
+    """
+    PhaseDetector._find_transition_points의 배치 버전 (데이터셋 재구축/백필용)
+
+    - 스무딩: 캐시된 Savitzky-Golay 계수로 (B, T) 배열을 한 번에 평활
+      (savgol_filter mode="interp"와 동일한 결과)
+    - Top: 전역 최고점, Impact: Top 이후 최저점 (prominence 조건을 누적 min/max로 벡터 검사)
+    - 벡터 판정이 애매한 스윙(plateau, 끝점 극값 등)만 PhaseDetector 규칙으로 개별 처리
+    """
+
+    def __init__(self, window_length: int = 11, polyorder: int = 3, prominence: float = 0.05):
+        """
+        Args:
+            window_length: 스무딩 윈도우 길이 (홀수)
+            polyorder: 스무딩 다항식 차수
+            prominence: Top/Impact로 인정할 최소 prominence (PhaseDetector와 동일)
+        """
+        self.window_length = window_length
+        self.polyorder = polyorder
+        self.prominence = prominence
+        self._fallback = PhaseDetector()
+
+    def detect_transitions(self, series: Sequence[np.ndarray]) -> list[Optional[dict[str, int]]]:
+        """
+        스윙별 전환점 감지
+
+        Args:
+            series: 스윙별 주도 손목 Y좌표 1D 배열 리스트 (길이가 달라도 됨)
+
+        Returns:
+            스윙별 전환점 dict (PhaseDetector._find_transition_points와 같은 키),
+            감지 실패 시 None
+        """
+        results: list[Optional[dict[str, int]]] = [None] * len(series)
+        lengths = np.array([len(s) for s in series], dtype=np.int64)
+
+        # 윈도우보다 짧은 시퀀스는 필터 파라미터가 달라 개별 처리
+        full = np.flatnonzero(lengths >= self.window_length)
+        for i in np.flatnonzero(lengths < self.window_length):
+            results[i] = self._detect_single(np.asarray(series[i], dtype=np.float64))
+
+        if len(full) == 0:
+            return results
+
+        smoothed, sub_lengths = self.smooth([series[i] for i in full])
+        tops, impacts, ok = self._vector_extrema(smoothed, sub_lengths)
+
+        for row, i in enumerate(full):
+            length = int(sub_lengths[row])
+            if ok[row]:
+                results[i] = self._transitions(int(tops[row]), int(impacts[row]), length)
+            else:
+                results[i] = self._fallback_transitions(smoothed[row, :length])
+        return results
+
+    def smooth(self, series: Sequence[np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        시계열을 (B, T_max) 배열로 패딩 후 축 방향 스무딩
+
+        Args:
+            series: 길이가 window_length 이상인 1D 배열 리스트
+
+        Returns:
+            (smoothed, lengths) - smoothed의 각 행은 lengths[i] 이후가 NaN
+        """
+        lengths = np.array([len(s) for s in series], dtype=np.int64)
+        window = self.window_length
+        if len(lengths) and lengths.min() < window:
+            raise ValueError(f"All series must have at least {window} samples")
+
+        batch, t_max = len(series), int(lengths.max()) if len(lengths) else 0
+        padded = np.full((batch, t_max), np.nan, dtype=np.float64)
+        for row, s in enumerate(series):
+            padded[row, :len(s)] = s
+
+        half = window // 2
+        out = np.full_like(padded, np.nan)
+
+        # 내부 구간: 중앙 계수와 슬라이딩 윈도우 내적
+        center = savgol_dot_coeffs(window, self.polyorder)
+        windows = np.lib.stride_tricks.sliding_window_view(padded, window, axis=1)
+        out[:, half:t_max - half] = windows @ center
+
+        # 가장자리: 첫/마지막 윈도우에 위치별 다항식 적합 계수 적용 (mode="interp")
+        edge = np.stack([savgol_dot_coeffs(window, self.polyorder, pos) for pos in range(window)])
+        out[:, :half] = padded[:, :window] @ edge[:half].T
+        last_idx = lengths[:, None] - window + np.arange(window)
+        last = np.take_along_axis(padded, last_idx, axis=1)
+        tail_idx = lengths[:, None] - half + np.arange(half)
+        np.put_along_axis(out, tail_idx, last @ edge[half + 1:].T, axis=1)
+
+        # 패딩 구간은 NaN 유지
+        out[np.arange(t_max)[None, :] >= lengths[:, None]] = np.nan
+        return out, lengths
+
+    def _vector_extrema(
+        self,
+        smoothed: np.ndarray,
+        lengths: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Top/Impact 인덱스와 벡터 판정 성공 여부"""
+        batch, t_max = smoothed.shape
+        rows = np.arange(batch)
+        valid = np.arange(t_max)[None, :] < lengths[:, None]
+
+        # Top: 전역 최고점 (prominence = 값 - max(왼쪽 최소, 오른쪽 최소))
+        tops = np.argmax(np.where(valid, smoothed, -np.inf), axis=1)
+        top_val = smoothed[rows, tops]
+        lo_filled = np.where(valid, smoothed, np.inf)
+        prefix_min = np.minimum.accumulate(lo_filled, axis=1)
+        suffix_min = np.minimum.accumulate(lo_filled[:, ::-1], axis=1)[:, ::-1]
+        top_prom = top_val - np.maximum(prefix_min[rows, tops], suffix_min[rows, tops])
+
+        # Impact: Top 이후 최저점 (prominence = 이후 최고값 - 값)
+        after = valid & (np.arange(t_max)[None, :] > tops[:, None])
+        impacts = np.argmin(np.where(after, smoothed, np.inf), axis=1)
+        impact_val = smoothed[rows, impacts]
+        hi_filled = np.where(after, smoothed, -np.inf)
+        suffix_max = np.maximum.accumulate(hi_filled[:, ::-1], axis=1)[:, ::-1]
+        impact_prom = suffix_max[rows, impacts] - impact_val
+
+        # 끝점 극값/plateau는 find_peaks 규칙과 달라질 수 있어 개별 처리
+        last = lengths - 1
+        prev_top = smoothed[rows, np.maximum(tops - 1, 0)]
+        next_top = smoothed[rows, np.minimum(tops + 1, last)]
+        prev_imp = smoothed[rows, np.maximum(impacts - 1, 0)]
+        next_imp = smoothed[rows, np.minimum(impacts + 1, last)]
+        ok = (
+            (tops > 0) & (tops < last) & (prev_top < top_val) & (next_top < top_val)
+            & (impacts > tops) & (impacts < last) & (prev_imp > impact_val) & (next_imp > impact_val)
+            & (top_prom >= self.prominence) & (impact_prom >= self.prominence)
+        )
+        return tops, impacts, ok
+
+    def _transitions(self, top: int, impact: int, length: int) -> dict[str, int]:
+        """PhaseDetector._find_transition_points와 같은 형태의 전환점"""
+        address_end = int(length * 0.05)
+        return {
+            "address_end": address_end,
+            "backswing_start": address_end + 1,
+            "top": top,
+            "downswing_start": top + 1,
+            "impact": impact,
+            "follow_start": impact + 1,
+            "video_end": length - 1
+        }
+
+    def _fallback_transitions(self, smoothed: np.ndarray) -> Optional[dict[str, int]]:
+        """이미 스무딩된 시계열에 PhaseDetector 규칙 적용"""
+        try:
+            points = self._fallback._find_transition_points(smoothed)
+        except ValueError:
+            return None
+        return {key: int(value) for key, value in points.items()}
+
+    def _detect_single(self, signal: np.ndarray) -> Optional[dict[str, int]]:
+        """짧은 시퀀스: 길이에 맞춘 필터로 개별 처리"""
+        window_length, polyorder = fit_filter_params(len(signal), self.window_length, self.polyorder)
+        if window_length <= polyorder or polyorder < 0:
+            return None
+        smoothed = self._fallback._smooth_signal(signal, self.window_length, self.polyorder)
+        return self._fallback_transitions(smoothed)
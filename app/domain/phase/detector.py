@@ -2,28 +2,64 @@
 페이즈 감지 Domain Logic
 손목 Y좌표 변화로 6단계 스윙 페이즈 감지
 """
+import logging
+from typing import Optional
+
 import numpy as np
 from scipy.signal import savgol_filter, find_peaks
 
-from app.schemas.angle_dto import AngleMetrics
+from app.config.settings import settings
+from app.domain.angle.calculator import poses_to_xy, _KP
+from app.domain.phase.filters import fit_filter_params
+from app.schemas.angle_dto import AngleCalculationResult
 from app.schemas.phase_dto import PhaseDetectionResult, PhaseInfo
 from app.schemas.pose_dto import PoseData
 
+# 페이즈 대표 각도로 내보내는 메트릭
+REPRESENTATIVE_METRICS: tuple[str, ...] = (
+    "left_elbow",
+    "right_elbow",
+    "left_knee",
+    "right_knee",
+    "x_factor",
+    "shoulder_rotation",
+    "hip_rotation",
+)
+
+# ML 모델 출력 클래스 중 전환점으로 쓰는 라벨 (P4 = Top, P7 = Impact)
+ML_TOP_CLASS = "P4"
+ML_IMPACT_CLASS = "P7"
+
+logger = logging.getLogger(__name__)
+
 
 class PhaseDetector:
     """스윙 6단계 페이즈 감지기"""
 
-    def __init__(self, swing_direction: str = "right"):
+    def __init__(
+        self,
+        swing_direction: str = "right",
+        method: Optional[str] = None,
+        inference_server=None,
+        ml_min_confidence: float = 0.5
+    ):
         """
         Args:
             swing_direction: "right" (우타) 또는 "left" (좌타)
+            method: "rule" | "ml" | "auto" (None = settings.PHASE_METHOD)
+                auto는 ML 결과가 없거나 불확실하면 규칙 기반으로 대체
+            inference_server: PhaseInferenceServer (None = settings 모델로 지연 생성)
+            ml_min_confidence: ML Top/Impact 확률이 이 값 미만이면 불확실로 간주
         """
         self.swing_direction = swing_direction
+        self.method = method or settings.PHASE_METHOD
+        self.inference_server = inference_server
+        self.ml_min_confidence = ml_min_confidence
 
     def detect(
         self,
         poses: list[PoseData],
-        angles: list[AngleMetrics],
+        angles: AngleCalculationResult,
         fps: float
     ) -> PhaseDetectionResult:
         """
@@ -37,23 +73,30 @@ class PhaseDetector:
 
         Args:
             poses: 포즈 데이터 리스트
-            angles: 각도 데이터 리스트
+            angles: 각도 계산 결과 (배열 기반)
             fps: 프레임 레이트
 
         Returns:
             PhaseDetectionResult (6개 페이즈 정보)
         """
-        # 1. 주도 손목 선택 (우타: 왼손, 좌타: 오른손)
-        wrist_y_coords = self._extract_wrist_y_coords(poses)
+        transition_frames = None
+        if self.method in ("ml", "auto"):
+            transition_frames = self._find_transition_points_ml(poses, angles)
+            if transition_frames is None and self.method == "ml":
+                raise ValueError("Cannot detect swing phases - ML phase model unavailable or uncertain")
 
-        # 2. Savitzky-Golay 필터 적용 (노이즈 제거)
-        smoothed = self._smooth_signal(wrist_y_coords)
+        if transition_frames is None:
+            # 1. 주도 손목 선택 (우타: 왼손, 좌타: 오른손)
+            wrist_y_coords = self._extract_wrist_y_coords(poses)
 
-        # 3. 전환점 감지
-        transition_frames = self._find_transition_points(smoothed)
+            # 2. Savitzky-Golay 필터 적용 (노이즈 제거)
+            smoothed = self._smooth_signal(wrist_y_coords)
+
+            # 3. 전환점 감지
+            transition_frames = self._find_transition_points(smoothed)
 
         # 4. 6단계 페이즈 생성
-        phases = self._create_phases(transition_frames, poses, angles, fps)
+        phases = self._create_phases(transition_frames, angles, fps)
 
         return PhaseDetectionResult(phases=phases)
 
@@ -70,12 +113,7 @@ class PhaseDetector:
 
     def _smooth_signal(self, signal: np.ndarray, window_length: int = 11, polyorder: int = 3) -> np.ndarray:
         """Savitzky-Golay 필터로 신호 스무딩"""
-        if len(signal) < window_length:
-            window_length = len(signal) if len(signal) % 2 == 1 else len(signal) - 1
-
-        if window_length < polyorder + 2:
-            polyorder = window_length - 2
-
+        window_length, polyorder = fit_filter_params(len(signal), window_length, polyorder)
         return savgol_filter(signal, window_length=window_length, polyorder=polyorder)
 
     def _find_transition_points(self, smoothed_signal: np.ndarray) -> dict[str, int]:
@@ -134,23 +172,97 @@ class PhaseDetector:
             "video_end": len(smoothed_signal) - 1
         }
 
+    def _ml_features(self, poses: list[PoseData], angles: AngleCalculationResult) -> np.ndarray:
+        """
+        ML 모델 입력 피처 (T, 3): 주도 팔꿈치, 주도 무릎, spine_tilt
+        (학습 데이터셋의 elbow / knee / spine_tilt 컬럼과 같은 순서)
+        """
+        lead = "left" if self.swing_direction == "right" else "right"
+        elbow = angles.column(f"{lead}_elbow")
+        knee = angles.column(f"{lead}_knee")
+
+        # spine_tilt: 골반 중심 → 어깨 중심 벡터의 수직 대비 기울기 (도)
+        xy = poses_to_xy(poses)
+        mid_shoulder = (xy[:, _KP["left_shoulder"]] + xy[:, _KP["right_shoulder"]]) / 2
+        mid_hip = (xy[:, _KP["left_hip"]] + xy[:, _KP["right_hip"]]) / 2
+        spine = mid_shoulder - mid_hip
+        spine_tilt = np.degrees(np.arctan2(spine[:, 0], -spine[:, 1]))
+
+        return np.stack([elbow, knee, spine_tilt], axis=1)
+
+    def _find_transition_points_ml(
+        self,
+        poses: list[PoseData],
+        angles: AngleCalculationResult
+    ) -> Optional[dict[str, int]]:
+        """
+        LSTM 페이즈 모델로 전환점 찾기
+
+        Returns:
+            _find_transition_points와 같은 형태, 모델이 없거나 결과가 불확실하면 None
+        """
+        server = self.inference_server
+        if server is None and settings.PHASE_MODEL_PATH:
+            # torch는 모델이 설정된 경우에만 import
+            from app.ml.inference_server import get_phase_inference_server
+            server = get_phase_inference_server()
+        if server is None or len(poses) < 5:
+            return None
+
+        try:
+            prob = server.predict_proba(
+                self._ml_features(poses, angles), timeout=settings.PHASE_INFERENCE_TIMEOUT_SEC
+            )
+            classes = list(server.adapter.classes_)
+            top_prob = prob[:, classes.index(ML_TOP_CLASS)]
+            impact_prob = prob[:, classes.index(ML_IMPACT_CLASS)]
+        except Exception as e:
+            # 시간 초과 / 추론 오류 / 모델 클래스 구성이 다름
+            logger.warning(f"⚠️ ML 페이즈 추론 실패, 규칙 기반으로 대체: {e!r}")
+            return None
+
+        # Top: P4 확률 최대 프레임, Impact: Top 이후 P7 확률 최대 프레임
+        top_frame = int(np.argmax(top_prob))
+        if not 1 < top_frame < len(prob) - 2:
+            return None
+        impact_frame = top_frame + 1 + int(np.argmax(impact_prob[top_frame + 1:]))
+        if impact_frame >= len(prob) - 1:
+            return None
+        if min(top_prob[top_frame], impact_prob[impact_frame]) < self.ml_min_confidence:
+            return None
+
+        address_end = min(int(len(prob) * 0.05), top_frame - 1)
+        return {
+            "address_end": address_end,
+            "backswing_start": address_end + 1,
+            "top": top_frame,
+            "downswing_start": top_frame + 1,
+            "impact": impact_frame,
+            "follow_start": impact_frame + 1,
+            "video_end": len(prob) - 1
+        }
+
     def _create_phases(
         self,
         transitions: dict[str, int],
-        poses: list[PoseData],
-        angles: list[AngleMetrics],
+        angles: AngleCalculationResult,
         fps: float
     ) -> list[PhaseInfo]:
-        """전환점 기반으로 6개 페이즈 생성"""
+        """전환점(포즈 인덱스) 기반으로 6개 페이즈 생성"""
+        # 인덱스 → 프레임 번호 (가시성 필터로 빠진 프레임/스윙 구간 오프셋 반영)
+        frame_numbers = angles.frame_numbers
+
+        def frame_of(index: int) -> int:
+            return int(frame_numbers[min(index, len(frame_numbers) - 1)])
 
         # 각 페이즈 구간 정의
         phase_ranges = [
-            ("Address", 0, transitions["address_end"]),
-            ("Backswing", transitions["backswing_start"], transitions["top"]),
-            ("Top", transitions["top"], transitions["downswing_start"]),
-            ("Downswing", transitions["downswing_start"], transitions["impact"]),
-            ("Impact", transitions["impact"], transitions["follow_start"]),
-            ("Follow-through", transitions["follow_start"], transitions["video_end"])
+            ("Address", frame_of(0), frame_of(transitions["address_end"])),
+            ("Backswing", frame_of(transitions["backswing_start"]), frame_of(transitions["top"])),
+            ("Top", frame_of(transitions["top"]), frame_of(transitions["downswing_start"])),
+            ("Downswing", frame_of(transitions["downswing_start"]), frame_of(transitions["impact"])),
+            ("Impact", frame_of(transitions["impact"]), frame_of(transitions["follow_start"])),
+            ("Follow-through", frame_of(transitions["follow_start"]), frame_of(transitions["video_end"]))
         ]
 
         phases = []
@@ -161,8 +273,9 @@ class PhaseDetector:
             duration = end_time - start_time
 
             # 이 구간의 평균 각도 계산
-            phase_angles = [a for a in angles if start_frame <= a.frame_number <= end_frame]
-            representative_angles = self._calc_representative_angles(phase_angles)
+            representative_angles = angles.mean_between(
+                start_frame, end_frame, REPRESENTATIVE_METRICS
+            )
 
             phase_info = PhaseInfo(
                 name=phase_name,  # type: ignore (PhaseType은 Literal이라 자동 검증됨)
@@ -176,18 +289,3 @@ class PhaseDetector:
             phases.append(phase_info)
 
         return phases
-
-    def _calc_representative_angles(self, phase_angles: list[AngleMetrics]) -> dict:
-        """페이즈의 대표 각도 (평균) 계산"""
-        if not phase_angles:
-            return {}
-
-        return {
-            "left_elbow": float(np.mean([a.left_elbow for a in phase_angles])),
-            "right_elbow": float(np.mean([a.right_elbow for a in phase_angles])),
-            "left_knee": float(np.mean([a.left_knee for a in phase_angles])),
-            "right_knee": float(np.mean([a.right_knee for a in phase_angles])),
-            "x_factor": float(np.mean([a.x_factor for a in phase_angles])),
-            "shoulder_rotation": float(np.mean([a.shoulder_rotation for a in phase_angles])),
-            "hip_rotation": float(np.mean([a.hip_rotation for a in phase_angles]))
-        }
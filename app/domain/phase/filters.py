@@ -0,0 +1,35 @@
+"""
+페이즈 감지용 필터 계수 헬퍼
+Savitzky-Golay 계수를 (윈도우, 차수, 위치)별로 1회만 계산해 재사용
+"""
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+from scipy.signal import savgol_coeffs
+
+
+def fit_filter_params(length: int, window_length: int = 11, polyorder: int = 3) -> tuple[int, int]:
+    """시퀀스 길이에 맞게 윈도우/차수 보정 (PhaseDetector._smooth_signal에서도 사용)"""
+    if length < window_length:
+        window_length = length if length % 2 == 1 else length - 1
+
+    if window_length < polyorder + 2:
+        polyorder = window_length - 2
+
+    return window_length, polyorder
+
+
+@lru_cache(maxsize=64)
+def savgol_dot_coeffs(window_length: int, polyorder: int, pos: Optional[int] = None) -> np.ndarray:
+    """
+    윈도우 샘플과 내적(dot)하면 pos 위치의 평활값이 되는 계수
+
+    Args:
+        window_length: 윈도우 길이 (홀수)
+        polyorder: 다항식 차수
+        pos: 평가 위치 (None이면 중앙 = 대칭 필터, window_length-1이면 완전 causal)
+    """
+    coeffs = savgol_coeffs(window_length, polyorder, pos=pos, use="dot")
+    coeffs.setflags(write=False)  # 캐시 공유 배열 보호
+    return coeffs
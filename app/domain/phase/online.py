@@ -0,0 +1,223 @@
+"""
+실시간 페이즈 감지 Domain Logic
+프레임이 도착할 때마다 fixed-lag 스무딩 + 점진적 peak 확정으로 페이즈 전환 이벤트 발행
+"""
+import logging
+from collections import deque
+from typing import Callable, Optional
+
+import numpy as np
+
+from app.domain.phase.filters import savgol_dot_coeffs
+from app.schemas.phase_dto import PhaseTransition
+from app.schemas.pose_dto import PoseData
+
+logger = logging.getLogger(__name__)
+
+TransitionSubscriber = Callable[[PhaseTransition], None]
+
+# 상태 (감지 대기 중인 페이즈)
+_WAIT_ADDRESS = "wait_address"
+_ADDRESS = "address"
+_BACKSWING = "backswing"
+_DOWNSWING = "downswing"
+_DONE = "done"
+
+
+class OnlinePhaseDetector:
+    """
+    PhaseDetector의 스트리밍 버전
+
+    - 스무딩: 최근 window_length 샘플에 Savitzky-Golay 계수를 내적 (lag 프레임 지연)
+      lag = window_length // 2 이면 배치 PhaseDetector와 같은 대칭 필터
+    - Top / Impact: PhaseDetector와 같은 기준(손목 Y peak → valley)으로,
+      극값에서 prominence 이상 되돌아오면 확정
+    - 지연 상한: 스무딩 lag + max_confirm_frames (극값 갱신이 멈추고 되돌림이 시작된 경우)
+    """
+
+    def __init__(
+        self,
+        swing_direction: str = "right",
+        fps: float = 60.0,
+        window_length: int = 11,
+        polyorder: int = 3,
+        lag: Optional[int] = None,
+        prominence: float = 0.05,
+        motion_threshold: float = 0.02,
+        baseline_frames: int = 5,
+        max_confirm_frames: Optional[int] = None
+    ):
+        """
+        Args:
+            swing_direction: "right" (우타) 또는 "left" (좌타)
+            fps: 프레임 레이트
+            window_length: 스무딩 윈도우 길이 (홀수)
+            polyorder: 스무딩 다항식 차수
+            lag: 스무딩 지연 프레임 (0 = 완전 causal, None = window_length // 2)
+            prominence: Top/Impact 확정에 필요한 되돌림 크기 (정규화 좌표)
+            motion_threshold: Address → Backswing 판정 이동량 (정규화 좌표)
+            baseline_frames: Address 기준선 계산에 쓰는 초기 프레임 수
+            max_confirm_frames: 극값 이후 이 프레임 수가 지나면 되돌림이 작아도 확정
+                (None = fps의 0.25초)
+        """
+        if lag is None:
+            lag = window_length // 2
+        if not 0 <= lag < window_length:
+            raise ValueError(f"lag must be in [0, {window_length}), got {lag}")
+
+        self.swing_direction = swing_direction
+        self.fps = fps
+        self.window_length = window_length
+        self.lag = lag
+        self.prominence = prominence
+        self.motion_threshold = motion_threshold
+        self.baseline_frames = baseline_frames
+        self.max_confirm_frames = (
+            max_confirm_frames if max_confirm_frames is not None else max(1, int(fps * 0.25))
+        )
+        self._coeffs = savgol_dot_coeffs(window_length, polyorder, window_length - 1 - lag)
+        self._subscribers: list[TransitionSubscriber] = []
+        self.reset()
+
+    # ---------------- 구독 ----------------
+    def subscribe(self, callback: TransitionSubscriber) -> Callable[[], None]:
+        """
+        페이즈 전환 이벤트 구독
+
+        Returns:
+            구독 해제 함수
+        """
+        self._subscribers.append(callback)
+        return lambda: self._subscribers.remove(callback)
+
+    # ---------------- 입력 ----------------
+    def push(self, pose: PoseData) -> list[PhaseTransition]:
+        """
+        포즈 1프레임 입력
+
+        Returns:
+            이번 입력으로 확정된 전환 이벤트 (없으면 빈 리스트)
+        """
+        wrist = pose.left_wrist if self.swing_direction == "right" else pose.right_wrist
+        return self.push_value(pose.frame_number, wrist.y)
+
+    def push_value(self, frame_number: int, wrist_y: float) -> list[PhaseTransition]:
+        """주도 손목 Y좌표 1개 입력 (push의 저수준 버전)"""
+        self._raw.append(wrist_y)
+        self._frames.append(frame_number)
+        self._last_frame = frame_number
+        if len(self._raw) < self.window_length or self.state == _DONE:
+            return []
+
+        # fixed-lag 스무딩: 윈도우 내 (window_length - 1 - lag) 위치의 평활값
+        smoothed = float(np.dot(self._coeffs, np.fromiter(self._raw, dtype=np.float64)))
+        frame = self._frames[self.window_length - 1 - self.lag]
+
+        events = self._step(frame, smoothed)
+        for event in events:
+            self.transitions.append(event)
+            for callback in list(self._subscribers):
+                try:
+                    callback(event)
+                except Exception as e:
+                    # 구독자 오류가 스트림을 멈추지 않도록 격리
+                    logger.warning(f"⚠️ 페이즈 구독자 오류: {e}")
+        return events
+
+    # ---------------- 상태 ----------------
+    @property
+    def is_complete(self) -> bool:
+        """Impact / Follow-through까지 확정되었는지"""
+        return self.state == _DONE
+
+    def reset(self) -> None:
+        """다음 스윙을 위해 상태 초기화 (구독자는 유지)"""
+        self._raw: deque = deque(maxlen=self.window_length)
+        self._frames: deque = deque(maxlen=self.window_length)
+        self._last_frame = -1
+        self._baseline: list[float] = []
+        self._extreme_value = 0.0
+        self._extreme_frame = -1
+        self.state = _WAIT_ADDRESS
+        self.transitions: list[PhaseTransition] = []
+
+    def transition_points(self, video_end: int) -> dict[str, int]:
+        """
+        확정된 전환점을 PhaseDetector._find_transition_points와 같은 형태로 반환
+
+        Args:
+            video_end: 마지막 프레임 번호
+
+        Raises:
+            ValueError: Impact까지 확정되지 않은 경우
+        """
+        if not self.is_complete:
+            raise ValueError("Cannot build transition points - swing not complete")
+
+        frames = {t.name: t.frame for t in self.transitions}
+        return {
+            "address_end": frames["Backswing"] - 1,
+            "backswing_start": frames["Backswing"],
+            "top": frames["Top"],
+            "downswing_start": frames["Downswing"],
+            "impact": frames["Impact"],
+            "follow_start": frames["Follow-through"],
+            "video_end": video_end
+        }
+
+    # ---------------- 내부 ----------------
+    def _event(self, name: str, frame: int) -> PhaseTransition:
+        return PhaseTransition(
+            name=name,  # type: ignore (PhaseType은 Literal이라 자동 검증됨)
+            frame=frame,
+            time=frame / self.fps,
+            emitted_frame=self._last_frame
+        )
+
+    def _confirmed(self, frame: int, retreat: float) -> bool:
+        """극값 확정: 충분히 되돌아왔거나, 극값 이후 되돌림이 max_confirm_frames 동안 유지됨"""
+        if retreat >= self.prominence:
+            return True
+        return retreat > 0 and frame - self._extreme_frame >= self.max_confirm_frames
+
+    def _step(self, frame: int, value: float) -> list[PhaseTransition]:
+        """평활값 1개로 상태 전이"""
+        if self.state == _WAIT_ADDRESS:
+            self.state = _ADDRESS
+            self._baseline.append(value)
+            return [self._event("Address", frame)]
+
+        if self.state == _ADDRESS:
+            if len(self._baseline) < self.baseline_frames:
+                self._baseline.append(value)
+                return []
+            if abs(value - float(np.mean(self._baseline))) <= self.motion_threshold:
+                return []
+            self.state = _BACKSWING
+            self._extreme_value, self._extreme_frame = value, frame
+            return [self._event("Backswing", frame)]
+
+        if self.state == _BACKSWING:
+            # Top: 손목 Y peak (PhaseDetector와 동일 기준)
+            if value >= self._extreme_value:
+                self._extreme_value, self._extreme_frame = value, frame
+                return []
+            if not self._confirmed(frame, self._extreme_value - value):
+                return []
+            top = self._extreme_frame
+            self.state = _DOWNSWING
+            self._extreme_value, self._extreme_frame = value, frame
+            return [self._event("Top", top), self._event("Downswing", top + 1)]
+
+        if self.state == _DOWNSWING:
+            # Impact: Top 이후 valley
+            if value <= self._extreme_value:
+                self._extreme_value, self._extreme_frame = value, frame
+                return []
+            if not self._confirmed(frame, value - self._extreme_value):
+                return []
+            impact = self._extreme_frame
+            self.state = _DONE
+            return [self._event("Impact", impact), self._event("Follow-through", impact + 1)]
+
+        return []
@@ -0,0 +1,122 @@
+"""
+멀티 스윙 구간 분리 Domain Logic
+긴 영상(연습장 세션)에서 주도 손목의 움직임 에너지/높이 변화로 스윙 구간 검출
+"""
+import numpy as np
+from scipy.signal import savgol_filter
+
+from app.domain.phase.filters import fit_filter_params
+from app.schemas.phase_dto import SwingSegment
+from app.schemas.pose_dto import PoseData
+
+
+class SwingSegmenter:
+    """
+    스윙 구간 분리기
+
+    Process:
+    1. 주도 손목 (x, y) 시계열 → 프레임 간 이동 속도 (정규화 좌표/초)
+    2. 스무딩 후 임계값 이상인 구간을 "움직임"으로 표시
+    3. 짧은 정지(merge_gap 미만)는 병합, 너무 짧거나 손목 높이 변화가 작은 구간은 제외
+    4. 앞뒤로 Address / Follow-through 여유 구간(pad)을 붙이되 이웃 스윙과 겹치지 않게 자름
+    """
+
+    def __init__(
+        self,
+        swing_direction: str = "right",
+        speed_threshold: float = 0.3,
+        min_swing_sec: float = 0.6,
+        merge_gap_sec: float = 0.4,
+        pad_sec: float = 0.5,
+        min_height_range: float = 0.1
+    ):
+        """
+        Args:
+            swing_direction: "right" (우타) 또는 "left" (좌타)
+            speed_threshold: 움직임으로 보는 손목 속도 (정규화 좌표/초)
+            min_swing_sec: 스윙으로 인정할 최소 움직임 길이(초)
+            merge_gap_sec: 이보다 짧은 정지는 같은 스윙으로 병합(초) - Top에서의 멈춤 등
+            pad_sec: 구간 앞뒤에 붙이는 여유 길이(초)
+            min_height_range: 스윙으로 인정할 최소 손목 높이 변화 (정규화 좌표)
+        """
+        self.swing_direction = swing_direction
+        self.speed_threshold = speed_threshold
+        self.min_swing_sec = min_swing_sec
+        self.merge_gap_sec = merge_gap_sec
+        self.pad_sec = pad_sec
+        self.min_height_range = min_height_range
+
+    def segment(self, poses: list[PoseData], fps: float) -> list[SwingSegment]:
+        """
+        스윙 구간 검출
+
+        Args:
+            poses: 전체 영상의 포즈 데이터 리스트
+            fps: 프레임 레이트
+
+        Returns:
+            SwingSegment 리스트 (시간순, 인덱스는 poses 기준)
+        """
+        if len(poses) < 3:
+            return []
+
+        frames = np.array([p.frame_number for p in poses], dtype=np.float64)
+        wrist = np.array([
+            (w.x, w.y) for w in (
+                p.left_wrist if self.swing_direction == "right" else p.right_wrist
+                for p in poses
+            )
+        ])
+
+        # 1. 속도 (빠진 프레임은 실제 프레임 간격으로 나눔)
+        dt = np.maximum(np.diff(frames), 1.0) / fps
+        speed = np.linalg.norm(np.diff(wrist, axis=0), axis=1) / dt
+        speed = np.concatenate([[speed[0]], speed])
+
+        # 2. 스무딩 + 움직임 마스크
+        window_length, polyorder = fit_filter_params(len(speed))
+        if polyorder >= 0 and window_length > polyorder:
+            speed = savgol_filter(speed, window_length, polyorder)
+        active = speed > self.speed_threshold
+
+        # 3. 연속 구간 → 병합 → 필터
+        runs = self._runs(active)
+        runs = self._merge(runs, frames, fps)
+        runs = [
+            (s, e) for s, e in runs
+            if (frames[e - 1] - frames[s]) / fps >= self.min_swing_sec
+            and np.ptp(wrist[s:e, 1]) >= self.min_height_range
+        ]
+
+        # 4. 여유 구간 추가 (이웃과 겹치면 중간 지점에서 자름)
+        pad = int(round(self.pad_sec * fps))
+        segments = []
+        for i, (s, e) in enumerate(runs):
+            lo = 0 if i == 0 else (runs[i - 1][1] + s) // 2
+            hi = len(poses) if i == len(runs) - 1 else (e + runs[i + 1][0]) // 2
+            start, end = max(lo, s - pad), min(hi, e + pad)
+            segments.append(SwingSegment(
+                index=i,
+                start_index=start,
+                end_index=end,
+                start_frame=int(frames[start]),
+                end_frame=int(frames[end - 1])
+            ))
+        return segments
+
+    def _runs(self, mask: np.ndarray) -> list[tuple[int, int]]:
+        """True 연속 구간 [start, end) 리스트"""
+        edges = np.diff(np.concatenate([[0], mask.astype(np.int8), [0]]))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        return list(zip(starts.tolist(), ends.tolist()))
+
+    def _merge(self, runs: list[tuple[int, int]], frames: np.ndarray, fps: float) -> list[tuple[int, int]]:
+        """merge_gap_sec 미만으로 떨어진 구간 병합"""
+        merged: list[tuple[int, int]] = []
+        for s, e in runs:
+            if merged and (frames[s] - frames[merged[-1][1] - 1]) / fps < self.merge_gap_sec:
+                merged[-1] = (merged[-1][0], e)
+            else:
+                merged.append((s, e))
+        return merged
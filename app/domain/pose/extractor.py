@@ -2,21 +2,77 @@
 포즈 추출 Domain Logic
 MediaPipe Pose 사용
 """
+from typing import Optional
+
 import numpy as np
 import mediapipe as mp
 
 from app.schemas.pose_dto import PoseExtractionResult, PoseData, Keypoint
 
+# PoseData 필드 → MediaPipe PoseLandmark 인덱스
+LANDMARK_INDEX: dict[str, int] = {
+    "nose": 0,
+    "left_shoulder": 11,
+    "right_shoulder": 12,
+    "left_elbow": 13,
+    "right_elbow": 14,
+    "left_wrist": 15,
+    "right_wrist": 16,
+    "left_hip": 23,
+    "right_hip": 24,
+    "left_knee": 25,
+    "right_knee": 26,
+    "left_ankle": 27,
+    "right_ankle": 28,
+}
+
+
+def _to_keypoint(landmark) -> Keypoint:
+    """MediaPipe Landmark(속성 또는 dict) → Keypoint DTO 변환"""
+    if isinstance(landmark, dict):
+        return Keypoint(**{k: landmark[k] for k in ("x", "y", "z", "visibility")})
+    return Keypoint(
+        x=landmark.x,
+        y=landmark.y,
+        z=landmark.z,
+        visibility=landmark.visibility
+    )
+
+
+def landmarks_to_pose_data(landmarks, frame_number: int, timestamp: float) -> PoseData:
+    """
+    MediaPipe 33개 랜드마크 → PoseData (주요 keypoint만)
+
+    Args:
+        landmarks: results.pose_landmarks.landmark 또는 dict 리스트
+        frame_number: 프레임 번호
+        timestamp: 타임스탬프(초)
+    """
+    return PoseData(
+        frame_number=frame_number,
+        timestamp=timestamp,
+        **{name: _to_keypoint(landmarks[idx]) for name, idx in LANDMARK_INDEX.items()}
+    )
+
 
 class PoseExtractor:
     """MediaPipe 기반 포즈 추출기"""
 
-    def __init__(self, visibility_threshold: float = 0.5):
+    def __init__(self, visibility_threshold: float = 0.5, reusable: bool = False, model_complexity: int = 2):
+        """
+        Args:
+            visibility_threshold: 주요 keypoint 최소 가시성
+            reusable: True면 extract() 후 MediaPipe 그래프를 닫지 않고 다음 영상에 재사용 (풀 전용)
+            model_complexity: MediaPipe 모델 크기 0, 1, 2 (높을수록 정확하지만 느림)
+        """
         self.visibility_threshold = visibility_threshold
+        self.model_complexity = model_complexity
+        self.reusable = reusable
+        self.low_visibility_frames = 0  # process_frame에서 가시성 미달로 버린 누적 프레임 수
         self.mp_pose = mp.solutions.pose
         self.pose = self.mp_pose.Pose(
             static_image_mode=False,
-            model_complexity=2,  # 0, 1, 2 (높을수록 정확하지만 느림)
+            model_complexity=model_complexity,
             smooth_landmarks=True,
             min_detection_confidence=0.5,
             min_tracking_confidence=0.5
@@ -34,56 +90,61 @@ class PoseExtractor:
             PoseExtractionResult
         """
         poses = []
+        dropped_before = self.low_visibility_frames
 
         for frame_idx, frame in enumerate(frames):
-            timestamp = frame_idx / fps
-
-            # MediaPipe 포즈 추정
-            results = self.pose.process(frame)
-
-            if results.pose_landmarks:
-                # 33개 keypoints를 DTO로 변환
-                landmarks = results.pose_landmarks.landmark
-
-                # 주요 keypoint만 추출 (실제로는 33개 전부)
-                pose_data = PoseData(
-                    frame_number=frame_idx,
-                    timestamp=timestamp,
-                    nose=self._to_keypoint(landmarks[self.mp_pose.PoseLandmark.NOSE]),
-                    left_shoulder=self._to_keypoint(landmarks[self.mp_pose.PoseLandmark.LEFT_SHOULDER]),
-                    right_shoulder=self._to_keypoint(landmarks[self.mp_pose.PoseLandmark.RIGHT_SHOULDER]),
-                    left_elbow=self._to_keypoint(landmarks[self.mp_pose.PoseLandmark.LEFT_ELBOW]),
-                    right_elbow=self._to_keypoint(landmarks[self.mp_pose.PoseLandmark.RIGHT_ELBOW]),
-                    left_wrist=self._to_keypoint(landmarks[self.mp_pose.PoseLandmark.LEFT_WRIST]),
-                    right_wrist=self._to_keypoint(landmarks[self.mp_pose.PoseLandmark.RIGHT_WRIST]),
-                    left_hip=self._to_keypoint(landmarks[self.mp_pose.PoseLandmark.LEFT_HIP]),
-                    right_hip=self._to_keypoint(landmarks[self.mp_pose.PoseLandmark.RIGHT_HIP]),
-                    left_knee=self._to_keypoint(landmarks[self.mp_pose.PoseLandmark.LEFT_KNEE]),
-                    right_knee=self._to_keypoint(landmarks[self.mp_pose.PoseLandmark.RIGHT_KNEE]),
-                    left_ankle=self._to_keypoint(landmarks[self.mp_pose.PoseLandmark.LEFT_ANKLE]),
-                    right_ankle=self._to_keypoint(landmarks[self.mp_pose.PoseLandmark.RIGHT_ANKLE]),
-                )
-
-                # visibility 체크
-                if self._is_valid_pose(pose_data):
-                    poses.append(pose_data)
+            pose_data = self.process_frame(frame, frame_idx, fps)
+            if pose_data is not None:
+                poses.append(pose_data)
 
-        self.pose.close()
+        if self.reusable:
+            self.reset()
+        else:
+            self.pose.close()
 
         return PoseExtractionResult(
             total_frames=len(frames),
-            poses=poses
+            poses=poses,
+            low_visibility_frames=self.low_visibility_frames - dropped_before,
+            model_complexity=self.model_complexity
         )
 
-    def _to_keypoint(self, landmark) -> Keypoint:
-        """MediaPipe Landmark → Keypoint DTO 변환"""
-        return Keypoint(
-            x=landmark.x,
-            y=landmark.y,
-            z=landmark.z,
-            visibility=landmark.visibility
+    def process_frame(self, frame: np.ndarray, frame_idx: int, fps: float) -> Optional[PoseData]:
+        """
+        단일 프레임 포즈 추출 (실시간 입력용)
+
+        Args:
+            frame: RGB 이미지
+            frame_idx: 프레임 번호
+            fps: 프레임 레이트
+
+        Returns:
+            PoseData (포즈 미검출 또는 가시성 미달이면 None)
+        """
+        # MediaPipe 포즈 추정
+        results = self.pose.process(frame)
+        if not results.pose_landmarks:
+            return None
+
+        # 33개 keypoints 중 주요 keypoint만 DTO로 변환
+        pose_data = landmarks_to_pose_data(
+            results.pose_landmarks.landmark, frame_idx, frame_idx / fps
         )
 
+        # visibility 체크
+        if not self._is_valid_pose(pose_data):
+            self.low_visibility_frames += 1
+            return None
+        return pose_data
+
+    def reset(self) -> None:
+        """트래킹 상태 초기화 (이전 영상의 랜드마크 스무딩이 다음 영상에 섞이지 않도록)"""
+        self.pose.reset()
+
+    def close(self) -> None:
+        """MediaPipe 리소스 해제 (process_frame만 쓰는 세션 모드 종료 시 호출)"""
+        self.pose.close()
+
     def _is_valid_pose(self, pose: PoseData) -> bool:
         """포즈가 유효한지 검증 (주요 keypoint visibility 체크)"""
         key_points = [
@@ -0,0 +1,130 @@
+"""
+PoseExtractor 풀
+MediaPipe 그래프 생성(모델 로드)은 수백 ms라 요청마다 만들지 않고, (가시성 임계값, 모델 크기)별로 재사용
+
+PoseExtractor 1개는 한 번에 한 영상만 처리 (트래킹 상태가 있음)
+→ 분석 1건이 빌려 쓰고 끝나면 reset 후 반납
+"""
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+import numpy as np
+
+from app.domain.pose.extractor import PoseExtractor
+from app.schemas.pose_dto import PoseData, PoseExtractionResult
+
+logger = logging.getLogger(__name__)
+
+ExtractorFactory = Callable[[float, int], PoseExtractor]
+
+DEFAULT_MODEL_COMPLEXITY = 2
+
+
+def _default_factory(visibility_threshold: float, model_complexity: int) -> PoseExtractor:
+    return PoseExtractor(visibility_threshold=visibility_threshold, reusable=True, model_complexity=model_complexity)
+
+
+class PoseExtractorPool:
+    """(가시성 임계값, 모델 크기)별 유휴 PoseExtractor 목록 (부족하면 새로 생성, 유휴는 max_idle개까지 보관)"""
+
+    def __init__(self, max_idle: int = 4, factory: ExtractorFactory = _default_factory):
+        """
+        Args:
+            max_idle: 임계값별 최대 유휴 추출기 수 (보통 cpu 실행기 워커 수)
+            factory: (visibility_threshold, model_complexity) → 재사용 가능한 PoseExtractor
+        """
+        self.max_idle = max_idle
+        self.factory = factory
+        self._lock = threading.Lock()
+        self._idle: dict[tuple[float, int], list[PoseExtractor]] = {}
+        self.created = 0
+
+    def acquire(
+        self, visibility_threshold: float, model_complexity: int = DEFAULT_MODEL_COMPLEXITY
+    ) -> PoseExtractor:
+        with self._lock:
+            idle = self._idle.get((visibility_threshold, model_complexity))
+            if idle:
+                return idle.pop()
+            self.created += 1
+        logger.info(
+            f"🧍 PoseExtractor 생성 (visibility={visibility_threshold}, complexity={model_complexity}, "
+            f"total={self.created})"
+        )
+        return self.factory(visibility_threshold, model_complexity)
+
+    def release(self, extractor: PoseExtractor) -> None:
+        """반납 (트래킹 상태 초기화, 유휴가 가득 차면 닫음)"""
+        try:
+            extractor.reset()
+        except Exception as e:
+            logger.warning(f"⚠️ PoseExtractor reset 실패, 폐기: {e}")
+            extractor.close()
+            return
+        with self._lock:
+            idle = self._idle.setdefault((extractor.visibility_threshold, extractor.model_complexity), [])
+            if len(idle) < self.max_idle:
+                idle.append(extractor)
+                return
+        extractor.close()
+
+    @contextmanager
+    def lease(
+        self, visibility_threshold: float, model_complexity: int = DEFAULT_MODEL_COMPLEXITY
+    ) -> Iterator[PoseExtractor]:
+        extractor = self.acquire(visibility_threshold, model_complexity)
+        try:
+            yield extractor
+        finally:
+            self.release(extractor)
+
+    def view(
+        self, visibility_threshold: float, model_complexity: int = DEFAULT_MODEL_COMPLEXITY
+    ) -> "PooledPoseExtractor":
+        """서비스에 넘길 PoseExtractor 호환 객체"""
+        return PooledPoseExtractor(self, visibility_threshold, model_complexity)
+
+    def close(self) -> None:
+        """유휴 추출기 모두 닫기 (앱 종료 시)"""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for extractors in idle.values():
+            for extractor in extractors:
+                extractor.close()
+
+
+class PooledPoseExtractor:
+    """
+    PoseExtractor 인터페이스(extract / process_frame / close)를 풀 위에서 제공
+
+    - extract: 호출 동안만 빌림
+    - process_frame: 세션 모드처럼 프레임을 이어서 넣는 경우, 첫 호출에 빌려 close()까지 유지
+    """
+
+    def __init__(
+        self, pool: PoseExtractorPool, visibility_threshold: float, model_complexity: int = DEFAULT_MODEL_COMPLEXITY
+    ):
+        self.pool = pool
+        self.visibility_threshold = visibility_threshold
+        self.model_complexity = model_complexity
+        self._held: Optional[PoseExtractor] = None
+
+    def with_complexity(self, model_complexity: int) -> "PooledPoseExtractor":
+        """같은 풀에서 모델 크기만 다른 추출기 (마감이 급할 때 경량 모델)"""
+        return PooledPoseExtractor(self.pool, self.visibility_threshold, model_complexity)
+
+    def extract(self, frames: list[np.ndarray], fps: float) -> PoseExtractionResult:
+        with self.pool.lease(self.visibility_threshold, self.model_complexity) as extractor:
+            return extractor.extract(frames, fps)
+
+    def process_frame(self, frame: np.ndarray, frame_idx: int, fps: float) -> Optional[PoseData]:
+        if self._held is None:
+            self._held = self.pool.acquire(self.visibility_threshold, self.model_complexity)
+        return self._held.process_frame(frame, frame_idx, fps)
+
+    def close(self) -> None:
+        held, self._held = self._held, None
+        if held is not None:
+            self.pool.release(held)
@@ -2,6 +2,9 @@
 비디오 전처리 Domain Logic
 외부 의존성 없는 순수 함수
 """
+import time
+from typing import Iterator
+
 import cv2
 import numpy as np
 
@@ -54,16 +57,7 @@ class VideoPreprocessor:
 
             # FPS 리샘플링 (N 프레임마다 1개 추출)
             if frame_idx % frame_interval == 0:
-                # 리사이즈
-                resized = cv2.resize(frame, (target_width, target_height))
-
-                # 좌우 반전 (좌타자용)
-                if request.mirror:
-                    resized = cv2.flip(resized, 1)
-
-                # RGB 변환 (MediaPipe는 RGB 사용)
-                rgb_frame = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
-                frames.append(rgb_frame)
+                frames.append(self._transform(frame, target_width, target_height, request.mirror))
 
             frame_idx += 1
 
@@ -78,7 +72,76 @@ class VideoPreprocessor:
             fps=actual_fps,
             duration=duration,
             width=target_width,
-            height=target_height
+            height=target_height,
+            source_fps=original_fps,
+            frame_step=frame_interval
         )
 
         return frames, metadata
+
+    def stream(
+        self,
+        request: VideoPreprocessRequest,
+        follow: bool = False,
+        poll_interval: float = 0.2,
+        idle_timeout: float = 5.0
+    ) -> Iterator[tuple[int, np.ndarray]]:
+        """
+        프레임을 하나씩 표준화해서 내보내는 제너레이터 (세션 모드용, 전체 프레임을 메모리에 올리지 않음)
+
+        Args:
+            request: 전처리 요청 (경로, FPS, 높이 등)
+            follow: True면 파일 끝에 도달해도 새 프레임이 쓰일 때까지 대기 (녹화 중인 파일)
+            poll_interval: follow 모드에서 파일을 다시 확인하는 간격(초)
+            idle_timeout: follow 모드에서 새 프레임 없이 이 시간이 지나면 종료(초)
+
+        Yields:
+            (frame_number, RGB 프레임) - frame_number는 리샘플링 후 기준 (0, 1, 2, ...)
+        """
+        cap = cv2.VideoCapture(request.file_path)
+        if not cap.isOpened():
+            raise ValueError(f"Cannot open video: {request.file_path}")
+
+        original_fps = cap.get(cv2.CAP_PROP_FPS) or request.target_fps
+        frame_interval = max(1, int(original_fps / request.target_fps))
+        target_width = target_height = None
+
+        raw_idx = 0      # 원본 프레임 위치
+        out_idx = 0      # 내보낸 프레임 번호
+        idle_since = None
+
+        try:
+            while True:
+                ret, frame = cap.read()
+                if not ret:
+                    if not follow:
+                        break
+                    # 녹화 중인 파일: 잠시 대기 후 다시 열어 마지막 위치부터 읽기
+                    idle_since = idle_since or time.monotonic()
+                    if time.monotonic() - idle_since > idle_timeout:
+                        break
+                    time.sleep(poll_interval)
+                    cap.release()
+                    cap = cv2.VideoCapture(request.file_path)
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, raw_idx)
+                    continue
+
+                idle_since = None
+                if target_width is None:
+                    scale_factor = request.target_height / frame.shape[0]
+                    target_width = int(frame.shape[1] * scale_factor)
+                    target_height = request.target_height
+
+                if raw_idx % frame_interval == 0:
+                    yield out_idx, self._transform(frame, target_width, target_height, request.mirror)
+                    out_idx += 1
+                raw_idx += 1
+        finally:
+            cap.release()
+
+    def _transform(self, frame: np.ndarray, width: int, height: int, mirror: bool) -> np.ndarray:
+        """리사이즈 → (좌타자) 좌우 반전 → RGB 변환 (MediaPipe는 RGB 사용)"""
+        resized = cv2.resize(frame, (width, height))
+        if mirror:
+            resized = cv2.flip(resized, 1)
+        return cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
@@ -0,0 +1,138 @@
+"""
+디스크 LRU + TTL 캐시 (분석 결과 JSON)
+
+파일: {directory}/{key}.json, 첫 줄은 저장 시각(epoch), 나머지는 값
+- 조회 시 파일 mtime을 갱신 → 재시작 후에도 mtime 순서로 LRU 순서 복원
+- 항목 수 / 총 크기 상한을 넘으면 가장 오래 안 쓴 항목부터 삭제
+- 같은 디렉토리를 여러 프로세스가 공유해도 됨 (쓰기는 임시 파일 + rename, 모르는 키는 디스크에서 확인)
+"""
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
+
+logger = logging.getLogger(__name__)
+
+_KEY_RE = re.compile(r"^[0-9a-f]{16,128}$")
+
+
+class DiskLruCache:
+    """키(hex 문자열) → 문자열 값 디스크 캐시 (스레드 안전)"""
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_entries: int = 1000,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl_sec: float = 24 * 3600
+    ):
+        """
+        Args:
+            directory: 캐시 폴더 (없으면 생성)
+            max_entries: 최대 항목 수
+            max_bytes: 최대 총 크기 (파일 크기 합)
+            ttl_sec: 저장 후 유효 시간 (0 이하면 만료 없음)
+        """
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_sec = ttl_sec
+        self._lock = threading.Lock()
+        self._index: "OrderedDict[str, int]" = OrderedDict()  # key → 파일 크기 (앞쪽이 가장 오래 안 쓴 항목)
+        self._total_bytes = 0
+        self._load_index()
+
+    def get(self, key: str) -> Optional[str]:
+        """값 조회 (없거나 만료되면 None)"""
+        path = self._path(key)
+        with self._lock:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    stored_at = float(f.readline())
+                    value = f.read()
+            except (OSError, ValueError):
+                self._forget(key)
+                return None
+            if self.ttl_sec > 0 and time.time() - stored_at > self.ttl_sec:
+                self._remove(key)
+                return None
+            if key not in self._index:
+                self._track(key, path.stat().st_size)  # 다른 프로세스가 저장한 항목
+            self._index.move_to_end(key)
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        """값 저장 (같은 키면 덮어씀) 후 상한 초과분 삭제"""
+        path = self._path(key)
+        data = f"{time.time()!r}\n{value}".encode("utf-8")
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{key}.{uuid.uuid4().hex[:8]}.tmp")
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+            self._forget(key)
+            self._track(key, len(data))
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def _load_index(self) -> None:
+        if not self.directory.exists():
+            return
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, path.stem, st.st_size))
+        with self._lock:
+            for _, key, size in sorted(entries):
+                self._track(key, size)
+            self._evict()
+
+    def _evict(self) -> None:
+        while self._index and (len(self._index) > self.max_entries or self._total_bytes > self.max_bytes):
+            key = next(iter(self._index))
+            self._remove(key)
+            logger.debug(f"🧹 결과 캐시 제거: {key}")
+
+    def _track(self, key: str, size: int) -> None:
+        self._index[key] = size
+        self._total_bytes += size
+
+    def _forget(self, key: str) -> None:
+        size = self._index.pop(key, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    def _remove(self, key: str) -> None:
+        self._forget(key)
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _path(self, key: str) -> Path:
+        if not _KEY_RE.match(key):
+            raise ValueError(f"invalid cache key: {key}")
+        return self.directory / f"{key}.json"
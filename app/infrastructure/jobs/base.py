@@ -0,0 +1,79 @@
+"""
+분석 작업 브로커 인터페이스
+API 노드는 submit/get만, 워커 노드는 claim → complete/fail만 호출
+"""
+from abc import ABC, abstractmethod
+from typing import Optional
+
+# queued → running → succeeded | failed (running 중 워커가 죽으면 lease 만료 후 다시 claim)
+# claim마다 attempts가 1 늘어나므로 (job_id, attempts)가 lease 소유 토큰 → 다시 claim된 작업에 옛 워커가 쓰지 못함
+JOB_STATUSES = ("queued", "running", "succeeded", "failed")
+
+
+class JobBroker(ABC):
+    """
+    작업 큐 브로커
+
+    작업 dict 형식 (get / claim 반환값):
+        {id, kind, status, payload(dict), result(str|None), error(str|None), attempts,
+         created_at, started_at, finished_at}  (시각은 epoch 초)
+    """
+
+    @abstractmethod
+    def submit(self, kind: str, payload: dict) -> str:
+        """
+        작업 등록
+
+        Args:
+            kind: 작업 종류 ("single" | "multi")
+            payload: 워커가 작업을 재구성할 JSON 직렬화 가능 데이터
+
+        Returns:
+            job_id
+        """
+
+    @abstractmethod
+    def claim(self, lease_sec: float) -> Optional[dict]:
+        """
+        가장 오래된 대기 작업(또는 lease가 만료된 실행 중 작업) 1개를 running으로 가져옴
+
+        Args:
+            lease_sec: 이 시간 안에 complete/fail이 없으면 다른 워커가 다시 가져갈 수 있음
+
+        Returns:
+            작업 dict, 없으면 None
+        """
+
+    @abstractmethod
+    def renew(self, job_id: str, attempt: int, lease_sec: float) -> bool:
+        """
+        실행 중 작업의 lease 연장 (실행 중 주기적으로 호출)
+
+        Args:
+            job_id: 작업 id
+            attempt: claim 시점의 attempts (lease 소유 확인용, 아래 메서드도 동일)
+            lease_sec: 지금부터 새 lease 길이
+
+        Returns:
+            False면 lease를 이미 잃음 (만료 후 다른 워커가 가져갔거나 끝난 작업)
+        """
+
+    @abstractmethod
+    def complete(self, job_id: str, attempt: int, result: str) -> bool:
+        """작업 성공 (result: 응답 DTO JSON), lease를 잃었으면 기록하지 않고 False"""
+
+    @abstractmethod
+    def fail(self, job_id: str, attempt: int, error: str) -> bool:
+        """작업 실패 (재시도 없음), lease를 잃었으면 기록하지 않고 False"""
+
+    @abstractmethod
+    def release(self, job_id: str, attempt: int) -> bool:
+        """실행 중 작업을 대기열 맨 앞으로 되돌림 (워커 종료 시, 시도 횟수는 되돌림), lease를 잃었으면 False"""
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[dict]:
+        """작업 조회 (없으면 None)"""
+
+    @abstractmethod
+    def count(self, status: str) -> int:
+        """상태별 작업 수 (queued / running만 지원해도 됨)"""
@@ -0,0 +1,33 @@
+"""
+작업 브로커 선택 (settings.JOBS_BROKER_URL)
+
+- 미설정 / sqlite:///경로 → SQLiteJobBroker (한 호스트 안 API + 워커 프로세스)
+- redis://host:port/db     → RedisJobBroker (API 노드와 워커 노드를 따로 확장)
+"""
+from typing import Optional
+
+from app.config.settings import settings
+from app.infrastructure.jobs.base import JobBroker
+from app.infrastructure.jobs.redis_broker import RedisJobBroker, RespClient
+from app.infrastructure.jobs.sqlite_broker import SQLiteJobBroker
+
+
+def create_job_broker(url: Optional[str] = None) -> JobBroker:
+    """
+    URL → 브로커 인스턴스 (연결은 첫 명령 시점에 열림)
+
+    Raises:
+        ValueError: 지원하지 않는 스킴
+    """
+    url = url or settings.JOBS_BROKER_URL
+    if not url:
+        return SQLiteJobBroker(settings.JOBS_DB_PATH)
+    if url.startswith("sqlite:///"):
+        return SQLiteJobBroker(url[len("sqlite:///"):])
+    if url.startswith("redis://"):
+        return RedisJobBroker(RespClient.from_url(url), prefix=settings.JOBS_REDIS_PREFIX)
+    raise ValueError(f"unsupported JOBS_BROKER_URL: {url}")
+
+
+# 프로세스 전역 브로커
+job_broker = create_job_broker()
@@ -0,0 +1,328 @@
+"""
+분석 작업 큐 - Redis 브로커 (여러 호스트의 API/워커 노드가 공유)
+redis-py 없이 RESP 프로토콜을 직접 사용 (필요한 명령이 적고, RESP 호환 서버면 어디든 붙음)
+
+키 구조 (prefix 기본 "swing:jobs"):
+    {prefix}:job:{id}  hash   작업 필드
+    {prefix}:queue     list   대기 작업 id (LPUSH 등록 / RPOP claim → FIFO)
+    {prefix}:leases    zset   실행 중 작업 id → lease 만료 시각
+
+상태 전이는 Lua 스크립트(EVAL) 하나로 처리 → 꺼내기와 lease 등록 사이에 워커가 죽어도 작업이 사라지지 않음
+(스크립트가 job hash 키를 직접 조립하므로 Redis Cluster가 아닌 단일 인스턴스/복제 구성 전제)
+"""
+import json
+import socket
+import threading
+import time
+import uuid
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+from app.infrastructure.jobs.base import JobBroker
+
+
+class RespError(Exception):
+    """Redis 에러 응답 (-ERR ...)"""
+
+
+class _NotSent(Exception):
+    """연결/전송이 1바이트도 보내기 전에 실패 (서버가 명령을 받지 않았으므로 재시도 안전)"""
+
+    def __init__(self, cause: OSError):
+        super().__init__(str(cause))
+        self.cause = cause
+
+
+class RespClient:
+    """
+    최소 RESP2 클라이언트 (동기, 연결 1개 + 락)
+
+    연결이 끊기면 다음 명령에서 1회 재연결
+    (명령을 1바이트도 보내지 못한 경우만 재시도 - 보낸 뒤 실패하면 서버가 이미 실행했을 수 있음)
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        timeout: float = 5.0
+    ):
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._sock: Optional[socket.socket] = None
+        self._reader = None
+
+    @classmethod
+    def from_url(cls, url: str, timeout: float = 5.0) -> "RespClient":
+        """redis://[:password@]host[:port][/db]"""
+        parsed = urlparse(url)
+        db = int(parsed.path.lstrip("/") or 0)
+        return cls(parsed.hostname or "localhost", parsed.port or 6379, db, parsed.password, timeout)
+
+    def execute(self, *args) -> Any:
+        """명령 1개 실행 → 응답 (bulk string은 str, 에러 응답은 RespError)"""
+        return self.pipeline([args])[0]
+
+    def pipeline(self, commands: list[tuple]) -> list:
+        """
+        여러 명령을 한 번에 보내고 응답을 순서대로 받음 (왕복 1회, 원자성은 없음)
+
+        Raises:
+            RespError: 에러 응답이 하나라도 있으면 (나머지 응답은 모두 읽은 뒤)
+            OSError: 명령을 보낸 뒤 연결 실패 (실행 여부를 알 수 없으므로 재시도하지 않음)
+        """
+        payload = b"".join(_encode(cmd) for cmd in commands)
+        with self._lock:
+            try:
+                try:
+                    replies = self._roundtrip(payload, len(commands))
+                except _NotSent:
+                    self._close()
+                    replies = self._roundtrip(payload, len(commands))
+            except _NotSent as e:
+                self._close()
+                raise e.cause
+            except OSError:
+                # 보낸 뒤 응답을 읽다 실패: LPUSH / HINCRBY / RPOP 중복·유실 방지를 위해 재전송 안 함
+                self._close()
+                raise
+        for reply in replies:
+            if isinstance(reply, RespError):
+                raise reply
+        return replies
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _roundtrip(self, payload: bytes, count: int) -> list:
+        if self._sock is None:
+            try:
+                self._connect()
+            except OSError as e:
+                raise _NotSent(e)
+        sent = 0
+        try:
+            while sent < len(payload):
+                sent += self._sock.send(payload[sent:])
+        except OSError as e:
+            if sent == 0:
+                raise _NotSent(e)
+            raise
+        return [self._read_reply() for _ in range(count)]
+
+    def _connect(self) -> None:
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self._sock, self._reader = sock, sock.makefile("rb")
+        setup = []
+        if self.password:
+            setup.append(("AUTH", self.password))
+        if self.db:
+            setup.append(("SELECT", self.db))
+        if setup:
+            self._sock.sendall(b"".join(_encode(cmd) for cmd in setup))
+            for _ in setup:
+                reply = self._read_reply()
+                if isinstance(reply, RespError):
+                    self._close()
+                    raise reply
+
+    def _close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._reader.close()
+                self._sock.close()
+            finally:
+                self._sock, self._reader = None, None
+
+    def _read_reply(self) -> Any:
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("redis connection closed")
+        kind, body = line[:1], line[1:-2]
+        if kind == b"+":
+            return body.decode()
+        if kind == b"-":
+            return RespError(body.decode())
+        if kind == b":":
+            return int(body)
+        if kind == b"$":
+            size = int(body)
+            if size < 0:
+                return None
+            data = self._reader.read(size + 2)[:-2]
+            return data.decode("utf-8")
+        if kind == b"*":
+            size = int(body)
+            return None if size < 0 else [self._read_reply() for _ in range(size)]
+        raise ConnectionError(f"unexpected RESP reply: {line!r}")
+
+
+def _encode(args: tuple) -> bytes:
+    parts = [f"*{len(args)}\r\n".encode()]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+# KEYS: queue, leases / ARGV: now, lease_until, job 키 접두사
+# lease가 만료된 작업을 먼저, 없으면 큐 끝(RPOP)을 꺼내 running + lease 등록까지 한 번에 → 작업 hash 반환
+CLAIM_SCRIPT = """
+local id = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[1], 'LIMIT', 0, 1)[1]
+if not id then
+    id = redis.call('RPOP', KEYS[1])
+    if not id then return false end
+end
+local job = ARGV[3] .. id
+redis.call('HSET', job, 'status', 'running', 'started_at', ARGV[1])
+redis.call('HINCRBY', job, 'attempts', 1)
+redis.call('ZADD', KEYS[2], ARGV[2], id)
+return redis.call('HGETALL', job)
+"""
+
+
+# 이하 스크립트 공통 - KEYS[1]: job, ARGV[1]: id, ARGV[2]: claim 시점 attempts
+# running이 아니거나 그새 다시 claim됐으면(attempts 증가) lease를 잃은 것 → 아무것도 쓰지 않음
+_LEASE_GUARD = """
+if redis.call('HGET', KEYS[1], 'status') ~= 'running'
+    or redis.call('HGET', KEYS[1], 'attempts') ~= ARGV[2] then
+    return 0
+end
+"""
+
+# KEYS: job, leases / ARGV: id, attempt, lease_until
+# XX: lease가 남아 있을 때만 갱신, CH: 갱신 수 반환
+RENEW_SCRIPT = _LEASE_GUARD + """
+return redis.call('ZADD', KEYS[2], 'XX', 'CH', ARGV[3], ARGV[1])
+"""
+
+# KEYS: job, leases / ARGV: id, attempt, status, 필드, 값, finished_at
+FINISH_SCRIPT = _LEASE_GUARD + """
+redis.call('HSET', KEYS[1], 'status', ARGV[3], ARGV[4], ARGV[5], 'finished_at', ARGV[6])
+redis.call('ZREM', KEYS[2], ARGV[1])
+return 1
+"""
+
+# KEYS: job, leases, queue / ARGV: id, attempt
+# RPUSH = RPOP 쪽 → 다음 claim 대상
+RELEASE_SCRIPT = _LEASE_GUARD + """
+redis.call('ZREM', KEYS[2], ARGV[1])
+redis.call('HSET', KEYS[1], 'status', 'queued')
+redis.call('HDEL', KEYS[1], 'started_at')
+redis.call('HINCRBY', KEYS[1], 'attempts', -1)
+redis.call('RPUSH', KEYS[3], ARGV[1])
+return 1
+"""
+
+
+class RedisJobBroker(JobBroker):
+    """
+    Redis 작업 브로커
+
+    - claim: CLAIM_SCRIPT 1회 실행 (만료 lease 재할당 또는 RPOP + running 표시 + lease 등록이 원자적)
+    - 응답을 받기 전에 연결이 끊겨도 작업은 이미 lease가 걸린 running 상태
+      → 그 워커가 실행하지 않으면 lease 만료 후 다른 claim이 다시 가져감 (유실 없음)
+    - renew/complete/fail/release: claim 시점 attempts가 그대로일 때만 반영 (_LEASE_GUARD)
+    """
+
+    def __init__(self, client: RespClient, prefix: str = "swing:jobs"):
+        """
+        Args:
+            client: RESP 클라이언트
+            prefix: 키 접두사 (환경별 분리용)
+        """
+        self.client = client
+        self.prefix = prefix
+        self.queue_key = f"{prefix}:queue"
+        self.leases_key = f"{prefix}:leases"
+
+    def submit(self, kind: str, payload: dict) -> str:
+        job_id = f"job_{uuid.uuid4().hex[:16]}"
+        fields = {
+            "id": job_id,
+            "kind": kind,
+            "status": "queued",
+            "payload": json.dumps(payload, ensure_ascii=False),
+            "attempts": 0,
+            "created_at": repr(time.time()),
+        }
+        self.client.pipeline([
+            ("HSET", self._job_key(job_id), *_flatten(fields)),
+            ("LPUSH", self.queue_key, job_id),
+        ])
+        return job_id
+
+    def claim(self, lease_sec: float) -> Optional[dict]:
+        now = time.time()
+        flat = self.client.execute(
+            "EVAL", CLAIM_SCRIPT, 2, self.queue_key, self.leases_key,
+            repr(now), repr(now + lease_sec), self._job_key(""),
+        )
+        return _decode_job(flat) if flat else None
+
+    def renew(self, job_id: str, attempt: int, lease_sec: float) -> bool:
+        score = repr(time.time() + lease_sec)
+        return self._eval(RENEW_SCRIPT, job_id, attempt, score) == 1
+
+    def complete(self, job_id: str, attempt: int, result: str) -> bool:
+        return self._finish(job_id, attempt, "succeeded", "result", result)
+
+    def fail(self, job_id: str, attempt: int, error: str) -> bool:
+        return self._finish(job_id, attempt, "failed", "error", error)
+
+    def release(self, job_id: str, attempt: int) -> bool:
+        return self._eval(RELEASE_SCRIPT, job_id, attempt, queue=True) == 1
+
+    def get(self, job_id: str) -> Optional[dict]:
+        flat = self.client.execute("HGETALL", self._job_key(job_id))
+        return _decode_job(flat) if flat else None
+
+    def count(self, status: str) -> int:
+        if status == "queued":
+            return self.client.execute("LLEN", self.queue_key)
+        if status == "running":
+            return self.client.execute("ZCARD", self.leases_key)
+        raise ValueError(f"RedisJobBroker.count supports queued/running only: {status}")
+
+    def _finish(self, job_id: str, attempt: int, status: str, field: str, value: str) -> bool:
+        finished_at = repr(time.time())
+        return self._eval(FINISH_SCRIPT, job_id, attempt, status, field, value, finished_at) == 1
+
+    def _eval(self, script: str, job_id: str, attempt: int, *args, queue: bool = False) -> Any:
+        keys = [self._job_key(job_id), self.leases_key] + ([self.queue_key] if queue else [])
+        return self.client.execute("EVAL", script, len(keys), *keys, job_id, attempt, *args)
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.prefix}:job:{job_id}"
+
+
+def _decode_job(flat: list) -> dict:
+    """HGETALL 응답(필드, 값 교대 리스트) → 작업 dict"""
+    raw = dict(zip(flat[0::2], flat[1::2]))
+    return {
+        "id": raw["id"],
+        "kind": raw["kind"],
+        "status": raw["status"],
+        "payload": json.loads(raw["payload"]),
+        "result": raw.get("result"),
+        "error": raw.get("error"),
+        "attempts": int(raw.get("attempts", 0)),
+        "created_at": float(raw["created_at"]),
+        "started_at": _float_or_none(raw.get("started_at")),
+        "finished_at": _float_or_none(raw.get("finished_at")),
+    }
+
+
+def _flatten(fields: dict) -> list:
+    return [item for pair in fields.items() for item in pair]
+
+
+def _float_or_none(value: Optional[str]) -> Optional[float]:
+    return float(value) if value not in (None, "") else None
@@ -0,0 +1,151 @@
+"""
+분석 작업 큐 - SQLite 브로커 (단일 호스트)
+API 프로세스 안 워커와 같은 호스트의 워커 프로세스들이 DB 파일 하나를 공유
+"""
+import json
+import logging
+import sqlite3
+import time
+import uuid
+from contextlib import closing
+from pathlib import Path
+from typing import Optional, Union
+
+from app.config.settings import settings
+from app.infrastructure.jobs.base import JobBroker
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    lease_until REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at);
+"""
+
+
+class SQLiteJobBroker(JobBroker):
+    """
+    SQLite 작업 브로커
+
+    - 연결은 호출마다 새로 열고 닫음 (스레드/프로세스 간 공유 안전, WAL 모드)
+    - claim은 BEGIN IMMEDIATE 트랜잭션으로 한 작업을 한 워커에만 배정
+    - renew/complete/fail/release는 status = 'running' AND attempts = (claim 시점 값)일 때만 반영
+    """
+
+    def __init__(self, db_path: Optional[Union[str, Path]] = None):
+        """
+        Args:
+            db_path: DB 파일 경로 (기본: settings.JOBS_DB_PATH)
+        """
+        self.db_path = Path(db_path or settings.JOBS_DB_PATH)
+        self._initialized = False
+
+    def submit(self, kind: str, payload: dict) -> str:
+        job_id = f"job_{uuid.uuid4().hex[:16]}"
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, kind, status, payload, created_at) VALUES (?, ?, 'queued', ?, ?)",
+                (job_id, kind, json.dumps(payload, ensure_ascii=False), time.time())
+            )
+        return job_id
+
+    def claim(self, lease_sec: float) -> Optional[dict]:
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT id FROM jobs WHERE status = 'queued' "
+                    "OR (status = 'running' AND lease_until < ?) ORDER BY created_at LIMIT 1",
+                    (now,)
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+                conn.execute(
+                    "UPDATE jobs SET status = 'running', attempts = attempts + 1, "
+                    "started_at = ?, lease_until = ? WHERE id = ?",
+                    (now, now + lease_sec, row["id"])
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return self.get(row["id"])
+
+    def renew(self, job_id: str, attempt: int, lease_sec: float) -> bool:
+        now = time.time()
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_until = ? "
+                "WHERE id = ? AND status = 'running' AND attempts = ? AND lease_until >= ?",
+                (now + lease_sec, job_id, attempt, now)
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, job_id: str, attempt: int, result: str) -> bool:
+        return self._finish(job_id, attempt, "succeeded", result=result)
+
+    def fail(self, job_id: str, attempt: int, error: str) -> bool:
+        return self._finish(job_id, attempt, "failed", error=error)
+
+    def release(self, job_id: str, attempt: int) -> bool:
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'queued', attempts = MAX(attempts - 1, 0), "
+                "started_at = NULL, lease_until = NULL WHERE id = ? AND status = 'running' AND attempts = ?",
+                (job_id, attempt)
+            )
+            return cursor.rowcount == 1
+
+    def get(self, job_id: str) -> Optional[dict]:
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        job.pop("lease_until", None)
+        return job
+
+    def count(self, status: str) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM jobs WHERE status = ?", (status,)).fetchone()[0]
+
+    def _finish(
+        self,
+        job_id: str,
+        attempt: int,
+        status: str,
+        result: Optional[str] = None,
+        error: Optional[str] = None
+    ) -> bool:
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?, lease_until = NULL "
+                "WHERE id = ? AND status = 'running' AND attempts = ?",
+                (status, result, error, time.time(), job_id, attempt)
+            )
+            return cursor.rowcount == 1
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._initialized = True
+        return conn
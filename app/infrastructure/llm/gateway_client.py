@@ -15,7 +15,8 @@ class LLMGatewayClient:
         provider: str = "noop",
         model: str = "gpt-4o-mini",
         api_key: Optional[str] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        http_client: Optional[httpx.AsyncClient] = None
     ):
         """
         Args:
@@ -24,12 +25,14 @@ class LLMGatewayClient:
             model: 모델명
             api_key: API 키 (optional, Gateway에서 관리할 수도 있음)
             timeout: 타임아웃(초)
+            http_client: 공유 AsyncClient (없으면 agenerate_feedback 호출마다 생성)
         """
         self.gateway_url = gateway_url.rstrip("/")
         self.provider=provider.lower()
         self.model = model
         self.api_key = api_key
         self.timeout = timeout
+        self.http_client = http_client
 
         if self.provider == 'noop':
             logger.info("🧪 LLM Client: NoOp 모드 (테스트용, 과금 없음)")
@@ -63,28 +66,12 @@ class LLMGatewayClient:
             logger.info("Noop 모드: Mock 응답 반환 (과금 없음)")
             return self._generate_mock_feedback(diagnosis)
 
-        # System prompt
-        system_prompt = self._build_system_prompt(tone, language)
-
-        # User prompt (진단 요약)
-        user_prompt = self._build_user_prompt(diagnosis, club)
-
         # LLM Gateway 호출
         try:
             response = httpx.post(
                 f"{self.gateway_url}/api/chat",
-                json={
-                    "provider": self.provider,
-                    "model": self.model,
-                    "messages": [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ],
-                    "user_id": user_id,
-                    "temperature": 0.7,
-                    "max_tokens": 500
-                },
-                headers={"X-API-Key": self.api_key} if self.api_key else {},
+                json=self._feedback_payload(diagnosis, user_id, club, tone, language),
+                headers=self._headers(),
                 timeout=self.timeout
             )
             response.raise_for_status()
@@ -96,6 +83,57 @@ class LLMGatewayClient:
             # Fallback: 룰 기반 피드백
             return self._fallback_feedback(diagnosis)
 
+    async def agenerate_feedback(
+        self,
+        diagnosis: DiagnosisResult,
+        user_id: str,
+        club: str,
+        tone: str = "professional",
+        language: str = "ko"
+    ) -> str:
+        """
+        generate_feedback의 비동기 버전 (이벤트 루프를 막지 않음)
+
+        Args / Returns: generate_feedback과 동일
+        """
+        if self.provider == "noop":
+            logger.info("Noop 모드: Mock 응답 반환 (과금 없음)")
+            return self._generate_mock_feedback(diagnosis)
+
+        url = f"{self.gateway_url}/api/chat"
+        payload = self._feedback_payload(diagnosis, user_id, club, tone, language)
+        try:
+            if self.http_client is not None:
+                response = await self.http_client.post(url, json=payload, headers=self._headers(), timeout=self.timeout)
+            else:
+                async with httpx.AsyncClient(timeout=self.timeout) as client:
+                    response = await client.post(url, json=payload, headers=self._headers())
+            response.raise_for_status()
+            return response.json().get("content", "피드백 생성 실패")
+
+        except httpx.HTTPError as e:
+            logger.warning(f"⚠️ LLM Gateway 호출 실패, 룰 기반 피드백 사용: {e}")
+            return self._fallback_feedback(diagnosis)
+
+    def _feedback_payload(
+        self, diagnosis: DiagnosisResult, user_id: str, club: str, tone: str, language: str
+    ) -> dict:
+        """피드백 생성 요청 본문 (system prompt + 진단 요약)"""
+        return {
+            "provider": self.provider,
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": self._build_system_prompt(tone, language)},
+                {"role": "user", "content": self._build_user_prompt(diagnosis, club)}
+            ],
+            "user_id": user_id,
+            "temperature": 0.7,
+            "max_tokens": 500
+        }
+
+    def _headers(self) -> dict:
+        return {"X-API-Key": self.api_key} if self.api_key else {}
+
     def _build_system_prompt(self, tone: str, language: str) -> str:
         """System prompt 생성"""
         tone_map = {
@@ -0,0 +1,155 @@
+"""
+분석 실행 로그 (JSON Lines)
+요청 경로에서는 큐에 넣기만 하고, 백그라운드 스레드가 모아서 한 번에 append + 크기 기준 회전
+
+파일: LOG_DIR/runs.jsonl (회전 시 runs-YYYYmmdd-HHMMSS-<n>.jsonl)
+스키마: scripts/utils/libs/flatten.flatten_core_blocks / scripts/datasets/build_phase_dataset.py 입력과 동일
+"""
+import json
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Union
+
+from prometheus_client import Counter
+
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+RUNLOG_RECORDS = Counter("swing_runlog_records_total", "실행 로그 레코드 수", ["result"])
+
+_STOP = object()
+
+
+class RunLogWriter:
+    """
+    배치 JSONL 로그 작성기
+
+    - write(): 논블로킹 (큐가 가득 차면 레코드를 버리고 카운트만 증가)
+    - 백그라운드 스레드: batch_size개 또는 flush_interval초마다 파일에 한 번 append
+    - 현재 파일이 max_bytes를 넘으면 날짜 붙은 이름으로 바꾸고 새 파일 시작
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Union[str, Path]] = None,
+        filename: str = "runs.jsonl",
+        max_bytes: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_queue: Optional[int] = None
+    ):
+        """
+        Args:
+            directory: 로그 폴더 (기본: settings.LOG_DIR)
+            filename: 현재 로그 파일 이름
+            max_bytes: 회전 기준 크기 (기본: settings.RUNLOG_MAX_BYTES)
+            batch_size: 한 번에 쓰는 최대 레코드 수
+            flush_interval: 레코드가 적어도 이 시간(초)마다 기록
+            max_queue: 대기 레코드 상한 (넘으면 버림)
+        """
+        self.directory = Path(directory or settings.LOG_DIR)
+        self.path = self.directory / filename
+        self.max_bytes = max_bytes or settings.RUNLOG_MAX_BYTES
+        self.batch_size = batch_size or settings.RUNLOG_BATCH_SIZE
+        self.flush_interval = flush_interval or settings.RUNLOG_FLUSH_SEC
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue or settings.RUNLOG_QUEUE_SIZE)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def write(self, record: dict) -> bool:
+        """
+        레코드 1개 등록 (파일 I/O 없음)
+
+        Returns:
+            큐에 들어갔으면 True, 가득 차서 버렸으면 False
+        """
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            RUNLOG_RECORDS.labels("dropped").inc()
+            return False
+        return True
+
+    def close(self, timeout: float = 5.0) -> None:
+        """남은 레코드를 모두 기록하고 스레드 종료"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        thread.join(timeout)
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="runlog-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch, stop = self._collect()
+            if batch:
+                try:
+                    self._append(batch)
+                    RUNLOG_RECORDS.labels("written").inc(len(batch))
+                except Exception as e:
+                    RUNLOG_RECORDS.labels("failed").inc(len(batch))
+                    logger.error(f"❌ 실행 로그 기록 실패 ({self.path}): {e}")
+            if stop:
+                return
+
+    def _collect(self) -> tuple[list[dict], bool]:
+        """첫 레코드를 기다린 뒤 batch_size개 또는 flush_interval까지 모음"""
+        first = self._queue.get()
+        if first is _STOP:
+            return [], True
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _append(self, batch: list[dict]) -> None:
+        data = "".join(json.dumps(r, ensure_ascii=False, default=str) + "\n" for r in batch).encode("utf-8")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        try:
+            size = self.path.stat().st_size
+        except OSError:
+            size = 0
+        if size and size + len(data) > self.max_bytes:
+            self._rotate()
+        with open(self.path, "ab") as f:
+            f.write(data)
+
+    def _rotate(self) -> None:
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        stem, suffix = self.path.stem, self.path.suffix
+        n = 0
+        while True:
+            target = self.path.with_name(f"{stem}-{stamp}-{n}{suffix}")
+            if not target.exists():
+                break
+            n += 1
+        self.path.rename(target)
+        logger.info(f"🔁 실행 로그 회전: {target.name}")
+
+
+# 프로세스 전역 작성기 (첫 write 시 스레드 시작, lifespan 종료 시 close)
+run_log = RunLogWriter()
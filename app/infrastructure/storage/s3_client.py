@@ -36,19 +36,27 @@ class S3StorageClient:
             # 환경변수나 IAM Role 사용
             self.s3_client = boto3.client("s3", region_name=region_name)
 
-    def upload_result(self, result: AnalyzeSwingResponse) -> str:
+    def result_key(self, result: AnalyzeSwingResponse) -> str:
+        """결과 객체 키 (user_id/YYYYMMDD/analysis_id.json)"""
+        timestamp = datetime.now().strftime("%Y%m%d")
+        return f"swing-analysis/{result.user_id}/{timestamp}/{result.analysis_id}.json"
+
+    def result_url(self, s3_key: str) -> str:
+        """객체 URL (https://bucket.s3.amazonaws.com/path/to/file.json)"""
+        return f"https://{self.bucket_name}.s3.amazonaws.com/{s3_key}"
+
+    def upload_result(self, result: AnalyzeSwingResponse, s3_key: Optional[str] = None) -> str:
         """
         분석 결과를 S3에 JSON으로 저장
 
         Args:
             result: 분석 응답 DTO
+            s3_key: 저장 키 (같은 결과를 나중에 덮어쓸 때 지정, 기본: result_key())
 
         Returns:
             S3 URL (https://bucket.s3.amazonaws.com/path/to/file.json)
         """
-        # 파일명 생성 (user_id/YYYYMMDD/analysis_id.json)
-        timestamp = datetime.now().strftime("%Y%m%d")
-        s3_key = f"swing-analysis/{result.user_id}/{timestamp}/{result.analysis_id}.json"
+        s3_key = s3_key or self.result_key(result)
 
         # JSON 직렬화
         json_data = result.model_dump_json(indent=2)
@@ -66,6 +74,4 @@ class S3StorageClient:
             }
         )
 
-        # URL 생성
-        url = f"https://{self.bucket_name}.s3.amazonaws.com/{s3_key}"
-        return url
+        return self.result_url(s3_key)
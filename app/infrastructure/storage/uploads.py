@@ -0,0 +1,110 @@
+"""
+작업용 업로드 공유 스토리지
+API 노드는 업로드를 여기에 넣고 참조(ref)만 작업 payload에 담고, 워커 노드가 ref로 꺼내 분석
+
+- local: 공유 볼륨 디렉토리 (NFS / docker volume, SHARED_UPLOADS_DIR)
+- s3:    S3 버킷 (UPLOADS_S3_BUCKET, 워커는 임시 파일로 내려받아 사용)
+"""
+import os
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+import boto3
+
+from app.config.settings import settings
+
+
+class UploadStorage(ABC):
+    """업로드 파일 공유 스토리지"""
+
+    @abstractmethod
+    def put(self, local_path: str, name: str) -> str:
+        """
+        로컬 업로드 파일을 공유 스토리지로 옮김 (원본 로컬 파일은 제거)
+
+        Args:
+            local_path: API 노드에 저장된 업로드 파일
+            name: 스토리지 안 파일 이름 (작업마다 고유)
+
+        Returns:
+            ref (작업 payload에 담을 참조)
+        """
+
+    @abstractmethod
+    @contextmanager
+    def open_local(self, ref: str) -> Iterator[str]:
+        """ref → 분석에 쓸 로컬 파일 경로 (with 블록 동안 유효)"""
+
+    @abstractmethod
+    def delete(self, ref: str) -> None:
+        """작업이 끝난 업로드 삭제 (없으면 무시)"""
+
+
+class LocalUploadStorage(UploadStorage):
+    """공유 디렉토리 (모든 노드가 같은 경로로 마운트)"""
+
+    def __init__(self, root: Optional[Union[str, Path]] = None):
+        self.root = Path(root or settings.SHARED_UPLOADS_DIR)
+
+    def put(self, local_path: str, name: str) -> str:
+        self.root.mkdir(parents=True, exist_ok=True)
+        shutil.move(local_path, self.root / name)
+        return name
+
+    @contextmanager
+    def open_local(self, ref: str) -> Iterator[str]:
+        yield str(self._path(ref))
+
+    def delete(self, ref: str) -> None:
+        path = self._path(ref)
+        if path.exists():
+            os.remove(path)
+
+    def _path(self, ref: str) -> Path:
+        path = (self.root / ref).resolve()
+        if self.root.resolve() not in path.parents:
+            raise ValueError(f"invalid upload ref: {ref}")
+        return path
+
+
+class S3UploadStorage(UploadStorage):
+    """S3 버킷 (노드 간 공유 볼륨이 없을 때)"""
+
+    def __init__(self, bucket_name: str, prefix: str = "uploads/", region_name: str = "us-east-1"):
+        self.bucket_name = bucket_name
+        self.prefix = prefix
+        self.s3_client = boto3.client("s3", region_name=region_name)
+
+    def put(self, local_path: str, name: str) -> str:
+        key = f"{self.prefix}{name}"
+        self.s3_client.upload_file(local_path, self.bucket_name, key)
+        os.remove(local_path)
+        return key
+
+    @contextmanager
+    def open_local(self, ref: str) -> Iterator[str]:
+        tmp_dir = tempfile.mkdtemp(prefix="swing-upload-")
+        path = os.path.join(tmp_dir, os.path.basename(ref))
+        try:
+            self.s3_client.download_file(self.bucket_name, ref, path)
+            yield path
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def delete(self, ref: str) -> None:
+        self.s3_client.delete_object(Bucket=self.bucket_name, Key=ref)
+
+
+def create_upload_storage() -> UploadStorage:
+    """settings.UPLOADS_STORAGE ("local" | "s3") → 스토리지"""
+    if settings.UPLOADS_STORAGE == "s3":
+        return S3UploadStorage(settings.UPLOADS_S3_BUCKET, prefix=settings.UPLOADS_S3_PREFIX)
+    return LocalUploadStorage()
+
+
+# 프로세스 전역 업로드 스토리지
+upload_storage = create_upload_storage()
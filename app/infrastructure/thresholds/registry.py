@@ -0,0 +1,174 @@
+"""
+thresholds 버전 레지스트리
+설정 디렉토리의 날짜별 파일을 시작 시 1회 로드해 날짜/파일명/지문으로 조회
+(요청 경로에서는 파일시스템 접근 없음)
+"""
+import hashlib
+import logging
+from pathlib import Path
+from typing import Optional, Union
+
+from app.config.settings import settings
+from app.infrastructure.thresholds.snapshot import ThresholdSnapshot, build_snapshot
+from app.infrastructure.thresholds.watcher import ThresholdStore, threshold_store
+from app.utils.resource_finder import rf
+
+logger = logging.getLogger(__name__)
+
+CURRENT = "current"
+
+
+class ThresholdRegistry:
+    """
+    날짜별 thresholds 버전 보관소
+
+    선택 우선순위:
+    1. 요청이 지정한 버전 (날짜 / 파일명 / 지문 앞자리 / "current")
+    2. settings.THRESHOLDS_PIN
+    3. settings.THRESHOLDS_AB_SPLIT (요청 키 해시로 결정 → 같은 사용자는 항상 같은 버전)
+    4. 핫 리로드 스토어의 현재 버전
+    """
+
+    def __init__(
+        self,
+        config_dir: Union[str, Path, None] = None,
+        store: ThresholdStore = threshold_store,
+        pin: Optional[str] = None,
+        ab_split: Optional[dict[str, float]] = None
+    ):
+        """
+        Args:
+            config_dir: 날짜별 파일 디렉토리 (기본: rf.config)
+            store: "current" 버전을 제공하는 핫 리로드 스토어
+            pin: 고정 버전 (기본: settings.THRESHOLDS_PIN)
+            ab_split: {버전: 가중치} (기본: settings.THRESHOLDS_AB_SPLIT)
+        """
+        self.config_dir = Path(config_dir) if config_dir else rf.config
+        self.store = store
+        self.pin = pin if pin is not None else settings.THRESHOLDS_PIN
+        self.ab_split = ab_split if ab_split is not None else settings.THRESHOLDS_AB_SPLIT
+        self._by_key: dict[str, ThresholdSnapshot] = {}
+        self._versions: tuple[ThresholdSnapshot, ...] = ()
+
+    @property
+    def versions(self) -> tuple[ThresholdSnapshot, ...]:
+        """로드된 버전 (날짜순)"""
+        return self._versions
+
+    def load(self) -> int:
+        """
+        설정 디렉토리의 날짜별 파일 전부 로드 (검증 실패 파일은 건너뜀)
+
+        Returns:
+            로드된 버전 수
+        """
+        snapshots = []
+        # 운영 파일명 끝에 공백이 붙어 있어 "*_thresholds.json"만으로는 매칭되지 않음
+        for path in sorted(self.config_dir.glob("*_thresholds.json*")):
+            if path.is_symlink():
+                continue
+            try:
+                snapshot = build_snapshot(path, path.read_bytes())
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️ thresholds 버전 로드 실패 ({path.name.strip()}): {e}")
+                continue
+            if snapshot.date is not None:
+                snapshots.append(snapshot)
+
+        snapshots.sort(key=lambda s: s.date)
+        by_key: dict[str, ThresholdSnapshot] = {}
+        for snapshot in snapshots:
+            by_key[snapshot.date] = snapshot
+            by_key[snapshot.version] = snapshot
+            by_key[snapshot.fingerprint] = snapshot
+
+        # 참조 교체로 반영 (조회 중인 요청은 이전 dict를 계속 사용)
+        self._by_key = by_key
+        self._versions = tuple(snapshots)
+        logger.info(f"📚 thresholds 버전 {len(snapshots)}개 로드: {[s.date for s in snapshots]}")
+
+        # 설정의 pin / A/B 버전이 없으면 모든 요청이 실패하므로 경고 후 무시 (current로 동작)
+        if self.pin and not self._known(self.pin):
+            logger.warning(f"⚠️ THRESHOLDS_PIN 버전 없음, 무시: {self.pin}")
+            self.pin = ""
+        unknown = [v for v in self.ab_split if not self._known(v)]
+        if unknown:
+            logger.warning(f"⚠️ THRESHOLDS_AB_SPLIT 버전 없음, 제외: {unknown}")
+            self.ab_split = {v: w for v, w in self.ab_split.items() if v not in unknown}
+        return len(snapshots)
+
+    def get(self, version: str) -> ThresholdSnapshot:
+        """
+        버전 조회
+
+        Args:
+            version: 날짜("2025-11-10"), 파일명, 지문(앞 6자리 이상) 또는 "current"
+
+        Raises:
+            KeyError: 알 수 없는 버전
+        """
+        if version == CURRENT:
+            snapshot = self.store.get()
+            if snapshot is None:
+                raise KeyError(version)
+            return snapshot
+
+        by_key = self._by_key
+        snapshot = by_key.get(version)
+        if snapshot is not None:
+            return snapshot
+
+        if len(version) >= 6:
+            matches = {s for s in self._versions if s.fingerprint.startswith(version)}
+            if len(matches) == 1:
+                return matches.pop()
+        raise KeyError(version)
+
+    def select(self, version: Optional[str] = None, key: Optional[str] = None) -> Optional[ThresholdSnapshot]:
+        """
+        요청에 사용할 버전 선택
+
+        Args:
+            version: 요청이 지정한 버전 (없으면 pin → A/B → current 순)
+            key: A/B 분배용 안정 키 (user_id 등, 없으면 A/B 미적용)
+
+        Returns:
+            ThresholdSnapshot (로드된 것이 없으면 None)
+
+        Raises:
+            KeyError: version을 지정했는데 알 수 없는 버전 (설정의 pin / A/B 버전이 없으면 current로 대체)
+        """
+        if version:
+            return self.get(version)
+        configured = self.pin or (self._ab_bucket(key) if self.ab_split and key else None)
+        if configured:
+            try:
+                return self.get(configured)
+            except KeyError:
+                logger.warning(f"⚠️ 설정된 thresholds 버전 없음, current 사용: {configured}")
+        return self.store.get()
+
+    def _known(self, version: str) -> bool:
+        """설정 검증용 (current는 스토어가 나중에 로드될 수 있으므로 항상 유효)"""
+        if version == CURRENT:
+            return True
+        try:
+            self.get(version)
+        except KeyError:
+            return False
+        return True
+
+    def _ab_bucket(self, key: str) -> str:
+        """키 해시를 [0, 1) 구간에 매핑해 가중치 누적 구간으로 버전 결정"""
+        total = sum(self.ab_split.values())
+        point = int(hashlib.sha256(key.encode("utf-8")).hexdigest()[:8], 16) / 0x100000000 * total
+        cumulative = 0.0
+        for version, weight in self.ab_split.items():
+            cumulative += weight
+            if point < cumulative:
+                return version
+        return next(reversed(self.ab_split))
+
+
+# 프로세스 전역 레지스트리
+threshold_registry = ThresholdRegistry()
@@ -0,0 +1,82 @@
+"""
+thresholds 스냅샷
+파일 1개를 읽어 검증 → 컴파일한 불변 객체 (핫 리로드 스토어 / 버전 레지스트리 공용)
+"""
+import hashlib
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from app.config.settings import settings
+from app.domain.diagnosis.distributions import DistributionTable
+from app.domain.diagnosis.scoring import DistributionScorer
+from app.utils.thresholds_utils import qc_thresholds_usable, validate_thresholds
+
+# "2025-11-10_thresholds.json" → "2025-11-10"
+_DATE_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2})_thresholds\.json$")
+
+
+class ThresholdSnapshot:
+    """
+    한 버전의 thresholds (생성 후 변경하지 않음)
+
+    요청은 시작 시 받은 스냅샷만 계속 사용하므로
+    처리 도중 파일이 바뀌어도 한 요청 안에서는 같은 버전을 본다.
+    """
+
+    __slots__ = ("version", "date", "path", "fingerprint", "data", "compiled", "scorer", "loaded_at")
+
+    def __init__(self, version: str, path: Path, fingerprint: str, data: dict[str, Any], compiled: DistributionTable):
+        self.version = version
+        self.date: Optional[str] = version_date(version)
+        self.path = path
+        self.fingerprint = fingerprint
+        self.data = data
+        self.compiled = compiled
+        self.scorer = DistributionScorer(compiled, min_n=settings.THRESH_MIN_N)  # 엔진 페이즈 기준 CDF
+        self.loaded_at = time.time()
+
+
+def version_date(version: str) -> Optional[str]:
+    """파일명에서 날짜 추출 (날짜형 파일명이 아니면 None)"""
+    match = _DATE_PATTERN.match(version.strip())
+    return match.group(1) if match else None
+
+
+def fingerprint_of(raw: bytes) -> str:
+    """파일 내용 지문 (sha256 앞 12자리)"""
+    return hashlib.sha256(raw).hexdigest()[:12]
+
+
+def build_snapshot(path: Path, raw: bytes) -> ThresholdSnapshot:
+    """
+    파일 내용 검증 + 컴파일
+
+    Args:
+        path: 읽은 파일 경로 (심링크면 실제 대상 파일명이 버전이 됨)
+        raw: 파일 내용
+
+    Returns:
+        ThresholdSnapshot
+
+    Raises:
+        ValueError: JSON 파싱 실패 또는 스키마 검증 실패
+    """
+    data = json.loads(raw.decode("utf-8"))
+
+    required = set(settings.THRESH_REQUIRED_KEYS)
+    errors = validate_thresholds(data, required)
+    if errors:
+        raise ValueError(f"invalid thresholds: {errors[:5]}")
+    if not qc_thresholds_usable(data, required):
+        raise ValueError("no usable metric blocks")
+
+    return ThresholdSnapshot(
+        version=Path(path).resolve().name.strip(),  # 운영 파일명 끝 공백 제거
+        path=Path(path),
+        fingerprint=fingerprint_of(raw),
+        data=data,
+        compiled=DistributionTable(data)
+    )
@@ -0,0 +1,159 @@
+"""
+thresholds_current.json 핫 리로드
+심링크 교체(rotate_thresholds / make release)를 감지해 검증 → 컴파일 → 스냅샷 원자적 교체
+"""
+import asyncio
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+from app.infrastructure.thresholds.snapshot import ThresholdSnapshot, build_snapshot, fingerprint_of
+from app.utils.resource_finder import rf
+
+try:  # inotify 기반 감시 (선택 의존성)
+    from watchfiles import awatch
+except ImportError:  # pragma: no cover - 설치 환경에 따라 다름
+    awatch = None
+
+logger = logging.getLogger(__name__)
+
+
+class ThresholdStore:
+    """
+    RCU 스타일 스냅샷 보관소
+
+    - 읽기: 현재 스냅샷 참조를 그대로 반환 (락 없음)
+    - 쓰기: 새 파일을 검증/컴파일한 뒤 참조 1개만 교체, 실패하면 기존 버전 유지
+    """
+
+    def __init__(
+        self,
+        path_resolver: Callable[[], Union[str, Path]] = rf.thresholds_path,
+        retry_interval: float = 5.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            path_resolver: 현재 thresholds 파일 경로를 돌려주는 함수
+                (기본: THRESHOLDS_FILE → thresholds_current.json → 최신 날짜 파일)
+            retry_interval: 한 번도 로드하지 못했을 때 get()의 재시도 간격(초)
+            clock: 단조 시계 (테스트용)
+        """
+        self.path_resolver = path_resolver
+        self.retry_interval = retry_interval
+        self._clock = clock
+        self._snapshot: Optional[ThresholdSnapshot] = None
+        self._last_attempt: Optional[float] = None  # get()에서 마지막으로 로드를 시도한 시각
+
+    def get(self) -> Optional[ThresholdSnapshot]:
+        """
+        현재 스냅샷 (아직 로드 전이면 로드 시도)
+
+        로드에 실패하면 retry_interval 동안은 다시 읽지 않고 None
+        (파일이 없거나 깨진 동안 요청마다 디스크 읽기 / 검증 / 에러 로그가 반복되지 않도록)
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            now = self._clock()
+            if self._last_attempt is not None and now - self._last_attempt < self.retry_interval:
+                return None
+            self._last_attempt = now
+            self.reload()
+            snapshot = self._snapshot
+        return snapshot
+
+    def reload(self) -> bool:
+        """
+        현재 thresholds 파일을 다시 읽어 교체
+
+        Returns:
+            새 버전으로 교체되었으면 True (내용이 같거나 검증 실패면 False)
+        """
+        path = Path(self.path_resolver())
+        try:
+            raw = path.read_bytes()
+        except OSError as e:
+            logger.warning(f"⚠️ thresholds 읽기 실패 ({path}): {e}")
+            return False
+
+        current = self._snapshot
+        if current is not None and current.fingerprint == fingerprint_of(raw):
+            return False
+
+        try:
+            self._snapshot = build_snapshot(path, raw)
+        except ValueError as e:
+            logger.error(f"❌ thresholds 검증 실패, 기존 버전 유지 ({path}): {e}")
+            return False
+
+        fingerprint = self._snapshot.fingerprint
+        logger.info(f"🔄 thresholds 교체: {self._snapshot.version} ({fingerprint})")
+        return True
+
+
+class ThresholdWatcher:
+    """
+    thresholds 파일 감시 (watchfiles가 있으면 inotify, 없으면 폴링)
+
+    심링크 교체는 링크 자체가 아니라 디렉토리 엔트리 변경이므로 설정 디렉토리를 감시하고,
+    변경이 보이면 store.reload()가 지문 비교로 실제 교체 여부를 결정한다.
+    """
+
+    def __init__(self, store: ThresholdStore, poll_interval: float = 1.0):
+        self.store = store
+        self.poll_interval = poll_interval
+        self._stop = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> "ThresholdWatcher":
+        """현재 이벤트 루프에서 감시 태스크 시작"""
+        self._task = asyncio.create_task(self._run(), name="thresholds-watcher")
+        return self
+
+    async def stop(self) -> None:
+        """감시 종료"""
+        self._stop.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        if awatch is not None:
+            try:
+                await self._watch_inotify()
+                return
+            except Exception as e:
+                logger.warning(f"⚠️ inotify 감시 실패, 폴링으로 전환: {e}")
+        await self._watch_polling()
+
+    async def _watch_inotify(self) -> None:
+        watch_dir = Path(self.store.path_resolver()).parent
+        async for _changes in awatch(watch_dir, stop_event=self._stop):
+            await asyncio.to_thread(self.store.reload)
+
+    async def _watch_polling(self) -> None:
+        last = self._stat_key()
+        while not self._stop.is_set():
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            key = self._stat_key()
+            if key != last:
+                last = key
+                await asyncio.to_thread(self.store.reload)
+
+    def _stat_key(self) -> Optional[tuple]:
+        """(실제 경로, mtime, size) - 심링크가 다른 파일로 바뀌면 실제 경로가 달라짐"""
+        try:
+            path = os.path.realpath(self.store.path_resolver())
+            st = os.stat(path)
+            return path, st.st_mtime_ns, st.st_size
+        except OSError:
+            return None
+
+
+# 프로세스 전역 스토어
+threshold_store = ThresholdStore()
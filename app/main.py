@@ -1,11 +1,56 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.openapi.utils import get_openapi
 
 from app.api import include_all_routers
+from app.common.admission import SESSION_PATHS, AdmissionMiddleware, session_admission
+from app.common.deadline import RequestClockMiddleware
+from app.common.executors import drain_background, shutdown_executors
 from app.config.settings import settings
+from app.infrastructure.runlog.writer import run_log
+from app.infrastructure.thresholds.registry import threshold_registry
+from app.infrastructure.thresholds.watcher import ThresholdWatcher, threshold_store
+from app.services.container import container
+from app.services.job_runner import job_runner
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # thresholds 최초 로드 (현재 버전 + 날짜별 버전) + 심링크 교체 감시 (재시작 없이 반영)
+    threshold_store.reload()
+    threshold_registry.load()
+    watcher = None
+    if settings.THRESHOLDS_WATCH:
+        watcher = ThresholdWatcher(threshold_store, poll_interval=settings.THRESHOLDS_POLL_SEC).start()
+    # 공유 컴포넌트 (포즈 추출기 풀 / 클럽별 진단 엔진 / LLM·S3 클라이언트)
+    await container.start()
+    # 비동기 작업 API 워커 (JOBS_WORKERS=0이면 별도 워커 프로세스만 처리)
+    if job_runner.workers > 0:
+        job_runner.start()
+    try:
+        yield
+    finally:
+        await job_runner.stop()
+        if watcher is not None:
+            await watcher.stop()
+        # 응답 뒤 후속 작업(피드백 병합 업로드 등) 마무리 → 공유 클라이언트 정리
+        await drain_background()
+        await container.aclose()
+        shutdown_executors(wait=False)
+        # 남은 실행 로그 기록
+        await asyncio.to_thread(run_log.close)
+
 
 # 앱 생성
-app = FastAPI(debug=settings.DEBUG_MODE)
+app = FastAPI(debug=settings.DEBUG_MODE, lifespan=lifespan)
+
+# 분석 요청 입장 제어 (혼잡하면 업로드를 받기 전에 429/503 + Retry-After)
+app.add_middleware(AdmissionMiddleware)
+app.add_middleware(AdmissionMiddleware, controller=session_admission, paths=SESSION_PATHS)
+# 요청 도착 시각 기록 (마지막에 등록 = 가장 바깥 → 마감 예산에 업로드/입장 대기 포함)
+app.add_middleware(RequestClockMiddleware)
 
 # 자동으로 app/api/* 모듈을 스캔해 라우터 전부 등록
 include_all_routers(app)
@@ -0,0 +1,208 @@
+"""
+LSTM 페이즈 모델 동적 배칭 추론 워커
+동시 요청을 수 ms 동안 모아 (B, T, F) 한 배치로 추론 후 요청별로 분배
+"""
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
+from typing import Optional
+
+import numpy as np
+import torch
+
+from app.config.settings import settings
+from app.ml.phase_adapter import TorchPhaseAdapter
+from app.ml.phase_lstm import PhaseLSTM
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class PhaseInferenceServer:
+    """
+    프로세스 내 추론 워커 (전용 스레드 1개)
+
+    - submit(X): (T, F) 시퀀스를 큐에 넣고 Future 반환
+    - 워커: 첫 요청 도착 후 max_wait_ms 동안(또는 max_batch_size까지) 추가 요청 수집
+      → 0-패딩 (B, T_max, F) 배치 1회 추론 → 요청별 (T_i, C) 확률로 분리
+    """
+
+    def __init__(
+        self,
+        adapter: TorchPhaseAdapter,
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+        num_threads: int = 1
+    ):
+        """
+        Args:
+            adapter: 추론에 사용할 TorchPhaseAdapter
+            max_batch_size: 한 번에 추론할 최대 시퀀스 수
+            max_wait_ms: 첫 요청 이후 배치를 모으는 최대 대기 시간
+            num_threads: torch intra-op 스레드 상한 (포즈 워커와 CPU 경쟁 방지)
+        """
+        self.adapter = adapter
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.num_threads = num_threads
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "PhaseInferenceServer":
+        """워커 스레드 시작"""
+        if self._thread is None or not self._thread.is_alive():
+            # intra-op 스레드 수는 프로세스 전역 설정
+            torch.set_num_threads(self.num_threads)
+            self._thread = threading.Thread(
+                target=self._run, name="phase-inference", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """대기 중인 요청을 처리한 뒤 워커 종료"""
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, X: np.ndarray) -> Future:
+        """
+        시퀀스 1개 추론 요청
+
+        Args:
+            X: (T, F) 프레임별 피처
+
+        Returns:
+            (T, C) 확률을 결과로 갖는 Future
+        """
+        if X.ndim != 2:
+            raise ValueError(f"X shape expected (T,F), got {X.shape}")
+        future: Future = Future()
+        self._queue.put((np.asarray(X, dtype=np.float32), future))
+        return future
+
+    def predict_proba(self, X: np.ndarray, timeout: Optional[float] = None) -> np.ndarray:
+        """
+        submit 후 결과 대기 (동기 호출용)
+
+        Raises:
+            TimeoutError: timeout 안에 결과가 없음 (아직 배치에 들어가지 않은 요청은 취소)
+        """
+        future = self.submit(X)
+        try:
+            return future.result(timeout)
+        except FuturesTimeoutError:
+            future.cancel()
+            raise
+
+    def _run(self) -> None:
+        """배치 수집 → 추론 루프"""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            stop = False
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._run_batch(batch)
+            if stop:
+                return
+
+    def _run_batch(self, batch: list[tuple[np.ndarray, Future]]) -> None:
+        """패딩 → 1회 추론 → 결과 분배"""
+        # 취소된 요청은 제외
+        batch = [(x, f) for x, f in batch if f.set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        try:
+            lengths = [len(x) for x, _ in batch]
+            padded = np.zeros((len(batch), max(lengths), batch[0][0].shape[1]), dtype=np.float32)
+            for i, (x, _) in enumerate(batch):
+                padded[i, :len(x)] = x
+            probs = self.adapter.predict_proba_batch(padded, lengths)
+        except Exception as e:
+            logger.warning(f"⚠️ 페이즈 모델 배치 추론 실패 (batch={len(batch)}): {e}")
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        for (_, future), prob in zip(batch, probs):
+            future.set_result(prob)
+
+
+_server: Optional[PhaseInferenceServer] = None
+_server_lock = threading.Lock()
+_load_failed_at: Optional[float] = None  # 마지막 로드 실패 시각 (time.monotonic)
+
+
+def _load_backing_off() -> bool:
+    """최근 로드 실패 후 PHASE_MODEL_RETRY_SEC가 아직 지나지 않았는지"""
+    return _load_failed_at is not None and time.monotonic() - _load_failed_at < settings.PHASE_MODEL_RETRY_SEC
+
+
+def get_phase_inference_server() -> Optional[PhaseInferenceServer]:
+    """
+    settings.PHASE_MODEL_PATH 체크포인트로 공용 추론 워커를 1회 생성
+
+    로드에 실패하면 PHASE_MODEL_RETRY_SEC 동안은 다시 시도하지 않고 바로 None
+    (요청마다 락 안에서 torch.load를 반복하지 않도록)
+
+    Returns:
+        PhaseInferenceServer, 모델 경로가 없거나 로드 실패 시 None
+    """
+    global _server, _load_failed_at
+    if _server is not None:
+        return _server
+    if _load_backing_off():
+        return None
+
+    with _server_lock:
+        if _server is not None:
+            return _server
+        if not settings.PHASE_MODEL_PATH or _load_backing_off():
+            return None
+
+        try:
+            model = PhaseLSTM(
+                input_dim=settings.PHASE_MODEL_INPUT_DIM,
+                hidden_dim=settings.PHASE_MODEL_HIDDEN_DIM,
+                num_classes=settings.PHASE_MODEL_NUM_CLASSES
+            )
+            state = torch.load(settings.PHASE_MODEL_PATH, map_location="cpu", weights_only=True)
+            model.load_state_dict(state)
+        except Exception as e:
+            _load_failed_at = time.monotonic()
+            logger.warning(
+                f"⚠️ 페이즈 모델 로드 실패 ({settings.PHASE_MODEL_PATH}): {e} "
+                f"({settings.PHASE_MODEL_RETRY_SEC:.0f}초 후 재시도)"
+            )
+            return None
+        _load_failed_at = None
+
+        adapter = TorchPhaseAdapter(model, input_dim=settings.PHASE_MODEL_INPUT_DIM)
+        _server = PhaseInferenceServer(
+            adapter,
+            max_batch_size=settings.PHASE_BATCH_MAX_SIZE,
+            max_wait_ms=settings.PHASE_BATCH_MAX_WAIT_MS,
+            num_threads=settings.TORCH_NUM_THREADS
+        ).start()
+        return _server
@@ -37,3 +37,21 @@ class TorchPhaseAdapter:
         logits = logits.squeeze(0)  # (T, C)
         prob = torch.softmax(logits, dim=-1).cpu().numpy()
         return prob
+
+    @torch.no_grad()
+    def predict_proba_batch(self, X: np.ndarray, lengths: list[int]) -> list[np.ndarray]:
+        """
+        X: (B, T, F) 뒤쪽 0-패딩된 배치, lengths: 시퀀스별 실제 길이
+        출력: 시퀀스별 (T_i, C) 소프트맥스 확률
+        단방향 LSTM이라 뒤쪽 패딩은 앞 프레임 출력에 영향을 주지 않는다.
+        """
+        if X.ndim != 3:
+            raise ValueError(f"X shape expected (B,T,F), got {X.shape}")
+        if X.shape[2] != self.input_dim:
+            raise ValueError(
+                f"Feature dim mismatch: model expects {self.input_dim}, got {X.shape[2]}"
+            )
+
+        x = torch.tensor(X, dtype=torch.float32, device=self.device)  # (B, T, F)
+        prob = torch.softmax(self.model(x), dim=-1).cpu().numpy()  # (B, T, C)
+        return [prob[i, :n] for i, n in enumerate(lengths)]
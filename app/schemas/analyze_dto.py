@@ -2,6 +2,8 @@
 스윙 분석 API의 Request/Response DTO
 Router ↔ Service 간 데이터 전달용
 """
+from datetime import datetime
+
 from pydantic import BaseModel, Field
 from typing import Optional, Literal
 
@@ -33,6 +35,16 @@ class AnalyzeSwingRequest(BaseModel):
     llm_provider: Optional[str] = Field(default="openai", description="LLM 제공자")
     llm_model: Optional[str] = Field(default="gpt-4o-mini", description="LLM 모델명")
 
+    # 분포 기반 진단에 쓸 thresholds 버전 (없으면 pin → A/B → current)
+    thresholds_version: Optional[str] = Field(default=None, description="thresholds 버전")
+
+    # AI 피드백 전달 방식 (deferred: LLM을 기다리지 않고 응답, 피드백은 백그라운드 생성)
+    feedback_mode: Literal["inline", "deferred"] = Field(default="inline", description="AI 피드백 전달 방식")
+    # 처리 시간 예산 (없으면 settings.REQUEST_DEADLINE_SEC)
+    deadline_ms: Optional[int] = Field(default=None, ge=100, description="처리 시간 예산(ms)")
+    # 예산 시작점 (time.monotonic, 없으면 서비스 진입 시각)
+    received_at: Optional[float] = Field(default=None, description="요청 도착 시각")
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -65,6 +77,20 @@ class DiagnosisResult(BaseModel):
     score: float = Field(..., ge=0.0, le=100.0, description="점수 (0-100)")
     issues: list[str] = Field(default_factory=list, description="발견된 문제점 목록")
     suggestions: list[str] = Field(default_factory=list, description="개선 제안 목록")
+    percentile_ranks: dict[str, float] = Field(
+        default_factory=dict,
+        description="메트릭별 백분위 0~100 (분포 기반 진단일 때)"
+    )
+
+
+class KinematicSequenceResult(BaseModel):
+    """키네마틱 시퀀스 (다운스윙 구간 세그먼트별 최대 속도 순서)"""
+    order: list[str] = Field(..., description="피크 순서 (이상적: hips → shoulders → arms → wrists)")
+    is_ideal_order: bool = Field(..., description="이상적인 순서와 일치 여부")
+    peak_times: dict[str, float] = Field(..., description="세그먼트별 피크 시간(초)")
+    peak_velocities: dict[str, float] = Field(
+        ..., description="세그먼트별 피크 속도 (회전/관절: 도/초, 손목: 정규화 좌표/초)"
+    )
 
 
 class AnalyzeSwingResponse(BaseModel):
@@ -82,13 +108,36 @@ class AnalyzeSwingResponse(BaseModel):
         description="페이즈별 진단 결과"
     )
     overall_score: float = Field(..., ge=0.0, le=100.0, description="전체 스윙 점수")
+    thresholds_version: Optional[str] = Field(None, description="분포 기반 진단에 사용한 thresholds 버전")
+
+    # 키네마틱 시퀀스 (선택적)
+    kinematic_sequence: Optional[KinematicSequenceResult] = Field(
+        None,
+        description="세그먼트별 최대 속도 순서/시점"
+    )
 
     # LLM 피드백
     ai_feedback: str = Field(..., description="AI가 생성한 개선 피드백")
+    ai_feedback_status: Literal["ready", "pending"] = Field(
+        "ready",
+        description="pending이면 ai_feedback은 진단 텍스트 요약, LLM 피드백은 ai_feedback_url로 조회"
+    )
+    ai_feedback_url: Optional[str] = Field(None, description="지연 AI 피드백 조회 경로 (feedback_mode=deferred)")
 
     # 저장 경로 (선택적)
     result_url: Optional[str] = Field(None, description="S3에 저장된 결과 JSON URL")
 
+    # 처리 시간 (서비스 진입 ~ 응답 생성)
+    processing_time_ms: Optional[float] = Field(None, description="전체 처리 시간 (밀리초)")
+    stage_timings_ms: Optional[dict[str, dict[str, float]]] = Field(
+        None,
+        description="단계별 시간 {stage: {queue_ms, exec_ms}} (decode, pose, angles, phase, diagnosis, llm, storage 등)"
+    )
+    degradation_notes: list[str] = Field(
+        default_factory=list,
+        description="마감 시간 때문에 낮춘 품질 (비어 있으면 전체 품질로 분석)"
+    )
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -115,6 +164,91 @@ class AnalyzeSwingResponse(BaseModel):
                 ],
                 "overall_score": 78.3,
                 "ai_feedback": "백스윙 시 상체 회전이 부족합니다...",
-                "result_url": "https://s3.../analysis_20240315_123456.json"
+                "result_url": "https://s3.../analysis_20240315_123456.json",
+                "processing_time_ms": 12480.5,
+                "stage_timings_ms": {
+                    "decode": {"queue_ms": 0.1, "exec_ms": 1820.4},
+                    "pose": {"queue_ms": 0.1, "exec_ms": 9310.2},
+                    "diagnosis": {"queue_ms": 0.1, "exec_ms": 1.2},
+                    "llm": {"queue_ms": 0.0, "exec_ms": 1240.7}
+                }
             }
         }
+
+
+class SwingAnalysisResult(BaseModel):
+    """멀티 스윙 분석의 스윙 1개 결과"""
+    swing_index: int = Field(..., description="스윙 순번 (0부터)")
+    start_frame: int = Field(..., description="스윙 구간 시작 프레임")
+    end_frame: int = Field(..., description="스윙 구간 끝 프레임")
+    timestamp_start: float = Field(..., description="스윙 구간 시작 시간(초)")
+    timestamp_end: float = Field(..., description="스윙 구간 끝 시간(초)")
+
+    phases: list[PhaseResult] = Field(..., description="감지된 6단계 스윙 페이즈")
+    diagnosis_by_phase: list[DiagnosisResult] = Field(..., description="페이즈별 진단 결과")
+    overall_score: float = Field(..., ge=0.0, le=100.0, description="스윙 점수")
+    kinematic_sequence: Optional[KinematicSequenceResult] = Field(
+        None,
+        description="세그먼트별 최대 속도 순서/시점"
+    )
+    feedback: str = Field(..., description="진단 기반 텍스트 피드백")
+
+
+class AnalyzeMultiSwingResponse(BaseModel):
+    """멀티 스윙(연습장 세션) 분석 응답"""
+    analysis_id: str = Field(..., description="분석 결과 고유 ID")
+    user_id: str
+    club: str
+
+    swings: list[SwingAnalysisResult] = Field(..., description="스윙별 분석 결과 (시간순)")
+    thresholds_version: Optional[str] = Field(None, description="분포 기반 진단에 사용한 thresholds 버전")
+    detected_segments: int = Field(..., description="검출된 스윙 구간 수 (페이즈 감지 실패 포함)")
+    processing_time_ms: Optional[float] = Field(None, description="전체 처리 시간 (밀리초)")
+    stage_timings_ms: Optional[dict[str, dict[str, float]]] = Field(
+        None,
+        description="단계별 시간 {stage: {queue_ms, exec_ms}} (swing = 스윙 구간별 분석 합계)"
+    )
+    degradation_notes: list[str] = Field(
+        default_factory=list,
+        description="마감 시간 때문에 낮춘 품질 (비어 있으면 전체 품질로 분석)"
+    )
+
+
+class SessionEvent(BaseModel):
+    """세션 모드 스트리밍 이벤트 (NDJSON 1줄)"""
+    event: Literal["swing", "end"] = Field(..., description="swing: 스윙 1개 완료, end: 세션 종료")
+    session_id: str = Field(..., description="세션 ID")
+    swing: Optional[SwingAnalysisResult] = Field(None, description="완료된 스윙 분석 (event=swing)")
+    frames_processed: int = Field(..., description="지금까지 처리한 프레임 수")
+    swings_emitted: int = Field(..., description="지금까지 내보낸 스윙 수")
+
+
+class AnalyzeJobSubmitResponse(BaseModel):
+    """비동기 분석 작업 등록 응답"""
+    job_id: str = Field(..., description="작업 ID")
+    status: Literal["queued", "running", "succeeded", "failed"] = Field(..., description="작업 상태")
+    status_url: str = Field(..., description="상태/결과 조회 경로 (GET)")
+
+
+class AnalyzeJobStatusResponse(BaseModel):
+    """비동기 분석 작업 상태/결과"""
+    job_id: str = Field(..., description="작업 ID")
+    kind: Literal["single", "multi"] = Field(..., description="single: /analyze, multi: /analyze/multi와 같은 분석")
+    status: Literal["queued", "running", "succeeded", "failed"] = Field(..., description="작업 상태")
+    attempts: int = Field(..., description="실행 시도 횟수")
+    created_at: datetime = Field(..., description="등록 시각")
+    started_at: Optional[datetime] = Field(None, description="마지막 실행 시작 시각")
+    finished_at: Optional[datetime] = Field(None, description="완료/실패 시각")
+    result: Optional[dict] = Field(
+        None,
+        description="status=succeeded일 때 AnalyzeSwingResponse / AnalyzeMultiSwingResponse"
+    )
+    error: Optional[str] = Field(None, description="status=failed일 때 에러 메시지")
+
+
+class AiFeedbackResponse(BaseModel):
+    """지연 AI 피드백 상태/결과 (GET /analyze/feedback/{analysis_id})"""
+    analysis_id: str = Field(..., description="분석 결과 ID")
+    status: Literal["pending", "ready", "failed"] = Field(..., description="피드백 생성 상태")
+    ai_feedback: Optional[str] = Field(None, description="status=ready일 때 LLM 피드백")
+    error: Optional[str] = Field(None, description="status=failed일 때 에러 메시지")
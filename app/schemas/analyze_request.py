@@ -46,6 +46,25 @@ class AnalyzeSwingApiRequest(BaseModel):
         description="LLM 모델명 (예: gpt-4o-mini)"
     )
 
+    # 분포 기반 진단 thresholds 버전 (날짜/파일명/지문/current)
+    thresholds_version: Optional[str] = Field(
+        default=None,
+        description="thresholds 버전 고정 (지정 시 분포 기반 진단)"
+    )
+
+    # AI 피드백 전달 방식
+    feedback_mode: Literal["inline", "deferred"] = Field(
+        default="inline",
+        description="inline: 응답에 LLM 피드백 포함, deferred: 진단 직후 응답 + 피드백은 ai_feedback_url로 나중에 조회"
+    )
+
+    # 요청 마감 시간 (서비스 진입 기준, 부족하면 포즈/LLM/S3 단계 품질을 낮춤)
+    deadline_ms: Optional[int] = Field(
+        default=None,
+        ge=100,
+        description="처리 시간 예산(ms), 없으면 서버 기본값 (REQUEST_DEADLINE_SEC)"
+    )
+
     @validator("llm_model")
     def validate_llm_model(cls, v, values):
         """llm_provider가 openai/anthropic면 llm_model도 필수"""
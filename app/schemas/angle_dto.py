@@ -2,7 +2,24 @@
 각도 계산 관련 DTO
 AngleCalculator 입출력용
 """
-from pydantic import BaseModel, Field
+from typing import Optional
+
+import numpy as np
+from pydantic import BaseModel, Field, PrivateAttr
+
+# AngleCalculationResult.values 의 컬럼 순서 (AngleMetrics 필드 순서와 동일)
+ANGLE_METRIC_NAMES: tuple[str, ...] = (
+    "left_elbow",
+    "right_elbow",
+    "left_knee",
+    "right_knee",
+    "left_hip",
+    "right_hip",
+    "x_factor",
+    "shoulder_rotation",
+    "hip_rotation",
+)
+
 
 class AngleMetrics(BaseModel):
     """1개 프레임의 각도 측정값"""
@@ -30,9 +47,17 @@ class AngleMetrics(BaseModel):
 
 
 class AngleCalculationResult(BaseModel):
-    """전체 비디오의 각도 계산 결과"""
+    """
+    전체 비디오의 각도 계산 결과
+
+    프레임별 각도는 (N, len(ANGLE_METRIC_NAMES)) 배열로 보관하고,
+    AngleMetrics 리스트는 `angles`에 처음 접근할 때만 생성한다.
+    (API 응답에는 페이즈 평균만 나가므로 대부분의 요청에서 생성되지 않음)
+    """
     total_frames: int
-    angles: list[AngleMetrics] = Field(..., description="프레임별 각도 측정값")
+    frame_numbers: np.ndarray = Field(..., description="프레임 번호 (N,)")
+    timestamps: np.ndarray = Field(..., description="타임스탬프(초) (N,)")
+    values: np.ndarray = Field(..., description="프레임별 각도 행렬 (N, M), 컬럼 = ANGLE_METRIC_NAMES")
 
     # 평균값 (진단에 사용)
     avg_left_elbow: float
@@ -40,3 +65,82 @@ class AngleCalculationResult(BaseModel):
     avg_left_knee: float
     avg_right_knee: float
     avg_x_factor: float
+
+    _angles: Optional[list[AngleMetrics]] = PrivateAttr(default=None)
+
+    class Config:
+        # NumPy 배열 필드 허용
+        arbitrary_types_allowed = True
+
+    @classmethod
+    def from_arrays(
+        cls,
+        frame_numbers: np.ndarray,
+        timestamps: np.ndarray,
+        values: np.ndarray
+    ) -> "AngleCalculationResult":
+        """프레임별 배열로 결과 생성 (평균은 한 번의 reduction으로 계산)"""
+        if len(values):
+            means = dict(zip(ANGLE_METRIC_NAMES, values.mean(axis=0).tolist()))
+        else:
+            means = dict.fromkeys(ANGLE_METRIC_NAMES, float("nan"))
+
+        return cls(
+            total_frames=len(frame_numbers),
+            frame_numbers=frame_numbers,
+            timestamps=timestamps,
+            values=values,
+            avg_left_elbow=means["left_elbow"],
+            avg_right_elbow=means["right_elbow"],
+            avg_left_knee=means["left_knee"],
+            avg_right_knee=means["right_knee"],
+            avg_x_factor=means["x_factor"]
+        )
+
+    def slice(self, start: int, stop: int) -> "AngleCalculationResult":
+        """[start, stop) 인덱스 구간의 결과 (배열은 view로 공유, 평균만 재계산)"""
+        return AngleCalculationResult.from_arrays(
+            self.frame_numbers[start:stop],
+            self.timestamps[start:stop],
+            self.values[start:stop]
+        )
+
+    @property
+    def angles(self) -> list[AngleMetrics]:
+        """프레임별 각도 측정값 (명시적으로 접근할 때 1회 생성 후 캐시)"""
+        if self._angles is None:
+            self._angles = [
+                AngleMetrics(
+                    frame_number=int(frame_number),
+                    timestamp=float(timestamp),
+                    **dict(zip(ANGLE_METRIC_NAMES, row.tolist())),
+                )
+                for frame_number, timestamp, row in zip(
+                    self.frame_numbers, self.timestamps, self.values
+                )
+            ]
+        return self._angles
+
+    def column(self, name: str) -> np.ndarray:
+        """메트릭 이름으로 프레임별 시계열 (N,) 반환"""
+        return self.values[:, ANGLE_METRIC_NAMES.index(name)]
+
+    def mean_between(
+        self,
+        start_frame: int,
+        end_frame: int,
+        metrics: tuple[str, ...] = ANGLE_METRIC_NAMES,
+    ) -> dict[str, float]:
+        """
+        [start_frame, end_frame] 구간(프레임 번호 기준)의 메트릭별 평균
+
+        Returns:
+            {metric: 평균} (구간에 프레임이 없으면 빈 dict)
+        """
+        mask = (self.frame_numbers >= start_frame) & (self.frame_numbers <= end_frame)
+        if not mask.any():
+            return {}
+
+        cols = [ANGLE_METRIC_NAMES.index(m) for m in metrics]
+        means = self.values[mask][:, cols].mean(axis=0)
+        return dict(zip(metrics, means.tolist()))
@@ -19,6 +19,9 @@ class PhaseDiagnosis(BaseModel):
         example={"left_elbow": 145.2, "threshold_min": 160, "threshold_max": 170}
     )
 
+    # 분포 기반 진단일 때 메트릭별 백분위 (0~100)
+    percentile_ranks: dict[str, float] = Field(default_factory=dict)
+
 
 class DiagnosisResult(BaseModel):
     """전체 진단 결과"""
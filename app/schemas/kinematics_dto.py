@@ -0,0 +1,40 @@
+"""
+키네마틱스(속도/가속도) 관련 DTO
+KinematicsAnalyzer 입출력용
+"""
+import numpy as np
+from pydantic import BaseModel, Field
+
+# 키네마틱 시퀀스 세그먼트 (이상적인 피크 순서)
+KINEMATIC_SEGMENTS: tuple[str, ...] = ("hips", "shoulders", "arms", "wrists")
+
+
+class SegmentPeak(BaseModel):
+    """세그먼트별 최대 속도 시점"""
+    segment: str = Field(..., description="hips / shoulders / arms / wrists")
+    frame: int = Field(..., description="피크 프레임 번호")
+    time: float = Field(..., description="피크 시간(초)")
+    peak_velocity: float = Field(
+        ..., description="피크 속도 (회전/관절: 도/초, 손목: 정규화 좌표/초)"
+    )
+
+
+class KinematicSequence(BaseModel):
+    """키네마틱 시퀀스 (hips → shoulders → arms → wrists)"""
+    order: list[str] = Field(..., description="실제 피크 순서")
+    peaks: list[SegmentPeak] = Field(..., description="세그먼트별 피크 (KINEMATIC_SEGMENTS 순)")
+    is_ideal_order: bool = Field(..., description="이상적인 순서와 일치 여부")
+
+
+class KinematicsResult(BaseModel):
+    """전체 비디오의 키네마틱스 계산 결과"""
+    fps: float
+    frame_numbers: np.ndarray = Field(..., description="균일 프레임 그리드 (T,)")
+    velocity: np.ndarray = Field(..., description="각속도 행렬 (T, M), 도/초, 컬럼 = ANGLE_METRIC_NAMES")
+    acceleration: np.ndarray = Field(..., description="각가속도 행렬 (T, M), 도/초²")
+    lead_wrist_speed: np.ndarray = Field(..., description="주도 손목 선속도 (T,), 정규화 좌표/초")
+    sequence: KinematicSequence
+
+    class Config:
+        # NumPy 배열 필드 허용
+        arbitrary_types_allowed = True
@@ -24,6 +24,28 @@ class PhaseInfo(BaseModel):
     )
 
 
+class PhaseTransition(BaseModel):
+    """실시간 감지된 페이즈 전환 이벤트"""
+    name: PhaseType = Field(..., description="새로 시작된 페이즈")
+    frame: int = Field(..., description="전환 프레임 번호")
+    time: float = Field(..., description="전환 시간(초)")
+    emitted_frame: int = Field(..., description="이벤트가 확정된 시점의 입력 프레임 번호")
+
+    @property
+    def latency_frames(self) -> int:
+        """전환 시점부터 확정까지 걸린 프레임 수"""
+        return self.emitted_frame - self.frame
+
+
+class SwingSegment(BaseModel):
+    """긴 영상에서 분리된 스윙 1개 구간"""
+    index: int = Field(..., description="스윙 순번 (0부터)")
+    start_index: int = Field(..., description="포즈 리스트 시작 인덱스")
+    end_index: int = Field(..., description="포즈 리스트 끝 인덱스 (미포함)")
+    start_frame: int = Field(..., description="시작 프레임 번호")
+    end_frame: int = Field(..., description="끝 프레임 번호")
+
+
 class PhaseDetectionResult(BaseModel):
     """페이즈 감지 결과 (6단계)"""
     phases: list[PhaseInfo] = Field(..., min_items=6, max_items=6)
@@ -43,6 +43,8 @@ class PoseExtractionResult(BaseModel):
     """전체 비디오의 포즈 추출 결과"""
     total_frames: int
     poses: list[PoseData] = Field(..., description="프레임별 포즈 데이터")
+    low_visibility_frames: int = Field(0, description="포즈는 검출됐지만 가시성 미달로 버린 프레임 수")
+    model_complexity: Optional[int] = Field(None, description="사용한 MediaPipe 모델 크기 (0, 1, 2)")
 
     def get_pose_at_frame(self, frame_num: int) -> Optional[PoseData]:
         """특정 프레임의 포즈 반환"""
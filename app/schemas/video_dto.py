@@ -3,6 +3,7 @@
 VideoPreprocessor 입출력용
 """
 from pydantic import BaseModel, Field
+from typing import Optional
 
 class VideoPreprocessRequest(BaseModel):
     """비디오 전처리 요청"""
@@ -35,6 +36,8 @@ class VideoPreprocessResult(BaseModel):
     duration: float  # 초
     width: int
     height: int
+    source_fps: Optional[float] = Field(None, description="원본 FPS")
+    frame_step: int = Field(1, ge=1, description="원본 N프레임마다 1개 사용 (FPS 리샘플링 간격)")
     # frames는 실제로는 list[np.ndarray]지만 DTO에는 메타데이터만
 
     class Config:
@@ -0,0 +1,181 @@
+"""
+앱 수명 동안 공유하는 컴포넌트 컨테이너
+
+요청마다 만들던 컴포넌트를 lifespan 시작 시(또는 첫 사용 시) 1번만 생성:
+- 상태 없는 도메인 컴포넌트: VideoPreprocessor, AngleCalculator, 방향별 PhaseDetector / KinematicsAnalyzer / SwingSegmenter
+- 상태 있는 자원은 풀로: PoseExtractor (MediaPipe 그래프)
+- 클럽 × thresholds 스냅샷별 DiagnosisEngine (threshold/룰 파일이 바뀌면 다시 생성)
+- 외부 클라이언트: LLM Gateway(공유 httpx.AsyncClient), S3
+
+요청별 값(user_id, club, 방향, 가시성 등)은 AnalyzeSwingRequest DTO로만 전달하고,
+service_for()는 공유 컴포넌트를 묶은 가벼운 SwingAnalysisService만 만든다.
+"""
+import logging
+import threading
+from typing import Optional
+
+import httpx
+
+from app.config.settings import settings
+from app.domain.angle.calculator import AngleCalculator
+from app.domain.diagnosis.engine import DiagnosisEngine
+from app.domain.diagnosis.rules import rule_cache
+from app.domain.diagnosis.scoring import DistributionScorer
+from app.domain.diagnosis.thresholds import threshold_cache
+from app.domain.kinematics.analyzer import KinematicsAnalyzer
+from app.domain.phase.detector import PhaseDetector
+from app.domain.phase.segmenter import SwingSegmenter
+from app.domain.pose.pool import PoseExtractorPool
+from app.domain.video.preprocessor import VideoPreprocessor
+from app.infrastructure.llm.gateway_client import LLMGatewayClient
+from app.infrastructure.storage.s3_client import S3StorageClient
+from app.infrastructure.thresholds.registry import threshold_registry
+from app.services.swing_analysis_service import SwingAnalysisService
+
+logger = logging.getLogger(__name__)
+
+SWING_DIRECTIONS = ("right", "left")
+
+
+class EngineCache:
+    """
+    (클럽, thresholds 버전)별 DiagnosisEngine 캐시
+
+    threshold_cache / rule_cache가 파일 변경으로 새 객체를 돌려주면 엔진도 다시 생성
+    (엔진 안의 메트릭 인덱스 / 기준 지문 계산이 요청 경로에서 빠짐)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._engines: dict[tuple[str, Optional[str]], DiagnosisEngine] = {}
+
+    def get(
+        self, club: str, scorer: Optional[DistributionScorer] = None, version: Optional[str] = None
+    ) -> DiagnosisEngine:
+        table = threshold_cache.get(club)
+        rules = rule_cache.get()
+        key = (club, version)
+
+        engine = self._engines.get(key)
+        if engine is not None and engine.table is table and engine.scorer is scorer and engine.rules is rules:
+            return engine
+
+        engine = DiagnosisEngine(club=club, table=table, scorer=scorer, thresholds_version=version, rules=rules)
+        with self._lock:
+            self._engines[key] = engine
+        return engine
+
+    def __len__(self) -> int:
+        return len(self._engines)
+
+
+class AppContainer:
+    """lifespan 동안 공유하는 컴포넌트 묶음 (프로세스 전역 container)"""
+
+    def __init__(self, pose_pool: Optional[PoseExtractorPool] = None):
+        """
+        Args:
+            pose_pool: PoseExtractor 풀 (기본: settings.POSE_POOL_MAX_IDLE)
+        """
+        self.video_preprocessor = VideoPreprocessor()
+        self.angle_calculator = AngleCalculator()
+        self.phase_detectors = {d: PhaseDetector(swing_direction=d) for d in SWING_DIRECTIONS}
+        self.kinematics_analyzers = {d: KinematicsAnalyzer(swing_direction=d) for d in SWING_DIRECTIONS}
+        self.swing_segmenters = {d: SwingSegmenter(swing_direction=d) for d in SWING_DIRECTIONS}
+        self.pose_pool = pose_pool or PoseExtractorPool(max_idle=settings.POSE_POOL_MAX_IDLE)
+        self.engines = EngineCache()
+
+        self.http_client: Optional[httpx.AsyncClient] = None
+        self._llm_clients: dict[tuple[str, str], LLMGatewayClient] = {}
+        self._storage_client: Optional[S3StorageClient] = None
+        self._lock = threading.Lock()
+
+    async def start(self) -> "AppContainer":
+        """이벤트 루프에 묶이는 자원 생성 (lifespan 시작 시)"""
+        if self.http_client is None:
+            self.http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.LLM_HTTP_MAX_CONNECTIONS
+                )
+            )
+            self._llm_clients.clear()  # 공유 클라이언트 없이 만들어진 LLM 클라이언트는 버림
+        return self
+
+    async def aclose(self) -> None:
+        """공유 자원 정리 (lifespan 종료 시)"""
+        if self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
+        self._llm_clients.clear()
+        self.pose_pool.close()
+
+    def service_for(
+        self,
+        club: str,
+        swing_direction: str,
+        visibility_threshold: float = 0.5,
+        llm_provider: Optional[str] = None,
+        llm_model: Optional[str] = None,
+        thresholds_version: Optional[str] = None,
+        user_id: Optional[str] = None
+    ) -> SwingAnalysisService:
+        """
+        공유 컴포넌트로 분석 서비스 조립 (생성 비용 없음)
+
+        Raises:
+            KeyError: 알 수 없는 thresholds_version
+        """
+        # 분포 기반 진단: 버전별 스냅샷에 미리 컴파일된 CDF 테이블 사용
+        scorer, version = None, None
+        if thresholds_version or settings.DIAGNOSIS_SCORING == "distribution":
+            snapshot = threshold_registry.select(thresholds_version, key=user_id)
+            if snapshot is not None:
+                scorer, version = snapshot.scorer, snapshot.version
+
+        return SwingAnalysisService(
+            video_preprocessor=self.video_preprocessor,
+            pose_extractor=self.pose_pool.view(visibility_threshold),
+            angle_calculator=self.angle_calculator,
+            phase_detector=self.phase_detectors[swing_direction],
+            diagnosis_engine=self.engines.get(club, scorer, version),
+            llm_client=self.llm_client(llm_provider, llm_model),
+            storage_client=self.storage_client(),
+            kinematics_analyzer=self.kinematics_analyzers[swing_direction],
+            swing_segmenter=self.swing_segmenters[swing_direction]
+        )
+
+    def llm_client(self, provider: Optional[str], model: Optional[str]) -> Optional[LLMGatewayClient]:
+        """(provider, model)별 LLM 클라이언트 (실제 provider + 모델 + API 키가 있을 때만)"""
+        if provider not in ("openai", "anthropic") or not model or not settings.OPENAI_API_KEY:
+            return None
+        key = (provider, model)
+        client = self._llm_clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._llm_clients.get(key)
+                if client is None:
+                    client = LLMGatewayClient(
+                        gateway_url=settings.LLM_GATEWAY_URL,
+                        provider=provider,
+                        model=model,
+                        api_key=settings.OPENAI_API_KEY,
+                        http_client=self.http_client
+                    )
+                    self._llm_clients[key] = client
+        return client
+
+    def storage_client(self) -> Optional[S3StorageClient]:
+        """결과 저장 S3 클라이언트 (S3_BUCKET_NAME이 있을 때만, boto3 client 1회 생성)"""
+        bucket = getattr(settings, "S3_BUCKET_NAME", None)
+        if not bucket:
+            return None
+        if self._storage_client is None:
+            with self._lock:
+                if self._storage_client is None:
+                    self._storage_client = S3StorageClient(bucket_name=bucket)
+        return self._storage_client
+
+
+# 프로세스 전역 컨테이너 (lifespan에서 start/aclose)
+container = AppContainer()
@@ -0,0 +1,79 @@
+"""
+지연 AI 피드백 저장소 (feedback_mode="deferred")
+
+분석 응답은 진단 직후 반환하고, LLM 피드백은 응답 뒤 백그라운드에서 생성해 여기에 기록
+클라이언트는 응답의 ai_feedback_url (GET /analyze/feedback/{analysis_id})로 나중에 조회
+
+상태: pending → ready | failed
+저장: 디스크 LRU + TTL (같은 호스트의 API / 작업 워커 프로세스가 디렉토리를 공유)
+"""
+import hashlib
+import logging
+from typing import Optional
+
+from app.config.settings import settings
+from app.infrastructure.cache.disk_cache import DiskLruCache
+from app.schemas.analyze_dto import AiFeedbackResponse
+
+logger = logging.getLogger(__name__)
+
+
+class FeedbackStore:
+    """analysis_id → AiFeedbackResponse JSON"""
+
+    def __init__(self, store: Optional[DiskLruCache] = None):
+        """
+        Args:
+            store: 디스크 캐시 (기본: settings.FEEDBACK_STORE_* 설정)
+        """
+        if store is None:
+            store = DiskLruCache(
+                settings.FEEDBACK_STORE_DIR,
+                max_entries=settings.FEEDBACK_STORE_MAX_ENTRIES,
+                ttl_sec=settings.FEEDBACK_TTL_SEC
+            )
+        self.store = store
+
+    @staticmethod
+    def url(analysis_id: str) -> str:
+        """응답에 넣을 조회 경로"""
+        return f"/analyze/feedback/{analysis_id}"
+
+    def mark_pending(self, analysis_id: str) -> None:
+        self._put(AiFeedbackResponse(analysis_id=analysis_id, status="pending"))
+
+    def complete(self, analysis_id: str, feedback: str) -> None:
+        self._put(AiFeedbackResponse(analysis_id=analysis_id, status="ready", ai_feedback=feedback))
+
+    def fail(self, analysis_id: str, error: str) -> None:
+        self._put(AiFeedbackResponse(analysis_id=analysis_id, status="failed", error=error))
+
+    def link(self, analysis_id: str, source_id: str) -> None:
+        """캐시에서 재사용한 응답(analysis_id)의 피드백을 원래 분석(source_id)의 피드백으로 연결"""
+        self.store.put(self._key(analysis_id, alias=True), source_id)
+
+    def get(self, analysis_id: str) -> Optional[AiFeedbackResponse]:
+        """조회 (모르는 ID / 만료면 None)"""
+        raw = self.store.get(self._key(analysis_id))
+        if raw is not None:
+            return AiFeedbackResponse.model_validate_json(raw)
+        source_id = self.store.get(self._key(analysis_id, alias=True))
+        if source_id is None:
+            return None
+        raw = self.store.get(self._key(source_id))
+        if raw is None:
+            return None
+        return AiFeedbackResponse.model_validate_json(raw).model_copy(update={"analysis_id": analysis_id})
+
+    def _put(self, record: AiFeedbackResponse) -> None:
+        self.store.put(self._key(record.analysis_id), record.model_dump_json())
+
+    @staticmethod
+    def _key(analysis_id: str, alias: bool = False) -> str:
+        # analysis_id는 경로에서 그대로 들어오므로 파일명으로 쓰지 않고 해시
+        name = f"alias:{analysis_id}" if alias else analysis_id
+        return hashlib.sha256(name.encode("utf-8")).hexdigest()[:32]
+
+
+# 프로세스 전역 피드백 저장소
+feedback_store = FeedbackStore()
@@ -0,0 +1,216 @@
+"""
+비동기 분석 작업 실행
+POST /analyze/jobs로 등록된 작업을 고정 개수 워커가 브로커에서 꺼내 실행 (처리량 = 워커 수)
+API 프로세스 안(JOBS_WORKERS) 또는 별도 워커 프로세스(app.worker)에서 같은 코드로 동작
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+from app.config.settings import settings
+from app.infrastructure.jobs.base import JobBroker
+from app.infrastructure.jobs.broker import job_broker
+from app.infrastructure.storage.uploads import UploadStorage, upload_storage
+from app.schemas.analyze_request import AnalyzeSwingApiRequest
+from app.services.service_factory import build_analyze_request, create_swing_analysis_service
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[str, dict], Awaitable[str]]
+
+
+class UnknownThresholdsVersion(Exception):
+    """작업 요청의 thresholds_version을 찾을 수 없음 (재시도해도 같은 결과)"""
+
+
+async def execute_job(kind: str, payload: dict) -> str:
+    """
+    작업 1건 실행
+
+    Args:
+        kind: "single" (analyze) | "multi" (analyze_multi)
+        payload: {"request": AnalyzeSwingApiRequest dict, "upload": 업로드 스토리지 ref}
+
+    Returns:
+        응답 DTO JSON 문자열
+
+    Raises:
+        UnknownThresholdsVersion: 알 수 없는 thresholds_version
+    """
+    # 작업 결과가 곧 응답이므로 피드백은 항상 포함
+    # (deferred면 실행한 워커 로컬 피드백 저장소에만 남아 API 노드에서 조회할 수 없음)
+    req = AnalyzeSwingApiRequest(**{**payload["request"], "feedback_mode": "inline"})
+    # 버전 확인은 분석 전에만 (분석 중 다른 KeyError를 버전 오류로 오인하지 않도록)
+    try:
+        service = create_swing_analysis_service(
+            club=req.club,
+            swing_direction=req.swing_direction,
+            visibility_threshold=req.visibility_threshold,
+            llm_provider=req.llm_provider,
+            llm_model=req.llm_model,
+            thresholds_version=req.thresholds_version,
+            user_id=req.user_id
+        )
+    except KeyError as e:
+        raise UnknownThresholdsVersion(req.thresholds_version) from e
+    # S3 스토리지면 다운로드가 블로킹이므로 진입/정리를 스레드에서 실행
+    local = upload_storage.open_local(payload["upload"])
+    file_path = await asyncio.to_thread(local.__enter__)
+    try:
+        request = build_analyze_request(req, file_path)
+        if kind == "multi":
+            result = await service.analyze_multi(request)
+        else:
+            result = await service.analyze(request)
+    finally:
+        await asyncio.to_thread(local.__exit__, None, None, None)
+    return result.model_dump_json()
+
+
+class JobRunner:
+    """
+    작업 큐 워커 풀 (이벤트 루프 안 asyncio 태스크 N개)
+
+    - 무거운 단계는 서비스가 cpu/io 실행기로 넘기므로 워커 태스크는 대기만 함
+    - 새 작업 등록 시 notify()로 즉시 깨우고, 다른 프로세스가 넣은 작업은 poll_interval마다 확인
+    - 종료 시 실행 중이던 작업은 대기 상태로 되돌림 (재시작 후 다시 실행)
+    - 실행 중에는 lease_sec / 3마다 lease를 연장 (lease보다 오래 걸리는 작업이 다른 워커에서 또 실행되지 않도록)
+    - lease를 잃으면 실행 중인 핸들러를 취소하고 업로드 삭제/결과 기록 없이 손을 뗌
+    """
+
+    def __init__(
+        self,
+        broker: JobBroker = job_broker,
+        workers: Optional[int] = None,
+        handler: JobHandler = execute_job,
+        uploads: UploadStorage = upload_storage,
+        poll_interval: Optional[float] = None,
+        lease_sec: Optional[float] = None,
+        max_attempts: Optional[int] = None
+    ):
+        """
+        Args:
+            broker: 작업 브로커
+            workers: 동시 실행 작업 수 (기본: settings.JOBS_WORKERS)
+            handler: (kind, payload) → 결과 JSON 코루틴
+            uploads: 끝난 작업의 업로드를 지울 스토리지
+            poll_interval: 빈 큐 재확인 주기(초)
+            lease_sec: 작업 lease (이 시간이 지나면 다른 워커가 다시 가져감)
+            max_attempts: 최대 시도 횟수 (lease 만료로 재시도된 횟수 포함)
+        """
+        self.broker = broker
+        self.workers = settings.JOBS_WORKERS if workers is None else workers
+        self.handler = handler
+        self.uploads = uploads
+        self.poll_interval = poll_interval or settings.JOBS_POLL_SEC
+        self.lease_sec = lease_sec or settings.JOBS_LEASE_SEC
+        self.max_attempts = max_attempts or settings.JOBS_MAX_ATTEMPTS
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> "JobRunner":
+        """현재 이벤트 루프에서 워커 태스크 시작"""
+        self._wakeup = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{i}") for i in range(self.workers)
+        ]
+        logger.info(f"🧵 작업 워커 {self.workers}개 시작 ({type(self.broker).__name__})")
+        return self
+
+    def notify(self) -> None:
+        """새 작업 등록 알림 (이벤트 루프 스레드에서 호출)"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def stop(self) -> None:
+        """워커 종료 (실행 중 작업은 release)"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._wakeup = None
+
+    async def run_one(self, job: dict) -> None:
+        """claim한 작업 1건 실행 → 결과/에러 기록, 끝나면 업로드 삭제 (lease를 잃으면 둘 다 새 소유 워커에 맡김)"""
+        job_id, attempt = job["id"], job["attempts"]
+        if attempt > self.max_attempts:
+            await self._remove_upload(job)
+            await asyncio.to_thread(self.broker.fail, job_id, attempt, f"too many attempts ({attempt - 1})")
+            return
+
+        logger.info(f"🔄 작업 시작: {job_id} (kind={job['kind']}, attempt={attempt})")
+        work = asyncio.create_task(self.handler(job["kind"], job["payload"]), name=f"job-{job_id}")
+        heartbeat = asyncio.create_task(self._heartbeat(job_id, attempt, work), name=f"job-lease-{job_id}")
+        try:
+            result = await work
+        except asyncio.CancelledError:
+            if heartbeat.done() and not asyncio.current_task().cancelling():
+                # heartbeat는 lease를 잃었을 때만 스스로 끝나며 작업을 취소함
+                return
+            heartbeat.cancel()
+            await asyncio.to_thread(self.broker.release, job_id, attempt)
+            raise
+        except UnknownThresholdsVersion as e:
+            error = f"unknown thresholds_version: {e}"
+        except Exception as e:
+            logger.error(f"❌ 작업 실패: {job_id}: {e}", exc_info=True)
+            error = f"분석 실패: {e}"
+        else:
+            error = None
+        finally:
+            heartbeat.cancel()
+
+        # 업로드 정리 후 상태 기록 (완료가 보인 시점에는 정리도 끝나 있음)
+        # 정리 전에 lease를 한 번 더 확인 (그새 다시 claim됐으면 새 워커가 업로드를 써야 함)
+        if not await asyncio.to_thread(self.broker.renew, job_id, attempt, self.lease_sec):
+            logger.warning(f"⚠️ lease를 잃어 결과를 버림: {job_id}")
+            return
+        await self._remove_upload(job)
+        if error is None:
+            recorded = await asyncio.to_thread(self.broker.complete, job_id, attempt, result)
+        else:
+            recorded = await asyncio.to_thread(self.broker.fail, job_id, attempt, error)
+        if not recorded:
+            logger.warning(f"⚠️ lease를 잃어 결과를 버림: {job_id}")
+        elif error is None:
+            logger.info(f"✅ 작업 완료: {job_id}")
+
+    async def _worker(self) -> None:
+        while True:
+            job = await asyncio.to_thread(self.broker.claim, self.lease_sec)
+            if job is not None:
+                await self.run_one(job)
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def _heartbeat(self, job_id: str, attempt: int, work: asyncio.Task) -> None:
+        """실행 중 lease 연장 (일시 실패는 재시도, lease를 잃었으면 작업 취소 후 종료)"""
+        while True:
+            await asyncio.sleep(self.lease_sec / 3)
+            try:
+                renewed = await asyncio.to_thread(self.broker.renew, job_id, attempt, self.lease_sec)
+            except Exception as e:
+                logger.warning(f"⚠️ lease 연장 실패 ({job_id}): {e}")
+                continue
+            if not renewed:
+                logger.warning(f"⚠️ lease를 잃어 작업 중단 ({job_id}): 다른 워커가 다시 실행함")
+                work.cancel()
+                return
+
+    async def _remove_upload(self, job: dict) -> None:
+        ref = job["payload"].get("upload")
+        if not ref:
+            return
+        try:
+            await asyncio.to_thread(self.uploads.delete, ref)
+            logger.info(f"🗑️ 업로드 삭제: {ref}")
+        except Exception as e:
+            logger.warning(f"⚠️ 업로드 삭제 실패 ({ref}): {e}")
+
+
+# 프로세스 전역 워커 풀 (lifespan에서 start/stop)
+job_runner = JobRunner()
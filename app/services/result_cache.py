@@ -0,0 +1,197 @@
+"""
+분석 결과 캐시 + 진행 중 요청 합치기
+
+같은 영상이 재시도/중복 업로드로 여러 번 들어오는 경우:
+1. 디스크 캐시에 같은 키의 결과가 있으면 바로 반환 (hit)
+2. 같은 키의 분석이 이미 진행 중이면 그 결과를 함께 기다림 (coalesced)
+3. 없으면 새로 분석하고 결과를 캐시에 저장 (miss)
+
+키 = sha256(업로드 내용 해시, 분석 모드, 클럽, 방향, 프로필, 진단 기준 지문)
+합치기 키 = 캐시 키 + 시간 예산 (마감 때문에 품질을 낮춘 결과는 캐시하지 않고, 예산이 같은 요청끼리만 공유)
+"""
+import asyncio
+import hashlib
+import logging
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from app.common import metrics
+from app.common.deadline import Deadline
+from app.config.settings import settings
+from app.infrastructure.cache.disk_cache import DiskLruCache
+from app.schemas.analyze_dto import AnalyzeSwingRequest
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def result_cache_key(content_hash: str, mode: str, request: AnalyzeSwingRequest, fingerprint: str) -> str:
+    """
+    분석 결과 캐시 키
+
+    Args:
+        content_hash: 업로드 파일 sha256 hex
+        mode: "single" | "multi"
+        request: 분석 요청 (클럽/방향/가시성/정규화/LLM 설정)
+        fingerprint: 진단 기준 지문 (DiagnosisEngine.fingerprint, 버전/A·B 분배 결과 반영)
+
+    Returns:
+        sha256 hex
+    """
+    profile = [
+        f"vis={request.visibility_threshold}",
+        f"norm={request.normalize_mode}",
+        f"llm={request.llm_provider}:{request.llm_model}",
+    ]
+    if request.llm_provider in ("openai", "anthropic"):
+        profile.append(f"user={request.user_id}")  # LLM 피드백은 사용자별로 다를 수 있음
+    if request.feedback_mode != "inline":
+        profile.append(f"feedback={request.feedback_mode}")  # 응답 형태(피드백 포함 여부)가 다름
+    parts = [content_hash, mode, request.club, request.swing_direction, ",".join(profile), fingerprint]
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def result_flight_key(cache_key: str, request: AnalyzeSwingRequest) -> str:
+    """
+    진행 중 분석 합치기 키
+
+    마감 없는 요청이 마감 있는 요청의 (품질을 낮춘) 결과를 받지 않도록 시간 예산을 포함
+
+    Args:
+        cache_key: result_cache_key()
+        request: 분석 요청 (deadline_ms)
+
+    Returns:
+        합치기 키
+    """
+    budget = Deadline.budget_for(request.deadline_ms)
+    return cache_key if budget is None else f"{cache_key}|deadline={budget:g}"
+
+
+class SingleFlight:
+    """
+    같은 키의 코루틴은 한 번만 실행하고 나머지 호출자는 그 결과를 공유
+
+    실행은 별도 태스크라 먼저 온 호출자가 취소돼도 나머지 호출자(와 캐시 저장)는 계속 진행
+    """
+
+    def __init__(self):
+        self._flights: dict[str, asyncio.Task] = {}
+
+    async def run(self, key: str, factory: Callable[[], Awaitable]) -> tuple[object, bool]:
+        """
+        Args:
+            key: 합치기 키
+            factory: 새로 실행할 때만 호출 (동기 호출, 코루틴 반환)
+
+        Returns:
+            (결과, 진행 중이던 실행에 합류했는지)
+        """
+        task = self._flights.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._flights[key] = task
+            task.add_done_callback(lambda _t: self._flights.pop(key, None))
+        return await asyncio.shield(task), shared
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+
+class AnalysisResultCache:
+    """응답 DTO 디스크 캐시 + 진행 중 분석 합치기"""
+
+    def __init__(self, store: Optional[DiskLruCache] = None):
+        """
+        Args:
+            store: 디스크 캐시 (기본: settings.RESULT_CACHE_* 설정)
+        """
+        if store is None:
+            store = DiskLruCache(
+                settings.RESULT_CACHE_DIR,
+                max_entries=settings.RESULT_CACHE_MAX_ENTRIES,
+                max_bytes=settings.RESULT_CACHE_MAX_BYTES,
+                ttl_sec=settings.RESULT_CACHE_TTL_SEC
+            )
+        self.store = store
+        self.flights = SingleFlight()
+
+    async def get_or_compute(
+        self,
+        key: str,
+        model: type[M],
+        factory: Callable[[], Awaitable[M]],
+        cleanup: Optional[Callable[[], None]] = None,
+        flight_key: Optional[str] = None
+    ) -> tuple[M, str]:
+        """
+        Args:
+            key: result_cache_key()
+            model: 응답 DTO 타입 (캐시 JSON 복원용)
+            factory: 새로 분석할 때만 호출되는 코루틴 팩토리
+            cleanup: 이 호출자의 입력(업로드 파일)이 필요 없어지면 1회 호출 (블로킹 함수)
+                     새로 분석하는 경우는 분석이 끝난 뒤(호출자가 취소돼도) 실행 태스크가 호출
+            flight_key: 진행 중 분석 합치기 키 (기본: key, result_flight_key())
+
+        Returns:
+            (응답 DTO, "hit" | "coalesced" | "miss") - 호출자마다 별도 사본
+        """
+        owned = False  # cleanup을 실행 태스크가 맡았는지
+
+        def start():
+            nonlocal owned
+            owned = True
+            return self._compute(key, model, factory, cleanup)
+
+        try:
+            cached = await self._load(key, model)
+            if cached is not None:
+                metrics.CACHE_REQUESTS.labels("hit").inc()
+                return cached, "hit"
+
+            result, shared = await self.flights.run(flight_key or key, start)
+            outcome = "coalesced" if shared else "miss"
+            metrics.CACHE_REQUESTS.labels(outcome).inc()
+            return result.model_copy(deep=True), outcome
+        finally:
+            if cleanup is not None and not owned:
+                await asyncio.to_thread(cleanup)
+
+    async def _compute(
+        self,
+        key: str,
+        model: type[M],
+        factory: Callable[[], Awaitable[M]],
+        cleanup: Optional[Callable[[], None]]
+    ) -> M:
+        try:
+            # 디스크 확인과 합류 사이에 끝난 실행이 있으면 그 결과 사용
+            cached = await self._load(key, model)
+            if cached is not None:
+                return cached
+            result = await factory()
+        finally:
+            if cleanup is not None:
+                await asyncio.to_thread(cleanup)
+        if getattr(result, "degradation_notes", None):
+            return result  # 마감 때문에 품질을 낮춘 결과는 다음 요청에 재사용하지 않음 (합류한 호출자만 공유)
+        try:
+            await asyncio.to_thread(self.store.put, key, result.model_dump_json())
+        except Exception as e:
+            logger.warning(f"⚠️ 결과 캐시 저장 실패 ({key[:12]}): {e}")
+        return result
+
+    async def _load(self, key: str, model: type[M]) -> Optional[M]:
+        try:
+            raw = await asyncio.to_thread(self.store.get, key)
+        except Exception as e:
+            logger.warning(f"⚠️ 결과 캐시 조회 실패 ({key[:12]}): {e}")
+            return None
+        return model.model_validate_json(raw) if raw is not None else None
+
+
+# 프로세스 전역 결과 캐시
+result_cache = AnalysisResultCache()
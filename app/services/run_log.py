@@ -0,0 +1,135 @@
+"""
+분석 실행 로그 레코드
+분석 1건(멀티는 스윙 1개)을 aggregate_logs / build_phase_dataset이 읽는 JSON 스키마로 변환
+
+스키마 (scripts/utils/libs/flatten.flatten_core_blocks 참고):
+    swingId, input{filePath, side, club}, env, appVersion, timestamp,
+    preprocess{mode, ms, fps, sourceFps, height, mirror}, pose{frameStep, fps, modelComplexity, minVisibility},
+    rules{club, fingerprint, keyCount}, phase{method},
+    detectedFrames, totalFrames, detectionRate,
+    metrics{...}, phases{페이즈: 시작 프레임}, phase_metrics{P2..P9: {elbow, knee, ...}},
+    diagnosis_by_phase{페이즈: {score, issues}}
+"""
+import time
+from typing import Optional
+
+from app.config.settings import settings
+from app.domain.diagnosis.engine import DiagnosisEngine
+from app.domain.diagnosis.scoring import METRIC_ALIASES, PHASE_POSITIONS
+from app.schemas.analyze_dto import AnalyzeSwingRequest, DiagnosisResult, PhaseResult
+from app.schemas.pose_dto import PoseExtractionResult
+from app.schemas.video_dto import VideoPreprocessResult
+
+APP_VERSION = "1.0.0"
+
+# 각도 계산기 메트릭 이름 → 데이터셋 메트릭 이름 (elbow, knee, ...)
+_DATASET_METRICS = {v: k for k, v in METRIC_ALIASES.items()}
+
+
+def build_run_record(
+    *,
+    swing_id: str,
+    mode: str,
+    request: AnalyzeSwingRequest,
+    video_metadata: VideoPreprocessResult,
+    pose_result: PoseExtractionResult,
+    engine: DiagnosisEngine,
+    phase_method: str,
+    phases: list[PhaseResult],
+    diagnoses: list[DiagnosisResult],
+    overall_score: float,
+    stage_timings_ms: dict[str, dict[str, float]],
+    processing_time_ms: Optional[float] = None
+) -> dict:
+    """
+    분석 결과 → 실행 로그 레코드 1개
+
+    Args:
+        swing_id: 레코드 ID (analysis_id, 멀티는 analysis_id#스윙번호)
+        mode: "single" | "multi"
+        request: 분석 요청
+        video_metadata: 전처리 결과 메타데이터
+        pose_result: 포즈 추출 결과 (멀티는 영상 전체)
+        engine: 진단 엔진 (기준 지문 / 기준 칸 수)
+        phase_method: 페이즈 감지 방식 (PhaseDetector.method)
+        phases: API 페이즈 결과
+        diagnoses: API 진단 결과
+        overall_score: 종합 점수
+        stage_timings_ms: StageTimings.as_dict()
+        processing_time_ms: 요청 전체 처리 시간
+
+    Returns:
+        JSON 직렬화 가능한 dict
+    """
+    total = pose_result.total_frames
+    detected = len(pose_result.poses)
+
+    metrics = {"overall_score": round(overall_score, 2)}
+    if processing_time_ms is not None:
+        metrics["processing_ms"] = processing_time_ms
+    for stage, t in stage_timings_ms.items():
+        metrics[f"{stage}_ms"] = t["exec_ms"]
+
+    return {
+        "swingId": swing_id,
+        "input": {
+            "filePath": request.file_path,
+            "side": request.swing_direction,
+            "club": request.club,
+        },
+        "env": settings.ENV,
+        "appVersion": APP_VERSION,
+        "timestamp": int(time.time()),
+        "preprocess": {
+            "mode": mode,
+            "ms": stage_timings_ms.get("decode", {}).get("exec_ms"),
+            "fps": video_metadata.fps,
+            "sourceFps": video_metadata.source_fps,
+            "height": video_metadata.height,
+            "mirror": request.swing_direction == "left",
+        },
+        "pose": {
+            # 마감 대응으로 목표 FPS / 모델 크기를 낮췄으면 그 값 (데이터셋에서 경량화 실행 구분)
+            "frameStep": video_metadata.frame_step,
+            "fps": video_metadata.fps,
+            "modelComplexity": pose_result.model_complexity,
+            "minVisibility": request.visibility_threshold,
+        },
+        "rules": {
+            "club": request.club,
+            "version": engine.thresholds_version,
+            "fingerprint": engine.fingerprint,
+            "keyCount": engine.key_count,
+        },
+        "phase": {"method": phase_method},
+        "detectedFrames": detected,
+        "totalFrames": total,
+        "detectionRate": round(detected / total, 4) if total else 0.0,
+        "metrics": metrics,
+        "phases": {p.name: p.start_frame for p in phases},
+        "phase_metrics": phase_metrics(phases),
+        "diagnosis_by_phase": {
+            d.phase: {"score": round(d.score, 2), "issues": "; ".join(d.issues)}
+            for d in diagnoses
+        },
+    }
+
+
+def phase_metrics(phases: list[PhaseResult]) -> dict[str, dict[str, float]]:
+    """
+    엔진 페이즈 대표 각도 → P 포지션별 데이터셋 메트릭
+
+    한 페이즈에 P 포지션이 둘이면(Backswing = P2, P3) 같은 대표값을 양쪽에 기록
+    """
+    out: dict[str, dict[str, float]] = {}
+    for phase in phases:
+        values = {
+            _DATASET_METRICS[k]: round(float(v), 2)
+            for k, v in phase.key_angles.items()
+            if k in _DATASET_METRICS and v is not None
+        }
+        if not values:
+            continue
+        for position in PHASE_POSITIONS.get(phase.name, ()):
+            out[position] = values
+    return out
@@ -1,14 +1,9 @@
-from app.config.settings import settings
 from typing import Optional
 
+from app.schemas.analyze_dto import AnalyzeSwingRequest
+from app.schemas.analyze_request import AnalyzeSwingApiRequest
+from app.services.container import container
 from app.services.swing_analysis_service import SwingAnalysisService
-from app.domain.video.preprocessor import VideoPreprocessor
-from app.domain.pose.extractor import PoseExtractor
-from app.domain.angle.calculator import AngleCalculator
-from app.domain.phase.detector import PhaseDetector
-from app.domain.diagnosis.engine import DiagnosisEngine
-from app.infrastructure.llm.gateway_client import LLMGatewayClient
-from app.infrastructure.storage.s3_client import S3StorageClient
 
 
 def create_swing_analysis_service(
@@ -16,48 +11,56 @@ def create_swing_analysis_service(
         swing_direction: str,
         visibility_threshold: float = 0.5,
         llm_provider: str = None,
-        llm_model: Optional[str] = None
+        llm_model: Optional[str] = None,
+        thresholds_version: Optional[str] = None,
+        user_id: Optional[str] = None
 ) -> SwingAnalysisService:
     """
     SwingAnalysisService 인스턴스 생성
 
+    컴포넌트는 전역 container가 공유 (요청마다 새로 만들지 않음)
+
     Args:
-        club: 클럽 종류 (DiagnosisEngine에 전달)
-        swing_direction: 스윙 방향 (PhaseDetector에 전달)
-        visibility_threshold: MediaPipe 가시성 임계값
+        club: 클럽 종류 (DiagnosisEngine 선택)
+        swing_direction: 스윙 방향 (PhaseDetector 선택)
+        visibility_threshold: MediaPipe 가시성 임계값 (PoseExtractor 풀 키)
         llm_provider: LLM 제공자 (openai, anthropic)
         llm_model: LLM 모델명
+        thresholds_version: 분포 기반 진단 thresholds 버전 (지정 시 DIAGNOSIS_SCORING과 무관하게 분포 진단)
+        user_id: thresholds A/B 분배 키
 
     Returns:
         SwingAnalysisService 인스턴스
+
+    Raises:
+        KeyError: 알 수 없는 thresholds_version
     """
-    # Domain 컴포넌트 초기화
-    video_preprocessor = VideoPreprocessor()
-    pose_extractor = PoseExtractor(visibility_threshold=visibility_threshold)
-    angle_calculator = AngleCalculator()
-    phase_detector = PhaseDetector(swing_direction=swing_direction)
-    diagnosis_engine = DiagnosisEngine(club=club)
-
-    # Infrastructure 컴포넌트 초기화 (optional)
-    llm_client = None
-    if llm_provider in ("openai", "anthropic") and llm_model and settings.OPENAI_API_KEY:
-        llm_client = LLMGatewayClient(
-            gateway_url=settings.LLM_GATEWAY_URL,
-            provider=llm_provider,
-            model=llm_model,
-            api_key=settings.OPENAI_API_KEY
-        )
-
-    storage_client = None
-    if hasattr(settings, "S3_BUCKET_NAME") and settings.S3_BUCKET_NAME:
-        storage_client = S3StorageClient(bucket_name=settings.S3_BUCKET_NAME)
-
-    return SwingAnalysisService(
-        video_preprocessor=video_preprocessor,
-        pose_extractor=pose_extractor,
-        angle_calculator=angle_calculator,
-        phase_detector=phase_detector,
-        diagnosis_engine=diagnosis_engine,
-        llm_client=llm_client,
-        storage_client=storage_client
-    )
\ No newline at end of file
+    return container.service_for(
+        club=club,
+        swing_direction=swing_direction,
+        visibility_threshold=visibility_threshold,
+        llm_provider=llm_provider,
+        llm_model=llm_model,
+        thresholds_version=thresholds_version,
+        user_id=user_id
+    )
+
+
+def build_analyze_request(
+    req: AnalyzeSwingApiRequest, file_path: str, received_at: Optional[float] = None
+) -> AnalyzeSwingRequest:
+    """API Request DTO + 저장된 파일 경로 (+ 요청 도착 시각) → Service DTO"""
+    return AnalyzeSwingRequest(
+        file_path=file_path,
+        user_id=req.user_id,
+        club=req.club,
+        swing_direction=req.swing_direction,
+        visibility_threshold=req.visibility_threshold,
+        normalize_mode=req.normalize_mode,
+        llm_provider=req.llm_provider,
+        llm_model=req.llm_model,
+        thresholds_version=req.thresholds_version,
+        feedback_mode=req.feedback_mode,
+        deadline_ms=req.deadline_ms,
+        received_at=received_at
+    )
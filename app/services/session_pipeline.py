@@ -0,0 +1,165 @@
+"""
+세션 모드 파이프라인
+긴 영상/스트림을 프레임 단위로 처리하면서 스윙이 끝날 때마다 즉시 분석 결과 발행
+"""
+import logging
+from collections import deque
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+
+from app.config.settings import settings
+from app.domain.phase.online import OnlinePhaseDetector
+from app.schemas.analyze_dto import SwingAnalysisResult
+from app.schemas.phase_dto import SwingSegment
+from app.schemas.pose_dto import PoseData
+from app.services.swing_analysis_service import SwingAnalysisService
+
+logger = logging.getLogger(__name__)
+
+
+class SwingSessionPipeline:
+    """
+    연습 세션 파이프라인 (메모리 사용량은 세션 길이와 무관하게 일정)
+
+    - 링 버퍼: 최근 buffer_sec 동안의 포즈만 보관 (deque maxlen)
+    - 트리거: OnlinePhaseDetector가 Impact/Follow-through를 확정하고
+      post_roll_sec가 지나면 버퍼에서 해당 스윙 구간을 잘라 분석
+    - 분석: SwingAnalysisService.analyze_segment (배치 PhaseDetector + 진단)
+    """
+
+    def __init__(
+        self,
+        service: SwingAnalysisService,
+        fps: float,
+        buffer_sec: Optional[float] = None,
+        max_swing_sec: Optional[float] = None,
+        pre_roll_sec: float = 0.5,
+        post_roll_sec: float = 0.5
+    ):
+        """
+        Args:
+            service: 도메인 컴포넌트를 가진 분석 서비스
+            fps: 프레임 레이트
+            buffer_sec: 포즈 링 버퍼 길이(초) (None = settings.SESSION_BUFFER_SEC)
+            max_swing_sec: Backswing 이후 이 시간 안에 끝나지 않으면 스윙 후보 폐기(초)
+            pre_roll_sec: Backswing 이전에 포함할 Address 구간(초)
+            post_roll_sec: Follow-through 이후 기다렸다가 포함할 구간(초)
+        """
+        self.service = service
+        self.fps = fps
+        buffer_sec = buffer_sec or settings.SESSION_BUFFER_SEC
+        max_swing_sec = max_swing_sec or settings.SESSION_MAX_SWING_SEC
+
+        self.buffer: deque[PoseData] = deque(maxlen=max(1, int(buffer_sec * fps)))
+        self.max_swing_frames = int(max_swing_sec * fps)
+        self.pre_roll = int(pre_roll_sec * fps)
+        self.post_roll = int(post_roll_sec * fps)
+        self.online = OnlinePhaseDetector(
+            swing_direction=service.phase_detector.swing_direction, fps=fps
+        )
+
+        self.frames_processed = 0
+        self.swings_emitted = 0
+        self._swing_start: Optional[int] = None
+        self._emit_at: Optional[int] = None
+
+    def run(self, frames: Iterable[tuple[int, np.ndarray]]) -> Iterator[SwingAnalysisResult]:
+        """
+        프레임 스트림 처리
+
+        Args:
+            frames: (frame_number, RGB 프레임) 이터러블 (VideoPreprocessor.stream)
+
+        Yields:
+            스윙이 완료될 때마다 SwingAnalysisResult (post_roll 전에 스트림이 끝난 스윙 포함)
+        """
+        try:
+            for frame_number, frame in frames:
+                result = self.push_frame(frame_number, frame)
+                if result is not None:
+                    yield result
+            result = self.flush()
+            if result is not None:
+                yield result
+        finally:
+            self.service.pose_extractor.close()
+
+    def push_frame(self, frame_number: int, frame: np.ndarray) -> Optional[SwingAnalysisResult]:
+        """프레임 1개 → 포즈 추출 → push_pose"""
+        self.frames_processed += 1
+        pose = self.service.pose_extractor.process_frame(frame, frame_number, self.fps)
+        if pose is None:
+            return None
+        return self.push_pose(pose)
+
+    def push_pose(self, pose: PoseData) -> Optional[SwingAnalysisResult]:
+        """
+        포즈 1개 입력
+
+        Returns:
+            이번 입력으로 스윙이 완료되면 SwingAnalysisResult, 아니면 None
+        """
+        self.buffer.append(pose)
+        self.online.push(pose)
+        now = pose.frame_number
+
+        # 스윙 시작 (Backswing 확정)
+        if self._swing_start is None:
+            backswing = next((t for t in self.online.transitions if t.name == "Backswing"), None)
+            if backswing is not None:
+                self._swing_start = backswing.frame - self.pre_roll
+
+        # 스윙 완료 → post_roll 이후 분석
+        if self._emit_at is None and self.online.is_complete:
+            self._emit_at = self.online.transitions[-1].frame + self.post_roll
+
+        if self._emit_at is not None and now >= self._emit_at:
+            result = self._analyze_buffered(self._swing_start)
+            self._rearm()
+            return result
+
+        # 끝나지 않는 스윙 후보(왜글 등)는 폐기
+        if self._swing_start is not None and self._emit_at is None \
+                and now - self._swing_start > self.max_swing_frames + self.pre_roll:
+            logger.info(f"ℹ️ 스윙 후보 폐기 (frame {self._swing_start}~{now})")
+            self._rearm()
+        return None
+
+    def flush(self) -> Optional[SwingAnalysisResult]:
+        """
+        스트림 종료 처리: 완료됐지만 post_roll을 기다리던 스윙을 지금까지의 버퍼로 분석
+
+        Returns:
+            대기 중이던 스윙의 SwingAnalysisResult, 없으면 None
+        """
+        if self._emit_at is None or self._swing_start is None:
+            return None
+        result = self._analyze_buffered(self._swing_start)
+        self._rearm()
+        return result
+
+    def _analyze_buffered(self, start_frame: int) -> Optional[SwingAnalysisResult]:
+        """링 버퍼에서 스윙 구간을 잘라 분석"""
+        window = [p for p in self.buffer if p.frame_number >= start_frame]
+        if len(window) < 3:
+            return None
+
+        angles = self.service.angle_calculator.calculate(window)
+        segment = SwingSegment(
+            index=self.swings_emitted,
+            start_index=0,
+            end_index=len(window),
+            start_frame=window[0].frame_number,
+            end_frame=window[-1].frame_number
+        )
+        result = self.service.analyze_segment(segment, window, angles, self.fps)
+        if result is not None:
+            self.swings_emitted += 1
+        return result
+
+    def _rearm(self) -> None:
+        """다음 스윙 감지를 위해 트리거 상태 초기화 (버퍼는 유지)"""
+        self.online.reset()
+        self._swing_start = None
+        self._emit_at = None
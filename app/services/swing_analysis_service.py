@@ -2,24 +2,43 @@
 스윙 분석 Service Layer
 Domain 컴포넌트들을 조합하여 전체 분석 파이프라인 실행
 """
+import asyncio
+import logging
+import time
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 
+from app.common import metrics
+from app.common.deadline import Deadline
+from app.common.executors import StageExecutor, StageTimings, get_executor, spawn_background
+from app.config.settings import settings
 from app.schemas.analyze_dto import (
     AnalyzeSwingRequest,
     AnalyzeSwingResponse,
+    AnalyzeMultiSwingResponse,
+    SwingAnalysisResult,
     PhaseResult,
-    DiagnosisResult as ApiDiagnosisResult
+    DiagnosisResult as ApiDiagnosisResult,
+    KinematicSequenceResult
 )
+from app.schemas.phase_dto import SwingSegment
 from app.schemas.video_dto import VideoPreprocessRequest
 from app.domain.video.preprocessor import VideoPreprocessor
 from app.domain.pose.extractor import PoseExtractor
 from app.domain.angle.calculator import AngleCalculator
 from app.domain.phase.detector import PhaseDetector
+from app.domain.phase.segmenter import SwingSegmenter
+from app.domain.kinematics.analyzer import KinematicsAnalyzer
 from app.domain.diagnosis.engine import DiagnosisEngine
 from app.infrastructure.llm.gateway_client import LLMGatewayClient
+from app.infrastructure.runlog.writer import run_log
 from app.infrastructure.storage.s3_client import S3StorageClient
+from app.services.feedback_store import feedback_store
+from app.services.run_log import build_run_record
+
+logger = logging.getLogger(__name__)
 
 
 class SwingAnalysisService:
@@ -40,7 +59,11 @@ class SwingAnalysisService:
         phase_detector: PhaseDetector,
         diagnosis_engine: DiagnosisEngine,
         llm_client: Optional[LLMGatewayClient] = None,
-        storage_client: Optional[S3StorageClient] = None
+        storage_client: Optional[S3StorageClient] = None,
+        kinematics_analyzer: Optional[KinematicsAnalyzer] = None,
+        swing_segmenter: Optional[SwingSegmenter] = None,
+        cpu_executor: Optional[StageExecutor] = None,
+        io_executor: Optional[StageExecutor] = None
     ):
         """
         Args:
@@ -51,6 +74,10 @@ class SwingAnalysisService:
             diagnosis_engine: 진단 엔진
             llm_client: LLM 클라이언트 (선택적)
             storage_client: S3 클라이언트 (선택적)
+            kinematics_analyzer: 키네마틱스 계산기 (선택적)
+            swing_segmenter: 멀티 스윙 구간 분리기 (analyze_multi에서 사용)
+            cpu_executor: 디코딩/포즈/계산 단계 실행기 (기본: 전역 "cpu")
+            io_executor: 블로킹 I/O(S3) 실행기 (기본: 전역 "io")
         """
         self.video_preprocessor = video_preprocessor
         self.pose_extractor = pose_extractor
@@ -59,6 +86,12 @@ class SwingAnalysisService:
         self.diagnosis_engine = diagnosis_engine
         self.llm_client = llm_client
         self.storage_client = storage_client
+        self.kinematics_analyzer = kinematics_analyzer
+        self.swing_segmenter = swing_segmenter or SwingSegmenter(
+            swing_direction=phase_detector.swing_direction
+        )
+        self.cpu_executor = cpu_executor or get_executor("cpu")
+        self.io_executor = io_executor or get_executor("io")
 
     async def analyze(self, request: AnalyzeSwingRequest) -> AnalyzeSwingResponse:
         """
@@ -69,9 +102,16 @@ class SwingAnalysisService:
         2. 포즈 추출
         3. 각도 계산
         4. 페이즈 감지
-        5. 진단 생성
-        6. AI 피드백 생성
-        7. S3 저장 (선택적)
+        5. 진단 생성 (+ 키네마틱 시퀀스 동시 실행)
+        6. AI 피드백 생성 (진단 직후 시작)
+        7. S3 저장 (선택적, LLM 호출과 동시 → 피드백은 응답 뒤 같은 키에 병합)
+           feedback_mode="deferred"면 LLM을 기다리지 않고 응답 (피드백은 ai_feedback_url로 조회)
+
+        요청 마감(deadline_ms)이 있으면 단계마다 남은 시간을 확인해 품질을 낮추고
+        (포즈 경량화 / 키네마틱스·LLM 생략 / S3 응답 뒤 저장) degradation_notes에 기록
+
+        동기 단계는 모두 cpu/io 실행기에서 실행하고, LLM 호출은 비동기로 await
+        (이벤트 루프는 요청 수신/응답만 처리)
 
         Args:
             request: 분석 요청 DTO
@@ -79,89 +119,441 @@ class SwingAnalysisService:
         Returns:
             AnalyzeSwingResponse
         """
+        started = time.perf_counter()
+        with _analysis_metrics("single"):
+            response = await self._analyze(request, started)
+        return response
+
+    async def _analyze(self, request: AnalyzeSwingRequest, started: float) -> AnalyzeSwingResponse:
         analysis_id = self._generate_analysis_id()
+        timings = StageTimings()
+        deadline = Deadline.for_request(request.deadline_ms, request.received_at)
+        cpu = self.cpu_executor
+
+        # ========== Step 1~2: 비디오 전처리 + 포즈 추출 ==========
+        pose_result, video_metadata = await self._extract_poses(request, timings, deadline)
+
+        # ========== Step 3: 각도 계산 ==========
+        angle_result = await cpu.run(
+            "angles", self.angle_calculator.calculate, pose_result.poses, timings=timings
+        )
+
+        # ========== Step 4: 페이즈 감지 ==========
+        phase_result = await cpu.run(
+            "phase", self.phase_detector.detect,
+            poses=pose_result.poses,
+            angles=angle_result,
+            fps=video_metadata.fps,
+            timings=timings
+        )
+
+        # ========== Step 5: 진단 생성 (+ 키네마틱 시퀀스 동시 실행) ==========
+        kinematics_task = None
+        if self.kinematics_analyzer:
+            if deadline.allows(settings.DEADLINE_KINEMATICS_MIN_SEC):
+                kinematics_task = asyncio.ensure_future(cpu.run(
+                    "kinematics", self._analyze_kinematics,
+                    pose_result.poses, angle_result, phase_result, video_metadata.fps,
+                    timings=timings
+                ))
+            else:
+                deadline.degrade("kinematics", "키네마틱 시퀀스 생략 (남은 시간 부족)")
+        try:
+            diagnosis_result = await cpu.run(
+                "diagnosis", self.diagnosis_engine.diagnose, phase_result.phases, timings=timings
+            )
+        except BaseException:
+            if kinematics_task is not None:
+                kinematics_task.cancel()
+            raise
+
+        # ========== Step 6: AI 피드백 생성 시작 (선택적, 진단 직후) ==========
+        text_feedback = self._generate_text_feedback(diagnosis_result)
+        deferred = self.llm_client is not None and request.feedback_mode == "deferred"
+        llm_task = None
+        if deferred:
+            # 응답 뒤에 끝나므로 마감과 무관
+            llm_task = asyncio.ensure_future(self._generate_ai_feedback(request, diagnosis_result, timings))
+        elif self.llm_client:
+            if deadline.allows(settings.DEADLINE_LLM_MIN_SEC):
+                llm_task = asyncio.ensure_future(self._generate_ai_feedback(
+                    request, diagnosis_result, timings, deadline=deadline, fallback=text_feedback
+                ))
+            else:
+                deadline.degrade("llm_skip", "AI 피드백 생략 → 진단 텍스트 피드백 (남은 시간 부족)")
+
+        try:
+            kinematic_sequence = await kinematics_task if kinematics_task is not None else None
+        except BaseException:
+            if llm_task is not None:
+                llm_task.cancel()
+            raise
+
+        # Step 7~8이 실패하면 진행 중인 LLM 호출도 취소 (결과를 쓸 곳이 없는 과금 / 고아 태스크 방지)
+        try:
+            # ========== Step 7: Response DTO 생성 ==========
+            response = AnalyzeSwingResponse(
+                analysis_id=analysis_id,
+                user_id=request.user_id,
+                club=request.club,
+                phases=self._to_phase_results(phase_result),
+                diagnosis_by_phase=self._to_diagnosis_results(diagnosis_result),
+                overall_score=diagnosis_result.overall_score,
+                thresholds_version=self.diagnosis_engine.thresholds_version,
+                kinematic_sequence=kinematic_sequence,
+                ai_feedback=text_feedback,  # LLM이 있으면 완료 후 교체 (없으면 진단 텍스트가 최종)
+                result_url=None  # S3 업로드 후 업데이트
+            )
+
+            # ========== Step 8: S3 저장 (선택적, LLM 호출과 동시) ==========
+            # merge_key: 응답 뒤 최종 결과를 이 키에 (다시) 업로드
+            merge_key = None
+            upload_now = False
+            if self.storage_client:
+                merge_key = self.storage_client.result_key(response)
+                upload_now = deadline.allows(settings.DEADLINE_STORAGE_MIN_SEC)
+                if not upload_now:
+                    deadline.degrade("storage_defer", "결과 저장을 응답 뒤로 미룸 (result_url은 업로드 완료 후 유효)")
+                    response.result_url = self.storage_client.result_url(merge_key)
+
+            if deferred:
+                # LLM을 기다리지 않고 응답 → 피드백은 응답 뒤 feedback_store (+ 같은 S3 키)에 기록
+                response.ai_feedback_status = "pending"
+                response.ai_feedback_url = feedback_store.url(analysis_id)
+                await self.io_executor.run("feedback_store", feedback_store.mark_pending, analysis_id)
+                if upload_now:
+                    response.result_url = await self.io_executor.run(
+                        "storage", self.storage_client.upload_result, response, merge_key, timings=timings
+                    )
+            elif upload_now and llm_task is not None:
+                # 진단 텍스트 피드백으로 먼저 저장 → LLM 피드백은 응답 뒤 같은 키에 덮어써서 병합
+                upload = self.io_executor.run(
+                    "storage", self.storage_client.upload_result, response.model_copy(deep=True), merge_key,
+                    timings=timings
+                )
+                response.result_url, response.ai_feedback = await asyncio.gather(upload, llm_task)
+            else:
+                if llm_task is not None:
+                    response.ai_feedback = await llm_task
+                if upload_now:
+                    response.result_url = await self.io_executor.run(
+                        "storage", self.storage_client.upload_result, response, merge_key, timings=timings
+                    )
+                    merge_key = None  # 최종 결과 저장 완료
+        except BaseException:
+            if llm_task is not None:
+                llm_task.cancel()
+            raise
+
+        response.degradation_notes = list(deadline.notes)
+        response.processing_time_ms = round((time.perf_counter() - started) * 1000, 2)
+        response.stage_timings_ms = timings.as_dict()
+        logger.info(f"⏱️ {analysis_id} {response.processing_time_ms:.0f}ms stages: {timings.summary()}")
+
+        if deferred:
+            spawn_background(
+                self._deliver_feedback(analysis_id, llm_task, response.model_copy(deep=True), merge_key),
+                name=f"feedback:{analysis_id}"
+            )
+        elif merge_key is not None:
+            spawn_background(
+                self.io_executor.run(
+                    "storage_merge", self.storage_client.upload_result, response.model_copy(deep=True), merge_key
+                ),
+                name=f"storage_merge:{analysis_id}"
+            )
+
+        self._write_run_log(
+            analysis_id, "single", request, video_metadata, pose_result, response,
+            response.stage_timings_ms, response.processing_time_ms
+        )
+        return response
+
+    async def analyze_multi(self, request: AnalyzeSwingRequest) -> AnalyzeMultiSwingResponse:
+        """
+        멀티 스윙(연습장 세션) 분석
+
+        Process:
+        1. 비디오 전처리 + 포즈 추출 (영상 전체 1회)
+        2. 각도 계산 (영상 전체 1회, 스윙별로 배열 view만 잘라 사용)
+        3. 스윙 구간 분리
+        4. 스윙별 페이즈 감지 / 키네마틱스 / 진단 병렬 실행 (cpu 실행기)
+
+        Args:
+            request: 분석 요청 DTO
+
+        Returns:
+            AnalyzeMultiSwingResponse (페이즈 감지에 실패한 구간은 제외)
+        """
+        started = time.perf_counter()
+        with _analysis_metrics("multi"):
+            response = await self._analyze_multi(request, started)
+        return response
+
+    async def _analyze_multi(self, request: AnalyzeSwingRequest, started: float) -> AnalyzeMultiSwingResponse:
+        analysis_id = self._generate_analysis_id()
+        timings = StageTimings()
+        cpu = self.cpu_executor
+
+        deadline = Deadline.for_request(request.deadline_ms, request.received_at)
+        pose_result, video_metadata = await self._extract_poses(request, timings, deadline)
+        poses = pose_result.poses
+        fps = video_metadata.fps
+
+        angle_result = await cpu.run("angles", self.angle_calculator.calculate, poses, timings=timings)
+        segments = await cpu.run("segment", self.swing_segmenter.segment, poses, fps, timings=timings)
+        logger.info(f"🏌️ 스윙 구간 {len(segments)}개 검출")
+
+        # 구간별 분석은 서로 독립 → 실행기에 한꺼번에 제출 (MULTI_SWING_MAX_WORKERS개씩)
+        swings: list[SwingAnalysisResult] = []
+        limit = asyncio.Semaphore(max(1, settings.MULTI_SWING_MAX_WORKERS))
+
+        async def run_segment(seg: SwingSegment):
+            async with limit:
+                return await cpu.run(
+                    "swing", self.analyze_segment, seg, poses, angle_result, fps, timings=timings
+                )
+
+        if segments:
+            results = await asyncio.gather(*(run_segment(seg) for seg in segments))
+            swings = [r for r in results if r is not None]
+
+        processing_time_ms = round((time.perf_counter() - started) * 1000, 2)
+        logger.info(f"⏱️ {analysis_id} {processing_time_ms:.0f}ms stages: {timings.summary()}")
+
+        stage_timings_ms = timings.as_dict()
+        for swing in swings:
+            self._write_run_log(
+                f"{analysis_id}#{swing.swing_index}", "multi", request, video_metadata, pose_result, swing,
+                stage_timings_ms, processing_time_ms
+            )
+
+        return AnalyzeMultiSwingResponse(
+            analysis_id=analysis_id,
+            user_id=request.user_id,
+            club=request.club,
+            swings=swings,
+            thresholds_version=self.diagnosis_engine.thresholds_version,
+            detected_segments=len(segments),
+            processing_time_ms=processing_time_ms,
+            stage_timings_ms=stage_timings_ms,
+            degradation_notes=list(deadline.notes)
+        )
+
+    def analyze_segment(
+        self, segment: SwingSegment, poses, angle_result, fps: float
+    ) -> Optional[SwingAnalysisResult]:
+        """
+        스윙 구간 1개 분석 (포즈/각도는 공유 결과를 잘라서 사용)
+
+        Args:
+            segment: 스윙 구간 (인덱스는 poses / angle_result 기준)
+            poses: 포즈 데이터 리스트
+            angle_result: poses와 같은 길이의 각도 계산 결과
+            fps: 프레임 레이트
+
+        Returns:
+            SwingAnalysisResult, 페이즈 감지 실패 시 None
+        """
+        seg_poses = poses[segment.start_index:segment.end_index]
+        seg_angles = angle_result.slice(segment.start_index, segment.end_index)
+
+        try:
+            phase_result = self.phase_detector.detect(poses=seg_poses, angles=seg_angles, fps=fps)
+        except ValueError as e:
+            logger.warning(f"⚠️ 스윙 #{segment.index} 페이즈 감지 실패: {e}")
+            return None
+
+        kinematic_sequence = None
+        if self.kinematics_analyzer:
+            kinematic_sequence = self._analyze_kinematics(seg_poses, seg_angles, phase_result, fps)
+
+        diagnosis_result = self.diagnosis_engine.diagnose(phase_result.phases)
+
+        return SwingAnalysisResult(
+            swing_index=segment.index,
+            start_frame=segment.start_frame,
+            end_frame=segment.end_frame,
+            timestamp_start=segment.start_frame / fps,
+            timestamp_end=segment.end_frame / fps,
+            phases=self._to_phase_results(phase_result),
+            diagnosis_by_phase=self._to_diagnosis_results(diagnosis_result),
+            overall_score=diagnosis_result.overall_score,
+            kinematic_sequence=kinematic_sequence,
+            feedback=self._generate_text_feedback(diagnosis_result)
+        )
+
+    async def _extract_poses(
+        self, request: AnalyzeSwingRequest, timings: StageTimings, deadline: Optional[Deadline] = None
+    ):
+        """
+        비디오 전처리 + 포즈 추출 (cpu 실행기) → (PoseExtractionResult, VideoMetadata)
+
+        마감까지 DEADLINE_FULL_POSE_SEC보다 적게 남았으면 목표 FPS와 MediaPipe 모델 크기를 낮춤
+        """
+        target_fps = 60  # settings에서 가져올 수도 있음
+        pose_extractor = self.pose_extractor
+        if deadline is not None and not deadline.allows(settings.DEADLINE_FULL_POSE_SEC):
+            target_fps = settings.DEADLINE_REDUCED_FPS
+            note = f"포즈 추출 경량화 (목표 {target_fps}fps"
+            if hasattr(pose_extractor, "with_complexity"):
+                pose_extractor = pose_extractor.with_complexity(settings.DEADLINE_REDUCED_COMPLEXITY)
+                note += f", model_complexity={settings.DEADLINE_REDUCED_COMPLEXITY}"
+            deadline.degrade("pose", note + ")")
 
-        # ========== Step 1: 비디오 전처리 ==========
         preprocess_request = VideoPreprocessRequest(
             file_path=request.file_path,
-            target_fps=60,  # settings에서 가져올 수도 있음
+            target_fps=target_fps,
             target_height=720,
             mirror=(request.swing_direction == "left")
         )
-        frames, video_metadata = self.video_preprocessor.process(preprocess_request)
+        frames, video_metadata = await self.cpu_executor.run(
+            "decode", self.video_preprocessor.process, preprocess_request, timings=timings
+        )
+        pose_result = await self.cpu_executor.run(
+            "pose", pose_extractor.extract, frames, video_metadata.fps, timings=timings
+        )
+        metrics.record_frames(
+            total=pose_result.total_frames,
+            detected=len(pose_result.poses),
+            low_visibility=pose_result.low_visibility_frames
+        )
+        return pose_result, video_metadata
 
-        # ========== Step 2: 포즈 추출 ==========
-        pose_result = self.pose_extractor.extract(frames, video_metadata.fps)
+    def _write_run_log(
+        self, swing_id: str, mode: str, request: AnalyzeSwingRequest, video_metadata, pose_result,
+        result, stage_timings_ms: dict, processing_time_ms: float
+    ) -> None:
+        """실행 로그 1건 등록 (큐에 넣기만 함, 실패해도 분석 결과에는 영향 없음)"""
+        if not settings.RUNLOG_ENABLED:
+            return
+        try:
+            run_log.write(build_run_record(
+                swing_id=swing_id,
+                mode=mode,
+                request=request,
+                video_metadata=video_metadata,
+                pose_result=pose_result,
+                engine=self.diagnosis_engine,
+                phase_method=self.phase_detector.method,
+                phases=result.phases,
+                diagnoses=result.diagnosis_by_phase,
+                overall_score=result.overall_score,
+                stage_timings_ms=stage_timings_ms,
+                processing_time_ms=processing_time_ms
+            ))
+        except Exception as e:
+            logger.warning(f"⚠️ 실행 로그 생성 실패 ({swing_id}): {e}")
 
-        # ========== Step 3: 각도 계산 ==========
-        angle_result = self.angle_calculator.calculate(pose_result.poses)
+    def _to_phase_results(self, phase_result) -> list[PhaseResult]:
+        """도메인 페이즈 결과 → API PhaseResult 리스트"""
+        return [
+            PhaseResult(
+                name=phase.name,
+                start_frame=phase.start_frame,
+                end_frame=phase.end_frame,
+                timestamp_start=phase.start_time,
+                timestamp_end=phase.end_time,
+                key_angles=phase.representative_angles
+            )
+            for phase in phase_result.phases
+        ]
 
-        # ========== Step 4: 페이즈 감지 ==========
-        phase_result = self.phase_detector.detect(
-            poses=pose_result.poses,
-            angles=angle_result.angles,
-            fps=video_metadata.fps
-        )
+    def _to_diagnosis_results(self, diagnosis_result) -> list[ApiDiagnosisResult]:
+        """도메인 진단 결과 → API DiagnosisResult 리스트"""
+        return [
+            ApiDiagnosisResult(
+                phase=d.phase,
+                score=d.score,
+                issues=d.issues,
+                suggestions=d.suggestions,
+                percentile_ranks=d.percentile_ranks
+            )
+            for d in diagnosis_result.diagnoses
+        ]
 
-        # ========== Step 5: 진단 생성 ==========
-        diagnosis_result = self.diagnosis_engine.diagnose(phase_result.phases)
+    async def _generate_ai_feedback(
+        self,
+        request: AnalyzeSwingRequest,
+        diagnosis_result,
+        timings: StageTimings,
+        deadline: Optional[Deadline] = None,
+        fallback: Optional[str] = None
+    ) -> str:
+        """
+        LLM 피드백 생성 (llm 단계 시간 기록)
 
-        # ========== Step 6: AI 피드백 생성 (선택적) ==========
-        ai_feedback = ""
-        if self.llm_client:
-            ai_feedback = self.llm_client.generate_feedback(
+        Args:
+            deadline: 있으면 남은 시간을 타임아웃으로 사용, 넘기면 fallback 반환
+            fallback: 마감 초과 시 피드백 (진단 텍스트)
+        """
+        with timings.measure("llm"):
+            call = self.llm_client.agenerate_feedback(
                 diagnosis=diagnosis_result,
                 user_id=request.user_id,
                 club=request.club,
                 tone="professional",
                 language="ko"
             )
+            if deadline is None:
+                return await call
+            try:
+                return await asyncio.wait_for(call, deadline.timeout())
+            except asyncio.TimeoutError:
+                deadline.degrade("llm_timeout", "AI 피드백 시간 초과 → 진단 텍스트 피드백")
+                return fallback
+
+    async def _deliver_feedback(
+        self, analysis_id: str, llm_task: asyncio.Future, result: AnalyzeSwingResponse, s3_key: Optional[str]
+    ) -> None:
+        """지연 피드백: LLM 완료를 기다려 feedback_store에 기록, s3_key가 있으면 최종 결과를 그 키에 저장"""
+        try:
+            feedback = await llm_task
+        except asyncio.CancelledError:
+            feedback_store.fail(analysis_id, "cancelled")
+            raise
+        except Exception as e:
+            logger.error(f"❌ 지연 피드백 생성 실패 ({analysis_id}): {e}")
+            await self.io_executor.run("feedback_store", feedback_store.fail, analysis_id, str(e))
+            feedback = None
         else:
-            # Fallback: 진단 텍스트만 반환
-            ai_feedback = self._generate_text_feedback(diagnosis_result)
+            await self.io_executor.run("feedback_store", feedback_store.complete, analysis_id, feedback)
 
-        # ========== Step 7: Response DTO 생성 ==========
-        response = AnalyzeSwingResponse(
-            analysis_id=analysis_id,
-            user_id=request.user_id,
-            club=request.club,
-            phases=[
-                PhaseResult(
-                    name=phase.name,
-                    start_frame=phase.start_frame,
-                    end_frame=phase.end_frame,
-                    timestamp_start=phase.start_time,
-                    timestamp_end=phase.end_time,
-                    key_angles=phase.representative_angles
-                )
-                for phase in phase_result.phases
-            ],
-            diagnosis_by_phase=[
-                ApiDiagnosisResult(
-                    phase=d.phase,
-                    score=d.score,
-                    issues=d.issues,
-                    suggestions=d.suggestions
-                )
-                for d in diagnosis_result.diagnoses
-            ],
-            overall_score=diagnosis_result.overall_score,
-            ai_feedback=ai_feedback,
-            result_url=None  # S3 업로드 후 업데이트
-        )
+        if s3_key is not None:
+            # 피드백 실패여도 업로드를 응답 뒤로 미룬 경우가 있으므로 결과는 저장
+            if feedback is not None:
+                result.ai_feedback = feedback
+                result.ai_feedback_status = "ready"
+            await self.io_executor.run("storage_merge", self.storage_client.upload_result, result, s3_key)
 
-        # ========== Step 8: S3 저장 (선택적) ==========
-        if self.storage_client:
-            result_url = self.storage_client.upload_result(response)
-            response.result_url = result_url
+    def _analyze_kinematics(
+        self, poses, angle_result, phase_result, fps: float
+    ) -> Optional[KinematicSequenceResult]:
+        """
+        다운스윙(Top ~ Impact 직후) 구간의 키네마틱 시퀀스 계산
 
-        return response
+        Top / Follow-through가 없거나 프레임이 너무 적으면 None (분석 결과는 키네마틱스 없이 반환)
+        """
+        try:
+            top = phase_result.get_phase("Top")
+            follow = phase_result.get_phase("Follow-through")
+            window = (top.start_frame, follow.start_frame + int(0.1 * fps))
+            kinematics = self.kinematics_analyzer.analyze(
+                angles=angle_result, poses=poses, fps=fps, window=window
+            )
+        except ValueError as e:
+            logger.warning(f"⚠️ 키네마틱 시퀀스 계산 생략: {e}")
+            return None
+        sequence = kinematics.sequence
+        return KinematicSequenceResult(
+            order=sequence.order,
+            is_ideal_order=sequence.is_ideal_order,
+            peak_times={p.segment: p.time for p in sequence.peaks},
+            peak_velocities={p.segment: p.peak_velocity for p in sequence.peaks}
+        )
 
     def _generate_analysis_id(self) -> str:
-        """분석 ID 생성 (UUID + timestamp)"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        unique_id = str(uuid.uuid4())[:8]
-        return f"analysis_{timestamp}_{unique_id}"
+        return generate_analysis_id()
 
     def _generate_text_feedback(self, diagnosis_result) -> str:
         """LLM 없을 때 텍스트 피드백"""
@@ -176,3 +568,23 @@ class SwingAnalysisService:
                     lines.append(f"  개선: {d.suggestions[0]}")
 
         return "\n".join(lines)
+
+
+def generate_analysis_id() -> str:
+    """분석 ID 생성 (UUID + timestamp)"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    unique_id = str(uuid.uuid4())[:8]
+    return f"analysis_{timestamp}_{unique_id}"
+
+
+@contextmanager
+def _analysis_metrics(mode: str) -> Iterator[None]:
+    """분석 1건 전체 시간 / 성공·실패 수 기록"""
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        metrics.ANALYSIS_SECONDS.labels(mode).observe(time.perf_counter() - started)
+        metrics.ANALYSES_TOTAL.labels(mode, outcome).inc()
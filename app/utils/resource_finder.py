@@ -66,7 +66,8 @@ class ResourceFinder:
             except Exception:
                 return current
 
-        latest = self.latest_by_mtime(self.glob("*_thresholds.json", base=self.config))
+        # 날짜별 파일명 끝에 공백이 붙어 있는 경우도 포함
+        latest = self.latest_by_mtime(self.glob("*_thresholds.json*", base=self.config))
         return latest or current
 
     def dataset_path(self) -> Path:
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Dict, Any, Callable, Optional, Tuple
+from typing import Dict, Any, Callable, List, Optional, Tuple
 from functools import partial
 
 # ─────────────────────────────────────────
@@ -39,6 +39,71 @@ def walk_dict(
             )
 
 
+# ─────────────────────────────────────────
+# 스키마 검증 (scripts/thresholds/validate_thresholds, 핫 리로드 공용)
+# ─────────────────────────────────────────
+
+
+def _is_num(x) -> bool:
+    return isinstance(x, (int, float)) and x == x
+
+
+def validate_metric_block(name: str, block: Dict[str, Any], errors: List[str], required_keys: set[str]) -> None:
+    """
+    단일 메트릭 블록 검증 → 오류 문구를 errors에 누적
+      - 필수 키 존재, bins 오름차순(길이>=2), mean/std 숫자, n 0 이상 정수
+    """
+    missing = required_keys - set(block.keys())
+
+    if missing:
+        errors.append(f"[{name}] missing keys: {sorted(missing)}")
+        return
+
+    bins = block["bins"]
+
+    if not isinstance(bins, list) or len(bins) < 2:
+        errors.append(f"[{name}] bins must be list(len>=2)")
+    else:
+        # 오름차순 검사
+        for i in range(1, len(bins)):
+            if not (_is_num(bins[i - 1]) and _is_num(bins[i])) or bins[i] < bins[i - 1]:
+                errors.append(
+                    f"[{name}] bins not nondecreasing at idx {i}: {bins[i - 1]} -> {bins[i]}"
+                )
+                break
+
+    if not all(_is_num(block[k]) for k in ("mean", "std")):
+        errors.append(f"[{name}] mean/std must be numbers")
+
+    if not isinstance(block["n"], int) or block["n"] < 0:
+        errors.append(f"[{name}] n must be non-negative int")
+
+
+def validate_thresholds(root: Dict[str, Any], required_keys: set[str]) -> List[str]:
+    """
+    thresholds JSON 전체 검증 (스택 기반 DFS)
+
+    Returns:
+        오류 문구 리스트 (비어 있으면 통과)
+    """
+    errors: List[str] = []
+    stack: List[Tuple[Dict[str, Any], Tuple[str, ...]]] = [(root, tuple())]
+    while stack:
+        node, path = stack.pop()
+        if not isinstance(node, dict):
+            continue
+
+        if is_metric_block(node, required_keys):
+            name = ".".join(path) if path else "<root>"
+            validate_metric_block(name, node, errors, required_keys)
+            continue
+
+        for k, v in node.items():
+            if isinstance(v, dict):
+                stack.append((v, path + (str(k),)))
+    return errors
+
+
 # ─────────────────────────────────────────
 # 가벼운 Quality Check (중첩함수 제거: 전역 콜백 + partial 로 상태 주입)
 # ─────────────────────────────────────────
@@ -0,0 +1,81 @@
+"""
+분석 작업 워커 엔트리포인트 (API 노드와 별도로 확장)
+
+    python -m app.worker --workers 2
+
+API 노드는 JOBS_WORKERS=0으로 두고 업로드/등록/조회만 담당,
+워커 노드는 같은 JOBS_BROKER_URL / 업로드 공유 스토리지를 바라보며 작업을 실행
+"""
+import argparse
+import asyncio
+import logging
+import signal
+from typing import Optional
+
+from app.common.executors import drain_background, shutdown_executors
+from app.config.settings import settings
+from app.infrastructure.jobs.broker import create_job_broker
+from app.infrastructure.runlog.writer import run_log
+from app.infrastructure.thresholds.registry import threshold_registry
+from app.infrastructure.thresholds.watcher import ThresholdWatcher, threshold_store
+from app.services.container import container
+from app.services.job_runner import JobRunner
+
+logger = logging.getLogger("app.worker")
+
+
+async def run_worker(workers: int, broker_url: Optional[str] = None) -> None:
+    """
+    SIGINT/SIGTERM을 받을 때까지 작업 실행 (실행 중 작업은 종료 시 대기열로 되돌림)
+
+    Args:
+        workers: 동시 실행 작업 수
+        broker_url: 브로커 URL (없으면 settings.JOBS_BROKER_URL)
+    """
+    threshold_store.reload()
+    threshold_registry.load()
+    watcher = None
+    if settings.THRESHOLDS_WATCH:
+        watcher = ThresholdWatcher(threshold_store, poll_interval=settings.THRESHOLDS_POLL_SEC).start()
+
+    await container.start()
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    runner = JobRunner(create_job_broker(broker_url), workers=workers).start()
+    try:
+        await stop.wait()
+        logger.info("🛑 워커 종료 신호 수신")
+    finally:
+        await runner.stop()
+        if watcher is not None:
+            await watcher.stop()
+        # 응답 뒤 후속 작업(피드백 병합 업로드 등) 마무리 → 공유 클라이언트 정리
+        await drain_background()
+        await container.aclose()
+        shutdown_executors(wait=False)
+        # 남은 실행 로그 기록
+        await asyncio.to_thread(run_log.close)
+
+
+def _parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="swing analysis job worker")
+    ap.add_argument(
+        "--workers", type=int, default=max(1, settings.JOBS_WORKERS),
+        help="동시 실행 작업 수 (기본: JOBS_WORKERS)"
+    )
+    ap.add_argument("--broker", type=str, default=None, help="브로커 URL (기본: JOBS_BROKER_URL)")
+    return ap.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    asyncio.run(run_worker(args.workers, args.broker))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ from pathlib import Path
 from datetime import datetime, timezone
 import pandas as pd
 
-from libs.jsonio import load_json
+from libs.jsonio import iter_records
 from libs.flatten import (
     flatten_core_blocks,
     flatten_phase_metrics,
@@ -31,24 +31,37 @@ def main():
         return
 
     rows = []
+    dropped = 0  # 깨진 줄/레코드 수 (전체)
     for p in files:
+        skipped = []  # 이 파일에서 건너뛴 (줄 번호, 사유)
         try:
-            d = load_json(p)
-            row = flatten_core_blocks(d)
-            row["file"] = os.path.basename(p)
-            row.update(flatten_phase_metrics(d.get("phase_metrics")))
-            row.update(flatten_diag_by_phase(d.get("diagnosis_by_phase")))
-            if row_passes_filters(
-                row,
-                club=args.club,
-                phase_method=args.phase_method,
-                since=since,
-                until=until,
-            ):
-                rows.append(row)
-        except Exception as e:
+            # .json = 레코드 1개, .jsonl = 실행 로그 (레코드 여러 개), 깨진 줄은 그 줄만 건너뜀
+            for d in iter_records(p, on_error=lambda lineno, e: skipped.append((lineno, e))):
+                try:
+                    row = flatten_core_blocks(d)
+                    row["file"] = os.path.basename(p)
+                    row.update(flatten_phase_metrics(d.get("phase_metrics")))
+                    row.update(flatten_diag_by_phase(d.get("diagnosis_by_phase")))
+                except (AttributeError, TypeError, ValueError) as e:
+                    skipped.append((None, e))  # JSON이지만 레코드 형태가 아님
+                    continue
+                if row_passes_filters(
+                    row,
+                    club=args.club,
+                    phase_method=args.phase_method,
+                    since=since,
+                    until=until,
+                ):
+                    rows.append(row)
+        except OSError as e:
             print(f"[aggregate] skip {p}: {e}")
+        if skipped:
+            dropped += len(skipped)
+            lineno, e = skipped[0]
+            print(f"[aggregate] dropped {len(skipped)} malformed record(s) in {p} (first: line {lineno}: {e})")
 
+    if dropped:
+        print(f"[aggregate] dropped={dropped}")
     if not rows:
         print("[aggregate] no rows after filtering")
         return
@@ -0,0 +1,73 @@
+# scripts/datasets/backfill_phases.py
+"""
+저장된 포즈 캐시(KeypointConverter JSON, (T, 33, 4)) → 스윙별 전환점 CSV 백필
+BatchPhaseDetector로 모든 스윙을 한 번에 처리
+"""
+from __future__ import annotations
+import argparse, glob, time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from app.config.settings import settings
+from app.domain.phase.batch import BatchPhaseDetector
+from app.utils.keypoint_converter import KeypointConverter
+
+# MediaPipe 33 랜드마크 중 손목 인덱스
+LEFT_WRIST, RIGHT_WRIST = 15, 16
+
+
+def load_wrist_y(path: str, side: str) -> np.ndarray:
+    """포즈 캐시 1개 → 주도 손목 Y좌표 (우타: 왼손, 좌타: 오른손)"""
+    data = KeypointConverter.from_json_string(Path(path).read_text(encoding="utf-8")).to_numpy()
+    wrist = LEFT_WRIST if side == "right" else RIGHT_WRIST
+    return np.asarray(data[:, wrist, 1], dtype=np.float64)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="pose caches -> phase_transitions.csv")
+    ap.add_argument("--glob", type=str, default=str(settings.DATA_DIR / "poses" / "*.json"))
+    ap.add_argument("--side", type=str, default="right", choices=["right", "left"])
+    ap.add_argument("--out", type=str, default=str(settings.DATASETS_DIR / "phase_transitions.csv"))
+    args = ap.parse_args()
+
+    files = sorted(glob.glob(args.glob))
+    if not files:
+        print(f"[backfill_phases] no files matched: {args.glob}")
+        return
+
+    # 1) 포즈 캐시 로드
+    series, names = [], []
+    for fp in files:
+        try:
+            series.append(load_wrist_y(fp, args.side))
+            names.append(Path(fp).stem)
+        except Exception as e:
+            print(f"[backfill_phases] skip {fp}: {e}")
+
+    # 2) 배치 감지
+    started = time.perf_counter()
+    results = BatchPhaseDetector().detect_transitions(series)
+    elapsed = time.perf_counter() - started
+
+    # 3) 출력
+    rows = []
+    for name, points in zip(names, results):
+        row = {"swingId": name, "ok": points is not None}
+        row.update(points or {})
+        rows.append(row)
+
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame(rows).to_csv(out, index=False)
+
+    failed = sum(1 for r in results if r is None)
+    print(
+        f"[backfill_phases] saved: {out} swings={len(rows)} failed={failed} "
+        f"detect={elapsed:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,43 +1,58 @@
 # scripts/datasets/build_phase_dataset.py
 from __future__ import annotations
-import json, glob
-from pathlib import Path
+import glob
 import pandas as pd
 
 from app.config.settings import settings
+from scripts.utils.libs.jsonio import iter_records
+
+
+def _phase_rows(d: dict) -> list[dict]:
+    """로그 레코드 1개 → phase별 행 (phase_metrics가 없으면 빈 리스트)"""
+    swing_id = d.get("swingId")
+    club = (d.get("input") or {}).get("club")
+    phase_metrics = d.get("phase_metrics") or {}
+
+    # 각 phase별로 한 줄씩 적재
+    return [
+        {
+            "swingId": swing_id,
+            "phase": ph,  # 예: P2..P9
+            "club": str(club) if club is not None else None,
+            "elbow": vals.get("elbow"),
+            "knee": vals.get("knee"),
+            "spine_tilt": vals.get("spine_tilt"),
+            "shoulder_turn": vals.get("shoulder_turn"),
+            "hip_turn": vals.get("hip_turn"),
+            "x_factor": vals.get("x_factor"),
+        }
+        for ph, vals in phase_metrics.items()
+    ]
 
 
 def main():
-    # 1) 입력 로그 경로: settings.LOG_DIR/*.json
-    files = glob.glob(str(settings.LOG_DIR / "*.json"))
+    # 1) 입력 로그 경로: settings.LOG_DIR/*.json + 실행 로그 *.jsonl (회전 파일 포함)
+    files = glob.glob(str(settings.LOG_DIR / "*.json")) + glob.glob(str(settings.LOG_DIR / "*.jsonl"))
     rows = []
 
-    # 2) 로그 → 행 변환
+    # 2) 로그 → 행 변환 (.json = 레코드 1개, .jsonl = 실행 로그, 깨진 줄은 그 줄만 건너뜀)
+    dropped = 0
     for fp in files:
+        skipped = []  # 이 파일에서 건너뛴 (줄 번호, 사유)
         try:
-            d = json.loads(Path(fp).read_text(encoding="utf-8"))
-        except Exception:
-            continue
-
-        swing_id = d.get("swingId")
-        club = (d.get("input") or {}).get("club")
-        phase_metrics = d.get("phase_metrics") or {}
-
-        # 각 phase별로 한 줄씩 적재
-        for ph, vals in phase_metrics.items():
-            rows.append(
-                {
-                    "swingId": swing_id,
-                    "phase": ph,  # 예: P2..P9
-                    "club": str(club) if club is not None else None,
-                    "elbow": vals.get("elbow"),
-                    "knee": vals.get("knee"),
-                    "spine_tilt": vals.get("spine_tilt"),
-                    "shoulder_turn": vals.get("shoulder_turn"),
-                    "hip_turn": vals.get("hip_turn"),
-                    "x_factor": vals.get("x_factor"),
-                }
-            )
+            for d in iter_records(fp, on_error=lambda lineno, e: skipped.append((lineno, e))):
+                try:
+                    rows.extend(_phase_rows(d))
+                except (AttributeError, TypeError) as e:
+                    skipped.append((None, e))  # JSON이지만 레코드 형태가 아님
+        except OSError as e:
+            print(f"[build_phase_dataset] skip {fp}: {e}")
+        if skipped:
+            dropped += len(skipped)
+            lineno, e = skipped[0]
+            print(f"[build_phase_dataset] dropped {len(skipped)} malformed record(s) in {fp} (first: line {lineno}: {e})")
+    if dropped:
+        print(f"[build_phase_dataset] dropped={dropped}")
 
     df = pd.DataFrame(rows)
 
@@ -0,0 +1,149 @@
+# scripts/thresholds/rescore_swings.py
+"""
+저장된 분석 결과(AnalyzeSwingResponse / AnalyzeMultiSwingResponse JSON) 재채점
+thresholds 교체 후 과거 스윙 점수를 새 기준으로 다시 계산 → CSV
+
+예)
+  python -m scripts.thresholds.rescore_swings --glob "data/output/**/*.json" --version 2025-11-10
+"""
+from __future__ import annotations
+import argparse, csv, glob, json, time
+from pathlib import Path
+from typing import Iterator, get_args
+
+import numpy as np
+
+from app.config.settings import settings
+from app.domain.diagnosis.engine import DiagnosisEngine
+from app.infrastructure.thresholds.registry import ThresholdRegistry
+from app.schemas.phase_dto import PhaseType
+
+PHASE_NAMES: list[str] = list(get_args(PhaseType))
+
+
+def iter_swings(pattern: str) -> Iterator[dict]:
+    """
+    저장된 분석 JSON을 스윙 단위로 순회 (파일은 하나씩만 읽음)
+
+    Yields:
+        {"id", "user_id", "club", "old_score", "phases": [{name, key_angles}, ...]}
+    """
+    for fp in glob.iglob(pattern, recursive=True):
+        try:
+            doc = json.loads(Path(fp).read_text(encoding="utf-8"))
+        except Exception as e:
+            print(f"[rescore] skip {fp}: {e}")
+            continue
+
+        base = {"user_id": doc.get("user_id"), "club": doc.get("club") or "driver"}
+        analysis_id = doc.get("analysis_id") or Path(fp).stem
+        if "swings" in doc:  # 멀티 스윙 결과
+            for swing in doc["swings"]:
+                yield dict(base, id=f"{analysis_id}#{swing.get('swing_index')}",
+                           old_score=swing.get("overall_score"), phases=swing.get("phases") or [])
+        else:
+            yield dict(base, id=analysis_id, old_score=doc.get("overall_score"), phases=doc.get("phases") or [])
+
+
+def to_angles(swings: list[dict], metrics: tuple[str, ...]) -> np.ndarray:
+    """스윙 리스트 → (N, P, M) 대표 각도 배열 (없는 값은 NaN)"""
+    phase_index = {p: i for i, p in enumerate(PHASE_NAMES)}
+    metric_index = {m: j for j, m in enumerate(metrics)}
+    angles = np.full((len(swings), len(PHASE_NAMES), len(metrics)), np.nan)
+    for n, swing in enumerate(swings):
+        for phase in swing["phases"]:
+            i = phase_index.get(phase.get("name"))
+            if i is None:
+                continue
+            for metric, value in (phase.get("key_angles") or {}).items():
+                j = metric_index.get(metric)
+                if j is not None and value is not None:
+                    angles[n, i, j] = value
+    return angles
+
+
+def _parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="stored analyses -> rescored CSV")
+    ap.add_argument("--glob", type=str, default=str(settings.OUTPUT_DIR / "**" / "*.json"))
+    ap.add_argument(
+        "--version", type=str, default=None,
+        help="분포 기반 재채점에 쓸 thresholds 버전 (생략 시 클럽별 range 기준)"
+    )
+    ap.add_argument("--batch-size", type=int, default=4096)
+    ap.add_argument("--out", type=str, default=str(settings.DATASETS_DIR / "rescored_swings.csv"))
+    return ap.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+
+    scorer, version = None, None
+    if args.version:
+        registry = ThresholdRegistry()
+        registry.load()
+        snapshot = registry.get(args.version)
+        scorer, version = snapshot.scorer, snapshot.version
+
+    engines: dict[str, DiagnosisEngine] = {}
+
+    def engine_for(club: str) -> DiagnosisEngine:
+        if club not in engines:
+            engines[club] = DiagnosisEngine(club=club, scorer=scorer, thresholds_version=version)
+        return engines[club]
+
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    total, scoring_sec = 0, 0.0
+    started = time.perf_counter()
+
+    with out.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["swing_id", "user_id", "club", "old_score", "new_score", "delta"]
+                        + [f"score_{p}" for p in PHASE_NAMES])
+
+        def flush(chunk: list[dict]):
+            nonlocal scoring_sec
+            by_club: dict[str, list[dict]] = {}
+            for swing in chunk:
+                by_club.setdefault(swing["club"], []).append(swing)
+
+            for club, swings in by_club.items():
+                engine = engine_for(club)
+                angles = to_angles(swings, engine.metrics)
+                t0 = time.perf_counter()
+                phase_scores, overall = engine.diagnose_batch(angles, PHASE_NAMES)
+                scoring_sec += time.perf_counter() - t0
+
+                for swing, scores, new in zip(swings, phase_scores.tolist(), overall.tolist()):
+                    old = swing["old_score"]
+                    delta = round(new - old, 3) if old is not None else ""
+                    writer.writerow([swing["id"], swing["user_id"], club, old, round(new, 3), delta]
+                                    + [round(s, 3) for s in scores])
+
+        chunk: list[dict] = []
+        for swing in iter_swings(args.glob):
+            chunk.append(swing)
+            if len(chunk) >= args.batch_size:
+                flush(chunk)
+                total += len(chunk)
+                chunk = []
+        if chunk:
+            flush(chunk)
+            total += len(chunk)
+
+    elapsed = time.perf_counter() - started
+    if total == 0:
+        print(f"[rescore] no swings matched: {args.glob}")
+        return
+
+    print(f"[rescore] thresholds={version or 'range (club tables)'}")
+    print(
+        f"[rescore] swings={total} elapsed={elapsed:.2f}s "
+        f"({total / max(elapsed, 1e-9):.0f} swings/s end-to-end, "
+        f"{total / max(scoring_sec, 1e-9):.0f} swings/s scoring)"
+    )
+    print(f"[rescore] saved csv: {out}")
+
+
+if __name__ == "__main__":
+    main()
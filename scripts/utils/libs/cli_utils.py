@@ -4,7 +4,7 @@ from pathlib import Path
 
 def parse_args():
     p = argparse.ArgumentParser(description="Aggregate swing logs to a flat table")
-    p.add_argument("--glob", default="logs/*.json")
+    p.add_argument("--glob", default="logs/*.json*")
     p.add_argument("--out", default="artifacts/aggregated.csv")
     p.add_argument("--club")
     p.add_argument("--phase-method", dest="phase_method")
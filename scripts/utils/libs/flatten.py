@@ -34,9 +34,12 @@ def flatten_core_blocks(d: Dict[str, Any]) -> Dict[str, Any]:
         "preprocess.mode": safe_get(d, "preprocess.mode"),
         "preprocess.ms": safe_get(d, "preprocess.ms"),
         "preprocess.fps": safe_get(d, "preprocess.fps"),
+        "preprocess.sourceFps": safe_get(d, "preprocess.sourceFps"),
         "preprocess.height": safe_get(d, "preprocess.height"),
         "preprocess.mirror": safe_get(d, "preprocess.mirror"),
         "pose.frameStep": safe_get(d, "pose.frameStep"),
+        "pose.fps": safe_get(d, "pose.fps"),
+        "pose.modelComplexity": safe_get(d, "pose.modelComplexity"),
         "pose.minVisibility": safe_get(d, "pose.minVisibility"),
         "rules.club": safe_get(d, "rules.club"),
         "rules.fingerprint": safe_get(d, "rules.fingerprint"),
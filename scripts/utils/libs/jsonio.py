@@ -1,5 +1,5 @@
 import json
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterator, Optional
 
 
 def load_json(path: str) -> Dict[str, Any]:
@@ -7,6 +7,39 @@ def load_json(path: str) -> Dict[str, Any]:
         return json.load(f)
 
 
+def iter_records(
+    path: str, on_error: Optional[Callable[[int, Exception], None]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    .json (레코드 1개) / .jsonl (줄마다 레코드 1개, 빈 줄 무시) 공용 읽기
+
+    on_error가 있으면 깨진 레코드는 on_error(줄 번호, 예외) 후 건너뜀 (.json은 줄 번호 0)
+    없으면 예외를 그대로 올림
+    """
+    if not path.endswith(".jsonl"):
+        try:
+            record = load_json(path)
+        except ValueError as e:
+            if on_error is None:
+                raise
+            on_error(0, e)
+            return
+        yield record
+        return
+    with open(path, "r", encoding="utf-8", errors="replace" if on_error else "strict") as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                if on_error is None:
+                    raise
+                on_error(lineno, e)
+                continue
+            yield record
+
+
 def safe_get(d: Dict[str, Any], path: str, default=None):
     cur = d
     for part in path.split("."):
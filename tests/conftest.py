@@ -5,7 +5,7 @@ Pytest Configuration & Shared Fixtures
 """
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, AsyncMock
 import numpy as np
 from typing import List, Dict, Any
 
@@ -27,6 +27,21 @@ def client(app):
     return TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def _disable_side_outputs(monkeypatch):
+    """테스트 분석 결과가 실행 로그 / 결과 캐시 디렉토리에 쌓이지 않도록 비활성화"""
+    from app.config.settings import settings
+    monkeypatch.setattr(settings, "RUNLOG_ENABLED", False)
+    monkeypatch.setattr(settings, "RESULT_CACHE_ENABLED", False)
+
+
+@pytest.fixture(autouse=True)
+def _disable_admission(monkeypatch):
+    """API 테스트 결과가 테스트 머신의 CPU 부하 / 여유 메모리에 따라 달라지지 않도록 입장 제어 비활성화"""
+    from app.config.settings import settings
+    monkeypatch.setattr(settings, "ADMISSION_ENABLED", False)
+
+
 @pytest.fixture
 def auth_headers():
     """인증 헤더 (X-Internal-Api-Key)"""
@@ -155,6 +170,7 @@ def mock_llm_client():
     """Mock LLMGatewayClient"""
     mock = Mock()
     mock.generate_feedback.return_value = "전반적으로 좋은 스윙입니다. 백스윙 속도를 조금 더 높이세요."
+    mock.agenerate_feedback = AsyncMock(return_value=mock.generate_feedback.return_value)
     return mock
 
 
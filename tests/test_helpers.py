@@ -96,6 +96,56 @@ def create_visibility_test_frames(
     return frames
 
 
+POSE_KEYPOINT_NAMES = [
+    "nose", "left_shoulder", "right_shoulder", "left_elbow", "right_elbow",
+    "left_wrist", "right_wrist", "left_hip", "right_hip", "left_knee",
+    "right_knee", "left_ankle", "right_ankle",
+]
+
+
+def make_pose_data(frame_number: int, fps: float = 60.0, **coords):
+    """
+    PoseData DTO 생성 (지정하지 않은 keypoint는 (0.5, 0.5))
+
+    Args:
+        frame_number: 프레임 번호
+        fps: timestamp 계산용 프레임 레이트
+        **coords: keypoint 이름 → (x, y)
+
+    Example:
+        >>> pose = make_pose_data(0, left_wrist=(0.4, 0.2))
+    """
+    from app.schemas.pose_dto import PoseData, Keypoint
+
+    keypoints = {}
+    for name in POSE_KEYPOINT_NAMES:
+        x, y = coords.get(name, (0.5, 0.5))
+        keypoints[name] = Keypoint(x=x, y=y, z=0.0, visibility=1.0)
+    return PoseData(frame_number=frame_number, timestamp=frame_number / fps, **keypoints)
+
+
+def make_session_wrist_y(num_swings: int = 3, rest: int = 120, swing: int = 90) -> np.ndarray:
+    """
+    여러 스윙이 담긴 세션의 주도 손목 Y좌표 시계열
+
+    정지(rest 프레임) → 스윙(swing 프레임: 상승 → 하강 → 복귀)을 반복하고 정지로 끝남
+    """
+    t = np.linspace(0, 1, swing)
+    one = 0.5 + 0.3 * np.sin(np.pi * np.clip(t / 0.5, 0, 1)) * (t < 0.5)
+    one[t >= 0.5] = 0.5 - 0.3 * np.sin(np.pi * (t[t >= 0.5] - 0.5) / 0.5)
+
+    parts = []
+    for _ in range(num_swings):
+        parts += [np.full(rest, 0.5), one]
+    parts.append(np.full(rest, 0.5))
+    return np.concatenate(parts)
+
+
+def make_wrist_poses(wrist_y, fps: float = 60.0, wrist: str = "left_wrist") -> list:
+    """손목 Y좌표 시계열 → PoseData 리스트 (나머지 keypoint는 고정)"""
+    return [make_pose_data(i, fps, **{wrist: (0.5, float(y))}) for i, y in enumerate(wrist_y)]
+
+
 # ========================================
 # Angle Calculation Helpers
 # ========================================
@@ -135,6 +185,27 @@ def calculate_angle_from_points(
 # Phase Validation Helpers
 # ========================================
 
+SWING_PHASES = ["Address", "Backswing", "Top", "Downswing", "Impact", "Follow-through"]
+
+
+def make_phase_infos(angles_by_phase: Dict[str, Dict[str, float]]) -> list:
+    """
+    6개 페이즈 PhaseInfo 리스트 생성 (진단 엔진 입력용)
+
+    Args:
+        angles_by_phase: 페이즈 이름 → 대표 각도 (없는 페이즈는 빈 dict)
+    """
+    from app.schemas.phase_dto import PhaseInfo
+
+    return [
+        PhaseInfo(
+            name=name, start_frame=0, end_frame=1, start_time=0.0, end_time=0.1, duration=0.1,
+            representative_angles=angles_by_phase.get(name, {}),
+        )
+        for name in SWING_PHASES
+    ]
+
+
 def validate_phase_order(phases: List[Dict[str, Any]]) -> bool:
     """
     Phase 순서가 올바른지 검증
@@ -257,3 +328,201 @@ def assert_angle_range(angle: float, min_val: float = 0.0, max_val: float = 180.
     assert not np.isnan(angle), "Angle should not be NaN"
     assert not np.isinf(angle), "Angle should not be infinite"
     assert min_val <= angle <= max_val, f"Angle {angle} out of range [{min_val}, {max_val}]"
+
+
+# ========================================
+# Local Stand-ins
+# ========================================
+
+class FakeRedisServer:
+    """
+    RedisJobBroker 테스트용 RESP 서버 (localhost 임의 포트, 메모리 저장)
+
+    브로커가 쓰는 hash / list / zset 명령만 구현
+    EVAL은 Lua 대신 브로커 스크립트별 파이썬 대응 함수로 실행 (스크립트와 같은 순서로 명령을 호출)
+    """
+
+    def __init__(self):
+        import socketserver
+        import threading
+
+        self.hashes: Dict[str, Dict[str, str]] = {}
+        self.lists: Dict[str, List[str]] = {}
+        self.zsets: Dict[str, Dict[str, float]] = {}
+        self.commands: List[List[str]] = []
+        self.drop_replies = 0  # 0보다 크면 명령 실행 후 응답 없이 연결을 끊음 (그만큼 반복)
+        self._lock = threading.Lock()
+        self.scripts = self._broker_scripts()
+        fake = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                while True:
+                    args = fake._read_command(self.rfile)
+                    if args is None:
+                        return
+                    with fake._lock:
+                        fake.commands.append(args)
+                        reply = fake._dispatch(args)
+                        drop = fake.drop_replies > 0
+                        if drop:
+                            fake.drop_replies -= 1
+                    if drop:
+                        return
+                    self.wfile.write(fake._encode(reply))
+
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        self._server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"redis://127.0.0.1:{self.port}/0"
+
+    def __enter__(self) -> "FakeRedisServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+    @staticmethod
+    def _read_command(rfile):
+        line = rfile.readline()
+        if not line:
+            return None
+        args = []
+        for _ in range(int(line[1:-2])):
+            size = int(rfile.readline()[1:-2])
+            args.append(rfile.read(size + 2)[:-2].decode("utf-8"))
+        return args
+
+    def _encode(self, reply) -> bytes:
+        if isinstance(reply, Exception):
+            return f"-ERR {reply}\r\n".encode()
+        if reply is None:
+            return b"$-1\r\n"
+        if reply is True:
+            return b"+OK\r\n"
+        if isinstance(reply, int):
+            return f":{reply}\r\n".encode()
+        if isinstance(reply, list):
+            return f"*{len(reply)}\r\n".encode() + b"".join(self._encode(r) for r in reply)
+        data = str(reply).encode("utf-8")
+        return b"$%d\r\n%s\r\n" % (len(data), data)
+
+    def _broker_scripts(self):
+        from app.infrastructure.jobs import redis_broker
+
+        def claim(keys, argv):
+            queue, leases = keys
+            now, lease_until, prefix = argv
+            expired = self._dispatch(["ZRANGEBYSCORE", leases, "-inf", now, "LIMIT", "0", "1"])
+            job_id = expired[0] if expired else self._dispatch(["RPOP", queue])
+            if job_id is None:
+                return None
+            job = prefix + job_id
+            self._dispatch(["HSET", job, "status", "running", "started_at", now])
+            self._dispatch(["HINCRBY", job, "attempts", "1"])
+            self._dispatch(["ZADD", leases, lease_until, job_id])
+            return self._dispatch(["HGETALL", job])
+
+        def guarded(body):
+            def script(keys, argv):
+                h = self.hashes.get(keys[0], {})
+                if h.get("status") != "running" or h.get("attempts") != argv[1]:
+                    return 0
+                return body(keys, argv)
+            return script
+
+        def renew(keys, argv):
+            return self._dispatch(["ZADD", keys[1], "XX", "CH", argv[2], argv[0]])
+
+        def finish(keys, argv):
+            self._dispatch(["HSET", keys[0], "status", argv[2], argv[3], argv[4], "finished_at", argv[5]])
+            self._dispatch(["ZREM", keys[1], argv[0]])
+            return 1
+
+        def release(keys, argv):
+            self._dispatch(["ZREM", keys[1], argv[0]])
+            self._dispatch(["HSET", keys[0], "status", "queued"])
+            self._dispatch(["HDEL", keys[0], "started_at"])
+            self._dispatch(["HINCRBY", keys[0], "attempts", "-1"])
+            self._dispatch(["RPUSH", keys[2], argv[0]])
+            return 1
+
+        return {
+            redis_broker.CLAIM_SCRIPT: claim,
+            redis_broker.RENEW_SCRIPT: guarded(renew),
+            redis_broker.FINISH_SCRIPT: guarded(finish),
+            redis_broker.RELEASE_SCRIPT: guarded(release),
+        }
+
+    def _dispatch(self, args):
+        cmd, rest = args[0].upper(), args[1:]
+        if cmd in ("PING", "SELECT", "AUTH"):
+            return True
+        if cmd == "EVAL":
+            script = self.scripts.get(rest[0])
+            if script is None:
+                return ValueError("unknown script")
+            numkeys = int(rest[1])
+            return script(rest[2:2 + numkeys], rest[2 + numkeys:])
+        if cmd == "HSET":
+            h = self.hashes.setdefault(rest[0], {})
+            pairs = list(zip(rest[1::2], rest[2::2]))
+            added = sum(1 for k, _ in pairs if k not in h)
+            h.update(pairs)
+            return added
+        if cmd == "HDEL":
+            h = self.hashes.get(rest[0], {})
+            return sum(1 for k in rest[1:] if h.pop(k, None) is not None)
+        if cmd == "HINCRBY":
+            h = self.hashes.setdefault(rest[0], {})
+            h[rest[1]] = str(int(h.get(rest[1], 0)) + int(rest[2]))
+            return int(h[rest[1]])
+        if cmd == "HGETALL":
+            return [x for kv in self.hashes.get(rest[0], {}).items() for x in kv]
+        if cmd in ("LPUSH", "RPUSH"):
+            lst = self.lists.setdefault(rest[0], [])
+            for value in rest[1:]:
+                lst.insert(0, value) if cmd == "LPUSH" else lst.append(value)
+            return len(lst)
+        if cmd == "RPOP":
+            lst = self.lists.get(rest[0])
+            return lst.pop() if lst else None
+        if cmd == "LLEN":
+            return len(self.lists.get(rest[0], []))
+        if cmd == "ZADD":
+            z = self.zsets.setdefault(rest[0], {})
+            key, rest = rest[0], rest[1:]
+            flags = set()
+            while rest and rest[0].upper() in ("XX", "NX", "CH"):
+                flags.add(rest.pop(0).upper())
+            added = changed = 0
+            for score, member in zip(rest[0::2], rest[1::2]):
+                if ("XX" in flags and member not in z) or ("NX" in flags and member in z):
+                    continue
+                added += member not in z
+                changed += member not in z or z[member] != float(score)
+                z[member] = float(score)
+            return changed if "CH" in flags else added
+        if cmd == "ZREM":
+            z = self.zsets.get(rest[0], {})
+            return sum(1 for m in rest[1:] if z.pop(m, None) is not None)
+        if cmd == "ZCARD":
+            return len(self.zsets.get(rest[0], {}))
+        if cmd == "ZRANGEBYSCORE":
+            lo, hi = (float(v) for v in rest[1:3])
+            members = sorted(
+                (s, m) for m, s in self.zsets.get(rest[0], {}).items() if lo <= s <= hi
+            )
+            result = [m for _, m in members]
+            if len(rest) >= 6 and rest[3].upper() == "LIMIT":
+                offset, count = int(rest[4]), int(rest[5])
+                result = result[offset:offset + count]
+            return result
+        return ValueError(f"unknown command '{cmd}'")
@@ -95,7 +95,7 @@ class TestSwingAnalysisService:
         result = await service.analyze(analyze_request)
         
         # LLM 클라이언트가 호출됨
-        service.llm_client.generate_feedback.assert_called_once()
+        service.llm_client.agenerate_feedback.assert_called_once()
     
     @pytest.mark.asyncio
     async def test_analyze_without_llm_feedback(self, service, analyze_request):
@@ -105,7 +105,7 @@ class TestSwingAnalysisService:
         result = await service.analyze(analyze_request)
         
         # LLM 클라이언트가 호출되지 않음
-        assert not service.llm_client.generate_feedback.called
+        assert not service.llm_client.agenerate_feedback.called
     
     @pytest.mark.asyncio
     async def test_analyze_with_s3_upload(self, service, analyze_request):
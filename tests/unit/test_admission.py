@@ -0,0 +1,187 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.common.admission import SESSION_PATHS, AdmissionController, AdmissionMiddleware, AdmissionRejected
+from app.config.settings import settings
+
+
+class _Gate:
+    def __init__(self, busy=False):
+        self.busy = busy
+
+    def update(self):
+        return self.busy
+
+
+def _controller(max_in_flight=1, max_waiting=1, gate=None, free_mb=4096.0, **kwargs):
+    return AdmissionController(
+        max_in_flight=max_in_flight,
+        max_waiting=max_waiting,
+        min_free_memory_mb=512,
+        gate=gate or _Gate(),
+        memory_probe=lambda: free_mb,
+        probe_interval=0,
+        initial_service_sec=4.0,
+        **kwargs
+    )
+
+
+def test_queue_full_rejects_with_retry_after_and_readmits_after_release():
+    controller = _controller(max_in_flight=2, max_waiting=1)
+
+    async def scenario():
+        await controller.acquire()
+        await controller.acquire()
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        assert controller.waiting == 1
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire()
+
+        controller.release(service_sec=4.0)
+        await waiter  # 반납된 슬롯이 대기열 맨 앞 요청으로 이동
+        assert controller.in_flight == 2 and controller.waiting == 0
+
+        controller.release()
+        await controller.acquire()  # 여유가 생기면 다시 받음
+        return rejected.value
+
+    rejected = asyncio.run(scenario())
+
+    assert rejected.status_code == 429 and rejected.reason == "queue_full"
+    assert rejected.retry_after == 4  # 평균 4초 × 대기 2개 / 동시 2개
+
+
+def test_cancelled_waiter_leaves_queue():
+    controller = _controller(max_in_flight=1, max_waiting=2)
+
+    async def scenario():
+        await controller.acquire()
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        assert controller.waiting == 0
+        controller.release()
+        assert controller.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_own_load_tripping_cpu_gate_queues_instead_of_503():
+    controller = _controller(max_in_flight=2, max_waiting=1)
+    # 1분 loadavg처럼: 이 서버의 분석 2건으로 busy가 되고, 끝난 뒤에도 늦게 풀림
+    gate = controller.gate = _Gate()
+
+    async def scenario():
+        await controller.acquire()
+        await controller.acquire()
+        gate.busy = True
+
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        assert controller.waiting == 1  # 503 대신 대기열
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire()
+
+        controller.release()
+        await waiter
+        controller.release()
+        controller.release()
+        assert controller.in_flight == 0
+
+        await controller.acquire()  # 게이트가 아직 busy여도 실행 중이 없으면 받음
+        assert controller.in_flight == 1
+        return rejected.value
+
+    rejected = asyncio.run(scenario())
+
+    assert rejected.status_code == 429 and rejected.reason == "queue_full"
+
+
+def test_cpu_gate_stops_adding_slots_under_external_load():
+    controller = _controller(max_in_flight=3, max_waiting=2, gate=_Gate(busy=True))
+
+    async def scenario():
+        await controller.acquire()  # 실행 중이 없으면 1건은 받음
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        assert controller.in_flight == 1 and controller.waiting == 1
+
+        controller.gate.busy = False
+        controller.release()
+        await waiter
+        assert controller.in_flight == 1
+
+    asyncio.run(scenario())
+
+
+def test_low_memory_rejects_with_503_only_while_busy():
+    controller = _controller(free_mb=100.0)
+    controller.check()  # 실행 중이 없으면 받음
+
+    controller.in_flight = 1
+    with pytest.raises(AdmissionRejected) as rejected:
+        controller.check()
+    assert rejected.value.status_code == 503 and rejected.value.reason == "memory"
+    assert rejected.value.retry_after == 4
+
+
+def test_middleware_rejects_before_endpoint_and_skips_other_paths(monkeypatch):
+    monkeypatch.setattr(settings, "ADMISSION_ENABLED", True)
+    calls = []
+    app = FastAPI()
+    controller = _controller(max_in_flight=1, max_waiting=0)
+    controller.in_flight = 1  # 슬롯 가득 + 대기열 없음
+    app.add_middleware(AdmissionMiddleware, controller=controller)
+
+    @app.post("/analyze")
+    async def analyze():
+        calls.append("analyze")
+        return {}
+
+    @app.post("/analyze/jobs")
+    async def jobs():
+        return {"ok": True}
+
+    client = TestClient(app)
+    response = client.post("/analyze", files={"file": ("a.mp4", b"x" * 1024)})
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "4"
+    assert calls == []
+    assert client.post("/analyze/jobs").status_code == 200
+
+
+def test_session_streams_use_their_own_cap_and_service_time(monkeypatch):
+    monkeypatch.setattr(settings, "ADMISSION_ENABLED", True)
+    app = FastAPI()
+    requests = _controller(max_in_flight=1, max_waiting=0)
+    sessions = _controller(max_in_flight=1, max_waiting=0)
+    app.add_middleware(AdmissionMiddleware, controller=requests)
+    app.add_middleware(AdmissionMiddleware, controller=sessions, paths=SESSION_PATHS)
+
+    @app.post("/analyze")
+    async def analyze():
+        return {}
+
+    @app.post("/analyze/session")
+    async def session():
+        return {}
+
+    client = TestClient(app)
+    sessions.in_flight = 1  # 세션 하나가 스트림 중
+    assert client.post("/analyze/session").status_code == 429
+    assert client.post("/analyze").status_code == 200  # 요청 단위 분석 슬롯은 그대로
+
+    sessions.in_flight = 0
+    request_avg = requests.avg_service_sec
+    assert client.post("/analyze/session").status_code == 200
+    assert requests.in_flight == 0 and sessions.in_flight == 0
+    assert requests.avg_service_sec == request_avg  # 세션 길이는 요청 평균 처리 시간에 섞이지 않음
+    assert sessions.avg_service_sec != 4.0
@@ -0,0 +1,57 @@
+import numpy as np
+
+from app.domain.angle.calculator import AngleCalculator
+from tests.test_helpers import make_pose_data as _pose
+
+
+def test_right_angle_elbow_and_averages():
+    # 왼팔: shoulder(0.2,0.2) - elbow(0.4,0.2) - wrist(0.4,0.4) → 90도
+    poses = [
+        _pose(
+            i,
+            left_shoulder=(0.2, 0.2),
+            left_elbow=(0.4, 0.2),
+            left_wrist=(0.4, 0.4),
+            right_shoulder=(0.6, 0.2),
+            left_hip=(0.3, 0.6),
+            right_hip=(0.5, 0.6),
+        )
+        for i in range(5)
+    ]
+    result = AngleCalculator().calculate(poses)
+
+    assert result.total_frames == 5
+    assert result.values.shape == (5, 9)
+    assert np.allclose(result.column("left_elbow"), 90.0, atol=1e-3)
+    assert abs(result.avg_left_elbow - 90.0) < 1e-3
+    # 어깨/엉덩이 모두 수평 → X-Factor 0
+    assert abs(result.avg_x_factor) < 1e-6
+
+
+def test_per_frame_models_are_lazy():
+    poses = [_pose(i) for i in range(3)]
+    result = AngleCalculator().calculate(poses)
+
+    assert result._angles is None
+    angles = result.angles
+    assert [a.frame_number for a in angles] == [0, 1, 2]
+    assert result.angles is angles  # 캐시 재사용
+
+
+def test_mean_between_uses_frame_numbers():
+    poses = [
+        _pose(
+            i,
+            left_shoulder=(0.2, 0.3),
+            left_elbow=(0.4, 0.3),
+            left_wrist=(0.4, 0.4) if i < 2 else (0.6, 0.3),  # 90도 → 180도
+        )
+        for i in range(4)
+    ]
+    result = AngleCalculator().calculate(poses)
+
+    first = result.mean_between(0, 1, ("left_elbow",))
+    last = result.mean_between(2, 3, ("left_elbow",))
+    assert abs(first["left_elbow"] - 90.0) < 1e-3
+    assert abs(last["left_elbow"] - 180.0) < 1.0
+    assert result.mean_between(10, 20) == {}
@@ -0,0 +1,50 @@
+import numpy as np
+
+from app.domain.angle.calculator import AngleCalculator
+from app.domain.angle.stream import StreamingAngleCalculator
+from app.schemas.angle_dto import ANGLE_METRIC_NAMES
+from tests.test_helpers import make_pose_data
+
+
+def _random_poses(n=40, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        make_pose_data(
+            i,
+            left_shoulder=tuple(rng.random(2)),
+            left_elbow=tuple(rng.random(2)),
+            left_wrist=tuple(rng.random(2)),
+            right_hip=tuple(rng.random(2)),
+        )
+        for i in range(n)
+    ]
+
+
+def test_stream_matches_batch_and_welford_stats():
+    poses = _random_poses()
+    batch = AngleCalculator().calculate(poses)
+
+    stream = StreamingAngleCalculator()
+    received = []
+    stream.subscribe(received.append)
+    for pose in poses:
+        stream.push(pose)
+
+    streamed = np.array([[getattr(a, m) for m in ANGLE_METRIC_NAMES] for a in received])
+    assert np.allclose(streamed, batch.values)
+    assert np.allclose(stream.stats.mean, batch.values.mean(axis=0))
+    assert np.allclose(stream.stats.variance, batch.values.var(axis=0))
+    assert stream.statistics()["left_elbow"]["count"] == len(poses)
+
+
+def test_unsubscribe_and_landmark_input(sample_pose_frame):
+    stream = StreamingAngleCalculator()
+    received = []
+    unsubscribe = stream.subscribe(received.append)
+
+    assert stream.push_landmarks(sample_pose_frame, frame_number=0, timestamp=0.0) is not None
+    unsubscribe()
+    stream.push_landmarks(sample_pose_frame, frame_number=1, timestamp=1 / 60)
+
+    assert len(received) == 1
+    assert stream.push_landmarks([], frame_number=2, timestamp=2 / 60) is None
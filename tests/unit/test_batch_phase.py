@@ -0,0 +1,38 @@
+import numpy as np
+
+from app.domain.phase.batch import BatchPhaseDetector
+from app.domain.phase.detector import PhaseDetector
+
+
+def _reference(signal):
+    detector = PhaseDetector()
+    try:
+        points = detector._find_transition_points(detector._smooth_signal(signal))
+    except ValueError:
+        return None
+    return {k: int(v) for k, v in points.items()}
+
+
+def test_batch_matches_single_detector():
+    rng = np.random.default_rng(7)
+    series = []
+    for _ in range(200):
+        n = int(rng.integers(5, 240))
+        t = np.linspace(0, 1, n)
+        y = (
+            0.5
+            + 0.3 * np.exp(-((t - rng.uniform(0.2, 0.6)) / 0.1) ** 2)
+            - 0.3 * np.exp(-((t - rng.uniform(0.6, 0.9)) / 0.05) ** 2)
+            + rng.normal(0, 0.01, n)
+        )
+        series.append(y)
+
+    results = BatchPhaseDetector().detect_transitions(series)
+
+    assert results == [_reference(s) for s in series]
+
+
+def test_flat_series_returns_none():
+    results = BatchPhaseDetector().detect_transitions([np.full(60, 0.5), np.array([0.5, 0.5])])
+
+    assert results == [None, None]
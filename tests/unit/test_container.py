@@ -0,0 +1,145 @@
+import asyncio
+import threading
+
+from app.config.settings import settings
+from app.domain.diagnosis.thresholds import threshold_cache
+from app.domain.pose.pool import PoseExtractorPool
+from app.schemas.pose_dto import PoseExtractionResult
+from app.services.container import AppContainer, EngineCache
+
+
+class _FakeExtractor:
+    def __init__(self, visibility_threshold, model_complexity=2):
+        self.visibility_threshold = visibility_threshold
+        self.model_complexity = model_complexity
+        self.resets = 0
+        self.closed = False
+        self.frames = []
+
+    def extract(self, frames, fps):
+        self.frames.extend(frames)
+        return PoseExtractionResult(total_frames=len(frames), poses=[])
+
+    def process_frame(self, frame, frame_idx, fps):
+        self.frames.append(frame)
+        return None
+
+    def reset(self):
+        self.resets += 1
+
+    def close(self):
+        self.closed = True
+
+
+def _pool(max_idle=2):
+    created = []
+
+    def factory(visibility, complexity):
+        created.append(_FakeExtractor(visibility, complexity))
+        return created[-1]
+
+    return PoseExtractorPool(max_idle=max_idle, factory=factory), created
+
+
+def test_pose_pool_reuses_extractors_per_visibility():
+    pool, created = _pool()
+    view = pool.view(0.5)
+
+    view.extract([1, 2], 60)
+    view.extract([3], 60)
+    pool.view(0.7).extract([4], 60)
+
+    assert len(created) == 2
+    assert created[0].frames == [1, 2, 3]
+    assert created[0].resets == 2
+    assert created[1].visibility_threshold == 0.7
+
+
+def test_pose_pool_keeps_reduced_complexity_extractors_separate():
+    pool, created = _pool()
+    view = pool.view(0.5)
+
+    view.extract([1], 60)
+    view.with_complexity(1).extract([2], 60)
+    view.extract([3], 60)
+
+    assert [(e.model_complexity, e.frames) for e in created] == [(2, [1, 3]), (1, [2])]
+
+
+def test_pose_pool_concurrent_leases_get_separate_extractors():
+    pool, created = _pool(max_idle=1)
+    barrier = threading.Barrier(3)
+
+    def run():
+        with pool.lease(0.5):
+            barrier.wait(2.0)
+
+    threads = [threading.Thread(target=run) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(created) == 3
+    assert sum(e.closed for e in created) == 2  # 유휴 상한 1개만 보관
+
+    pool.close()
+    assert all(e.closed for e in created)
+
+
+def test_pooled_view_holds_extractor_for_streaming_until_close():
+    pool, created = _pool()
+    view = pool.view(0.5)
+
+    for i in range(3):
+        view.process_frame(i, i, 60)
+    assert len(created) == 1 and created[0].frames == [0, 1, 2]
+    assert pool._idle.get((0.5, 2)) in (None, [])
+
+    view.close()
+    assert pool._idle[(0.5, 2)] == [created[0]]
+
+
+def test_engine_cache_rebuilds_when_thresholds_reload():
+    engines = EngineCache()
+    first = engines.get("driver")
+
+    assert engines.get("driver") is first
+    assert engines.get("iron") is not first
+
+    threshold_cache.clear()  # 파일 변경과 같은 효과: 새 ThresholdTable 객체
+    assert engines.get("driver") is not first
+
+
+def test_container_assembles_services_from_shared_components(monkeypatch):
+    pool, _ = _pool()
+    app_container = AppContainer(pose_pool=pool)
+
+    a = app_container.service_for(club="driver", swing_direction="right", llm_provider="noop")
+    b = app_container.service_for(club="driver", swing_direction="right", visibility_threshold=0.7)
+    left = app_container.service_for(club="driver", swing_direction="left")
+
+    assert a is not b
+    assert a.video_preprocessor is b.video_preprocessor
+    assert a.diagnosis_engine is b.diagnosis_engine
+    assert a.phase_detector is b.phase_detector
+    assert left.phase_detector.swing_direction == "left"
+    assert left.swing_segmenter is not a.swing_segmenter
+    assert a.pose_extractor.visibility_threshold == 0.5
+    assert b.pose_extractor.visibility_threshold == 0.7
+    assert a.llm_client is None
+
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "test-key")
+
+    async def scenario():
+        await app_container.start()
+        try:
+            s1 = app_container.service_for(club="iron", swing_direction="right", llm_provider="openai", llm_model="m")
+            s2 = app_container.service_for(club="iron", swing_direction="right", llm_provider="openai", llm_model="m")
+            assert s1.llm_client is s2.llm_client
+            assert s1.llm_client.http_client is app_container.http_client
+        finally:
+            await app_container.aclose()
+        assert app_container.http_client is None
+
+    asyncio.run(scenario())
@@ -0,0 +1,109 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app import config as app_config
+from app.domain.diagnosis.engine import DiagnosisEngine
+from app.domain.diagnosis.rules import RuleCache, RuleSyntaxError, compile_rules, parse_rules
+from app.domain.diagnosis.thresholds import DEFAULT_THRESHOLDS, ThresholdTable
+from tests.test_helpers import make_phase_infos
+
+RULES = """
+# 주석
+rule weak_turn @ Top: x_factor < 40 and left_elbow < 150 => "꼬임 부족" "어깨를 더 돌리세요" deduct 4
+rule not_extended @ Impact, Follow-through: not left_elbow >= 160 => "팔이 굽음"
+rule hips_lead @ *: hip_rotation > shoulder_rotation or (40 > x_factor and x_factor != 0) => "골반 선행" deduct 1
+"""
+
+
+def test_parse_rules_and_syntax_errors():
+    rules = parse_rules(RULES)
+
+    assert [r.name for r in rules] == ["weak_turn", "not_extended", "hips_lead"]
+    assert rules[0].phases == ("Top",) and rules[0].deduction == 4.0 and rules[0].suggestion == "어깨를 더 돌리세요"
+    assert rules[1].phases == ("Impact", "Follow-through") and rules[1].deduction == 5.0
+    assert rules[2].phases is None
+    assert rules[0].source == "x_factor < 40 and left_elbow < 150"
+
+    with pytest.raises(RuleSyntaxError, match="line 1:"):
+        parse_rules('rule bad @ Top: x_factor < => "x"')
+    with pytest.raises(RuleSyntaxError, match="at least one metric"):
+        parse_rules('rule bad @ Top: 1 < 2 => "x"')
+    with pytest.raises(RuleSyntaxError, match="duplicated"):
+        parse_rules('rule a @ *: x_factor < 1 => "x" rule a @ *: x_factor < 2 => "y"')
+    # 오타 난 페이즈 / 메트릭은 컴파일 시점에 거부 (위치 포함), 데이터셋 이름은 계산기 이름으로
+    with pytest.raises(RuleSyntaxError, match="line 1:10: unknown phase 'Topp'"):
+        parse_rules('rule a @ Topp: x_factor < 1 => "x"')
+    with pytest.raises(RuleSyntaxError, match="unknown metric 'x_facter'"):
+        parse_rules('rule a @ Top: x_facter < 1 => "x"')
+    aliased = parse_rules('rule a @ Address: elbow < 150 and shoulder_turn > 90 => "x"')[0]
+    assert aliased.condition[1][0][1] == ("metric", "left_elbow")
+    assert aliased.condition[1][1][1] == ("metric", "shoulder_rotation")
+
+
+def test_evaluate_matches_python_semantics_with_missing_values():
+    rules = compile_rules(RULES)
+    cols = {m: j for j, m in enumerate(rules.metrics)}
+
+    def row(**values):
+        out = np.full(len(rules.metrics), np.nan)
+        for k, v in values.items():
+            out[cols[k]] = v
+        return out
+
+    phase_names = ["Top", "Top", "Impact", "Impact", "Address", "Top"]
+    measured = np.stack([
+        row(x_factor=35, left_elbow=140),                     # weak_turn + hips_lead(40 > x_factor)
+        row(x_factor=35),                                     # left_elbow 없음 → weak_turn 미발동
+        row(left_elbow=150),                                  # not (150 >= 160) → 발동
+        row(),                                                # 값 없음 → not 이어도 미발동
+        row(hip_rotation=50, shoulder_rotation=40),           # 메트릭끼리 비교
+        row(x_factor=0, hip_rotation=10, shoulder_rotation=40),
+    ])
+
+    hits = rules.evaluate(phase_names, measured)
+
+    assert hits.tolist() == [
+        [True, False, True],
+        [False, False, True],
+        [False, True, False],
+        [False, False, False],
+        [False, False, True],
+        [False, False, False],
+    ]
+    stats = {s["name"]: s for s in rules.stats()}
+    assert stats["weak_turn"]["hits"] == 1 and stats["weak_turn"]["evaluated"] == 3
+    assert stats["hips_lead"]["evaluated"] == 6
+
+
+def test_engine_applies_rule_deductions_and_messages():
+    engine = DiagnosisEngine(table=ThresholdTable(DEFAULT_THRESHOLDS), rules=compile_rules(RULES))
+    result = engine.diagnose(make_phase_infos({"Top": {"left_elbow": 155.0, "x_factor": 35.0}}))
+
+    top = result.get_diagnosis_for_phase("Top")
+    assert "꼬임 부족" not in top.issues            # left_elbow 155 → weak_turn 미발동
+    assert "골반 선행" in top.issues
+    assert top.score == 99                          # hips_lead deduct 1 (threshold는 범위/허용 오차 이내)
+    assert "x_factor" in engine.metrics
+
+
+def test_rule_cache_keeps_previous_rules_on_syntax_error(tmp_path):
+    path = tmp_path / "rules.txt"
+    path.write_text(RULES, encoding="utf-8")
+    cache = RuleCache(path)
+    first = cache.get()
+    assert len(first) == 3
+
+    path.write_text('rule broken @ Top: x_factor <', encoding="utf-8")
+    os.utime(path, ns=(0, 10**9))
+    assert cache.get() is first
+
+    path.unlink()
+    assert len(cache.get()) == 0
+
+
+def test_example_rules_file_compiles():
+    example = Path(app_config.__file__).with_name("diagnosis_rules.example.txt")
+    assert len(compile_rules(example.read_text(encoding="utf-8"))) == 4
@@ -0,0 +1,103 @@
+import numpy as np
+from scipy.stats import norm
+
+from app.domain.diagnosis.distributions import DistributionTable
+from app.domain.diagnosis.engine import DiagnosisEngine
+from app.domain.diagnosis.scoring import CDF_LEVELS, DistributionScorer
+from tests.test_helpers import SWING_PHASES, make_phase_infos
+
+LEVELS = np.linspace(0.0, 1.0, 21).round(2).tolist()  # 운영 파일처럼 bins에 분위 레벨만 들어 있음
+
+
+def _block(mean, std, bins=None):
+    return {"bins": bins or LEVELS, "mean": mean, "std": std, "n": 21}
+
+
+def _raw():
+    return {
+        "P2": {"elbow": _block(160.0, 10.0), "knee": _block(150.0, 5.0)},
+        "P3": {"elbow": _block(160.0, 10.0), "knee": _block(150.0, 5.0)},
+        "P4": {"elbow": _block(120.0, 20.0, bins=[80.0, 100.0, 120.0, 140.0, 160.0]), "knee": _block(140.0, 8.0)},
+        "P7": {"elbow": _block(170.0, 5.0), "knee": _block(160.0, 6.0)},
+    }
+
+
+def test_scorer_maps_positions_and_aliases():
+    scorer = DistributionScorer(DistributionTable(_raw()))
+
+    assert scorer.phases == ("Backswing", "Top", "Impact")
+    assert scorer.metrics == ("left_elbow", "left_knee")
+    assert scorer.mean[scorer.phase_index["Backswing"], 0] == 160.0
+
+
+def test_percentiles_match_normal_cdf_and_empirical_bins():
+    scorer = DistributionScorer(DistributionTable(_raw()))
+    rows = scorer.rows_for(["Backswing", "Top", "Impact", "Address"])
+    measured = np.array([
+        [150.0, 157.5],
+        [130.0, 140.0],   # Top elbow: 경험 분위 (80..160 균등 → 130은 62.5%)
+        [170.0, 300.0],   # 그리드 밖은 끝 레벨로 고정
+        [150.0, 150.0],   # 분포 없는 페이즈
+    ])
+
+    result = scorer.score(rows, measured)
+
+    np.testing.assert_allclose(result.percentile[0], 100 * norm.cdf([-1.0, 1.5]), atol=0.05)
+    np.testing.assert_allclose(result.z[0], [-1.0, 1.5])
+    assert abs(result.percentile[1, 0] - 62.5) < 0.1
+    assert abs(result.percentile[1, 1] - 50.0) < 0.05
+    assert result.percentile[2, 1] == 100 * CDF_LEVELS[-1]
+    assert np.isnan(result.percentile[3]).all() and not result.available[3].any()
+
+
+def test_engine_distribution_mode_scores_and_percentile_ranks():
+    engine = DiagnosisEngine(scorer=DistributionScorer(DistributionTable(_raw())), thresholds_version="v1")
+    result = engine.diagnose(make_phase_infos({
+        "Address": {"left_elbow": 10.0},                         # 분포 없음 → 판정 없음
+        "Backswing": {"left_elbow": 130.0, "left_knee": 150.0},  # elbow z=-3 → 범위 이탈
+        "Top": {"left_elbow": 120.0, "left_knee": 149.0},        # knee z=1.125 → 경고
+        "Impact": {"left_elbow": 170.0},
+    }))
+
+    by_phase = {d.phase: d for d in result.diagnoses}
+    assert by_phase["Address"].score == 100 and not by_phase["Address"].percentile_ranks
+    # 분포가 있는 Backswing / Top / Impact만 평균 (분포 없는 페이즈의 100점은 제외)
+    scored = [by_phase[name].score for name in ("Backswing", "Top", "Impact")]
+    assert abs(result.overall_score - sum(scored) / 3) < 1e-9
+    assert by_phase["Backswing"].score == 95
+    assert "left_elbow 부족" in by_phase["Backswing"].issues[0]
+    assert by_phase["Top"].score == 98 and not by_phase["Top"].issues
+    assert abs(by_phase["Impact"].percentile_ranks["left_elbow"] - 50.0) < 0.05
+    assert by_phase["Backswing"].measured_values["left_elbow"]["z_score"] == -3.0
+
+
+def _random_angles(rng, n, metrics):
+    angles = rng.normal(150.0, 25.0, size=(n, len(SWING_PHASES), len(metrics)))
+    angles[rng.random(angles.shape) < 0.2] = np.nan
+    return angles
+
+
+def _to_phases(angles, metrics):
+    return make_phase_infos({
+        name: {m: float(v) for m, v in zip(metrics, row) if not np.isnan(v)}
+        for name, row in zip(SWING_PHASES, angles)
+    })
+
+
+def test_diagnose_batch_matches_diagnose_in_both_modes():
+    from app.domain.diagnosis.thresholds import DEFAULT_THRESHOLDS, ThresholdTable
+
+    rng = np.random.default_rng(0)
+    engines = [
+        DiagnosisEngine(table=ThresholdTable(DEFAULT_THRESHOLDS)),
+        DiagnosisEngine(scorer=DistributionScorer(DistributionTable(_raw()))),
+    ]
+    for engine in engines:
+        angles = _random_angles(rng, 50, engine.metrics)
+        phase_scores, overall = engine.diagnose_batch(angles, SWING_PHASES)
+
+        assert phase_scores.shape == (50, len(SWING_PHASES))
+        for n in range(50):
+            single = engine.diagnose(_to_phases(angles[n], engine.metrics))
+            assert [d.score for d in single.diagnoses] == phase_scores[n].tolist()
+            assert single.overall_score == overall[n]
@@ -0,0 +1,75 @@
+import json
+import os
+
+import numpy as np
+
+from app.domain.diagnosis.engine import DiagnosisEngine
+from app.domain.diagnosis.thresholds import DEFAULT_THRESHOLDS, ThresholdCache, ThresholdTable
+from tests.test_helpers import make_phase_infos
+
+
+def test_table_compiles_to_dense_arrays():
+    table = ThresholdTable(DEFAULT_THRESHOLDS)
+
+    i, j = table.phase_index["Top"], table.metric_index["shoulder_rotation"]
+    assert (table.min[i, j], table.max[i, j], table.optimal[i, j]) == (80, 100, 90)
+    assert np.isnan(table.min[table.phase_index["Address"], j])
+    assert table.present.sum() == sum(len(b) for b in DEFAULT_THRESHOLDS.values())
+
+
+def test_diagnose_deductions_and_messages():
+    engine = DiagnosisEngine(table=ThresholdTable(DEFAULT_THRESHOLDS))
+    result = engine.diagnose(make_phase_infos({
+        "Address": {"left_elbow": 130.0, "right_knee": 170.0},    # 범위 미달 → -5
+        "Backswing": {"left_elbow": 185.0, "x_factor": 50.0},     # 범위 초과 → -5
+        "Top": {"left_elbow": 160.0, "unknown_metric": 1.0},      # 문제 없음
+    }))
+
+    scores = {d.phase: d.score for d in result.diagnoses}
+    assert scores["Address"] == 95
+    assert scores["Backswing"] == 95
+    assert scores["Top"] == 100
+
+    backswing = result.get_diagnosis_for_phase("Backswing")
+    assert backswing.issues == ["left_elbow 과다: 185.0도 (최대 180.0도)"]
+    assert backswing.suggestions == ["left_elbow을(를) 5.0도 감소시키세요"]
+    assert result.get_diagnosis_for_phase("Top").issues == []
+    assert result.overall_score == np.mean([95, 95, 100, 100, 100, 100])
+
+
+def test_optimal_warning_without_range():
+    table = ThresholdTable({"Impact": {"left_knee": {"optimal": 170}}})
+    result = DiagnosisEngine(table=table).diagnose(make_phase_infos({"Impact": {"left_knee": 150.0}}))
+
+    impact = result.get_diagnosis_for_phase("Impact")
+    assert impact.score == 98
+    assert impact.issues == []
+    assert impact.suggestions == ["left_knee 최적화 가능: 현재 150.0도, 최적 170.0도"]
+
+
+def test_messages_follow_measured_angle_order():
+    table = ThresholdTable({"Top": {"left_elbow": {"min": 150, "max": 180}, "shoulder_rotation": {"min": 80}}})
+    result = DiagnosisEngine(table=table).diagnose(make_phase_infos({"Top": {"shoulder_rotation": 50.0, "left_elbow": 100.0}}))
+
+    top = result.get_diagnosis_for_phase("Top")
+    assert [issue.split()[0] for issue in top.issues] == ["shoulder_rotation", "left_elbow"]
+    assert list(top.measured_values) == ["shoulder_rotation", "left_elbow"]
+
+
+def test_cache_reloads_on_mtime_change(tmp_path):
+    path = tmp_path / "iron.json"
+    path.write_text(json.dumps({"Top": {"left_elbow": {"min": 1, "max": 2}}}), encoding="utf-8")
+    cache = ThresholdCache(tmp_path)
+
+    first = cache.get("iron")
+    assert cache.get("iron") is first
+
+    path.write_text(json.dumps({"Top": {"left_elbow": {"min": 3, "max": 4}}}), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = cache.get("iron")
+    assert second is not first
+    assert second.min[0, 0] == 3
+    # 파일이 없는 클럽은 기본값 테이블
+    assert cache.get("wedge").raw is DEFAULT_THRESHOLDS
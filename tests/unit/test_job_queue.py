@@ -0,0 +1,256 @@
+import asyncio
+import time
+
+import pytest
+
+from app.infrastructure.jobs.broker import create_job_broker
+from app.infrastructure.jobs.redis_broker import RedisJobBroker, RespClient
+from app.infrastructure.jobs.sqlite_broker import SQLiteJobBroker
+from app.infrastructure.storage.uploads import LocalUploadStorage
+from app.services import job_runner as job_runner_module
+from app.services.job_runner import JobRunner, UnknownThresholdsVersion, execute_job
+from tests.test_helpers import FakeRedisServer
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def broker(request, tmp_path):
+    if request.param == "sqlite":
+        yield SQLiteJobBroker(tmp_path / "jobs.sqlite3")
+        return
+    with FakeRedisServer() as server:
+        client = RespClient.from_url(server.url)
+        yield RedisJobBroker(client, prefix="test:jobs")
+        client.close()
+
+
+def test_broker_claims_each_job_once_in_submit_order(broker):
+    first = broker.submit("single", {"upload": None, "n": 1})
+    second = broker.submit("multi", {"upload": None, "n": 2})
+
+    claimed = broker.claim(lease_sec=60)
+    assert claimed["id"] == first and claimed["status"] == "running" and claimed["attempts"] == 1
+    assert claimed["payload"] == {"upload": None, "n": 1}
+    assert broker.claim(lease_sec=60)["id"] == second
+    assert broker.claim(lease_sec=60) is None
+    assert broker.count("running") == 2
+
+    assert broker.complete(first, 1, '{"ok": true}')
+    assert broker.fail(second, 1, "boom")
+    assert broker.get(first)["status"] == "succeeded" and broker.get(first)["result"] == '{"ok": true}'
+    assert broker.get(second)["status"] == "failed" and broker.get(second)["error"] == "boom"
+    assert broker.count("running") == 0
+    assert broker.get("missing") is None
+
+
+def test_broker_reclaims_expired_lease_and_release_requeues_first(broker):
+    job_id = broker.submit("single", {"upload": None})
+    later = broker.submit("single", {"upload": None})
+
+    broker.claim(lease_sec=0.01)  # 워커가 죽어 complete/fail 없이 lease 만료
+    time.sleep(0.02)
+    again = broker.claim(lease_sec=60)
+    assert again["id"] == job_id and again["attempts"] == 2
+
+    assert not broker.release(job_id, 1)  # 먼저 가져갔던 워커는 lease를 잃음
+    assert not broker.complete(job_id, 1, "{}")
+    assert broker.release(job_id, 2)  # 워커 정상 종료 → 다음 claim 대상으로 복귀
+    assert broker.get(job_id)["status"] == "queued" and broker.get(job_id)["attempts"] == 1
+    assert broker.claim(lease_sec=60)["id"] == job_id
+    assert broker.claim(lease_sec=60)["id"] == later
+
+
+def test_broker_renews_only_a_live_lease(broker):
+    job_id = broker.submit("single", {"upload": None})
+    broker.claim(lease_sec=0.05)
+    assert broker.renew(job_id, 1, lease_sec=60)
+    assert not broker.renew(job_id, 2, lease_sec=60)
+    time.sleep(0.06)
+    assert broker.claim(lease_sec=60) is None  # 연장됐으므로 다른 워커가 가져가지 못함
+
+    assert broker.complete(job_id, 1, "{}")
+    assert not broker.complete(job_id, 1, "{}")
+    assert not broker.renew(job_id, 1, lease_sec=60)
+    assert not broker.renew("missing", 1, lease_sec=60)
+
+
+def test_resp_client_does_not_resend_after_reply_is_lost():
+    with FakeRedisServer() as server:
+        client = RespClient.from_url(server.url)
+        client.execute("PING")
+        server.drop_replies = 1
+
+        with pytest.raises(OSError):
+            client.execute("LPUSH", "q", "job-1")
+
+        # 서버는 이미 실행함 → 재전송했다면 2개
+        assert server.lists["q"] == ["job-1"]
+        assert client.execute("LLEN", "q") == 1  # 다음 명령은 새 연결로 정상 동작
+        client.close()
+
+
+def test_redis_claim_survives_lost_reply_via_lease_expiry():
+    with FakeRedisServer() as server:
+        client = RespClient.from_url(server.url)
+        broker = RedisJobBroker(client, prefix="test:jobs")
+        job_id = broker.submit("single", {"upload": None})
+        server.drop_replies = 1
+
+        with pytest.raises(OSError):
+            broker.claim(lease_sec=0.05)  # 서버는 꺼내고 lease까지 등록했지만 워커는 응답을 못 받음
+
+        assert [c[0] for c in server.commands[-1:]] == ["EVAL"]
+        assert broker.get(job_id)["status"] == "running" and broker.count("running") == 1
+        assert broker.claim(lease_sec=60) is None
+        time.sleep(0.06)
+        again = broker.claim(lease_sec=60)
+        assert again["id"] == job_id and again["attempts"] == 2
+        client.close()
+
+
+def test_create_job_broker_from_url(tmp_path):
+    assert isinstance(create_job_broker(f"sqlite:///{tmp_path / 'jobs.sqlite3'}"), SQLiteJobBroker)
+    redis_broker = create_job_broker("redis://:secret@cache:6380/2")
+    assert isinstance(redis_broker, RedisJobBroker)
+    client = redis_broker.client
+    assert (client.host, client.port, client.db, client.password) == ("cache", 6380, 2, "secret")
+    with pytest.raises(ValueError):
+        create_job_broker("amqp://localhost")
+
+
+def test_local_upload_storage_moves_and_rejects_escaping_refs(tmp_path):
+    storage = LocalUploadStorage(tmp_path / "shared")
+    upload = tmp_path / "upload.mp4"
+    upload.write_bytes(b"video")
+
+    ref = storage.put(str(upload), "job_1.mp4")
+    assert not upload.exists()
+    with storage.open_local(ref) as path:
+        assert open(path, "rb").read() == b"video"
+    storage.delete(ref)
+    assert not (tmp_path / "shared" / "job_1.mp4").exists()
+    with pytest.raises(ValueError):
+        storage.delete("../upload.mp4")
+
+
+def test_job_runner_bounds_concurrency_and_records_results(broker, tmp_path):
+    storage = LocalUploadStorage(tmp_path / "shared")
+    upload = tmp_path / "upload.mp4"
+    upload.write_bytes(b"video")
+    running, peak = 0, 0
+
+    async def handler(kind, payload):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        if payload["n"] == 3:
+            raise RuntimeError("decode error")
+        return f'{{"n": {payload["n"]}}}'
+
+    job_ids = [broker.submit("single", {"upload": None, "n": n}) for n in range(5)]
+    job_ids.append(broker.submit("single", {"upload": storage.put(str(upload), "job_5.mp4"), "n": 5}))
+
+    async def scenario():
+        runner = JobRunner(broker, workers=2, handler=handler, uploads=storage, poll_interval=0.01).start()
+        runner.notify()
+        while broker.count("queued") or broker.count("running"):
+            await asyncio.sleep(0.01)
+        await runner.stop()
+
+    asyncio.run(scenario())
+
+    assert peak == 2
+    statuses = {job_id: broker.get(job_id)["status"] for job_id in job_ids}
+    assert statuses[job_ids[3]] == "failed"
+    assert "decode error" in broker.get(job_ids[3])["error"]
+    assert all(status == "succeeded" for job_id, status in statuses.items() if job_id != job_ids[3])
+    assert broker.get(job_ids[5])["result"] == '{"n": 5}'
+    assert not (tmp_path / "shared" / "job_5.mp4").exists()  # 끝난 작업의 업로드는 삭제
+
+
+def test_job_runner_renews_lease_of_long_job_and_classifies_errors(broker, tmp_path):
+    storage = LocalUploadStorage(tmp_path / "shared")
+
+    async def handler(kind, payload):
+        if payload["n"] == 1:
+            raise UnknownThresholdsVersion("v999")
+        if payload["n"] == 2:
+            raise KeyError("club")  # 분석 중 KeyError는 버전 오류가 아님
+        await asyncio.sleep(0.3)  # lease(0.1초)보다 오래 걸리는 작업
+        return "{}"
+
+    job_ids = [broker.submit("single", {"upload": None, "n": 0})]
+
+    async def scenario():
+        runner = JobRunner(broker, workers=1, handler=handler, uploads=storage, poll_interval=0.01, lease_sec=0.1)
+        job = await asyncio.to_thread(broker.claim, 0.1)
+        run = asyncio.create_task(runner.run_one(job))
+        await asyncio.sleep(0.2)
+        assert await asyncio.to_thread(broker.claim, 60) is None  # lease가 연장되어 재실행되지 않음
+        await run
+        job_ids.extend(broker.submit("single", {"upload": None, "n": n}) for n in (1, 2))
+        for _ in range(2):
+            await runner.run_one(await asyncio.to_thread(broker.claim, 60))
+
+    asyncio.run(scenario())
+
+    assert broker.get(job_ids[0])["status"] == "succeeded"
+    assert broker.get(job_ids[0])["attempts"] == 1
+    assert broker.get(job_ids[1])["error"] == "unknown thresholds_version: v999"
+    assert "unknown thresholds_version" not in broker.get(job_ids[2])["error"]
+
+
+def test_job_runner_stops_job_and_keeps_upload_after_losing_lease(broker, tmp_path):
+    storage = LocalUploadStorage(tmp_path / "shared")
+    upload = tmp_path / "in.mp4"
+    upload.write_bytes(b"video")
+    job_id = broker.submit("single", {"upload": storage.put(str(upload), "job.mp4"), "n": 0})
+    cancelled = []
+
+    async def handler(kind, payload):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(payload["n"])
+            raise
+        return "{}"
+
+    async def scenario():
+        runner = JobRunner(broker, workers=1, handler=handler, uploads=storage, lease_sec=0.3)
+        job = await asyncio.to_thread(broker.claim, 0.01)
+        run = asyncio.create_task(runner.run_one(job))
+        await asyncio.sleep(0.03)
+        taken = await asyncio.to_thread(broker.claim, 60)  # lease 만료 → 다른 워커가 가져감
+        assert taken["id"] == job_id and taken["attempts"] == 2
+        await asyncio.wait_for(run, timeout=1)  # 다음 heartbeat에서 lease를 잃고 중단
+        assert cancelled == [0]
+
+    asyncio.run(scenario())
+
+    assert broker.get(job_id)["status"] == "running" and broker.get(job_id)["attempts"] == 2
+    assert (tmp_path / "shared" / "job.mp4").exists()  # 새 소유 워커가 쓸 업로드는 그대로
+
+
+def test_execute_job_always_returns_inline_feedback(monkeypatch, tmp_path):
+    storage = LocalUploadStorage(tmp_path / "shared")
+    upload = tmp_path / "in.mp4"
+    upload.write_bytes(b"video")
+    modes = []
+
+    class _Result:
+        def model_dump_json(self):
+            return "{}"
+
+    class _Service:
+        async def analyze(self, request):
+            modes.append(request.feedback_mode)
+            return _Result()
+
+    monkeypatch.setattr(job_runner_module, "upload_storage", storage)
+    monkeypatch.setattr(job_runner_module, "create_swing_analysis_service", lambda **kwargs: _Service())
+    request = {"user_id": "u1", "club": "driver", "feedback_mode": "deferred"}
+    payload = {"request": request, "upload": storage.put(str(upload), "job.mp4")}
+
+    assert asyncio.run(execute_job("single", payload)) == "{}"
+    assert modes == ["inline"]  # deferred면 피드백이 워커 로컬 저장소에만 남음
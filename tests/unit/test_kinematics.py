@@ -0,0 +1,86 @@
+import numpy as np
+
+from app.domain.kinematics.analyzer import KinematicsAnalyzer
+from app.schemas.angle_dto import AngleCalculationResult, ANGLE_METRIC_NAMES
+from tests.test_helpers import make_pose_data
+
+FPS = 60.0
+
+
+def _gaussian(t, center, width=0.05):
+    return np.exp(-((t - center) ** 2) / (2 * width ** 2))
+
+
+def _angle_result(values, frame_numbers):
+    return AngleCalculationResult(
+        total_frames=len(frame_numbers),
+        frame_numbers=np.asarray(frame_numbers),
+        timestamps=np.asarray(frame_numbers) / FPS,
+        values=values,
+        avg_left_elbow=0.0,
+        avg_right_elbow=0.0,
+        avg_left_knee=0.0,
+        avg_right_knee=0.0,
+        avg_x_factor=0.0,
+    )
+
+
+def test_velocity_is_fps_scaled():
+    frames = np.arange(60)
+    values = np.zeros((60, len(ANGLE_METRIC_NAMES)))
+    values[:, ANGLE_METRIC_NAMES.index("left_elbow")] = 2.0 * frames  # 2도/프레임
+    poses = [make_pose_data(int(f)) for f in frames]
+
+    result = KinematicsAnalyzer().analyze(_angle_result(values, frames), poses, FPS)
+
+    col = ANGLE_METRIC_NAMES.index("left_elbow")
+    assert np.allclose(result.velocity[:, col], 2.0 * FPS)  # 120도/초
+    assert np.allclose(result.acceleration[:, col], 0.0, atol=1e-6)
+
+
+def test_kinematic_sequence_order_with_dropped_frames():
+    frames = np.delete(np.arange(120), [30, 31, 70])  # 가시성 필터로 빠진 프레임
+    t = frames / FPS
+
+    values = np.zeros((len(frames), len(ANGLE_METRIC_NAMES)))
+    # 각 세그먼트의 "속도" 피크가 hips → shoulders → arms → wrists 순서가 되도록 적분형 신호 구성
+    values[:, ANGLE_METRIC_NAMES.index("hip_rotation")] = np.cumsum(_gaussian(t, 0.9))
+    values[:, ANGLE_METRIC_NAMES.index("shoulder_rotation")] = np.cumsum(_gaussian(t, 1.0))
+    values[:, ANGLE_METRIC_NAMES.index("left_elbow")] = np.cumsum(_gaussian(t, 1.1))
+    wrist_x = 0.2 + 0.5 * np.cumsum(_gaussian(t, 1.25)) / np.cumsum(_gaussian(t, 1.25))[-1]
+    poses = [make_pose_data(int(f), left_wrist=(x, 0.5)) for f, x in zip(frames, wrist_x)]
+
+    result = KinematicsAnalyzer().analyze(
+        _angle_result(values, frames), poses, FPS, window=(40, 100)
+    )
+
+    assert len(result.frame_numbers) == 120
+    assert result.sequence.order == ["hips", "shoulders", "arms", "wrists"]
+    assert result.sequence.is_ideal_order
+    peak_times = [p.time for p in result.sequence.peaks]
+    assert peak_times == sorted(peak_times)
+
+
+def test_service_skips_kinematics_when_window_cannot_be_computed():
+    from types import SimpleNamespace
+
+    from app.schemas.phase_dto import PhaseDetectionResult, PhaseInfo
+    from app.services.swing_analysis_service import SwingAnalysisService
+
+    def _phases(names):
+        return PhaseDetectionResult(phases=[
+            PhaseInfo(name=n, start_frame=i, end_frame=i + 1, start_time=0.0, end_time=0.0, duration=0.0,
+                      representative_angles={})
+            for i, n in enumerate(names)
+        ])
+
+    service = SimpleNamespace(kinematics_analyzer=KinematicsAnalyzer())
+    full = _phases(["Address", "Backswing", "Top", "Downswing", "Impact", "Follow-through"])
+    no_follow = _phases(["Address", "Backswing", "Top", "Downswing", "Impact", "Impact"])
+    frames = np.arange(2)
+    angles = _angle_result(np.zeros((2, len(ANGLE_METRIC_NAMES))), frames)
+    poses = [make_pose_data(int(f)) for f in frames]
+
+    # 프레임이 너무 적거나 Follow-through가 없어도 예외 없이 키네마틱스만 생략
+    assert SwingAnalysisService._analyze_kinematics(service, poses, angles, full, FPS) is None
+    assert SwingAnalysisService._analyze_kinematics(service, poses, angles, no_follow, FPS) is None
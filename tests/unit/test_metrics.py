@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.api.metrics import router
+from app.common import metrics
+from app.common.executors import StageExecutor, StageTimings
+
+
+def _value(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_stage_timings_feed_histograms_and_pool_gauges():
+    executor = StageExecutor("metrics-test", max_workers=1)
+    timings = StageTimings()
+    before = _value("swing_stage_seconds_count", stage="metrics_decode")
+
+    async def scenario():
+        await asyncio.gather(
+            executor.run("metrics_decode", time.sleep, 0.05, timings=timings),
+            executor.run("metrics_decode", time.sleep, 0.05, timings=timings),
+        )
+        with timings.measure("metrics_llm"):
+            await asyncio.sleep(0.02)
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+
+    assert _value("swing_stage_seconds_count", stage="metrics_decode") == before + 2
+    assert _value("swing_stage_queue_seconds_sum", stage="metrics_decode") >= 0.04
+    assert timings.as_dict()["metrics_llm"]["exec_ms"] >= 15
+    assert _value("swing_executor_workers", executor="metrics-test") == 1
+    assert _value("swing_executor_busy_workers", executor="metrics-test") == 0
+    assert _value("swing_executor_queued_tasks", executor="metrics-test") == 0
+
+
+def test_cancelled_queued_stage_is_not_executed():
+    executor = StageExecutor("metrics-cancel", max_workers=1)
+    ran = []
+
+    async def scenario():
+        blocker = asyncio.ensure_future(executor.run("block", time.sleep, 0.1))
+        queued = asyncio.ensure_future(executor.run("queued", ran.append, 1))
+        await asyncio.sleep(0.02)
+        queued.cancel()
+        await blocker
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+
+    assert ran == []
+    assert _value("swing_executor_queued_tasks", executor="metrics-cancel") == 0
+
+
+def test_frame_counters_split_drop_reasons():
+    low = _value("swing_frames_dropped_total", reason="low_visibility")
+    missing = _value("swing_frames_dropped_total", reason="no_pose")
+
+    metrics.record_frames(total=100, detected=90, low_visibility=6)
+
+    assert _value("swing_frames_dropped_total", reason="low_visibility") == low + 6
+    assert _value("swing_frames_dropped_total", reason="no_pose") == missing + 4
+
+
+def test_metrics_endpoint_exposes_prometheus_text():
+    app = FastAPI()
+    app.include_router(router)
+
+    response = TestClient(app).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "swing_stage_seconds_bucket" in response.text
+    assert 'swing_lru_cache_requests_total{cache="savgol_coeffs",result="hit"}' in response.text
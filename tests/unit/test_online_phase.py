@@ -0,0 +1,63 @@
+import numpy as np
+
+from app.domain.phase.detector import PhaseDetector
+from app.domain.phase.online import OnlinePhaseDetector
+from tests.test_helpers import make_pose_data
+
+FPS = 60.0
+
+
+def _swing_signal(n=120, top=50, impact=80):
+    """Address 정지 → 상승(Top) → 하강(Impact) → 소폭 회복"""
+    t = np.arange(n)
+    y = np.full(n, 0.5)
+    rise = (t >= 10) & (t <= top)
+    y[rise] = 0.5 + 0.3 * np.sin(np.pi / 2 * (t[rise] - 10) / (top - 10))
+    fall = (t > top) & (t <= impact)
+    y[fall] = 0.8 - 0.5 * np.sin(np.pi / 2 * (t[fall] - top) / (impact - top))
+    after = t > impact
+    y[after] = 0.3 + 0.1 * np.sin(np.pi / 2 * np.minimum(1.0, (t[after] - impact) / 20))
+    return y
+
+
+def test_online_matches_batch_transition_frames():
+    y = _swing_signal()
+    batch = PhaseDetector()._find_transition_points(PhaseDetector()._smooth_signal(y))
+
+    detector = OnlinePhaseDetector(fps=FPS)
+    for frame, value in enumerate(y):
+        detector.push_value(frame, float(value))
+
+    assert detector.is_complete
+    points = detector.transition_points(video_end=len(y) - 1)
+    assert abs(points["top"] - batch["top"]) <= 1
+    assert abs(points["impact"] - batch["impact"]) <= 1
+    assert [t.name for t in detector.transitions] == [
+        "Address", "Backswing", "Top", "Downswing", "Impact", "Follow-through"
+    ]
+
+
+def test_latency_is_bounded():
+    detector = OnlinePhaseDetector(fps=FPS)
+    for frame, value in enumerate(_swing_signal()):
+        detector.push_value(frame, float(value))
+
+    bound = detector.lag + detector.max_confirm_frames
+    for event in detector.transitions:
+        assert 0 <= event.latency_frames <= bound + 1
+
+
+def test_subscribers_receive_events_from_poses():
+    received = []
+    detector = OnlinePhaseDetector(fps=FPS)
+    detector.subscribe(lambda event: received.append(event.name))
+    detector.subscribe(lambda event: 1 / 0)  # 구독자 오류는 격리됨
+
+    for frame, value in enumerate(_swing_signal()):
+        detector.push(make_pose_data(frame, left_wrist=(0.5, float(value))))
+
+    assert received[0] == "Address"
+    assert received[-1] == "Follow-through"
+
+    detector.reset()
+    assert detector.transitions == [] and not detector.is_complete
@@ -0,0 +1,143 @@
+import threading
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from app.config.settings import settings
+from app.domain.phase.detector import PhaseDetector
+from app.ml.inference_server import PhaseInferenceServer
+from app.ml.phase_adapter import TorchPhaseAdapter
+from app.ml.phase_lstm import PhaseLSTM
+
+
+class _CountingAdapter(TorchPhaseAdapter):
+    def __init__(self, model):
+        super().__init__(model, input_dim=3)
+        self.batch_sizes = []
+
+    def predict_proba_batch(self, X, lengths):
+        self.batch_sizes.append(X.shape[0])
+        return super().predict_proba_batch(X, lengths)
+
+
+def _adapter():
+    torch.manual_seed(0)
+    return _CountingAdapter(PhaseLSTM(input_dim=3, hidden_dim=8, num_classes=8))
+
+
+def test_batched_results_match_single_sequence():
+    adapter = _adapter()
+    server = PhaseInferenceServer(adapter, max_batch_size=8, max_wait_ms=50).start()
+    rng = np.random.default_rng(0)
+    inputs = [rng.normal(size=(int(n), 3)).astype(np.float32) for n in (12, 30, 7, 21)]
+
+    results = [None] * len(inputs)
+
+    def call(i):
+        results[i] = server.predict_proba(inputs[i], timeout=5)
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(len(inputs))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    server.stop(timeout=5)
+
+    assert sum(adapter.batch_sizes) == len(inputs)
+    assert len(adapter.batch_sizes) < len(inputs)  # 적어도 일부는 한 배치로 묶임
+    for x, prob in zip(inputs, results):
+        assert prob.shape == (len(x), 8)
+        assert np.allclose(prob, adapter.predict_proba(x), atol=1e-5)
+
+
+class _FakeServer:
+    def __init__(self, prob):
+        self.prob = prob
+        self.adapter = type("A", (), {"classes_": [f"P{i}" for i in range(2, 10)]})()
+
+    def predict_proba(self, X, timeout=None):
+        self.timeout = timeout
+        if isinstance(self.prob, Exception):
+            raise self.prob
+        return self.prob
+
+
+def _ml_inputs(n):
+    from app.schemas.angle_dto import AngleCalculationResult, ANGLE_METRIC_NAMES
+    from tests.test_helpers import make_pose_data
+
+    poses = [make_pose_data(i) for i in range(n)]
+    angles = AngleCalculationResult(
+        total_frames=n,
+        frame_numbers=np.arange(n),
+        timestamps=np.arange(n) / 60.0,
+        values=np.zeros((n, len(ANGLE_METRIC_NAMES))),
+        avg_left_elbow=0.0,
+        avg_right_elbow=0.0,
+        avg_left_knee=0.0,
+        avg_right_knee=0.0,
+        avg_x_factor=0.0,
+    )
+    return poses, angles
+
+
+def test_ml_transitions_from_model_output():
+    n = 40
+    prob = np.full((n, 8), 0.01)
+    prob[20, 2] = 0.9   # P4 → Top
+    prob[30, 5] = 0.9   # P7 → Impact
+    detector = PhaseDetector(method="ml", inference_server=_FakeServer(prob))
+
+    poses, angles = _ml_inputs(n)
+    points = detector._find_transition_points_ml(poses, angles)
+
+    assert points["top"] == 20
+    assert points["impact"] == 30
+
+
+def test_ml_uncertain_output_is_rejected():
+    n = 40
+    detector = PhaseDetector(method="auto", inference_server=_FakeServer(np.full((n, 8), 0.125)))
+
+    poses, angles = _ml_inputs(n)
+
+    assert detector._find_transition_points_ml(poses, angles) is None
+
+
+def test_ml_timeout_or_unexpected_classes_fall_back_to_rules():
+    n = 40
+    poses, angles = _ml_inputs(n)
+    slow = _FakeServer(TimeoutError())
+    assert PhaseDetector(method="auto", inference_server=slow)._find_transition_points_ml(poses, angles) is None
+    assert slow.timeout == settings.PHASE_INFERENCE_TIMEOUT_SEC
+
+    renamed = _FakeServer(np.full((n, 8), 0.125))
+    renamed.adapter.classes_ = [f"class_{i}" for i in range(8)]
+    assert PhaseDetector(method="auto", inference_server=renamed)._find_transition_points_ml(poses, angles) is None
+
+
+def test_failed_model_load_is_not_retried_on_every_request(monkeypatch, tmp_path):
+    from app.config.settings import settings
+    from app.ml import inference_server
+
+    loads = []
+
+    def broken_load(*args, **kwargs):
+        loads.append(args[0])
+        raise RuntimeError("corrupt checkpoint")
+
+    monkeypatch.setattr(settings, "PHASE_MODEL_PATH", str(tmp_path / "phase.pt"))
+    monkeypatch.setattr(settings, "PHASE_MODEL_RETRY_SEC", 60)
+    monkeypatch.setattr(inference_server, "_server", None)
+    monkeypatch.setattr(inference_server, "_load_failed_at", None)
+    monkeypatch.setattr(inference_server.torch, "load", broken_load)
+
+    assert inference_server.get_phase_inference_server() is None
+    assert inference_server.get_phase_inference_server() is None
+    assert len(loads) == 1  # 백오프 동안은 로드하지 않음
+
+    monkeypatch.setattr(inference_server, "_load_failed_at", inference_server._load_failed_at - 61)
+    assert inference_server.get_phase_inference_server() is None
+    assert len(loads) == 2
@@ -0,0 +1,325 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.common.deadline import Deadline
+from app.common.executors import StageExecutor, drain_background
+from app.config.settings import settings
+from app.domain.angle.calculator import AngleCalculator
+from app.domain.diagnosis.engine import DiagnosisEngine
+from app.domain.phase.detector import PhaseDetector
+from app.infrastructure.cache.disk_cache import DiskLruCache
+from app.schemas.analyze_dto import AnalyzeSwingRequest
+from app.services.feedback_store import feedback_store
+from app.services.result_cache import result_cache_key
+from app.services.swing_analysis_service import SwingAnalysisService
+from tests.test_helpers import make_session_wrist_y, make_wrist_poses
+
+FPS = 60.0
+DELAY = 0.3
+
+
+class _SlowLLM:
+    def __init__(self, delay=DELAY):
+        self.delay = delay
+
+    async def agenerate_feedback(self, diagnosis, user_id, club, tone, language):
+        await asyncio.sleep(self.delay)
+        return "LLM 피드백"
+
+
+class _SlowStorage:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.uploads = []
+
+    def result_key(self, result):
+        return f"swing-analysis/{result.user_id}/{result.analysis_id}.json"
+
+    def result_url(self, s3_key):
+        return f"https://bucket/{s3_key}"
+
+    def upload_result(self, result, s3_key=None):
+        time.sleep(DELAY)
+        with self.lock:
+            self.uploads.append((s3_key, result.ai_feedback))
+        return self.result_url(s3_key)
+
+
+class _FakeVideo:
+    def __init__(self):
+        self.requests = []
+
+    def process(self, request):
+        self.requests.append(request)
+        return [], SimpleNamespace(fps=FPS)
+
+
+class _FakePose:
+    def __init__(self, poses):
+        self.poses = poses
+        self.complexities = []
+
+    def with_complexity(self, model_complexity):
+        self.complexities.append(model_complexity)
+        return self
+
+    def extract(self, frames, fps):
+        return SimpleNamespace(poses=self.poses, total_frames=len(self.poses), low_visibility_frames=0)
+
+
+def _service(llm=None, storage=None):
+    cpu = StageExecutor("test-cpu", max_workers=2)
+    io = StageExecutor("test-io", max_workers=2)
+    poses = make_wrist_poses(make_session_wrist_y(num_swings=1), FPS)
+    service = SwingAnalysisService(
+        video_preprocessor=_FakeVideo(),
+        pose_extractor=_FakePose(poses),
+        angle_calculator=AngleCalculator(),
+        phase_detector=PhaseDetector(method="rule"),
+        diagnosis_engine=DiagnosisEngine(club="driver"),
+        llm_client=llm,
+        storage_client=storage,
+        cpu_executor=cpu,
+        io_executor=io
+    )
+    return service
+
+
+def _request(**overrides):
+    fields = dict(file_path="unused.mp4", user_id="u1", club="driver", llm_provider="noop")
+    fields.update(overrides)
+    return AnalyzeSwingRequest(**fields)
+
+
+def test_llm_and_upload_overlap_and_feedback_is_merged_after_response():
+    storage = _SlowStorage()
+    service = _service(_SlowLLM(), storage)
+
+    async def scenario():
+        started = time.perf_counter()
+        response = await service.analyze(_request())
+        elapsed = time.perf_counter() - started
+        first_uploads = list(storage.uploads)
+        await drain_background()
+        return response, elapsed, first_uploads
+
+    try:
+        response, elapsed, first_uploads = asyncio.run(scenario())
+    finally:
+        service.cpu_executor.shutdown()
+        service.io_executor.shutdown()
+
+    # LLM과 S3가 순차였다면 2 × DELAY 이상
+    assert elapsed < DELAY * 1.8
+    assert response.ai_feedback == "LLM 피드백"
+    key = storage.result_key(response)
+    assert response.result_url == f"https://bucket/{key}"
+    # 응답 전: 진단 텍스트로 저장 / 응답 뒤: 같은 키에 LLM 피드백 병합
+    assert len(first_uploads) == 1
+    assert first_uploads[0][0] == key and first_uploads[0][1].startswith("전체 점수")
+    assert storage.uploads[-1] == (key, "LLM 피드백")
+    assert "storage_merge" not in response.stage_timings_ms
+
+
+def test_failed_upload_cancels_pending_llm_call():
+    class _BrokenStorage(_SlowStorage):
+        def upload_result(self, result, s3_key=None):
+            raise RuntimeError("s3 down")
+
+    class _TrackedLLM(_SlowLLM):
+        cancelled = False
+
+        async def agenerate_feedback(self, *args, **kwargs):
+            try:
+                return await super().agenerate_feedback(*args, **kwargs)
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
+
+    llm = _TrackedLLM(delay=DELAY * 4)
+    service = _service(llm, _BrokenStorage())
+
+    async def scenario():
+        with pytest.raises(RuntimeError, match="s3 down"):
+            await service.analyze(_request())
+        await asyncio.sleep(0)  # 취소 전달
+        return llm.cancelled  # asyncio.run 종료 시 일괄 취소되기 전에 확인
+
+    try:
+        cancelled = asyncio.run(scenario())
+    finally:
+        service.cpu_executor.shutdown()
+        service.io_executor.shutdown()
+
+    assert cancelled
+
+
+def test_upload_only_stores_final_result_once():
+    storage = _SlowStorage()
+    service = _service(storage=storage)
+
+    try:
+        response = asyncio.run(service.analyze(_request()))
+    finally:
+        service.cpu_executor.shutdown()
+        service.io_executor.shutdown()
+
+    assert len(storage.uploads) == 1
+    assert storage.uploads[0][1] == response.ai_feedback
+    assert response.result_url is not None
+
+
+def test_deferred_feedback_returns_before_llm_and_is_fetched_later(monkeypatch, tmp_path):
+    monkeypatch.setattr(feedback_store, "store", DiskLruCache(tmp_path / "feedback"))
+    storage = _SlowStorage()
+    service = _service(_SlowLLM(), storage)
+
+    async def scenario():
+        started = time.perf_counter()
+        response = await service.analyze(_request(feedback_mode="deferred"))
+        elapsed = time.perf_counter() - started
+        pending = feedback_store.get(response.analysis_id)
+        await drain_background()
+        return response, elapsed, pending
+
+    try:
+        response, elapsed, pending = asyncio.run(scenario())
+    finally:
+        service.cpu_executor.shutdown()
+        service.io_executor.shutdown()
+
+    # 응답은 S3 업로드만 기다림 (LLM 대기 없음)
+    assert elapsed < DELAY * 1.8
+    assert response.ai_feedback_status == "pending"
+    assert response.ai_feedback.startswith("전체 점수")
+    assert response.ai_feedback_url == f"/analyze/feedback/{response.analysis_id}"
+    assert pending.status == "pending"
+
+    ready = feedback_store.get(response.analysis_id)
+    assert ready.status == "ready" and ready.ai_feedback == "LLM 피드백"
+    key = storage.result_key(response)
+    assert storage.uploads[-1] == (key, "LLM 피드백")
+    assert feedback_store.get("analysis_unknown") is None
+
+    # 캐시에서 재사용한 응답의 새 ID로도 같은 피드백 조회
+    feedback_store.link("analysis_reused", response.analysis_id)
+    reused = feedback_store.get("analysis_reused")
+    assert reused.analysis_id == "analysis_reused" and reused.ai_feedback == "LLM 피드백"
+
+
+def test_deferred_mode_without_llm_returns_text_feedback_inline():
+    service = _service()
+
+    try:
+        response = asyncio.run(service.analyze(_request(feedback_mode="deferred")))
+    finally:
+        service.cpu_executor.shutdown()
+        service.io_executor.shutdown()
+
+    assert response.ai_feedback_status == "ready"
+    assert response.ai_feedback_url is None
+
+
+def test_result_cache_key_separates_feedback_modes():
+    inline = result_cache_key("abc", "single", _request(), "fp")
+    deferred = result_cache_key("abc", "single", _request(feedback_mode="deferred"), "fp")
+
+    assert inline != deferred
+
+
+def test_deadline_tracks_remaining_budget_and_notes():
+    now = [100.0]
+    deadline = Deadline(2.0, clock=lambda: now[0])
+
+    assert deadline.allows(2.0) and not deadline.allows(2.1)
+    now[0] += 1.5
+    assert deadline.remaining() == 0.5 and deadline.timeout() == 0.5
+    now[0] += 1.0
+    assert deadline.remaining() == 0.0
+
+    deadline.degrade("llm_skip", "AI 피드백 생략")
+    assert deadline.notes == ["AI 피드백 생략"]
+
+    unlimited = Deadline(None)
+    assert unlimited.allows(1e9) and unlimited.timeout() is None
+
+    # 예산은 요청 도착 시각부터 (업로드/입장 대기에 쓴 시간 포함)
+    arrived = Deadline(2.0, clock=lambda: now[0], started_at=now[0] - 1.5)
+    assert arrived.remaining() == 0.5
+
+
+def test_request_clock_middleware_records_arrival_before_body_is_read():
+    from fastapi import FastAPI, Request
+    from fastapi.testclient import TestClient
+
+    from app.common.deadline import RequestClockMiddleware, request_received_at
+
+    app = FastAPI()
+    app.add_middleware(RequestClockMiddleware)
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        await request.body()
+        received_at = request_received_at(request)
+        return {"received_at": received_at, "age": time.monotonic() - received_at}
+
+    body = TestClient(app).post("/echo", content=b"x" * 1024).json()
+    assert body["received_at"] is not None and body["age"] >= 0
+
+
+def test_short_budget_degrades_pose_llm_and_storage(monkeypatch):
+    monkeypatch.setattr(settings, "DEADLINE_FULL_POSE_SEC", 100)
+    monkeypatch.setattr(settings, "DEADLINE_LLM_MIN_SEC", 100)
+    monkeypatch.setattr(settings, "DEADLINE_STORAGE_MIN_SEC", 100)
+    storage = _SlowStorage()
+    service = _service(_SlowLLM(), storage)
+
+    async def scenario():
+        started = time.perf_counter()
+        response = await service.analyze(_request(deadline_ms=5000))
+        elapsed = time.perf_counter() - started
+        uploads_before = len(storage.uploads)
+        await drain_background()
+        return response, elapsed, uploads_before
+
+    try:
+        response, elapsed, uploads_before = asyncio.run(scenario())
+    finally:
+        service.cpu_executor.shutdown()
+        service.io_executor.shutdown()
+
+    assert service.video_preprocessor.requests[0].target_fps == settings.DEADLINE_REDUCED_FPS
+    assert service.pose_extractor.complexities == [settings.DEADLINE_REDUCED_COMPLEXITY]
+    assert len(response.degradation_notes) == 3
+    # LLM도 S3도 기다리지 않음
+    assert elapsed < DELAY
+    assert response.ai_feedback.startswith("전체 점수")
+    key = storage.result_key(response)
+    assert response.result_url == storage.result_url(key)
+    assert uploads_before == 0 and storage.uploads == [(key, response.ai_feedback)]
+
+
+def test_llm_is_cut_off_at_deadline(monkeypatch):
+    monkeypatch.setattr(settings, "DEADLINE_FULL_POSE_SEC", 0)
+    monkeypatch.setattr(settings, "DEADLINE_LLM_MIN_SEC", 0.1)
+    service = _service(_SlowLLM(delay=5.0))
+
+    async def scenario():
+        started = time.perf_counter()
+        response = await service.analyze(_request(deadline_ms=800))
+        return response, time.perf_counter() - started
+
+    try:
+        response, elapsed = asyncio.run(scenario())
+    finally:
+        service.cpu_executor.shutdown()
+        service.io_executor.shutdown()
+
+    assert elapsed < 1.5
+    assert response.ai_feedback.startswith("전체 점수")
+    assert response.degradation_notes == ["AI 피드백 시간 초과 → 진단 텍스트 피드백"]
+    assert service.video_preprocessor.requests[0].target_fps == 60
@@ -0,0 +1,235 @@
+import asyncio
+import hashlib
+import os
+import time
+
+import pytest
+from pydantic import BaseModel
+
+from app.infrastructure.cache.disk_cache import DiskLruCache
+from app.schemas.analyze_dto import AnalyzeSwingRequest
+from app.services.result_cache import AnalysisResultCache, result_cache_key, result_flight_key
+
+
+class _Result(BaseModel):
+    analysis_id: str
+    user_id: str = "u"
+
+
+def _key(name: str) -> str:
+    return hashlib.sha256(name.encode()).hexdigest()
+
+
+def test_disk_cache_roundtrip_and_lru_eviction(tmp_path):
+    cache = DiskLruCache(tmp_path, max_entries=2, ttl_sec=0)
+    cache.put(_key("a"), "A")
+    cache.put(_key("b"), "B")
+    assert cache.get(_key("a")) == "A"  # a가 최근 사용 → b가 가장 오래됨
+
+    cache.put(_key("c"), "C")
+    assert cache.get(_key("b")) is None
+    assert cache.get(_key("a")) == "A"
+    assert cache.get(_key("c")) == "C"
+    assert len(cache) == 2
+    assert not (tmp_path / f"{_key('b')}.json").exists()
+
+
+def test_disk_cache_size_limit_and_ttl(tmp_path):
+    cache = DiskLruCache(tmp_path, max_entries=100, max_bytes=250, ttl_sec=0.05)
+    for name in "abc":
+        cache.put(_key(name), "x" * 100)
+    assert cache.total_bytes <= 250
+    assert cache.get(_key("a")) is None
+    assert cache.get(_key("c")) == "x" * 100
+
+    time.sleep(0.1)
+    assert cache.get(_key("b")) is None
+    assert cache.get(_key("c")) is None
+    assert len(cache) == 0
+
+
+def test_disk_cache_restores_index_and_sees_other_writers(tmp_path):
+    first = DiskLruCache(tmp_path, max_entries=10)
+    first.put(_key("a"), "A")
+
+    second = DiskLruCache(tmp_path, max_entries=10)
+    assert len(second) == 1
+    first.put(_key("b"), "B")  # second는 모르는 항목
+    assert second.get(_key("b")) == "B"
+    assert len(second) == 2
+
+    with pytest.raises(ValueError):
+        second.get("../../etc/passwd")
+
+
+def test_identical_requests_share_one_computation(tmp_path):
+    cache = AnalysisResultCache(DiskLruCache(tmp_path))
+    calls, cleaned = [], []
+
+    async def analyze():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return _Result(analysis_id="analysis_1")
+
+    async def scenario():
+        results = await asyncio.gather(*(
+            cache.get_or_compute(_key("video"), _Result, analyze, cleanup=lambda i=i: cleaned.append(i))
+            for i in range(5)
+        ))
+        again = await cache.get_or_compute(_key("video"), _Result, analyze, cleanup=lambda: cleaned.append("hit"))
+        return results, again
+
+    results, again = asyncio.run(scenario())
+
+    assert len(calls) == 1
+    assert sorted(outcome for _, outcome in results) == ["coalesced"] * 4 + ["miss"]
+    assert {r.analysis_id for r, _ in results} == {"analysis_1"}
+    assert len({id(r) for r, _ in results}) == 5  # 호출자마다 별도 사본
+    assert again[1] == "hit" and again[0].analysis_id == "analysis_1"
+    assert sorted(map(str, cleaned)) == ["0", "1", "2", "3", "4", "hit"]
+    assert len(cache.flights) == 0
+
+
+def test_cancelled_leader_still_finishes_for_followers(tmp_path):
+    cache = AnalysisResultCache(DiskLruCache(tmp_path))
+    cleaned = []
+
+    async def analyze():
+        await asyncio.sleep(0.05)
+        return _Result(analysis_id="analysis_2")
+
+    async def scenario():
+        leader = asyncio.create_task(
+            cache.get_or_compute(_key("v2"), _Result, analyze, cleanup=lambda: cleaned.append("leader"))
+        )
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(
+            cache.get_or_compute(_key("v2"), _Result, analyze, cleanup=lambda: cleaned.append("follower"))
+        )
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await follower
+
+    result, outcome = asyncio.run(scenario())
+
+    assert outcome == "coalesced" and result.analysis_id == "analysis_2"
+    assert sorted(cleaned) == ["follower", "leader"]  # leader 업로드는 분석이 끝난 뒤 삭제
+    assert os.path.exists(tmp_path / f"{_key('v2')}.json")
+
+
+def test_degraded_results_are_not_cached(tmp_path):
+    cache = AnalysisResultCache(DiskLruCache(tmp_path))
+
+    class _Degraded(_Result):
+        degradation_notes: list[str] = ["AI 피드백 생략"]
+
+    async def analyze():
+        return _Degraded(analysis_id="analysis_3")
+
+    result, outcome = asyncio.run(cache.get_or_compute(_key("v3"), _Degraded, analyze))
+
+    assert outcome == "miss" and result.analysis_id == "analysis_3"
+    assert len(cache.store) == 0
+
+
+def test_requests_without_deadline_do_not_join_a_degradable_flight(tmp_path):
+    cache = AnalysisResultCache(DiskLruCache(tmp_path))
+    base = AnalyzeSwingRequest(file_path="a.mp4", user_id="u1", club="iron", llm_provider="noop", llm_model=None)
+    rushed = base.model_copy(update={"deadline_ms": 2000})
+    key = result_cache_key("h", "single", base, "fp")
+    assert key == result_cache_key("h", "single", rushed, "fp")  # 캐시 키는 같음 (캐시에는 전체 품질만 저장)
+    assert result_flight_key(key, base) == key
+    assert result_flight_key(key, rushed) != key
+    assert result_flight_key(key, rushed) == result_flight_key(key, rushed.model_copy(update={"user_id": "u2"}))
+
+    class _Degradable(_Result):
+        degradation_notes: list[str] = []
+
+    async def analyze(request):
+        await asyncio.sleep(0.05)
+        notes = ["AI 피드백 생략"] if request.deadline_ms else []
+        return _Degradable(analysis_id=f"analysis_{request.deadline_ms}", degradation_notes=notes)
+
+    async def scenario():
+        return await asyncio.gather(*(
+            cache.get_or_compute(key, _Degradable, lambda r=r: analyze(r), flight_key=result_flight_key(key, r))
+            for r in (rushed, base)
+        ))
+
+    (fast, fast_outcome), (full, full_outcome) = asyncio.run(scenario())
+
+    assert fast_outcome == full_outcome == "miss"
+    assert fast.degradation_notes and not full.degradation_notes
+    assert len(cache.store) == 1  # 전체 품질 결과만 캐시
+
+
+def test_cache_key_covers_request_profile_and_criteria():
+    base = AnalyzeSwingRequest(file_path="a.mp4", user_id="u1", club="iron", llm_provider="noop", llm_model=None)
+    key = result_cache_key("h", "single", base, "fp1")
+
+    assert key == result_cache_key("h", "single", base.model_copy(update={"user_id": "u2"}), "fp1")
+    assert key != result_cache_key("h", "multi", base, "fp1")
+    assert key != result_cache_key("h", "single", base, "fp2")
+    assert key != result_cache_key("h", "single", base.model_copy(update={"swing_direction": "left"}), "fp1")
+    assert key != result_cache_key("h", "single", base.model_copy(update={"visibility_threshold": 0.7}), "fp1")
+    # LLM 피드백은 사용자별 결과
+    llm = base.model_copy(update={"llm_provider": "openai", "llm_model": "gpt-4o-mini"})
+    assert result_cache_key("h", "single", llm, "fp1") != result_cache_key(
+        "h", "single", llm.model_copy(update={"user_id": "u2"}), "fp1"
+    )
+
+
+def test_analyze_endpoint_reuses_result_for_same_upload(tmp_path, monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.api import swing
+    from app.common.dependencies import verify_api_key
+    from app.config.settings import settings
+    from app.schemas.analyze_dto import AnalyzeSwingResponse
+
+    seen_paths = []
+
+    class _Service:
+        diagnosis_engine = type("_Engine", (), {"fingerprint": "fp"})()
+
+        async def analyze(self, request):
+            seen_paths.append(request.file_path)
+            assert os.path.exists(request.file_path)
+            return AnalyzeSwingResponse(
+                analysis_id=f"analysis_{len(seen_paths)}", user_id=request.user_id, club=request.club,
+                phases=[], diagnosis_by_phase=[], overall_score=80.0, ai_feedback="",
+                result_url=f"s3://bucket/analysis_{len(seen_paths)}.json",
+                processing_time_ms=5000.0, stage_timings_ms={"pose": {"queue_ms": 0.0, "exec_ms": 4000.0}}
+            )
+
+    monkeypatch.setattr(settings, "RESULT_CACHE_ENABLED", True)
+    monkeypatch.setattr(settings, "UPLOADS_DIR", tmp_path / "uploads")
+    monkeypatch.setattr(swing, "result_cache", AnalysisResultCache(DiskLruCache(tmp_path / "cache")))
+    monkeypatch.setattr(swing, "create_swing_analysis_service", lambda **_: _Service())
+
+    app = FastAPI()
+    app.include_router(swing.router)
+    app.dependency_overrides[verify_api_key] = lambda: True
+    client = TestClient(app)
+
+    def post(content, user):
+        return client.post(
+            "/analyze",
+            files={"file": ("swing.mp4", content, "video/mp4")},
+            data={"club": "driver", "user_id": user, "llm_provider": "noop"}
+        )
+
+    first, second, other = post(b"video-1", "u1"), post(b"video-1", "u2"), post(b"video-2", "u1")
+
+    assert first.headers["X-Analysis-Cache"] == "miss"
+    assert second.headers["X-Analysis-Cache"] == "hit"
+    # 결과 내용만 공유, ID/사용자/시간/저장 경로는 이 요청 기준
+    assert second.json()["overall_score"] == first.json()["overall_score"]
+    assert second.json()["analysis_id"] not in (first.json()["analysis_id"], "analysis_2")
+    assert second.json()["user_id"] == "u2"
+    assert second.json()["result_url"] is None and second.json()["stage_timings_ms"] is None
+    assert second.json()["processing_time_ms"] < 5000.0
+    assert other.headers["X-Analysis-Cache"] == "miss"
+    assert len(seen_paths) == 2 and seen_paths[0] != seen_paths[1]
+    assert os.listdir(tmp_path / "uploads") == []
@@ -0,0 +1,144 @@
+import json
+import threading
+import time
+
+import pytest
+
+from app.domain.diagnosis.engine import DiagnosisEngine
+from app.domain.diagnosis.thresholds import DEFAULT_THRESHOLDS, ThresholdTable
+from app.infrastructure.runlog.writer import RunLogWriter
+from app.schemas.analyze_dto import AnalyzeSwingRequest, DiagnosisResult, PhaseResult
+from app.schemas.pose_dto import PoseExtractionResult
+from app.schemas.video_dto import VideoPreprocessResult
+from app.services.run_log import build_run_record
+from scripts.utils.libs.flatten import flatten_core_blocks, flatten_diag_by_phase, flatten_phase_metrics
+from scripts.utils.libs.jsonio import iter_records
+
+
+def _read_all(directory):
+    return [r for path in sorted(directory.glob("runs*.jsonl")) for r in iter_records(str(path))]
+
+
+def test_writer_batches_records_and_flushes_on_close(tmp_path):
+    writer = RunLogWriter(tmp_path, batch_size=10, flush_interval=5.0)
+    for i in range(25):
+        assert writer.write({"swingId": f"s{i}"})
+    writer.close()
+
+    records = _read_all(tmp_path)
+    assert [r["swingId"] for r in records] == [f"s{i}" for i in range(25)]
+
+
+def test_writer_flushes_partial_batch_after_interval(tmp_path):
+    writer = RunLogWriter(tmp_path, batch_size=100, flush_interval=0.05)
+    try:
+        writer.write({"swingId": "late"})
+        deadline = time.monotonic() + 2.0
+        while not (tmp_path / "runs.jsonl").exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert _read_all(tmp_path) == [{"swingId": "late"}]
+    finally:
+        writer.close()
+
+
+def test_writer_rotates_by_size(tmp_path):
+    writer = RunLogWriter(tmp_path, max_bytes=200, batch_size=1, flush_interval=0.01)
+    for i in range(20):
+        writer.write({"swingId": f"s{i:02d}", "pad": "x" * 40})
+    writer.close()
+
+    rotated = list(tmp_path.glob("runs-*.jsonl"))
+    assert rotated
+    assert all(p.stat().st_size <= 200 for p in rotated)
+    assert sorted(r["swingId"] for r in _read_all(tmp_path)) == [f"s{i:02d}" for i in range(20)]
+
+
+def test_writer_drops_when_queue_is_full(tmp_path):
+    writer = RunLogWriter(tmp_path, batch_size=1, flush_interval=0.01, max_queue=2)
+    gate = threading.Event()
+    original = writer._append
+    writer._append = lambda batch: (gate.wait(2.0), original(batch))
+
+    accepted = [writer.write({"swingId": f"s{i}"}) for i in range(10)]
+    gate.set()
+    writer.close()
+
+    assert not all(accepted)
+    assert len(_read_all(tmp_path)) == sum(accepted)
+
+
+def test_run_record_matches_aggregate_schema():
+    engine = DiagnosisEngine(table=ThresholdTable(DEFAULT_THRESHOLDS))
+    request = AnalyzeSwingRequest(file_path="uploads/a.mp4", user_id="u1", club="iron", swing_direction="left")
+    phases = [
+        PhaseResult(name="Address", start_frame=0, end_frame=9, timestamp_start=0, timestamp_end=0.15,
+                    key_angles={"left_elbow": 170.0}),
+        PhaseResult(name="Backswing", start_frame=10, end_frame=29, timestamp_start=0.16, timestamp_end=0.48,
+                    key_angles={"left_elbow": 150.0, "left_knee": 160.0, "x_factor": 40.0, "right_elbow": 90.0}),
+    ]
+    diagnoses = [DiagnosisResult(phase="Backswing", score=72.5, issues=["a", "b"])]
+
+    record = build_run_record(
+        swing_id="analysis_1#2",
+        mode="multi",
+        request=request,
+        video_metadata=VideoPreprocessResult(
+            total_frames=80, fps=30, duration=2.6, width=405, height=720, source_fps=240, frame_step=8
+        ),
+        pose_result=PoseExtractionResult(total_frames=80, poses=[], model_complexity=1),
+        engine=engine,
+        phase_method="rule",
+        phases=phases,
+        diagnoses=diagnoses,
+        overall_score=81.234,
+        stage_timings_ms={"decode": {"queue_ms": 0.1, "exec_ms": 120.5}, "pose": {"queue_ms": 0, "exec_ms": 900}},
+        processing_time_ms=1100.0
+    )
+    record = json.loads(json.dumps(record))
+
+    flat = flatten_core_blocks(record)
+    assert flat["swingId"] == "analysis_1#2"
+    assert flat["input.club"] == "iron"
+    assert flat["preprocess.ms"] == 120.5
+    assert flat["preprocess.mirror"] is True
+    # 마감 대응으로 경량화한 실행의 실제 간격 / FPS / 모델 크기
+    assert flat["pose.frameStep"] == 8
+    assert flat["pose.fps"] == 30 and flat["preprocess.sourceFps"] == 240
+    assert flat["pose.modelComplexity"] == 1
+    assert flat["rules.fingerprint"] == engine.fingerprint
+    assert flat["rules.keyCount"] == int(engine.table.present.sum())
+    assert flat["detectionRate"] == 0.0
+    assert flat["metrics.pose_ms"] == 900
+    assert flat["phase_idx.Backswing"] == 10
+
+    pm = flatten_phase_metrics(record["phase_metrics"])
+    assert pm == {
+        "phase.P2.elbow": 150.0, "phase.P2.knee": 160.0, "phase.P2.x_factor": 40.0,
+        "phase.P3.elbow": 150.0, "phase.P3.knee": 160.0, "phase.P3.x_factor": 40.0,
+    }
+    assert flatten_diag_by_phase(record["diagnosis_by_phase"]) == {
+        "diag.Backswing.score": 72.5, "diag.Backswing.issues": "a; b"
+    }
+
+
+def test_iter_records_skips_only_broken_lines(tmp_path):
+    path = tmp_path / "runs.jsonl"
+    path.write_text('{"swingId": "a"}\n{"swingId": "b"\n\n{"swingId": "c"}\n', encoding="utf-8")
+    skipped = []
+
+    records = list(iter_records(str(path), on_error=lambda lineno, e: skipped.append(lineno)))
+
+    assert [r["swingId"] for r in records] == ["a", "c"]  # 깨진 줄 뒤의 레코드도 읽음
+    assert skipped == [2]
+    with pytest.raises(ValueError):
+        list(iter_records(str(path)))  # on_error 없으면 기존처럼 예외
+
+
+def test_engine_fingerprint_tracks_thresholds():
+    base = DiagnosisEngine(table=ThresholdTable(DEFAULT_THRESHOLDS))
+    same = DiagnosisEngine(table=ThresholdTable(json.loads(json.dumps(DEFAULT_THRESHOLDS))))
+    other = DiagnosisEngine(table=ThresholdTable({"Impact": {"left_knee": {"optimal": 170}}}))
+
+    assert len(base.fingerprint) == 12
+    assert base.fingerprint == same.fingerprint
+    assert base.fingerprint != other.fingerprint
@@ -0,0 +1,74 @@
+from unittest.mock import Mock
+
+import cv2
+import numpy as np
+
+from app.domain.angle.calculator import AngleCalculator
+from app.domain.diagnosis.engine import DiagnosisEngine
+from app.domain.phase.detector import PhaseDetector
+from app.domain.video.preprocessor import VideoPreprocessor
+from app.schemas.video_dto import VideoPreprocessRequest
+from app.services.session_pipeline import SwingSessionPipeline
+from app.services.swing_analysis_service import SwingAnalysisService
+from tests.test_helpers import make_session_wrist_y, make_wrist_poses
+
+FPS = 60.0
+
+
+def _service():
+    return SwingAnalysisService(
+        video_preprocessor=Mock(),
+        pose_extractor=Mock(),
+        angle_calculator=AngleCalculator(),
+        phase_detector=PhaseDetector(method="rule"),
+        diagnosis_engine=DiagnosisEngine(club="driver"),
+    )
+
+
+def test_session_emits_each_swing_as_it_completes():
+    poses = make_wrist_poses(make_session_wrist_y(num_swings=3), FPS)
+    pipeline = SwingSessionPipeline(_service(), fps=FPS, buffer_sec=4.0)
+
+    emitted = []
+    for pose in poses:
+        result = pipeline.push_pose(pose)
+        if result is not None:
+            emitted.append((pose.frame_number, result))
+
+    assert [r.swing_index for _, r in emitted] == [0, 1, 2]
+    for frame_number, result in emitted:
+        # 세션 끝이 아니라 스윙 직후에 발행됨
+        assert frame_number - result.end_frame <= 1
+        assert frame_number - result.phases[-1].start_frame < FPS
+    # 링 버퍼는 세션 길이와 무관하게 제한됨
+    assert len(pipeline.buffer) == int(4.0 * FPS) < len(poses)
+
+
+def test_session_flushes_swing_when_stream_ends_during_post_roll():
+    poses = make_wrist_poses(make_session_wrist_y(num_swings=1), FPS)
+    probe = SwingSessionPipeline(_service(), fps=FPS, buffer_sec=4.0)
+    end = next(i for i, pose in enumerate(poses) if probe.push_pose(pose) is None and probe._emit_at is not None)
+
+    service = _service()
+    service.pose_extractor.process_frame.side_effect = lambda frame, n, fps: poses[n]
+    pipeline = SwingSessionPipeline(service, fps=FPS, buffer_sec=4.0)
+    # Follow-through 확정 직후 스트림 종료 (post_roll 대기 중)
+    results = list(pipeline.run((n, None) for n in range(end + 1)))
+
+    assert [r.swing_index for r in results] == [0]
+    assert results[0].end_frame == poses[end].frame_number
+    service.pose_extractor.close.assert_called_once()
+
+
+def test_stream_yields_resampled_frames(tmp_path):
+    path = str(tmp_path / "clip.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 60, (64, 48))
+    for i in range(30):
+        writer.write(np.full((48, 64, 3), i * 8, dtype=np.uint8))
+    writer.release()
+
+    request = VideoPreprocessRequest(file_path=path, target_fps=30, target_height=480)
+    frames = list(VideoPreprocessor().stream(request))
+
+    assert [n for n, _ in frames] == list(range(15))
+    assert frames[0][1].shape == (480, 640, 3)
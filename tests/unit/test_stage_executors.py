@@ -0,0 +1,63 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+from app.common.executors import StageExecutor, StageTimings
+from app.infrastructure.llm.gateway_client import LLMGatewayClient
+
+
+def test_stage_timings_separate_queue_wait_from_execution():
+    executor = StageExecutor("test", max_workers=1)
+    timings = StageTimings()
+
+    async def scenario():
+        await asyncio.gather(
+            executor.run("first", time.sleep, 0.1, timings=timings),
+            executor.run("second", time.sleep, 0.1, timings=timings),
+        )
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+
+    stages = timings.as_dict()
+    assert stages["first"]["exec_ms"] >= 90 and stages["second"]["exec_ms"] >= 90
+    # 워커 1개 → 두 번째 단계는 첫 단계가 끝날 때까지 대기
+    assert stages["second"]["queue_ms"] >= 80
+    assert stages["first"]["queue_ms"] < 50
+    assert "second=" in timings.summary()
+
+
+def test_event_loop_stays_responsive_during_blocking_stage():
+    executor = StageExecutor("test", max_workers=1)
+    ticks = []
+
+    async def heartbeat(stop: asyncio.Event):
+        while not stop.is_set():
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.01)
+
+    async def scenario():
+        stop = asyncio.Event()
+        beat = asyncio.create_task(heartbeat(stop))
+        await executor.run("blocking", time.sleep, 0.2)
+        stop.set()
+        await beat
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+
+    assert len(ticks) >= 5
+    assert max(b - a for a, b in zip(ticks, ticks[1:])) < 0.1
+
+
+def test_async_feedback_noop_mode_returns_mock():
+    client = LLMGatewayClient(gateway_url="http://localhost:3030", provider="noop")
+    diagnosis = SimpleNamespace(overall_score=72.0, diagnoses=[])
+
+    feedback = asyncio.run(client.agenerate_feedback(diagnosis, user_id="u1", club="driver"))
+
+    assert feedback == client._generate_mock_feedback(diagnosis)
@@ -0,0 +1,58 @@
+from unittest.mock import Mock
+
+import numpy as np
+
+from app.domain.angle.calculator import AngleCalculator
+from app.domain.diagnosis.engine import DiagnosisEngine
+from app.domain.phase.detector import PhaseDetector
+from app.domain.phase.segmenter import SwingSegmenter
+from app.schemas.analyze_dto import AnalyzeSwingRequest
+from app.schemas.pose_dto import PoseExtractionResult
+from app.schemas.video_dto import VideoPreprocessResult
+from app.services.swing_analysis_service import SwingAnalysisService
+from tests.test_helpers import make_session_wrist_y, make_wrist_poses
+
+FPS = 60.0
+
+
+def test_segmenter_finds_each_swing():
+    poses = make_wrist_poses(make_session_wrist_y(num_swings=3), FPS)
+
+    segments = SwingSegmenter().segment(poses, FPS)
+
+    assert len(segments) == 3
+    for a, b in zip(segments, segments[1:]):
+        assert a.end_index <= b.start_index
+
+
+def test_segmenter_ignores_idle_clip():
+    assert SwingSegmenter().segment(make_wrist_poses(np.full(300, 0.5), FPS), FPS) == []
+
+
+async def test_analyze_multi_runs_pose_extraction_once():
+    poses = make_wrist_poses(make_session_wrist_y(num_swings=2), FPS)
+    preprocessor = Mock()
+    preprocessor.process.return_value = (
+        [], VideoPreprocessResult(total_frames=len(poses), fps=FPS, duration=len(poses) / FPS, width=1, height=1)
+    )
+    extractor = Mock()
+    extractor.extract.return_value = PoseExtractionResult(total_frames=len(poses), poses=poses)
+
+    service = SwingAnalysisService(
+        video_preprocessor=preprocessor,
+        pose_extractor=extractor,
+        angle_calculator=AngleCalculator(),
+        phase_detector=PhaseDetector(method="rule"),
+        diagnosis_engine=DiagnosisEngine(club="driver"),
+    )
+
+    result = await service.analyze_multi(
+        AnalyzeSwingRequest(file_path="session.mp4", user_id="u1", llm_provider="noop")
+    )
+
+    extractor.extract.assert_called_once()
+    assert result.detected_segments == 2
+    assert [s.swing_index for s in result.swings] == [0, 1]
+    # 페이즈 프레임 번호는 영상 전체 기준
+    second = result.swings[1]
+    assert second.phases[0].start_frame == second.start_frame
@@ -0,0 +1,75 @@
+import json
+
+import pytest
+
+from app.infrastructure.thresholds.registry import ThresholdRegistry
+from app.infrastructure.thresholds.watcher import ThresholdStore
+
+
+def _thresholds(mean):
+    block = {"bins": [mean - 10, mean, mean + 10], "mean": mean, "std": 5.0, "n": 20}
+    return {"P4": {"elbow": block}}
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    # 운영 파일처럼 파일명 끝에 공백이 붙은 경우 포함
+    (tmp_path / "2025-10-21_thresholds.json   ").write_text(json.dumps(_thresholds(150.0)))
+    (tmp_path / "2025-11-10_thresholds.json").write_text(json.dumps(_thresholds(160.0)))
+    (tmp_path / "2025-12-01_thresholds.json").write_text("{not json")
+    (tmp_path / "thresholds_current.json").symlink_to("2025-11-10_thresholds.json")
+    return tmp_path
+
+
+def _registry(config_dir, **kwargs):
+    store = ThresholdStore(path_resolver=lambda: config_dir / "thresholds_current.json")
+    registry = ThresholdRegistry(config_dir, store=store, **kwargs)
+    registry.load()
+    return registry
+
+
+def test_load_indexes_by_date_filename_and_fingerprint(config_dir):
+    registry = _registry(config_dir, pin="", ab_split={})
+
+    assert [s.date for s in registry.versions] == ["2025-10-21", "2025-11-10"]  # 깨진 파일은 제외
+    old = registry.get("2025-10-21")
+    assert old.version == "2025-10-21_thresholds.json"
+    assert registry.get(old.version) is old
+    assert registry.get(old.fingerprint[:6]) is old
+    assert registry.get("current").date == "2025-11-10"
+    with pytest.raises(KeyError):
+        registry.get("2024-01-01")
+
+
+def test_select_priority_request_then_pin_then_current(config_dir):
+    registry = _registry(config_dir, pin="", ab_split={})
+    assert registry.select().date == "2025-11-10"
+    assert registry.select("2025-10-21").date == "2025-10-21"
+
+    pinned = _registry(config_dir, pin="2025-10-21", ab_split={})
+    assert pinned.select(key="user_1").date == "2025-10-21"
+    assert pinned.select("current").date == "2025-11-10"
+
+
+def test_ab_split_is_sticky_and_weighted(config_dir):
+    registry = _registry(config_dir, pin="", ab_split={"2025-10-21": 0.5, "2025-11-10": 0.5})
+
+    picks = [registry.select(key=f"user_{i}").date for i in range(400)]
+    assert picks == [registry.select(key=f"user_{i}").date for i in range(400)]
+    assert 150 < picks.count("2025-10-21") < 250
+    assert registry.select().date == "2025-11-10"  # 키가 없으면 current
+
+
+def test_unknown_configured_versions_fall_back_to_current(config_dir):
+    pinned = _registry(config_dir, pin="2024-01-01", ab_split={})
+    assert pinned.pin == ""  # 로드 시 경고 후 무시
+    assert pinned.select(key="user_1").date == "2025-11-10"
+    with pytest.raises(KeyError):
+        pinned.select("2024-01-01")  # 요청이 직접 지정한 버전만 KeyError
+
+    split = _registry(config_dir, pin="", ab_split={"2024-01-01": 0.5, "2025-10-21": 0.5})
+    assert split.ab_split == {"2025-10-21": 0.5}
+    assert {split.select(key=f"user_{i}").date for i in range(50)} == {"2025-10-21"}
+
+    unloaded = ThresholdRegistry(config_dir, store=pinned.store, pin="2025-10-21", ab_split={})
+    assert unloaded.select(key="user_1").date == "2025-11-10"  # load 전에도 요청은 실패하지 않음
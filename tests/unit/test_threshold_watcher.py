@@ -0,0 +1,106 @@
+import asyncio
+import json
+import os
+
+import numpy as np
+
+from app.domain.diagnosis.distributions import DistributionTable
+from app.infrastructure.thresholds.watcher import ThresholdStore, ThresholdWatcher
+
+
+def _thresholds(mean):
+    block = {"bins": [mean - 10, mean - 5, mean, mean + 5, mean + 10], "mean": mean, "std": 5.0, "n": 20}
+    return {"P4": {"elbow": block, "knee": dict(block, mean=mean + 1)}, "P7": {"elbow": block}}
+
+
+def _write(path, data):
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def _point_current(tmp_path, target):
+    current = tmp_path / "thresholds_current.json"
+    tmp = tmp_path / "thresholds_current.json.tmp"
+    os.symlink(target.name, tmp)
+    os.replace(tmp, current)  # 운영과 같은 원자적 심링크 교체
+    return current
+
+
+def test_distribution_table_compiles_phase_metric_arrays():
+    table = DistributionTable(_thresholds(150.0))
+
+    assert table.phases == ("P4", "P7")
+    assert table.metrics == ("elbow", "knee")
+    assert table.mean[0, 1] == 151.0
+    assert np.isnan(table.mean[1, 1]) and table.n[1, 1] == 0
+    assert table.bins.shape == (2, 2, 5)
+    assert not table.mean.flags.writeable
+
+
+def test_store_swaps_on_valid_change_and_keeps_old_on_invalid(tmp_path):
+    v1, v2, bad = (tmp_path / n for n in ("2025-01-01_thresholds.json",
+                                            "2025-02-01_thresholds.json",
+                                            "2025-03-01_thresholds.json"))
+    _write(v1, _thresholds(150.0))
+    _write(v2, _thresholds(160.0))
+    _write(bad, {"P4": {"elbow": {"bins": [3, 2, 1], "mean": "x", "std": 1.0, "n": -1}}})
+
+    current = _point_current(tmp_path, v1)
+    store = ThresholdStore(path_resolver=lambda: current)
+    first = store.get()
+    assert first.version == v1.name
+    assert store.reload() is False  # 내용이 같으면 교체 없음
+
+    _point_current(tmp_path, v2)
+    assert store.reload() is True
+    assert store.get().version == v2.name
+    assert first.data["P4"]["elbow"]["mean"] == 150.0  # 이전 스냅샷은 그대로
+
+    _point_current(tmp_path, bad)
+    assert store.reload() is False
+    assert store.get().version == v2.name
+
+
+def test_store_throttles_loads_until_first_snapshot(tmp_path):
+    path = tmp_path / "2025-01-01_thresholds.json"
+    now = [0.0]
+    resolved = []
+
+    def resolve():
+        resolved.append(now[0])
+        return path
+
+    store = ThresholdStore(path_resolver=resolve, retry_interval=5.0, clock=lambda: now[0])
+    assert store.get() is None  # 파일 없음
+    now[0] = 1.0
+    assert store.get() is None
+    assert resolved == [0.0]  # retry_interval 안에서는 다시 읽지 않음
+
+    _write(path, _thresholds(150.0))
+    now[0] = 6.0
+    assert store.get().version == path.name
+    assert resolved == [0.0, 6.0]
+
+
+def test_polling_watcher_detects_symlink_swap(tmp_path, monkeypatch):
+    import app.infrastructure.thresholds.watcher as watcher_module
+    monkeypatch.setattr(watcher_module, "awatch", None)
+
+    v1, v2 = tmp_path / "2025-01-01_thresholds.json", tmp_path / "2025-02-01_thresholds.json"
+    _write(v1, _thresholds(150.0))
+    _write(v2, _thresholds(160.0))
+    current = _point_current(tmp_path, v1)
+    store = ThresholdStore(path_resolver=lambda: current)
+    store.reload()
+
+    async def scenario():
+        watcher = ThresholdWatcher(store, poll_interval=0.02).start()
+        await asyncio.sleep(0.05)
+        _point_current(tmp_path, v2)
+        for _ in range(100):
+            if store.get().version == v2.name:
+                break
+            await asyncio.sleep(0.02)
+        await watcher.stop()
+
+    asyncio.run(scenario())
+    assert store.get().version == v2.name